@@ -1,5 +1,46 @@
-from .graph_properties_analyzer import GraphPropertiesAnalyzer
-from .path_analyzer import PathAnalyzer
-from .matrix_analyzer import MatrixAnalyzer
+"""
+Analyzátory grafů.
 
-__all__ = ['GraphPropertiesAnalyzer', 'PathAnalyzer', 'MatrixAnalyzer']
+Moduly analyzátorů se načítají líně až při prvním přístupu ke třídě
+(`from graph_analyzer.analyzers import PathAnalyzer`), takže CLI při
+startu nenačítá analýzy, které se nepoužijí (ani numpy a multiprocessing).
+"""
+
+import importlib
+
+# Třída -> modul, ve kterém je definovaná
+_MODULES = {
+    'GraphPropertiesAnalyzer': 'graph_properties_analyzer',
+    'PathAnalyzer': 'path_analyzer',
+    'MatrixAnalyzer': 'matrix_analyzer',
+    'IncrementalShortestPaths': 'incremental_paths',
+    'CentralityAnalyzer': 'centrality_analyzer',
+    'RankAnalyzer': 'rank_analyzer',
+    'ApproxDistanceAnalyzer': 'approx_distance_analyzer',
+    'CoreAnalyzer': 'core_analyzer',
+    'CommunityAnalyzer': 'community_analyzer',
+    'SpanningTreeAnalyzer': 'spanning_tree_analyzer',
+    'FlowAnalyzer': 'flow_analyzer',
+    'DagAnalyzer': 'dag_analyzer',
+    'BiconnectivityAnalyzer': 'biconnectivity_analyzer',
+    'EulerAnalyzer': 'euler_analyzer',
+    'ColoringAnalyzer': 'coloring_analyzer',
+    'MatchingAnalyzer': 'matching_analyzer',
+    'FingerprintAnalyzer': 'fingerprint_analyzer',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    # Další přístupy už __getattr__ nevolají
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,369 @@
+"""
+Přibližné statistiky vzdáleností pro velké grafy (HyperANF, sweep odhady průměru).
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # numpy je volitelné - bez něj se počítá v čistém Pythonu
+    np = None
+
+from ..utils.indexed_graph import IndexedGraph
+from .centrality_analyzer import Z_95
+
+# Kvantily Studentova rozdělení (95%, oboustranně) podle počtu stupňů volnosti
+_T_95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086]
+
+_MASK64 = (1 << 64) - 1
+
+# Počet čítačů odhadovaných najednou
+_ESTIMATE_ROWS = 1 << 14
+
+
+def _t_quantile(df):
+    return _T_95[df - 1] if df <= len(_T_95) else Z_95
+
+
+def _splitmix64(x):
+    """Míchací funkce SplitMix64 - nezávislé 64bitové hashe uzlů."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _hll_alpha(registers):
+    if registers == 16:
+        return 0.673
+    if registers == 32:
+        return 0.697
+    if registers == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / registers)
+
+
+def _mean_ci(values):
+    """Vrátí (průměr, polovina 95% intervalu spolehlivosti nebo None pro jeden běh)."""
+    k = len(values)
+    mean = sum(values) / k
+    if k < 2:
+        return mean, None
+    variance = sum((v - mean) ** 2 for v in values) / (k - 1)
+    return mean, _t_quantile(k - 1) * math.sqrt(variance / k)
+
+
+class ApproxDistanceAnalyzer:
+    """
+    Třída pro odhad statistik vzdáleností bez výpočtu všech dvojic.
+
+    HyperANF: každý uzel x má čítač HyperLogLog (2^p registrů) pro množinu
+    uzlů dostupných z x nejvýše t kroky. Krok t je sjednocení čítače x
+    s čítači následníků z kroku t - 1 (maximum po registrech), takže celý
+    výpočet je O(m · 2^p) na iteraci a iterací je tolik, kolik je průměr.
+    Součet odhadů přes uzly je funkce okolí N(t) = počet dvojic
+    (x, y) s d(x, y) <= t, ze které se odvodí rozdělení vzdáleností,
+    průměrná vzdálenost a efektivní průměr. Intervaly spolehlivosti se
+    počítají z nezávislých běhů s různými hashi.
+
+    Vzdálenosti se měří v počtu hran (váhy se ignorují).
+    """
+
+    def __init__(self, graph, use_numpy=None):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+            use_numpy (bool): Vynutit/zakázat numpy (None = použít, je-li nainstalované)
+        """
+        self.graph = graph
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self._indexed = None
+
+    def _index(self):
+        if self._indexed is None or self._indexed_version != self.graph.version:
+            self._indexed = IndexedGraph(self.graph)
+            self._indexed_version = self.graph.version
+        return self._indexed
+
+    # ========== HyperANF ==========
+
+    def neighbourhood_function(self, precision=7, runs=3, seed=None, max_iter=None, quantile=0.9):
+        """
+        Odhadne funkci okolí a z ní odvozené statistiky vzdáleností.
+
+        Args:
+            precision (int): p - počet bitů indexu registru (2^p registrů na uzel,
+                relativní chyba čítače cca 1.04 / sqrt(2^p))
+            runs (int): Počet nezávislých běhů pro intervaly spolehlivosti
+            seed (int): Semínko hashů (None = 0)
+            max_iter (int): Maximální počet iterací (None = do ustálení)
+            quantile (float): Podíl dvojic pro efektivní průměr
+
+        Returns:
+            dict: {
+                'neighbourhood': [N(t)], 'neighbourhood_ci': [± pro N(t) nebo None],
+                'distribution': [podíl dvojic ve vzdálenosti t pro t = 1, 2, ...],
+                'distribution_ci': [± nebo None],
+                'average_distance': (odhad, ±), 'effective_diameter': (odhad, ±),
+                'reachable_pairs': (odhad, ±), 'iterations': počet iterací do ustálení,
+                'runs', 'precision', 'backend'
+            }
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("přesnost HyperLogLogu musí být v rozsahu 4-16")
+        if runs < 1:
+            raise ValueError("počet běhů musí být alespoň 1")
+        indexed = self._index()
+        seed = 0 if seed is None else seed
+
+        curves = []
+        for run in range(runs):
+            run_seed = _splitmix64((seed << 16) + run)
+            if self.use_numpy:
+                curves.append(self._anf_numpy(indexed, precision, run_seed, max_iter))
+            else:
+                curves.append(self._anf_python(indexed, precision, run_seed, max_iter))
+
+        length = max(len(curve) for curve in curves)
+        # Kratší běhy se ustálily dříve - doplní se poslední hodnotou
+        curves = [curve + [curve[-1]] * (length - len(curve)) for curve in curves]
+
+        per_run = [self._derive(curve, quantile) for curve in curves]
+        neighbourhood = []
+        neighbourhood_ci = []
+        rsd = 1.04 / math.sqrt(1 << precision)
+        for t in range(length):
+            mean, ci = _mean_ci([curve[t] for curve in curves])
+            neighbourhood.append(mean)
+            # Jeden běh - mez z relativní chyby čítačů
+            neighbourhood_ci.append(ci if ci is not None else Z_95 * rsd * mean)
+        distribution = []
+        distribution_ci = []
+        for t in range(length - 1):
+            mean, ci = _mean_ci([derived['distribution'][t] for derived in per_run])
+            distribution.append(mean)
+            distribution_ci.append(ci)
+
+        return {
+            'neighbourhood': neighbourhood,
+            'neighbourhood_ci': neighbourhood_ci,
+            'distribution': distribution,
+            'distribution_ci': distribution_ci,
+            'average_distance': _mean_ci([derived['average'] for derived in per_run]),
+            'effective_diameter': _mean_ci([derived['effective'] for derived in per_run]),
+            'reachable_pairs': _mean_ci([curve[-1] - curve[0] for curve in curves]),
+            'iterations': length - 1,
+            'runs': runs,
+            'precision': precision,
+            'backend': 'numpy' if self.use_numpy else 'python',
+        }
+
+    @staticmethod
+    def _derive(curve, quantile):
+        """Rozdělení vzdáleností, průměrná vzdálenost a efektivní průměr z jedné křivky N(t)."""
+        total = curve[-1] - curve[0]
+        if total <= 0:
+            return {'distribution': [0.0] * (len(curve) - 1), 'average': 0.0, 'effective': 0.0}
+        # Odhady nejsou přesně monotónní - záporné přírůstky se ořežou
+        distribution = [max(curve[t] - curve[t - 1], 0.0) for t in range(1, len(curve))]
+        scale = sum(distribution)
+        distribution = [d / scale for d in distribution]
+        average = sum(t * d for t, d in enumerate(distribution, 1))
+
+        effective = float(len(distribution))
+        cumulative = 0.0
+        for t, d in enumerate(distribution, 1):
+            if cumulative + d >= quantile:
+                # Lineární interpolace mezi t - 1 a t
+                effective = t - 1 + (quantile - cumulative) / d
+                break
+            cumulative += d
+        return {'distribution': distribution, 'average': average, 'effective': effective}
+
+    @staticmethod
+    def _initial_registers(n, precision, run_seed):
+        """Vrátí (index registru, hodnota) pro jediný prvek čítače každého uzlu."""
+        registers = 1 << precision
+        width = 64 - precision
+        result = []
+        for i in range(n):
+            h = _splitmix64(i ^ run_seed)
+            rest = h >> precision
+            result.append((h & (registers - 1), width - rest.bit_length() + 1))
+        return result
+
+    def _anf_numpy(self, indexed, precision, run_seed, max_iter):
+        n = indexed.n
+        registers = 1 << precision
+        regs = np.zeros((n, registers), dtype=np.uint8)
+        if n:
+            slots, values = zip(*self._initial_registers(n, precision, run_seed))
+            regs[np.arange(n), np.asarray(slots)] = np.asarray(values, dtype=np.uint8)
+
+        degrees = np.diff(np.asarray(indexed.offsets, dtype=np.int64))
+        sources = np.repeat(np.arange(n, dtype=np.int64), degrees)
+        targets = np.asarray(indexed.targets, dtype=np.int64)
+
+        alpha = _hll_alpha(registers)
+        powers = np.ldexp(1.0, -np.arange(65))
+
+        def estimate(rows):
+            result = np.empty(len(rows))
+            # Po blocích - pole mocnin má osminásobnou velikost registrů
+            for start in range(0, len(rows), _ESTIMATE_ROWS):
+                block = regs[rows[start:start + _ESTIMATE_ROWS]]
+                raw = alpha * registers * registers / powers[block].sum(axis=1)
+                zeros = (block == 0).sum(axis=1)
+                small = (raw <= 2.5 * registers) & (zeros > 0)
+                linear = registers * np.log(registers / np.maximum(zeros, 1))
+                result[start:start + _ESTIMATE_ROWS] = np.where(small, linear, raw)
+            return result
+
+        estimates = estimate(np.arange(n))
+        curve = [float(estimates.sum())]
+        changed = np.ones(n, dtype=bool)
+        iterations = 0
+        while max_iter is None or iterations < max_iter:
+            # Čítač, který se v minulém kroku nezměnil, je už v čítačích předchůdců obsažen
+            active = np.flatnonzero(changed[targets])
+            if not len(active):
+                break
+            arc_sources = sources[active]
+            starts = np.flatnonzero(np.r_[True, arc_sources[1:] != arc_sources[:-1]])
+            # Pořadí oblouku mezi aktivními oblouky svého uzlu; oblouky se stejným
+            # pořadím mají různé počáteční uzly, takže se dají sloučit naráz
+            position = np.arange(len(active)) - np.repeat(starts, np.diff(np.r_[starts, len(active)]))
+            by_position = np.argsort(position, kind='stable')
+            bounds = np.searchsorted(position[by_position], np.arange(position.max(initial=-1) + 2))
+
+            new = regs.copy()
+            for k in range(len(bounds) - 1):
+                arcs = active[by_position[bounds[k]:bounds[k + 1]]]
+                rows = sources[arcs]
+                new[rows] = np.maximum(new[rows], regs[targets[arcs]])
+            iterations += 1
+
+            rows = sources[active[starts]]
+            changed = np.zeros(n, dtype=bool)
+            changed[rows[(new[rows] != regs[rows]).any(axis=1)]] = True
+            regs = new
+            if not changed.any():
+                break
+            rows = np.flatnonzero(changed)
+            estimates[rows] = estimate(rows)
+            curve.append(float(estimates.sum()))
+        return curve
+
+    def _anf_python(self, indexed, precision, run_seed, max_iter):
+        n = indexed.n
+        registers = 1 << precision
+        regs = []
+        for slot, value in self._initial_registers(n, precision, run_seed):
+            counter = bytearray(registers)
+            counter[slot] = value
+            regs.append(bytes(counter))
+
+        adj = indexed.adjacency_lists()
+        alpha = _hll_alpha(registers)
+        powers = [2.0 ** -k for k in range(65)]
+
+        def estimate(regs):
+            total = 0.0
+            for counter in regs:
+                raw = alpha * registers * registers / sum(powers[r] for r in counter)
+                zeros = counter.count(0)
+                if raw <= 2.5 * registers and zeros:
+                    raw = registers * math.log(registers / zeros)
+                total += raw
+            return total
+
+        curve = [estimate(regs)]
+        iterations = 0
+        while max_iter is None or iterations < max_iter:
+            new = []
+            changed = False
+            for x in range(n):
+                counter = regs[x]
+                for y in adj[x]:
+                    counter = bytes(map(max, counter, regs[y]))
+                if counter != regs[x]:
+                    changed = True
+                new.append(counter)
+            iterations += 1
+            if not changed:
+                break
+            regs = new
+            curve.append(estimate(regs))
+        return curve
+
+    # ========== Dolní a horní mez průměru ==========
+
+    @staticmethod
+    def _bfs(adj, start, n):
+        """Vrátí (vzdálenosti, předchůdci, nejvzdálenější uzel, počet dosažených uzlů)."""
+        dist = [-1] * n
+        parent = [-1] * n
+        dist[start] = 0
+        order = [start]
+        for v in order:
+            next_dist = dist[v] + 1
+            for w in adj[v]:
+                if dist[w] < 0:
+                    dist[w] = next_dist
+                    parent[w] = v
+                    order.append(w)
+        return dist, parent, order[-1], len(order)
+
+    def diameter_bounds(self):
+        """
+        Spočítá meze průměru (v počtu hran) několika průchody do šířky.
+
+        Neorientovaný graf - 4-sweep: z uzlu nejvyššího stupně k nejvzdálenějšímu
+        uzlu a1, z něj k b1, ze středu cesty a1-b1 k a2 a z a2 znovu. Dolní mez
+        je největší nalezená excentricita, horní mez dvojnásobek excentricity
+        středu (platí jen pro souvislý graf). Orientovaný graf - průchody po
+        směru a proti směru hran z uzlu nejvyššího stupně a pak dvojitý sweep
+        z nejvzdálenějšího uzlu, jen dolní mez.
+
+        Returns:
+            dict: {'lower': dolní mez, 'upper': horní mez nebo None,
+                   'infinite': True pokud některá dvojice uzlů není dosažitelná
+                   (přesný průměr je pak nekonečno), 'sweeps': počet průchodů}
+        """
+        indexed = self._index()
+        n = indexed.n
+        if n == 0:
+            return {'lower': 0, 'upper': 0, 'infinite': False, 'sweeps': 0}
+        adj = indexed.adjacency_lists()
+        start = max(range(n), key=indexed.degree)
+
+        if not self.graph.is_directed:
+            dist, _, a1, reached = self._bfs(adj, start, n)
+            infinite = reached < n
+            dist_a1, parent, b1, _ = self._bfs(adj, a1, n)
+            lower = dist_a1[b1]
+            # Střed cesty a1 - b1
+            middle = b1
+            for _ in range(lower // 2):
+                middle = parent[middle]
+            dist_mid, _, a2, _ = self._bfs(adj, middle, n)
+            dist_a2, _, b2, _ = self._bfs(adj, a2, n)
+            lower = max(lower, dist_a2[b2])
+            upper = None if infinite else min(2 * dist_mid[a2], 2 * dist[a1])
+            return {'lower': lower, 'upper': upper, 'infinite': infinite, 'sweeps': 4}
+
+        radj = indexed.reverse_lists()[0]
+        dist, _, a, reached_out = self._bfs(adj, start, n)
+        lower = dist[a]
+        dist, _, _, reached_in = self._bfs(radj, start, n)
+        lower = max(lower, max(dist))
+        # Průchody po směru i proti směru ze stejného uzlu rozhodnou silnou souvislost
+        infinite = reached_out < n or reached_in < n
+        dist, _, b, _ = self._bfs(radj, a, n)
+        lower = max(lower, dist[b])
+        dist, _, c, _ = self._bfs(adj, b, n)
+        lower = max(lower, dist[c])
+        return {'lower': lower, 'upper': None, 'infinite': infinite, 'sweeps': 4}
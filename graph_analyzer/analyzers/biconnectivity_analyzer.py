@@ -0,0 +1,155 @@
+"""
+Analyzátor dvojsouvislosti grafu (mosty, artikulace, bloky).
+"""
+
+from ..utils.indexed_graph import IndexedGraph
+
+
+class BiconnectivityAnalyzer:
+    """
+    Třída pro hledání kritických míst grafu.
+
+    Most je hrana, jejímž odebráním přibude komponenta; artikulace je
+    takový uzel. Bloky (dvojsouvislé komponenty) jsou maximální podgrafy
+    bez artikulace; strom bloků a artikulací (block-cut tree) spojuje
+    každý blok s artikulacemi, které obsahuje.
+
+    Počítá se na neorientovaném grafu reálných uzlů (orientace se
+    ignoruje, smyčky a placeholdery se vynechají). Násobné hrany se
+    rozlišují podle pozice v `graph.edges`, takže dvojitá hrana mostem
+    není.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+
+    def analyze(self):
+        """
+        Najde mosty, artikulace a bloky jedním průchodem do hloubky.
+
+        Hopcroftův-Tarjanův algoritmus s hodnotami low: low[u] je nejmenší
+        čas objevení dosažitelný z podstromu u jednou zpětnou hranou.
+        Průchod je iterativní (zásobník uzlů a ukazatel na další oblouk
+        každého uzlu), takže zvládne i dlouhé řetězce bez rekurze. Hrany
+        se ukládají na zásobník a po uzavření bloku se z něj vyjmou.
+
+        Returns:
+            dict: {
+                'bridges': [Edge] mosty,
+                'articulation_points': [uzly] artikulace,
+                'blocks': [[uzly]] bloky (izolované uzly žádný blok netvoří),
+                'block_edges': [[Edge]] hrany jednotlivých bloků,
+                'block_cut_tree': [(číslo bloku, artikulace)] hrany stromu bloků
+            }
+        """
+        indexed = IndexedGraph(self.graph, include=self.graph.is_real_node,
+                               undirected=True, skip_loops=True)
+        n = indexed.n
+        offsets, targets, edge_pos = indexed.offsets, indexed.targets, indexed.edge_pos
+        disc = [-1] * n
+        low = [0] * n
+        pointer = offsets[:n]
+        parent_edge = [-1] * n
+        is_articulation = [False] * n
+        # Zdroj oblouku uloženého na zásobník (oblouk sám zná jen cíl)
+        sources = [0] * indexed.m
+        bridges = []
+        blocks = []
+        time = 0
+
+        for root in range(n):
+            if disc[root] >= 0:
+                continue
+            disc[root] = low[root] = time
+            time += 1
+            root_children = 0
+            stack = [root]
+            # Zásobník oblouků (indexy do targets) aktuálně otevřených bloků
+            arcs = []
+            while stack:
+                u = stack[-1]
+                k = pointer[u]
+                if k < offsets[u + 1]:
+                    pointer[u] = k + 1
+                    e = edge_pos[k]
+                    if e == parent_edge[u]:
+                        continue
+                    v = targets[k]
+                    if disc[v] < 0:
+                        parent_edge[v] = e
+                        disc[v] = low[v] = time
+                        time += 1
+                        sources[k] = u
+                        arcs.append(k)
+                        stack.append(v)
+                        if u == root:
+                            root_children += 1
+                    elif disc[v] < disc[u]:
+                        # Zpětná hrana k předkovi
+                        if disc[v] < low[u]:
+                            low[u] = disc[v]
+                        sources[k] = u
+                        arcs.append(k)
+                    continue
+
+                stack.pop()
+                if not stack:
+                    break
+                p = stack[-1]
+                if low[u] < low[p]:
+                    low[p] = low[u]
+                if low[u] >= disc[p]:
+                    # p odděluje podstrom u - vyjmou se hrany bloku až po stromovou hranu p-u
+                    if p != root:
+                        is_articulation[p] = True
+                    block = []
+                    while True:
+                        a = arcs.pop()
+                        block.append(a)
+                        if edge_pos[a] == parent_edge[u] and targets[a] == u:
+                            break
+                    blocks.append(block)
+                    if low[u] > disc[p]:
+                        bridges.append(parent_edge[u])
+            if root_children > 1:
+                is_articulation[root] = True
+
+        return self._result(indexed, sources, bridges, is_articulation, blocks)
+
+    def _result(self, indexed, sources, bridges, is_articulation, blocks):
+        ids = indexed.ids
+        edges = self.graph.edges
+        targets, edge_pos = indexed.targets, indexed.edge_pos
+        block_nodes = []
+        block_edges = []
+        tree = []
+        for number, block in enumerate(blocks):
+            if len(block) == 1:
+                # Nejčastější případ - blok z jediné hrany (most)
+                a = block[0]
+                u, v = sources[a], targets[a]
+                ordered = (u, v) if u < v else (v, u)
+                block_edges.append([edges[edge_pos[a]]])
+            else:
+                members = set(targets[a] for a in block)
+                members.update(sources[a] for a in block)
+                ordered = sorted(members)
+                block_edges.append([edges[pos] for pos in sorted({edge_pos[a] for a in block})])
+            block_nodes.append([ids[u] for u in ordered])
+            for u in ordered:
+                if is_articulation[u]:
+                    tree.append((number, ids[u]))
+
+        return {
+            'bridges': [edges[pos] for pos in sorted(bridges)],
+            'articulation_points': [ids[u] for u in range(indexed.n) if is_articulation[u]],
+            'blocks': block_nodes,
+            'block_edges': block_edges,
+            'block_cut_tree': tree,
+        }
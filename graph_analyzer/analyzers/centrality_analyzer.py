@@ -0,0 +1,280 @@
+"""
+Analyzátor centrality uzlů a hran (betweenness).
+"""
+
+import heapq
+import math
+import operator
+import os
+import random
+
+from .path_analyzer import PathAnalyzer
+from ..utils.indexed_graph import IndexedGraph
+
+# Od tolika prohledaných oblouků (zdroje × oblouky) se vyplatí pracovní procesy
+PARALLEL_THRESHOLD = 5_000_000
+
+# Kvantil normálního rozdělení pro 95% interval spolehlivosti
+Z_95 = 1.959964
+
+
+def _forward_bfs(adj, s, n):
+    """Průchod do šířky se sčítáním nejkratších cest; vrátí (pořadí, vzdálenosti, sigma)."""
+    dist = [-1] * n
+    sigma = [0] * n
+    dist[s] = 0
+    sigma[s] = 1
+    order = [s]
+    # Seznam se během iterace prodlužuje - funguje jako fronta
+    for v in order:
+        next_dist = dist[v] + 1
+        sigma_v = sigma[v]
+        for w in adj[v]:
+            dw = dist[w]
+            if dw < 0:
+                dist[w] = next_dist
+                sigma[w] = sigma_v
+                order.append(w)
+            elif dw == next_dist:
+                sigma[w] += sigma_v
+    return order, dist, sigma
+
+
+def _forward_dijkstra(adj, weights, s, n):
+    """Dijkstrův algoritmus se sčítáním nejkratších cest; vrátí (pořadí, vzdálenosti, sigma)."""
+    dist = [math.inf] * n
+    sigma = [0] * n
+    settled = [False] * n
+    dist[s] = 0
+    sigma[s] = 1
+    order = []
+    heap = [(0, s)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = True
+        order.append(v)
+        sigma_v = sigma[v]
+        for w, weight in zip(adj[v], weights[v]):
+            if settled[w]:
+                continue
+            candidate = d + weight
+            if candidate < dist[w]:
+                dist[w] = candidate
+                sigma[w] = sigma_v
+                heapq.heappush(heap, (candidate, w))
+            elif candidate == dist[w]:
+                sigma[w] += sigma_v
+    return order, dist, sigma
+
+
+def _accumulate(sources, state, squares=False):
+    """
+    Sečte závislosti (dependency) pro dané zdroje.
+
+    Předchůdci na nejkratších cestách se neukládají; při zpětném průchodu se
+    najdou podle vzdáleností mezi obrácenými oblouky, což ušetří alokaci
+    seznamu pro každý uzel a zdroj.
+
+    Args:
+        sources (list): Indexy zdrojových uzlů
+        state (tuple): Pole grafu (viz CentralityAnalyzer.betweenness)
+        squares (bool): Sčítat i čtverce závislostí (pro odhad rozptylu)
+
+    Returns:
+        tuple: (součty pro uzly, součty čtverců pro uzly nebo None, součty pro hrany)
+    """
+    adj, weights, radj, rweights, redges, n, edge_count, weighted = state
+    node_sum = [0.0] * n
+    node_sq = [0.0] * n if squares else None
+    edge_sum = [0.0] * edge_count
+    for s in sources:
+        delta = [0.0] * n
+        if weighted:
+            order, dist, sigma = _forward_dijkstra(adj, weights, s, n)
+            for w in reversed(order):
+                coeff = (1.0 + delta[w]) / sigma[w]
+                dw = dist[w]
+                for v, weight, e in zip(radj[w], rweights[w], redges[w]):
+                    if dist[v] + weight == dw and v != w:
+                        c = sigma[v] * coeff
+                        edge_sum[e] += c
+                        delta[v] += c
+        else:
+            order, dist, sigma = _forward_bfs(adj, s, n)
+            for w in reversed(order):
+                coeff = (1.0 + delta[w]) / sigma[w]
+                previous = dist[w] - 1
+                for v, e in zip(radj[w], redges[w]):
+                    if dist[v] == previous:
+                        c = sigma[v] * coeff
+                        edge_sum[e] += c
+                        delta[v] += c
+        delta[s] = 0.0
+        node_sum = list(map(operator.add, node_sum, delta))
+        if squares:
+            node_sq = [q + d * d for q, d in zip(node_sq, delta)]
+    return node_sum, node_sq, edge_sum
+
+
+# ========== Pracovní procesy ==========
+
+_worker_state = None
+
+
+def _init_worker(state):
+    global _worker_state
+    _worker_state = state
+
+
+def _accumulate_in_worker(sources, squares):
+    return _accumulate(sources, _worker_state, squares)
+
+
+class CentralityAnalyzer:
+    """
+    Třída pro výpočet centrality uzlů a hran v grafu.
+
+    Closeness a harmonická centralita vychází ze statistik vzdáleností
+    PathAnalyzer.get_distance_profile (bitově paralelní BFS).
+
+    Betweenness se počítá Brandesovým algoritmem - z každého zdroje jeden
+    průchod do šířky (neohodnocený graf) nebo Dijkstra (ohodnocený graf)
+    a zpětné sčítání závislostí. Zdroje se mohou rozdělit mezi pracovní
+    procesy; pro velké grafy je k dispozici odhad z náhodného vzorku zdrojů
+    se směrodatnými chybami.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+
+    def betweenness(self, samples=None, seed=None, workers=None):
+        """
+        Spočítá betweenness centralitu uzlů a hran.
+
+        Hodnota uzlu v je součet podílů nejkratších cest s-t, které vedou
+        přes v (pro hrany obdobně). V neorientovaném grafu se každá dvojice
+        počítá jednou.
+
+        Args:
+            samples (int): Počet náhodně vybraných zdrojů pro odhad (None = přesný výpočet)
+            seed (int): Semínko generátoru náhodných čísel pro výběr zdrojů
+            workers (int): Počet pracovních procesů (None = automaticky podle velikosti)
+
+        Returns:
+            dict: {
+                'nodes': {uzel: hodnota},
+                'edges': [hodnota pro každou hranu v pořadí graph.edges],
+                'stderr': {uzel: směrodatná chyba odhadu} nebo None u přesného výpočtu,
+                'exact': bool, 'sources': počet zdrojů, 'method': 'BFS' | 'Dijkstra'
+            }
+
+        Raises:
+            ValueError: Záporná váha hrany (Dijkstra by dal chybné výsledky)
+                nebo počet vzorků menší než 1
+        """
+        if samples is not None and samples < 1:
+            raise ValueError(f"počet vzorků musí být alespoň 1 (zadáno {samples})")
+        indexed = IndexedGraph(self.graph)
+        n = indexed.n
+        weighted = self.graph.is_weighted
+        if weighted and any(w < 0 for w in indexed.weights):
+            raise ValueError("betweenness vyžaduje nezáporné váhy hran")
+        adj = indexed.adjacency_lists()
+        weights = indexed.weight_lists()
+        if self.graph.is_directed:
+            radj, rweights, redges = indexed.reverse_lists()
+        else:
+            # Neorientovaný graf má ke každému oblouku i opačný
+            radj, rweights, redges = adj, weights, indexed.edge_lists()
+        state = (adj, weights, radj, rweights, redges, n, len(self.graph.edges), weighted)
+
+        exact = samples is None or samples >= n
+        if exact:
+            sources = list(range(n))
+        else:
+            sources = random.Random(seed).sample(range(n), samples)
+
+        node_sum, node_sq, edge_sum = self._run(sources, state, indexed.m, workers, squares=not exact)
+
+        k = len(sources)
+        scale = 1.0 if exact else n / k
+        if not self.graph.is_directed:
+            # Dvojice s-t a t-s jsou v neorientovaném grafu stejné cesty
+            scale /= 2.0
+
+        stderr = None
+        if not exact:
+            # Výběr bez vracení - korekce na konečnou populaci
+            fpc = (n - k) / (n - 1) if n > 1 else 0.0
+            stderr = {}
+            for i, node_id in enumerate(indexed.ids):
+                mean = node_sum[i] / k
+                variance = max(node_sq[i] / k - mean * mean, 0.0) * k / max(k - 1, 1)
+                se = n * math.sqrt(variance / k * fpc)
+                stderr[node_id] = se / 2.0 if not self.graph.is_directed else se
+
+        return {
+            'nodes': {node_id: node_sum[i] * scale for i, node_id in enumerate(indexed.ids)},
+            'edges': [value * scale for value in edge_sum],
+            'stderr': stderr,
+            'exact': exact,
+            'sources': k,
+            'method': 'Dijkstra' if weighted else 'BFS',
+        }
+
+    def closeness(self):
+        """
+        Spočítá closeness a harmonickou centralitu uzlů.
+
+        Closeness uzlu x je (r / součet vzdáleností) * (r / (n - 1)), kde r je
+        počet uzlů dostupných z x (Wassermanova-Faustova úprava, aby byla
+        hodnota srovnatelná i v nesouvislém grafu). Harmonická centralita je
+        součet 1 / d(x, y) přes dostupné uzly y. Vzdálenosti se měří z uzlu.
+
+        Returns:
+            dict: {'closeness': {uzel: hodnota}, 'harmonic': {uzel: hodnota}}
+        """
+        profile = PathAnalyzer(self.graph).get_distance_profile()
+        others = len(profile['ids']) - 1
+        closeness = {}
+        for node_id, reached, total in zip(profile['ids'], profile['reached'], profile['dist_sum']):
+            closeness[node_id] = (reached / total) * (reached / others) if total > 0 else 0.0
+        return {
+            'closeness': closeness,
+            'harmonic': dict(zip(profile['ids'], profile['harmonic'])),
+        }
+
+    @staticmethod
+    def _run(sources, state, arc_count, workers, squares):
+        """Spustí sčítání závislostí sériově, nebo rozdělené mezi pracovní procesy."""
+        if workers is None:
+            work = len(sources) * max(arc_count, 1)
+            workers = (os.cpu_count() or 1) if work >= PARALLEL_THRESHOLD else 1
+        workers = min(workers, len(sources))
+        if workers <= 1:
+            return _accumulate(sources, state, squares)
+
+        # Pool se načítá až při paralelním výpočtu (multiprocessing zpomaluje start CLI)
+        from concurrent.futures import ProcessPoolExecutor
+        n, edge_count = state[5], state[6]
+        # Více bloků než procesů vyrovná rozdílnou délku průchodů
+        chunk_count = workers * 4
+        chunks = [sources[i::chunk_count] for i in range(chunk_count) if sources[i::chunk_count]]
+        node_sum = [0.0] * n
+        node_sq = [0.0] * n if squares else None
+        edge_sum = [0.0] * edge_count
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+            for part_sum, part_sq, part_edges in pool.map(_accumulate_in_worker, chunks, [squares] * len(chunks)):
+                node_sum = list(map(operator.add, node_sum, part_sum))
+                if squares:
+                    node_sq = list(map(operator.add, node_sq, part_sq))
+                edge_sum = list(map(operator.add, edge_sum, part_edges))
+        return node_sum, node_sq, edge_sum
@@ -0,0 +1,323 @@
+"""
+Analyzátor barvení grafu (hladové barvení, DSatur, přesné barvení).
+"""
+
+import heapq
+
+from ..utils.indexed_graph import IndexedGraph
+from .core_analyzer import CoreAnalyzer
+
+
+class ColoringAnalyzer:
+    """
+    Třída pro obarvení uzlů tak, aby sousední uzly měly různé barvy.
+
+    Barví se neorientovaný prostý graf reálných uzlů (orientace, násobné
+    hrany a placeholdery se ignorují). Smyčky se vynechají - uzel se
+    smyčkou by jinak obarvit nešlo. Barvy jsou čísla od 0.
+
+    Metody vrací slovník {
+        'colors': {uzel: barva}, 'count': počet barev, 'algorithm': název,
+        'lower_bound': velikost nalezené kliky (dolní mez chromatického čísla),
+        'clique': [uzly kliky], 'degeneracy': degenerace grafu,
+        'upper_bound': degenerace + 1 (horní mez z barvení podle degenerace),
+        'optimal': zda je počet barev prokazatelně nejmenší možný
+    }.
+    """
+
+    ALGORITHMS = ('largest-first', 'smallest-last', 'dsatur', 'exact')
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+        self._prepared = None
+
+    def _prepare(self):
+        """Seznamy sousedů bez duplicit, jádrová čísla, pořadí odebírání a klika (počítá se jednou)."""
+        if self._prepared is None:
+            indexed = IndexedGraph(self.graph, include=self.graph.is_real_node,
+                                   undirected=True, skip_loops=True)
+            adj = [list(set(targets)) for targets in indexed.adjacency_lists()]
+            cores, order = CoreAnalyzer.peel(adj)
+            clique = self._greedy_clique(adj, cores, order)
+            self._prepared = indexed, adj, cores, order, clique
+        return self._prepared
+
+    @staticmethod
+    def _greedy_clique(adj, cores, order):
+        """
+        Hladově najde velkou kliku (dolní mez chromatického čísla).
+
+        Pro každý uzel se klika staví jen z jeho sousedů, kteří jsou
+        v pořadí odebírání za ním - těch je nejvýš tolik, kolik je jeho
+        jádrové číslo. Jádrová čísla v pořadí odebírání neklesají, takže
+        od konce se končí u prvního uzlu, který dosavadní kliku překonat
+        nemůže.
+        """
+        n = len(adj)
+        rank = [0] * n
+        for i, v in enumerate(order):
+            rank[v] = i
+        best = [order[-1]] if n else []
+        for v in reversed(order):
+            if cores[v] + 1 <= len(best):
+                break
+            rv = rank[v]
+            candidates = [u for u in adj[v] if rank[u] > rv]
+            clique = [v]
+            while candidates and len(clique) + len(candidates) > len(best):
+                u = max(candidates, key=cores.__getitem__)
+                clique.append(u)
+                neighbors = set(adj[u])
+                candidates = [w for w in candidates if w in neighbors]
+            if len(clique) > len(best):
+                best = clique
+        return best
+
+    def _result(self, colors, algorithm, optimal=False):
+        indexed, adj, cores, order, clique = self._prepare()
+        count = max(colors, default=-1) + 1
+        degeneracy = max(cores, default=0)
+        return {
+            'colors': dict(zip(indexed.ids, colors)),
+            'count': count,
+            'algorithm': algorithm,
+            'lower_bound': len(clique),
+            'clique': [indexed.ids[v] for v in clique],
+            'degeneracy': degeneracy,
+            'upper_bound': degeneracy + 1 if indexed.n else 0,
+            'optimal': optimal or count == len(clique),
+        }
+
+    @staticmethod
+    def _greedy(adj, sequence):
+        """Obarví uzly v daném pořadí nejmenší barvou, kterou nemá žádný soused (O(n + m))."""
+        colors = [-1] * len(adj)
+        # Značka barev sousedů: mark[c] == v znamená, že barvu c má soused uzlu v
+        mark = [-1] * (len(adj) + 1)
+        for v in sequence:
+            for u in adj[v]:
+                c = colors[u]
+                if c >= 0:
+                    mark[c] = v
+            c = 0
+            while mark[c] == v:
+                c += 1
+            colors[v] = c
+        return colors
+
+    def greedy(self, strategy='largest-first'):
+        """
+        Hladové barvení v pořadí daném strategií.
+
+        Args:
+            strategy (str): 'largest-first' - od největšího stupně, nebo
+                'smallest-last' - opačné pořadí odebírání uzlů nejmenšího
+                stupně; použije nejvýš degenerace + 1 barev
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed, adj, cores, order, clique = self._prepare()
+        if strategy == 'largest-first':
+            sequence = sorted(range(indexed.n), key=lambda v: -len(adj[v]))
+        elif strategy == 'smallest-last':
+            sequence = order[::-1]
+        else:
+            raise ValueError(f"neznámé pořadí barvení: {strategy}")
+        return self._result(self._greedy(adj, sequence), strategy)
+
+    @staticmethod
+    def _dsatur(adj):
+        """
+        Barvy uzlů podle DSatur.
+
+        Přihrádky podle saturace (počtu různých barev sousedů) jsou haldy
+        podle stupně. Saturace jen roste, takže se uzel při zvýšení vloží
+        do vyšší přihrádky a starý záznam se zahodí až při výběru.
+        """
+        n = len(adj)
+        colors = [-1] * n
+        seen = {}
+        buckets = [[(-len(adj[v]), v) for v in range(n)]]
+        heapq.heapify(buckets[0])
+        mark = [-1] * (n + 1)
+        top = 0
+        saturation = [0] * n
+        while top >= 0:
+            bucket = buckets[top]
+            if not bucket:
+                top -= 1
+                continue
+            _, v = heapq.heappop(bucket)
+            if colors[v] >= 0 or saturation[v] != top:
+                continue
+            for u in adj[v]:
+                c = colors[u]
+                if c >= 0:
+                    mark[c] = v
+            c = 0
+            while mark[c] == v:
+                c += 1
+            colors[v] = c
+            for u in adj[v]:
+                if colors[u] >= 0:
+                    continue
+                used = seen.get(u)
+                if used is None:
+                    used = seen[u] = set()
+                if c not in used:
+                    used.add(c)
+                    s = len(used)
+                    saturation[u] = s
+                    if s == len(buckets):
+                        buckets.append([])
+                    heapq.heappush(buckets[s], (-len(adj[u]), u))
+                    if s > top:
+                        top = s
+            seen.pop(v, None)
+        return colors
+
+    def dsatur(self):
+        """
+        Barvení algoritmem DSatur v O((n + m) log n).
+
+        Vždy se obarví neobarvený uzel s nejvíce různými barvami mezi
+        sousedy (při shodě s největším stupněm) nejmenší volnou barvou.
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed, adj, cores, order, clique = self._prepare()
+        return self._result(self._dsatur(adj), 'dsatur')
+
+    def exact(self, max_nodes=64):
+        """
+        Optimální barvení metodou větví a mezí nad bitovými množinami.
+
+        Každá komponenta se barví zvlášť. Horní mez dá DSatur, dolní mez
+        klika v komponentě; prohledávání barví uzel s největší saturací
+        všemi přípustnými barvami a novou barvu zkusí jen tehdy, když by
+        ještě mohla zlepšit dosavadní nejlepší řešení. Třídy barev
+        i sousedé jsou celá čísla použitá jako bitové množiny.
+
+        Args:
+            max_nodes (int): Největší povolená velikost komponenty
+
+        Returns:
+            dict: Viz dokumentace třídy
+
+        Raises:
+            ValueError: Některá komponenta je větší než max_nodes
+        """
+        indexed, adj, cores, order, clique = self._prepare()
+        colors = self._dsatur(adj)
+        seen = [False] * indexed.n
+        for root in range(indexed.n):
+            if seen[root]:
+                continue
+            seen[root] = True
+            component = [root]
+            for v in component:
+                for u in adj[v]:
+                    if not seen[u]:
+                        seen[u] = True
+                        component.append(u)
+            if len(component) > max_nodes:
+                raise ValueError(f"přesné barvení je omezené na komponenty do {max_nodes} uzlů "
+                                 f"(komponenta má {len(component)})")
+            for v, c in zip(component, self._exact_component(adj, component, colors)):
+                colors[v] = c
+        return self._result(colors, 'exact', optimal=True)
+
+    @staticmethod
+    def _exact_component(adj, component, colors):
+        """Optimální barvy uzlů komponenty (v pořadí `component`); `colors` je počáteční řešení."""
+        k = len(component)
+        local = {v: i for i, v in enumerate(component)}
+        neighbors = [0] * k
+        for i, v in enumerate(component):
+            for u in adj[v]:
+                neighbors[i] |= 1 << local[u]
+        degree = [bin(mask).count('1') for mask in neighbors]
+
+        best = [colors[v] for v in component]
+        best_count = max(best) + 1
+        # Dolní mez - hladová klika v komponentě od uzlů nejvyššího stupně
+        lower = 0
+        for i in sorted(range(k), key=lambda i: -degree[i]):
+            if degree[i] + 1 <= lower:
+                break
+            members = 1 << i
+            candidates = neighbors[i]
+            size = 1
+            while candidates:
+                j = max((j for j in range(k) if candidates >> j & 1), key=lambda j: degree[j])
+                members |= 1 << j
+                candidates &= neighbors[j]
+                size += 1
+            lower = max(lower, size)
+        if best_count <= lower:
+            return best
+
+        assignment = [-1] * k
+        classes = []
+
+        def search(remaining):
+            nonlocal best, best_count
+            if remaining == 0:
+                best = assignment[:]
+                best_count = len(classes)
+                return best_count <= lower
+            if len(classes) >= best_count:
+                return False
+            # Uzel s největší saturací, při shodě s největším stupněm
+            pick, pick_key = -1, None
+            for i in range(k):
+                if assignment[i] < 0:
+                    mask = neighbors[i]
+                    key = (sum(1 for members in classes if members & mask), degree[i])
+                    if pick_key is None or key > pick_key:
+                        pick, pick_key = i, key
+            bit = 1 << pick
+            mask = neighbors[pick]
+            for c, members in enumerate(classes):
+                if not members & mask:
+                    classes[c] = members | bit
+                    assignment[pick] = c
+                    if search(remaining - 1):
+                        return True
+                    classes[c] = members
+            if len(classes) + 1 < best_count:
+                classes.append(bit)
+                assignment[pick] = len(classes) - 1
+                if search(remaining - 1):
+                    return True
+                classes.pop()
+            assignment[pick] = -1
+            return False
+
+        search(k)
+        return best
+
+    def color(self, algorithm='dsatur', max_nodes=64):
+        """
+        Obarví graf zvoleným algoritmem.
+
+        Args:
+            algorithm (str): 'largest-first', 'smallest-last', 'dsatur' nebo 'exact'
+            max_nodes (int): Pro 'exact' největší povolená velikost komponenty
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        if algorithm == 'dsatur':
+            return self.dsatur()
+        if algorithm == 'exact':
+            return self.exact(max_nodes)
+        return self.greedy(algorithm)
@@ -0,0 +1,258 @@
+"""
+Analyzátor komunit grafu (Louvain, šíření značek).
+"""
+
+import random
+from collections import deque
+
+from ..utils.indexed_graph import IndexedGraph
+
+# Minimální přírůstek modularity (vůči celkové váze), pro který se uzel přesune
+_MIN_GAIN = 1e-12
+
+
+class CommunityAnalyzer:
+    """
+    Třída pro hledání komunit na váženém neorientovaném grafu.
+
+    Graf se převede na pole indexovaná čísly uzlů (IndexedGraph); orientace
+    se ignoruje, váha hrany je síla vazby (neohodnocená hrana má váhu 1),
+    smyčky, nečíselné váhy a placeholder uzly se vynechají.
+
+    Každá metoda vrací slovník {
+        'communities': {uzel: číslo komunity}, 'sizes': [velikost komunity],
+        'count': počet komunit, 'modularity': modularita rozkladu
+    } doplněný o údaje o průběhu výpočtu. Komunity jsou číslovány od
+    největší.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+
+    def _prepare(self):
+        indexed = IndexedGraph(self.graph, include=self.graph.is_real_node,
+                               undirected=True, skip_loops=True)
+        if any(w < 0 for w in indexed.weights):
+            raise ValueError("hledání komunit vyžaduje nezáporné váhy hran")
+        adj = indexed.adjacency_lists()
+        weights = [[float(w) for w in row] for row in indexed.weight_lists()]
+        return indexed, adj, weights
+
+    @staticmethod
+    def _modularity(adj, weights, membership, resolution=1.0):
+        """Modularita rozkladu `membership` (seznam čísel komunit podle indexu uzlu)."""
+        inner = {}
+        total = {}
+        m2 = 0.0
+        for i, (targets, row) in enumerate(zip(adj, weights)):
+            c = membership[i]
+            k = 0.0
+            for j, w in zip(targets, row):
+                k += w
+                if membership[j] == c:
+                    inner[c] = inner.get(c, 0.0) + w
+            total[c] = total.get(c, 0.0) + k
+            m2 += k
+        if m2 == 0:
+            return 0.0
+        return sum(inner.values()) / m2 - resolution * sum((t / m2) ** 2 for t in total.values())
+
+    def _result(self, indexed, membership, adj, weights, resolution=1.0):
+        # Přečíslování podle velikosti komunity (při shodě podle prvního uzlu)
+        members = {}
+        for i, c in enumerate(membership):
+            members.setdefault(c, []).append(i)
+        ordered = sorted(members.values(), key=lambda nodes: (-len(nodes), nodes[0]))
+        labels = [0] * indexed.n
+        for label, nodes in enumerate(ordered):
+            for i in nodes:
+                labels[i] = label
+        return {
+            'communities': dict(zip(indexed.ids, labels)),
+            'sizes': [len(nodes) for nodes in ordered],
+            'count': len(ordered),
+            'modularity': self._modularity(adj, weights, labels, resolution),
+        }
+
+    def modularity(self, communities, resolution=1.0):
+        """
+        Spočítá modularitu zadaného rozkladu.
+
+        Args:
+            communities (dict): {uzel: komunita}; chybějící uzly tvoří samostatné komunity
+            resolution (float): Rozlišení (gamma); větší hodnota upřednostní menší komunity
+
+        Returns:
+            float: Modularita Q
+        """
+        indexed, adj, weights = self._prepare()
+        membership = [communities.get(node_id, ('*', node_id)) for node_id in indexed.ids]
+        return self._modularity(adj, weights, membership, resolution)
+
+    def louvain(self, resolution=1.0, seed=None):
+        """
+        Najde komunity Louvainovou metodou.
+
+        Každá úroveň prochází uzly v náhodném pořadí a přesouvá je do
+        sousední komunity s největším přírůstkem modularity; po přesunu
+        se do fronty vrátí jeho sousedé. Když je fronta prázdná, komunity
+        se sloučí do uzlů nového (menšího) grafu a postup se opakuje,
+        dokud se něco mění.
+        Uzly, komunity i sloučené grafy jsou celočíselné seznamy indexů.
+
+        Args:
+            resolution (float): Rozlišení (gamma)
+            seed (int): Semínko náhodného pořadí průchodu (opakovatelné výsledky)
+
+        Returns:
+            dict: Viz dokumentace třídy a navíc 'levels' - modularita po každé úrovni
+        """
+        indexed, adj, weights = self._prepare()
+        rng = random.Random(seed)
+
+        # Graf aktuální úrovně: sousedé bez smyček, váhy a vnitřní váha uzlu
+        # (součet oblouků uvnitř, tj. dvojnásobek vah vnitřních hran)
+        level_adj, level_weights = adj, weights
+        loops = [0.0] * indexed.n
+        membership = list(range(indexed.n))
+        levels = []
+        m2 = sum(sum(row) for row in weights)
+
+        while m2 > 0:
+            n = len(level_adj)
+            strength = [sum(row) + loop for row, loop in zip(level_weights, loops)]
+            comm = list(range(n))
+            total = strength[:]
+            threshold = _MIN_GAIN * m2
+            moved = False
+
+            # Fronta aktivních uzlů: po přesunu uzlu se znovu projdou jen
+            # jeho sousedé mimo cílovou komunitu, ostatním se zisk nezměnil
+            order = list(range(n))
+            rng.shuffle(order)
+            queue = deque(order)
+            queued = [True] * n
+            while queue:
+                i = queue.popleft()
+                queued[i] = False
+                targets = level_adj[i]
+                if not targets:
+                    continue
+                ci = comm[i]
+                links = {}
+                for j, w in zip(targets, level_weights[i]):
+                    cj = comm[j]
+                    links[cj] = links.get(cj, 0.0) + w
+                scale = resolution * strength[i] / m2
+                total[ci] -= strength[i]
+                stay = links.get(ci, 0.0) - scale * total[ci]
+                best, best_gain = ci, stay
+                for c, w in links.items():
+                    gain = w - scale * total[c]
+                    if gain > best_gain:
+                        best, best_gain = c, gain
+                if best_gain - stay <= threshold:
+                    best = ci
+                total[best] += strength[i]
+                if best != ci:
+                    comm[i] = best
+                    moved = True
+                    for j in targets:
+                        if not queued[j] and comm[j] != best:
+                            queued[j] = True
+                            queue.append(j)
+
+            if not moved:
+                break
+
+            # Sloučení komunit do uzlů dalšího grafu
+            renumber = {}
+            for c in comm:
+                if c not in renumber:
+                    renumber[c] = len(renumber)
+            comm = [renumber[c] for c in comm]
+            membership = [comm[c] for c in membership]
+            size = len(renumber)
+            merged = [{} for _ in range(size)]
+            new_loops = [0.0] * size
+            for i in range(n):
+                ci = comm[i]
+                new_loops[ci] += loops[i]
+                row = merged[ci]
+                for j, w in zip(level_adj[i], level_weights[i]):
+                    cj = comm[j]
+                    if cj == ci:
+                        new_loops[ci] += w
+                    else:
+                        row[cj] = row.get(cj, 0.0) + w
+            level_adj = [list(row) for row in merged]
+            level_weights = [list(row.values()) for row in merged]
+            loops = new_loops
+            levels.append(self._modularity(adj, weights, membership, resolution))
+            if size == n:
+                break
+
+        result = self._result(indexed, membership, adj, weights, resolution)
+        result['levels'] = levels
+        return result
+
+    def label_propagation(self, seed=None, max_iter=100):
+        """
+        Najde komunity asynchronním šířením značek.
+
+        Na začátku má každý uzel vlastní značku. V každém kole se uzly
+        v náhodném pořadí přepnou na značku s největší celkovou vahou
+        mezi sousedy (shody rozhoduje náhoda, současná značka se ponechá,
+        pokud je mezi nejlepšími). Znovu se prochází jen uzly, v jejichž
+        okolí se značka změnila; výpočet končí, když takové nejsou.
+
+        Args:
+            seed (int): Semínko náhodného generátoru (opakovatelné výsledky)
+            max_iter (int): Maximální počet kol
+
+        Returns:
+            dict: Viz dokumentace třídy a navíc 'iterations' a 'converged'
+        """
+        indexed, adj, weights = self._prepare()
+        rng = random.Random(seed)
+        labels = list(range(indexed.n))
+        # V dalším kole se projdou jen uzly, jejichž soused změnil značku
+        active = [i for i in range(indexed.n) if adj[i]]
+        pending = [False] * indexed.n
+        iterations = 0
+
+        while active and iterations < max_iter:
+            iterations += 1
+            rng.shuffle(active)
+            for i in active:
+                pending[i] = False
+            changed = []
+            for i in active:
+                counts = {}
+                for j, w in zip(adj[i], weights[i]):
+                    label = labels[j]
+                    counts[label] = counts.get(label, 0.0) + w
+                best = max(counts.values())
+                if counts.get(labels[i]) == best:
+                    continue
+                candidates = [label for label, w in counts.items() if w == best]
+                labels[i] = candidates[0] if len(candidates) == 1 else rng.choice(candidates)
+                changed.append(i)
+            active = []
+            for i in changed:
+                label = labels[i]
+                for j in adj[i]:
+                    if not pending[j] and labels[j] != label:
+                        pending[j] = True
+                        active.append(j)
+
+        result = self._result(indexed, labels, adj, weights)
+        result['iterations'] = iterations
+        result['converged'] = not active
+        return result
@@ -0,0 +1,329 @@
+"""
+Analyzátor acyklických orientovaných grafů (topologické uspořádání, cesty v DAG).
+"""
+
+from ..utils.indexed_graph import arc_weight
+
+
+class DagAnalyzer:
+    """
+    Třída pro algoritmy nad acyklickými orientovanými grafy (DAG).
+
+    Oblouky odpovídají `graph.adj` - neorientovaná hrana je tedy oblouk
+    v obou směrech a tvoří cyklus délky 2, smyčka cyklus délky 1. Délka
+    oblouku je váha hrany (neohodnocená hrana má délku 1); hrany
+    s nečíselnou váhou se do uspořádání počítají, ale cesty po nich
+    nevedou. Záporné váhy jsou v DAG povolené.
+
+    Topologické uspořádání se spočítá jednou a sdílí ho všechny metody;
+    po změně grafu je potřeba vytvořit nový analyzátor.
+    """
+
+    def __init__(self, graph, include=None):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+            include (callable): Predikát nad identifikátorem uzlu (None = všechny uzly)
+        """
+        self.graph = graph
+        self.include = include
+        self._ids = None
+        self._order = None
+        self._cycle = None
+
+    def _build(self):
+        """Seznamy následníků a délek oblouků nad indexy uzlů (nečíselná váha = None)."""
+        include = self.include
+        self._ids = [node_id for node_id in self.graph.nodes if include is None or include(node_id)]
+        self._index = {node_id: i for i, node_id in enumerate(self._ids)}
+        index = self._index
+        self._targets = []
+        self._weights = []
+        adj = self.graph.adj
+        for node_id in self._ids:
+            targets = []
+            weights = []
+            for entry in adj.get(node_id, ()):
+                j = index.get(entry.v.identifier)
+                if j is not None:
+                    targets.append(j)
+                    weights.append(arc_weight(entry.weight))
+            self._targets.append(targets)
+            self._weights.append(weights)
+
+    def _sort(self):
+        """Kahnův algoritmus; vrátí (identifikátory, pořadí indexů, cyklus jako seznam indexů nebo None)."""
+        if self._ids is not None:
+            return self._ids, self._order, self._cycle
+
+        self._build()
+        n = len(self._ids)
+        adjacency = self._targets
+        indegree = [0] * n
+        for targets in adjacency:
+            for v in targets:
+                indegree[v] += 1
+
+        order = [u for u in range(n) if indegree[u] == 0]
+        # Seznam slouží zároveň jako fronta - čte se od začátku, přidává na konec
+        for u in order:
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+
+        cycle = None
+        if len(order) < n:
+            cycle = self._find_cycle(adjacency, indegree)
+
+        self._order, self._cycle = order, cycle
+        return self._ids, order, cycle
+
+    @staticmethod
+    def _find_cycle(adjacency, indegree):
+        """
+        Najde cyklus mezi uzly, které Kahnův algoritmus nevyřadil.
+
+        Každý takový uzel má nevyřazeného předchůdce, takže chůze po
+        předchůdcích se musí zacyklit.
+        """
+        n = len(adjacency)
+        predecessor = [-1] * n
+        for u in range(n):
+            if indegree[u] == 0:
+                continue
+            for v in adjacency[u]:
+                if indegree[v] > 0:
+                    predecessor[v] = u
+
+        u = next(u for u in range(n) if indegree[u] > 0)
+        seen = [False] * n
+        while not seen[u]:
+            seen[u] = True
+            u = predecessor[u]
+        cycle = [u]
+        v = predecessor[u]
+        while v != u:
+            cycle.append(v)
+            v = predecessor[v]
+        cycle.append(u)
+        cycle.reverse()
+        return cycle
+
+    def topological_sort(self):
+        """
+        Topologicky uspořádá uzly Kahnovým algoritmem (bez rekurze).
+
+        Returns:
+            dict: {
+                'is_dag': bool,
+                'order': uzly v topologickém pořadí (u grafu s cyklem jen ty,
+                    které na žádném cyklu ani za ním neleží),
+                'cycle': svědek cyklu [A, B, ..., A] nebo None
+            }
+        """
+        ids, order, cycle = self._sort()
+        return {
+            'is_dag': cycle is None,
+            'order': [ids[u] for u in order],
+            'cycle': None if cycle is None else [ids[u] for u in cycle],
+        }
+
+    def is_dag(self):
+        """Zjistí, zda je graf acyklický."""
+        return self._sort()[2] is None
+
+    def _require_dag(self):
+        ids, order, cycle = self._sort()
+        if cycle is not None:
+            raise ValueError("graf obsahuje cyklus: " + " → ".join(str(ids[u]) for u in cycle))
+        return ids, order
+
+    def _relax(self, sources, longest, reverse=False):
+        """
+        Relaxace oblouků v topologickém pořadí (O(n + m)).
+
+        Args:
+            sources (list): Indexy počátečních uzlů (vzdálenost 0)
+            longest (bool): Hledat nejdelší místo nejkratších cest
+            reverse (bool): Procházet obrácené oblouky (vzdálenosti do uzlů)
+
+        Returns:
+            tuple: (vzdálenosti - None pro nedosažitelné, předchůdci - -1 pro žádného)
+        """
+        ids, order = self._require_dag()
+        n = len(ids)
+        dist = [None] * n
+        previous = [-1] * n
+        for s in sources:
+            dist[s] = 0
+        adjacency, weights = self._targets, self._weights
+        if reverse:
+            adjacency = [[] for _ in range(n)]
+            weights = [[] for _ in range(n)]
+            for u in range(n):
+                for v, w in zip(self._targets[u], self._weights[u]):
+                    adjacency[v].append(u)
+                    weights[v].append(w)
+            order = order[::-1]
+        for u in order:
+            du = dist[u]
+            if du is None:
+                continue
+            for v, w in zip(adjacency[u], weights[u]):
+                if w is None:
+                    continue
+                d = du + w
+                dv = dist[v]
+                if dv is None or (d > dv if longest else d < dv):
+                    dist[v] = d
+                    previous[v] = u
+        return dist, previous
+
+    def _paths(self, source, longest):
+        """
+        Cesty z jednoho uzlu Kahnovým algoritmem jen nad částí grafu dosažitelnou ze source.
+
+        Nejdřív se projde dosažitelná část a spočítají se v ní vstupní
+        stupně, pak se oblouky relaxují v topologickém pořadí. Práce je
+        úměrná dosažitelné části, ne celému grafu.
+        """
+        include = self.include
+        if source not in self.graph.nodes or (include is not None and not include(source)):
+            raise ValueError(f"uzel '{source}' neexistuje v grafu")
+        adj = self.graph.adj
+
+        indegree = {source: 0}
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for entry in adj.get(u, ()):
+                v = entry.v.identifier
+                if v in indegree:
+                    indegree[v] += 1
+                elif include is None or include(v):
+                    indegree[v] = 1
+                    stack.append(v)
+
+        distances = {source: 0}
+        previous = {}
+        order = [source] if indegree[source] == 0 else []
+        for u in order:
+            du = distances.get(u)
+            for entry in adj.get(u, ()):
+                v = entry.v.identifier
+                if v not in indegree:
+                    continue
+                w = arc_weight(entry.weight)
+                if du is not None and w is not None:
+                    d = du + w
+                    dv = distances.get(v)
+                    if dv is None or (d > dv if longest else d < dv):
+                        distances[v] = d
+                        previous[v] = u
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+
+        if len(order) < len(indegree):
+            # Cyklus v dosažitelné části - svědka najde uspořádání celého grafu
+            self._require_dag()
+        return {'distances': distances, 'previous': previous}
+
+    def shortest_paths(self, source):
+        """
+        Nejkratší cesty z uzlu relaxací v topologickém pořadí (bez haldy).
+
+        Acyklická musí být jen část grafu dosažitelná ze source.
+
+        Args:
+            source (str): Počáteční uzel
+
+        Returns:
+            dict: {'distances': {uzel: vzdálenost}, 'previous': {uzel: předchůdce}}
+                jen pro uzly dosažitelné ze source
+
+        Raises:
+            ValueError: Ze source je dosažitelný cyklus nebo uzel neexistuje
+        """
+        return self._paths(source, longest=False)
+
+    def longest_paths(self, source):
+        """
+        Nejdelší cesty z uzlu relaxací v topologickém pořadí.
+
+        Args:
+            source (str): Počáteční uzel
+
+        Returns:
+            dict: Stejný tvar jako shortest_paths()
+
+        Raises:
+            ValueError: Ze source je dosažitelný cyklus nebo uzel neexistuje
+        """
+        return self._paths(source, longest=True)
+
+    @staticmethod
+    def path_to(previous, target):
+        """
+        Zrekonstruuje cestu ze slovníku předchůdců.
+
+        Args:
+            previous (dict): {uzel: předchůdce} z shortest_paths()/longest_paths()
+            target (str): Cílový uzel (musí být dosažitelný)
+
+        Returns:
+            list: Uzly cesty od počátku do target
+        """
+        path = [target]
+        while path[-1] in previous:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return path
+
+    def critical_path(self):
+        """
+        Analýza kritické cesty (CPM) - váhy hran jsou doby trvání činností.
+
+        Nejdřívější začátek uzlu je nejdelší cesta do něj z libovolného
+        zdroje, nejpozdější začátek je délka projektu minus nejdelší cesta
+        z uzlu do libovolného stoku. Uzly s nulovou rezervou leží na
+        kritické cestě.
+
+        Returns:
+            dict: {
+                'length': délka kritické cesty,
+                'path': uzly jedné kritické cesty,
+                'earliest': {uzel: nejdřívější začátek},
+                'latest': {uzel: nejpozdější začátek},
+                'slack': {uzel: rezerva}
+            }
+
+        Raises:
+            ValueError: Graf obsahuje cyklus
+        """
+        ids = self._require_dag()[0]
+        n = len(ids)
+        if n == 0:
+            return {'length': 0, 'path': [], 'earliest': {}, 'latest': {}, 'slack': {}}
+
+        everything = list(range(n))
+        earliest, previous = self._relax(everything, longest=True)
+        tail, _ = self._relax(everything, longest=True, reverse=True)
+        length = max(earliest)
+        end = max(range(n), key=lambda u: (earliest[u], -u))
+        path = [end]
+        while previous[path[-1]] >= 0:
+            path.append(previous[path[-1]])
+        path.reverse()
+
+        latest = [length - tail[u] for u in range(n)]
+        return {
+            'length': length,
+            'path': [ids[u] for u in path],
+            'earliest': dict(zip(ids, earliest)),
+            'latest': dict(zip(ids, latest)),
+            'slack': {ids[u]: latest[u] - earliest[u] for u in range(n)},
+        }
@@ -0,0 +1,201 @@
+"""
+Analyzátor eulerovských tahů a okruhů.
+"""
+
+class EulerAnalyzer:
+    """
+    Třída pro hledání eulerovského okruhu nebo tahu (každá hrana právě jednou).
+
+    Graf bez orientovaných hran se řeší jako neorientovaný, graf jen
+    s orientovanými hranami jako orientovaný. Smíšený graf (obojí druhy
+    hran) podporovaný není. Hrany se rozlišují podle pozice v
+    `graph.edges`, takže násobné hrany se projdou každá zvlášť; smyčka
+    přispívá ke stupni uzlu dvakrát (v orientovaném grafu jednou
+    k výstupnímu a jednou ke vstupnímu stupni). Váhy se nepoužívají
+    a hrany k placeholder uzlům se vynechají.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+
+    def _build(self):
+        """
+        Pole konců hran a stupňů uzlů nad indexy (jeden průchod hranami).
+
+        Returns:
+            tuple: (identifikátory, pozice hran, počátky, konce, stupně,
+                vstupní stupně - jen u orientovaného grafu, jinak None)
+        """
+        graph = self.graph
+        ids = list(filter(graph.is_real_node, graph.nodes))
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        positions = []
+        tails = []
+        heads = []
+        directed = graph.is_directed
+        for pos, edge in enumerate(graph.edges):
+            u = index.get(edge.u.identifier)
+            v = index.get(edge.v.identifier)
+            if u is None or v is None:
+                continue
+            if edge.direction == '-':
+                if directed:
+                    raise ValueError("eulerovský tah ve smíšeném grafu (orientované i neorientované hrany) není podporován")
+            elif edge.direction == '<':
+                u, v = v, u
+            positions.append(pos)
+            tails.append(u)
+            heads.append(v)
+
+        n = len(ids)
+        degree = [0] * n
+        for u in tails:
+            degree[u] += 1
+        in_degree = None
+        if directed:
+            in_degree = [0] * n
+            for v in heads:
+                in_degree[v] += 1
+        else:
+            for v in heads:
+                degree[v] += 1
+        return ids, positions, tails, heads, degree, in_degree
+
+    def analyze(self):
+        """
+        Zjistí, zda má graf eulerovský okruh nebo tah, a případně ho sestaví.
+
+        Podmínky stupňů se ověří nad předpočítaným polem stupňů:
+        neorientovaný graf smí mít 0 (okruh) nebo 2 (tah) uzly lichého
+        stupně, orientovaný graf musí mít všude výstupní stupeň roven
+        vstupnímu, nebo právě jeden uzel s přebytkem +1 (začátek tahu)
+        a jeden s -1 (konec). Souvislost hran ověří sama konstrukce -
+        pokud tah nepokryje všechny hrany, leží hrany ve více komponentách.
+
+        Returns:
+            dict: {
+                'directed': bool,
+                'type': 'circuit' | 'trail' | None (graf eulerovský není),
+                'reason': důvod, proč eulerovský není (jinak None),
+                'odd_nodes': uzly lichého stupně, resp. [(uzel, výstupní - vstupní stupeň)]
+                    nevyvážených uzlů orientovaného grafu,
+                'nodes': posloupnost uzlů okruhu/tahu ([] pokud neexistuje),
+                'edges': [Edge] hrany v pořadí průchodu
+            }
+
+        Raises:
+            ValueError: Smíšený graf
+        """
+        ids, positions, tails, heads, degree, in_degree = self._build()
+        directed = in_degree is not None
+        result = {'directed': directed, 'type': None, 'reason': None, 'odd_nodes': [], 'nodes': [], 'edges': []}
+
+        start = -1
+        if directed:
+            unbalanced = [u for u in range(len(ids)) if degree[u] != in_degree[u]]
+            result['odd_nodes'] = [(ids[u], degree[u] - in_degree[u]) for u in unbalanced]
+            if unbalanced:
+                surplus = sorted(degree[u] - in_degree[u] for u in unbalanced)
+                if surplus != [-1, 1]:
+                    result['reason'] = "výstupní a vstupní stupně uzlů nejsou vyrovnané"
+                    return result
+                start = next(u for u in unbalanced if degree[u] > in_degree[u])
+        else:
+            odd = [u for u in range(len(ids)) if degree[u] % 2]
+            result['odd_nodes'] = [ids[u] for u in odd]
+            if len(odd) > 2:
+                result['reason'] = f"graf má {len(odd)} uzlů lichého stupně"
+                return result
+            if odd:
+                start = odd[0]
+
+        m = len(positions)
+        if m == 0:
+            result['type'] = 'circuit'
+            return result
+        if start < 0:
+            start = next(u for u in range(len(ids)) if degree[u] > 0)
+
+        trail = self._hierholzer(len(ids), start, tails, heads, directed)
+        if len(trail) < m:
+            result['reason'] = "hrany grafu neleží v jedné komponentě"
+            return result
+
+        edges = self.graph.edges
+        u = start
+        nodes = [ids[u]]
+        for e in trail:
+            # Neorientovaná hrana se mohla projít proti zápisu
+            u = heads[e] if directed else tails[e] + heads[e] - u
+            nodes.append(ids[u])
+        result['type'] = 'circuit' if u == start else 'trail'
+        result['nodes'] = nodes
+        result['edges'] = [edges[positions[e]] for e in trail]
+        return result
+
+    @staticmethod
+    def _hierholzer(n, start, tails, heads, directed):
+        """
+        Iterativní Hierholzerův algoritmus v O(n + m).
+
+        Ze zásobníku se jde po dosud nepoužitých hranách, dokud to jde;
+        uzel bez volné hrany se přesune do výsledku. Každý uzel má ukazatel
+        na první neprozkoumanou hranu, takže se žádná hrana neprohlíží
+        víckrát.
+
+        Returns:
+            list: Indexy hran v pořadí průchodu ze `start`
+        """
+        m = len(tails)
+        count = [0] * (n + 1)
+        for u in tails:
+            count[u + 1] += 1
+        if not directed:
+            for v in heads:
+                count[v + 1] += 1
+        for u in range(n):
+            count[u + 1] += count[u]
+        fill = count[:n]
+        incident = [0] * count[n]
+        for e in range(m):
+            u = tails[e]
+            incident[fill[u]] = e
+            fill[u] += 1
+            if not directed:
+                # Smyčka se u svého uzlu objeví dvakrát, použije se jednou
+                v = heads[e]
+                incident[fill[v]] = e
+                fill[v] += 1
+
+        pointer = count[:n]
+        used = [False] * m
+        stack = [start]
+        via = [-1]
+        trail = []
+        while stack:
+            u = stack[-1]
+            i = pointer[u]
+            end = count[u + 1]
+            while i < end and used[incident[i]]:
+                i += 1
+            pointer[u] = i
+            if i < end:
+                e = incident[i]
+                used[e] = True
+                pointer[u] = i + 1
+                # Druhý konec hrany (u smyčky opět u)
+                stack.append(heads[e] if directed else tails[e] + heads[e] - u)
+                via.append(e)
+            else:
+                stack.pop()
+                e = via.pop()
+                if e >= 0:
+                    trail.append(e)
+        trail.reverse()
+        return trail
@@ -0,0 +1,349 @@
+"""
+Analyzátor maximálních toků a minimálních řezů.
+"""
+
+from collections import deque
+
+from ..utils.indexed_graph import IndexedGraph
+
+
+class _ResidualNetwork:
+    """
+    Reziduální síť v plochých polích.
+
+    Každá hrana grafu je dvojice reziduálních oblouků 2p (u -> v) a 2p + 1
+    (v -> u); opačný oblouk k oblouku a je tedy a ^ 1. Orientovaná hrana
+    má kapacitu jen v dopředném oblouku, neorientovaná v obou, takže
+    nepotřebuje dvě dvojice. Reziduální oblouky vycházející z uzlu u jsou
+    `arcs[start[u]:start[u + 1]]`. Kapacity se drží zvlášť (`capacity`),
+    aby šla síť pro další dotaz obnovit jedním zkopírováním pole.
+    """
+
+    def __init__(self, indexed, undirected_edges):
+        n = indexed.n
+        head = []
+        capacity = []
+        positions = []
+        paired = set()
+        offsets, targets, weights, edge_pos = indexed.offsets, indexed.targets, indexed.weights, indexed.edge_pos
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                pos = edge_pos[k]
+                both = pos in undirected_edges
+                if both:
+                    # Druhý oblouk neorientované hrany už dvojici má
+                    if pos in paired:
+                        continue
+                    paired.add(pos)
+                head += (targets[k], u)
+                capacity += (weights[k], weights[k] if both else 0)
+                positions.append(pos)
+
+        degree = [0] * n
+        for v in head:
+            degree[v] += 1
+        start = [0] * (n + 1)
+        for u in range(n):
+            start[u + 1] = start[u] + degree[u]
+        fill = start[:n]
+        arcs = [0] * len(head)
+        for a in range(len(head)):
+            u = head[a ^ 1]
+            arcs[fill[u]] = a
+            fill[u] += 1
+
+        self.n = n
+        self.head = head
+        self.capacity = capacity
+        self.positions = positions
+        self.start = start
+        self.arcs = arcs
+        self.residual = capacity[:]
+
+    def reset(self):
+        """Obnoví reziduální kapacity na původní (nulový tok)."""
+        self.residual[:] = self.capacity
+
+    def reaches(self, target):
+        """Vrátí příznaky uzlů, ze kterých vede do `target` cesta po reziduálních obloucích."""
+        head, residual, start, arcs = self.head, self.residual, self.start, self.arcs
+        seen = [False] * self.n
+        seen[target] = True
+        queue = deque([target])
+        while queue:
+            v = queue.popleft()
+            for i in range(start[v], start[v + 1]):
+                a = arcs[i]
+                u = head[a]
+                # Oblouk u -> v je opačný k oblouku a (v -> u)
+                if not seen[u] and residual[a ^ 1] > 0:
+                    seen[u] = True
+                    queue.append(u)
+        return seen
+
+    def dinic(self, s, t):
+        """Dinicův algoritmus: BFS vrstvy a blokující tok po cestách s aktuálním obloukem."""
+        n, head, residual, start, arcs = self.n, self.head, self.residual, self.start, self.arcs
+        total = 0
+        while True:
+            level = [-1] * n
+            level[s] = 0
+            queue = deque([s])
+            while queue and level[t] < 0:
+                u = queue.popleft()
+                for i in range(start[u], start[u + 1]):
+                    a = arcs[i]
+                    v = head[a]
+                    if level[v] < 0 and residual[a] > 0:
+                        level[v] = level[u] + 1
+                        queue.append(v)
+            if level[t] < 0:
+                return total
+
+            pointer = start[:n]
+            path = []
+            u = s
+            while True:
+                if u == t:
+                    flow = min(residual[a] for a in path)
+                    for a in path:
+                        residual[a] -= flow
+                        residual[a ^ 1] += flow
+                    total += flow
+                    # Návrat před první nasycený oblouk cesty
+                    for depth, a in enumerate(path):
+                        if residual[a] == 0:
+                            del path[depth:]
+                            break
+                    u = head[path[-1]] if path else s
+                    continue
+                end = start[u + 1]
+                i = pointer[u]
+                while i < end:
+                    a = arcs[i]
+                    v = head[a]
+                    if residual[a] > 0 and level[v] == level[u] + 1:
+                        break
+                    i += 1
+                pointer[u] = i
+                if i < end:
+                    path.append(a)
+                    u = v
+                    continue
+                # Slepá ulička - uzel se z vrstvené sítě vyřadí
+                if u == s:
+                    break
+                level[u] = -1
+                a = path.pop()
+                u = head[a ^ 1]
+                pointer[u] += 1
+
+    def push_relabel(self, s, t):
+        """
+        Push-relabel s výběrem aktivního uzlu s nejvyšší výškou.
+
+        Výšky se na začátku a vždy po n přeznačeních přepočítají zpětným
+        BFS z t (global relabeling). Uzly, ze kterých t není dosažitelné,
+        dostanou výšku n a dál se nezpracují - stačí první fáze algoritmu,
+        protože hodnota toku i řez jsou dané už přebytkem v t.
+        """
+        n, head, residual, start, arcs = self.n, self.head, self.residual, self.start, self.arcs
+        excess = [0] * n
+        height = [0] * n
+        pointer = start[:n]
+        buckets = [[] for _ in range(n)]
+        active = [False] * n
+        highest = -1
+
+        def global_relabel():
+            nonlocal highest
+            reach = [n] * n
+            reach[t] = 0
+            queue = deque([t])
+            while queue:
+                v = queue.popleft()
+                for i in range(start[v], start[v + 1]):
+                    a = arcs[i]
+                    u = head[a]
+                    if reach[u] == n and u != s and residual[a ^ 1] > 0:
+                        reach[u] = reach[v] + 1
+                        queue.append(u)
+            reach[s] = n
+            for bucket in buckets:
+                bucket.clear()
+            highest = -1
+            for u in range(n):
+                height[u] = reach[u]
+                pointer[u] = start[u]
+                active[u] = False
+                if excess[u] > 0 and u != t and reach[u] < n:
+                    active[u] = True
+                    buckets[reach[u]].append(u)
+                    highest = max(highest, reach[u])
+
+        for i in range(start[s], start[s + 1]):
+            a = arcs[i]
+            flow = residual[a]
+            if flow > 0:
+                residual[a] = 0
+                residual[a ^ 1] += flow
+                excess[head[a]] += flow
+                excess[s] -= flow
+        global_relabel()
+
+        relabels = 0
+        while highest >= 0:
+            bucket = buckets[highest]
+            if not bucket:
+                highest -= 1
+                continue
+            u = bucket.pop()
+            active[u] = False
+            end = start[u + 1]
+            hu = height[u]
+            while excess[u] > 0:
+                i = pointer[u]
+                if i == end:
+                    # Přeznačení na nejnižšího souseda s volnou kapacitou + 1
+                    hu = n
+                    for j in range(start[u], end):
+                        a = arcs[j]
+                        if residual[a] > 0 and height[head[a]] + 1 < hu:
+                            hu = height[head[a]] + 1
+                    height[u] = hu
+                    pointer[u] = start[u]
+                    relabels += 1
+                    if hu >= n:
+                        break
+                    continue
+                a = arcs[i]
+                v = head[a]
+                if residual[a] > 0 and height[v] + 1 == hu:
+                    flow = excess[u] if excess[u] < residual[a] else residual[a]
+                    residual[a] -= flow
+                    residual[a ^ 1] += flow
+                    excess[u] -= flow
+                    excess[v] += flow
+                    if not active[v] and v != t and v != s:
+                        active[v] = True
+                        buckets[hu - 1].append(v)
+                        if hu - 1 > highest:
+                            highest = hu - 1
+                    if excess[u] == 0:
+                        break
+                pointer[u] = i + 1
+            if excess[u] > 0 and hu < n:
+                active[u] = True
+                buckets[hu].append(u)
+                if hu > highest:
+                    highest = hu
+            if relabels >= n:
+                relabels = 0
+                global_relabel()
+        return excess[t]
+
+
+class FlowAnalyzer:
+    """
+    Třída pro výpočet maximálních toků a minimálních řezů.
+
+    Váhy hran jsou kapacity (neohodnocená hrana má kapacitu 1, takže tok
+    je pak počet hranově disjunktních cest). Orientovaná hrana je oblouk
+    ve směru orientace, neorientovaná hrana oblouk v každém směru. Smyčky,
+    nečíselné váhy a placeholder uzly se vynechají.
+
+    Reziduální síť se sestaví jednou při prvním dotazu a další dotazy
+    (i pro jiné dvojice uzlů) jen obnoví kapacity. Po změně grafu je
+    potřeba vytvořit nový analyzátor.
+    """
+
+    ALGORITHMS = ('dinic', 'push-relabel')
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+        self._indexed = None
+        self._network = None
+
+    def _prepare(self):
+        if self._network is None:
+            indexed = IndexedGraph(self.graph, include=self.graph.is_real_node,
+                                   skip_loops=True)
+            if any(w < 0 for w in indexed.weights):
+                raise ValueError("kapacity (váhy hran) musí být nezáporné")
+            undirected = {pos for pos, edge in enumerate(self.graph.edges) if edge.direction == '-'}
+            self._indexed = indexed
+            self._network = _ResidualNetwork(indexed, undirected)
+        return self._indexed, self._network
+
+    def max_flow(self, source, sink, algorithm='dinic'):
+        """
+        Spočítá maximální tok ze `source` do `sink` a minimální řez.
+
+        Řez je dán uzly, ze kterých po skončení výpočtu vede do `sink`
+        reziduální cesta; hrany řezu vedou z ostatních uzlů do nich a jsou
+        nasycené.
+
+        Args:
+            source (str): Zdroj
+            sink (str): Stok
+            algorithm (str): 'dinic' nebo 'push-relabel'
+
+        Returns:
+            dict: {
+                'value': hodnota maximálního toku (= kapacita řezu),
+                'cut_edges': [Edge] hrany minimálního řezu,
+                'source_side': [uzly na straně zdroje],
+                'algorithm': použitý algoritmus
+            }
+
+        Raises:
+            ValueError: Neznámý uzel nebo algoritmus, zdroj = stok, záporná kapacita
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"neznámý algoritmus toku: {algorithm}")
+        indexed, network = self._prepare()
+        for node_id in (source, sink):
+            if node_id not in indexed.index:
+                raise ValueError(f"uzel '{node_id}' neexistuje v grafu")
+        if source == sink:
+            raise ValueError("zdroj a stok musí být různé uzly")
+
+        s = indexed.index[source]
+        t = indexed.index[sink]
+        network.reset()
+        if algorithm == 'dinic':
+            value = network.dinic(s, t)
+        else:
+            value = network.push_relabel(s, t)
+
+        sink_side = network.reaches(t)
+        head, capacity = network.head, network.capacity
+        cut = [pos for a, pos in zip(range(0, len(head), 2), network.positions)
+               if (sink_side[head[a]] and not sink_side[head[a + 1]] and capacity[a] > 0)
+               or (sink_side[head[a + 1]] and not sink_side[head[a]] and capacity[a + 1] > 0)]
+        edges = self.graph.edges
+        return {
+            'value': value,
+            'cut_edges': [edges[pos] for pos in sorted(cut)],
+            'source_side': [node_id for node_id, reached in zip(indexed.ids, sink_side) if not reached],
+            'algorithm': algorithm,
+        }
+
+    def max_flows(self, pairs, algorithm='dinic'):
+        """
+        Spočítá maximální toky pro více dvojic uzlů nad jednou reziduální sítí.
+
+        Args:
+            pairs (iterable): Dvojice (zdroj, stok)
+            algorithm (str): 'dinic' nebo 'push-relabel'
+
+        Returns:
+            list: Výsledky max_flow() ve stejném pořadí
+        """
+        return [self.max_flow(source, sink, algorithm) for source, sink in pairs]
@@ -3,6 +3,57 @@ Analyzátor pro základní vlastnosti grafu.
 """
 
 import collections
+import os
+
+from ..utils.indexed_graph import IndexedGraph
+from .dag_analyzer import DagAnalyzer
+
+# Od tolika orientovaných hran se počítání trojúhelníků rozdělí mezi procesy
+TRIANGLE_PARALLEL_THRESHOLD = 2_000_000
+
+
+def _count_triangles(nodes, higher, lower):
+    """
+    Spočítá trojúhelníky uzlů s hranami orientovanými podle pořadí stupňů.
+
+    Trojúhelník u < v < w (v pořadí) se najde jednou pro u a v přes hranu
+    u -> v (w je v průniku vyšších sousedů obou) a jednou pro w přes hranu
+    u -> w (v je vyšší soused u a nižší soused w). Průniky jsou množinové
+    operace, na trojúhelník tedy nepřipadá žádná práce v Pythonu.
+
+    Args:
+        nodes (iterable): Indexy uzlů u, jejichž hrany se zpracují
+        higher (list): Množiny sousedů s vyšším pořadím
+        lower (list): Množiny sousedů s nižším pořadím
+
+    Returns:
+        dict: {index uzlu: počet trojúhelníků} (jen nenulové příspěvky)
+    """
+    counts = collections.Counter()
+    for u in nodes:
+        above = higher[u]
+        for v in above:
+            common = len(above & higher[v])
+            if common:
+                counts[u] += common
+                counts[v] += common
+            closing = len(above & lower[v])
+            if closing:
+                counts[v] += closing
+    return counts
+
+
+_worker_sets = None
+
+
+def _init_triangle_worker(higher, lower):
+    global _worker_sets
+    _worker_sets = (higher, lower)
+
+
+def _count_triangles_in_worker(nodes):
+    return _count_triangles(nodes, *_worker_sets)
+
 
 class GraphPropertiesAnalyzer:
     """
@@ -20,11 +71,11 @@ class GraphPropertiesAnalyzer:
 
     def _is_placeholder(self, node_id):
         """Return True if node_id represents a placeholder node (binary-tree skip markers)."""
-        return isinstance(node_id, str) and node_id.startswith('*')
+        return not self.graph.is_real_node(node_id)
 
     def _real_node_ids(self):
-        """Return set of node ids that are real (not placeholders)."""
-        return {nid for nid in self.graph.nodes if not self._is_placeholder(nid)}
+        """Return set of node ids that are real (not placeholders); maintained by the graph."""
+        return self.graph.real_node_ids()
 
     # Node-level helper methods (convenience API)
     def get_successors(self, node_id):
@@ -92,37 +143,8 @@ class GraphPropertiesAnalyzer:
     
     def is_connected_graph(self):
         """Zjistí, zda je graf souvislý (ignoruje placeholder uzly)."""
-        # FILTRUJ PLACEHOLDER UZLY
-        real_nodes = self._real_node_ids()
-        
-        if not real_nodes:
-            return True
-        
-        # ZAČNI OD PRVNÍHO SKUTEČNÉHO UZLU
-        start_node_id = next(iter(real_nodes))
-        visited = set()
-        queue = collections.deque([start_node_id])
-        visited.add(start_node_id)
-        
-        while queue:
-            current_node_id = queue.popleft()
-            
-            for edge in self.graph.adj[current_node_id]:
-                neighbor_id = edge.v.identifier
-                # POUZE SKUTEČNÉ UZLY
-                if neighbor_id in real_nodes and neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    queue.append(neighbor_id)
-            
-            if self.graph.is_directed:
-                for edge in self.graph.rev_adj[current_node_id]:
-                    neighbor_id = edge.u.identifier
-                    if neighbor_id in real_nodes and neighbor_id not in visited:
-                        visited.add(neighbor_id)
-                        queue.append(neighbor_id)
-        
-        # POROVNEJ S POČTEM SKUTEČNÝCH UZLŮ
-        return len(visited) == len(real_nodes)
+        # Komponenty udržuje graf inkrementálně, viz Graph.get_connectivity()
+        return self.graph.get_connectivity().is_connected()
 
     
     def is_complete_graph(self):
@@ -136,27 +158,8 @@ class GraphPropertiesAnalyzer:
         if self.graph.is_directed or self.graph.has_loops or self.graph.has_multiple_edges:
             return False
 
-        # Build unordered edge set between real nodes (frozenset of two node ids)
-        edge_set = set()
-        for e in self.graph.edges:
-            u_id = e.u.identifier
-            v_id = e.v.identifier
-            if u_id == v_id:
-                continue
-            if u_id in real_nodes and v_id in real_nodes:
-                edge_set.add(frozenset((u_id, v_id)))
-
-        expected_edges = num_nodes * (num_nodes - 1) // 2
-        if len(edge_set) != expected_edges:
-            return False
-
-        # Verify every unordered pair is present
-        real_list = list(real_nodes)
-        for i in range(num_nodes):
-            for j in range(i + 1, num_nodes):
-                if frozenset((real_list[i], real_list[j])) not in edge_set:
-                    return False
-        return True
+        # Prostý neorientovaný graf bez smyček: každá hrana mezi reálnými uzly je jiná dvojice
+        return self.graph.real_edge_count() == num_nodes * (num_nodes - 1) // 2
     
     def is_regular_graph(self):
         """Zjistí, zda je graf regulární (všechny uzly mají stejný stupeň)."""
@@ -164,41 +167,28 @@ class GraphPropertiesAnalyzer:
         if not real_nodes:
             return True
 
+        # Stupně přes hrany mezi reálnými uzly udržuje graf (Graph.real_degrees)
+        in_degrees, out_degrees = self.graph.real_degrees()
         if self.graph.is_directed:
             # Pro orientované grafy: k-regulární znamená stejný in-degree a out-degree pro všechny uzly
-            in_degrees = []
-            out_degrees = []
-            for node_id in real_nodes:
-                in_degree = len([e for e in self.graph.rev_adj.get(node_id, []) if e.u.identifier in real_nodes])
-                out_degree = len([e for e in self.graph.adj.get(node_id, []) if e.v.identifier in real_nodes])
-                in_degrees.append(in_degree)
-                out_degrees.append(out_degree)
-            
-            if not in_degrees or not out_degrees:
-                return True
-            
-            # Všechny uzly musí mít stejný vstupní stupeň a stejný výstupní stupeň
-            first_in_degree = in_degrees[0]
-            first_out_degree = out_degrees[0]
-            return (all(d == first_in_degree for d in in_degrees) and 
-                    all(d == first_out_degree for d in out_degrees))
+            return (len({in_degrees[node_id] for node_id in real_nodes}) == 1 and
+                    len({out_degrees[node_id] for node_id in real_nodes}) == 1)
         else:
             # Pro neorientované grafy: všechny uzly mají stejný stupeň
-            degrees = []
-            for node_id in real_nodes:
-                degrees.append(len([e for e in self.graph.adj.get(node_id, []) if e.v.identifier in real_nodes]))
-
-            if not degrees:
-                return True
-
-            first_degree = degrees[0]
-            return all(d == first_degree for d in degrees)
+            return len({out_degrees[node_id] for node_id in real_nodes}) == 1
     
     def is_bipartite_graph(self):
         """Zjistí, zda je graf bipartitní."""
-        if not self.graph.nodes:
-            return True
-        
+        return self.bipartition() is not None
+
+    def bipartition(self):
+        """
+        Obarví graf dvěma barvami průchodem do šířky (orientace hran se ignoruje).
+
+        Returns:
+            dict: {uzel: 0 nebo 1} - sousední uzly mají různou barvu;
+                None, pokud graf bipartitní není
+        """
         # Use BFS to color the graph with two colors
         color = {}
         for node_id in self.graph.nodes:
@@ -221,8 +211,8 @@ class GraphPropertiesAnalyzer:
                             color[v_id] = 1 - color[u_id]
                             queue.append(v_id)
                         elif color[v_id] == color[u_id]:
-                            return False
-        return True
+                            return None
+        return color
 
     def is_planar_graph(self):
         """
@@ -265,42 +255,8 @@ class GraphPropertiesAnalyzer:
         return True
     
     def count_components(self):
-        """Spočítá počet komponent grafu."""
-        if not self.graph.nodes:
-            return 0
-        
-        real_nodes = self._real_node_ids()
-        
-        if not real_nodes:
-            return 0
-
-        visited = set()
-        components = 0
-        
-        for node_id in real_nodes:
-            if node_id not in visited:
-                components += 1
-                queue = collections.deque([node_id])
-                visited.add(node_id)
-                
-                while queue:
-                    current_node_id = queue.popleft()
-
-                    for edge in self.graph.adj[current_node_id]:
-                        neighbor_id = edge.v.identifier
-
-                        if neighbor_id in real_nodes and neighbor_id not in visited:
-                            visited.add(neighbor_id)
-                            queue.append(neighbor_id)
-
-                    if self.graph.is_directed:
-                        for edge in self.graph.rev_adj[current_node_id]:
-                            neighbor_id = edge.u.identifier
-                            if neighbor_id not in visited:
-                                visited.add(neighbor_id)
-                                queue.append(neighbor_id)
-        
-        return components
+        """Spočítá počet komponent grafu (ignoruje placeholder uzly)."""
+        return self.graph.get_connectivity().component_count()
     
     def has_cycles(self):
         """Zjistí, zda graf obsahuje cykly."""
@@ -313,30 +269,8 @@ class GraphPropertiesAnalyzer:
             return self._has_cycles_undirected()
     
     def _has_cycles_directed(self):
-        """Detekce cyklů v orientovaném grafu pomocí DFS."""
-        WHITE, GRAY, BLACK = 0, 1, 2
-        # Only consider real nodes for cycle detection
-        real_nodes = self._real_node_ids()
-        color = {node_id: WHITE for node_id in real_nodes}
-
-        def dfs(node_id):
-            if color[node_id] == GRAY:
-                return True  # Back edge found, cycle detected
-            if color[node_id] == BLACK:
-                return False
-
-            color[node_id] = GRAY
-            for edge in self.graph.adj.get(node_id, []):
-                neigh = edge.v.identifier
-                if neigh in color and dfs(neigh):
-                    return True
-            color[node_id] = BLACK
-            return False
-
-        for node_id in list(color.keys()):
-            if color[node_id] == WHITE and dfs(node_id):
-                return True
-        return False
+        """Detekce cyklů v orientovaném grafu (Kahnův algoritmus, bez rekurze)."""
+        return not DagAnalyzer(self.graph, include=self.graph.is_real_node).is_dag()
     
     def _has_cycles_undirected(self):
         """Detekce cyklů v neorientovaném grafu pomocí DFS."""
@@ -367,13 +301,11 @@ class GraphPropertiesAnalyzer:
         real_nodes = self._real_node_ids()
         
         if self.graph.is_directed:
-            if self.has_cycles():
-                return False
-            
+            # Stupně jsou předpočítané, kontrola kořene je proto levnější než hledání cyklů
+            in_degrees, _ = self.graph.real_degrees()
             root_candidates = []
             for node_id in real_nodes:  # POUZE SKUTEČNÉ UZLY
-                in_degree = len([e for e in self.graph.rev_adj[node_id] 
-                            if e.u.identifier in real_nodes])
+                in_degree = in_degrees[node_id]
                 if in_degree == 0:
                     root_candidates.append(node_id)
                 elif in_degree > 1:
@@ -381,14 +313,14 @@ class GraphPropertiesAnalyzer:
             
             if len(root_candidates) != 1:
                 return False
+            if self.has_cycles():
+                return False
             
             return self.is_connected_graph()
         else:
             # Neorientovaný strom
             num_real_nodes = len(real_nodes)
-            num_real_edges = len([e for e in self.graph.edges 
-                                if (e.u.identifier in real_nodes and 
-                                    e.v.identifier in real_nodes)])
+            num_real_edges = self.graph.real_edge_count()
             
             if num_real_nodes == 0:
                 return True
@@ -411,9 +343,7 @@ class GraphPropertiesAnalyzer:
         real_nodes = self._real_node_ids()
         
         num_real_nodes = len(real_nodes)
-        num_real_edges = len([e for e in self.graph.edges 
-                            if (e.u.identifier in real_nodes and 
-                                e.v.identifier in real_nodes)])
+        num_real_edges = self.graph.real_edge_count()
         num_components = self.count_components()  # už filtruje placeholder uzly
         
         if num_real_nodes == 0:
@@ -426,6 +356,88 @@ class GraphPropertiesAnalyzer:
         return True
 
     
+    def triangle_counts(self, workers=None):
+        """
+        Spočítá trojúhelníky u každého reálného uzlu (placeholdery se ignorují).
+
+        Orientace hran, smyčky a násobné hrany se ignorují. Každá hrana se
+        orientuje k uzlu s vyšším stupněm (při shodě s vyšším indexem), takže
+        množiny "vyšších" sousedů mají velikost O(sqrt(m)) a celý výpočet
+        stojí O(m^1.5). Uzly se mohou rozdělit mezi pracovní procesy.
+
+        Args:
+            workers (int): Počet pracovních procesů (None = automaticky podle velikosti)
+
+        Returns:
+            tuple: (IndexedGraph, seznam počtů trojúhelníků podle indexu uzlu,
+                    seznam stupňů podle indexu uzlu - počet různých sousedů)
+        """
+        indexed = IndexedGraph(self.graph, include=self.graph.is_real_node, undirected=True, skip_loops=True)
+        neighbors = [set(targets) for targets in indexed.adjacency_lists()]
+        degrees = [len(adjacent) for adjacent in neighbors]
+        rank = sorted(range(indexed.n), key=lambda i: (degrees[i], i))
+        position = [0] * indexed.n
+        for order, i in enumerate(rank):
+            position[i] = order
+        higher = [{v for v in adjacent if position[v] > position[u]} for u, adjacent in enumerate(neighbors)]
+        lower = [adjacent - above for adjacent, above in zip(neighbors, higher)]
+
+        nodes = list(range(indexed.n))
+        arc_count = sum(len(above) for above in higher)
+        if workers is None:
+            workers = (os.cpu_count() or 1) if arc_count >= TRIANGLE_PARALLEL_THRESHOLD else 1
+        workers = min(workers, max(indexed.n, 1))
+        if workers <= 1:
+            counts = _count_triangles(nodes, higher, lower)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            # Prokládané bloky - uzly s vysokým pořadím mají málo vyšších sousedů
+            chunk_count = workers * 4
+            chunks = [nodes[i::chunk_count] for i in range(chunk_count)]
+            counts = collections.Counter()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_triangle_worker,
+                                     initargs=(higher, lower)) as pool:
+                for part in pool.map(_count_triangles_in_worker, chunks):
+                    counts.update(part)
+        return indexed, [counts.get(i, 0) for i in range(indexed.n)], degrees
+
+    def clustering(self, workers=None):
+        """
+        Spočítá trojúhelníky a koeficienty shlukování (na neorientovaném prostém grafu).
+
+        Lokální koeficient uzlu je podíl existujících hran mezi jeho sousedy
+        (2 t / (d (d - 1)), pro d < 2 je 0). Průměrný koeficient je průměr přes
+        všechny reálné uzly, tranzitivita je 3 × trojúhelníky / spojené trojice.
+
+        Args:
+            workers (int): Počet pracovních procesů (None = automaticky)
+
+        Returns:
+            dict: {
+                'triangles': celkový počet trojúhelníků,
+                'transitivity': tranzitivita, 'average_clustering': průměrný koeficient,
+                'nodes': {uzel: {'degree', 'triangles', 'clustering'}}
+            }
+        """
+        indexed, counts, degrees = self.triangle_counts(workers)
+        nodes = {}
+        triples = 0
+        for node_id, triangles, degree in zip(indexed.ids, counts, degrees):
+            pairs = degree * (degree - 1) // 2
+            triples += pairs
+            nodes[node_id] = {
+                'degree': degree,
+                'triangles': triangles,
+                'clustering': triangles / pairs if pairs else 0.0,
+            }
+        total = sum(counts) // 3
+        return {
+            'triangles': total,
+            'transitivity': 3 * total / triples if triples else 0.0,
+            'average_clustering': sum(node['clustering'] for node in nodes.values()) / len(nodes) if nodes else 0.0,
+            'nodes': nodes,
+        }
+
     def get_basic_properties(self):
         """
         Vrátí slovník se všemi základními vlastnostmi grafu.
@@ -0,0 +1,258 @@
+"""
+Inkrementální nejkratší cesty z jednoho zdroje při změnách grafu.
+"""
+
+import heapq
+from collections import defaultdict
+
+from ..utils.indexed_graph import arc_weight
+
+INF = float('inf')
+
+
+class IncrementalShortestPaths:
+    """
+    Udržuje vzdálenosti a strom nejkratších cest z jednoho zdroje.
+
+    Struktura se zaregistruje jako posluchač grafu a po každé změně hrany
+    přepočítá jen dotčenou oblast (postup Ramalingama a Repse):
+
+    - Přidání hrany nebo snížení váhy spustí Dijkstrův algoritmus jen
+      z koncového uzlu, a to pouze pokud se jeho vzdálenost zlepší.
+    - Odebrání hrany nebo zvýšení váhy mimo strom nejkratších cest nemá
+      žádný vliv.
+    - U hrany stromu se za dotčené považuje podstrom pod ní. Jeho uzlům se
+      vzdálenost nastaví podle nejlepšího předchůdce mimo podstrom a pak
+      se dopočítá Dijkstrou omezenou na podstrom.
+
+    Stejně jako PathAnalyzer předpokládá nezáporné váhy; neohodnocené hrany
+    mají délku 1 a hrany s nečíselnou váhou se ignorují.
+
+    Attributes:
+        source (str): Zdrojový uzel
+        last_touched (int): Počet uzlů přepočítaných při poslední změně
+        total_touched (int): Součet přepočítaných uzlů přes všechny změny (bez počátečního výpočtu)
+        updates (int): Počet zpracovaných změn hran
+    """
+
+    def __init__(self, graph, source):
+        """
+        Inicializace a úplný výpočet vzdáleností ze zdroje.
+
+        Args:
+            graph (Graph): Sledovaný graf (struktura se zaregistruje jako posluchač)
+            source (str): Identifikátor zdrojového uzlu
+        """
+        self.graph = graph
+        self.source = source
+        self.dist = {}
+        self.parent = {}                # uzel -> (předchůdce, klíč oblouku)
+        self.children = defaultdict(set)
+        self.last_touched = 0
+        self.total_touched = 0
+        self.updates = 0
+        self._recompute()
+        self.total_touched = 0  # počáteční výpočet se do přepočtů nezapočítává
+        graph.add_listener(self)
+
+    def close(self):
+        """Odpojí strukturu od grafu (další změny už nesleduje)."""
+        self.graph.remove_listener(self)
+
+    # ========== Oblouky grafu ==========
+
+    @staticmethod
+    def _arcs(edge):
+        """Vrátí orientované oblouky (odkud, kam, klíč) původní hrany."""
+        u_id = edge.u.identifier
+        v_id = edge.v.identifier
+        if edge.direction == '>':
+            return [(u_id, v_id, (id(edge), v_id))]
+        if edge.direction == '<':
+            return [(v_id, u_id, (id(edge), u_id))]
+        return [(u_id, v_id, (id(edge), v_id)), (v_id, u_id, (id(edge), u_id))]
+
+    def _out_arcs(self, node_id):
+        """Vrátí oblouky (kam, délka, klíč) vycházející z uzlu."""
+        for entry in self.graph.adj.get(node_id, ()):
+            weight = arc_weight(entry.weight)
+            if weight is not None:
+                head = entry.v.identifier
+                yield head, weight, (id(entry.origin or entry), head)
+
+    def _in_arcs(self, node_id):
+        """Vrátí oblouky (odkud, délka, klíč) vstupující do uzlu."""
+        for entry in self.graph.rev_adj.get(node_id, ()):
+            weight = arc_weight(entry.weight)
+            if weight is not None:
+                yield entry.u.identifier, weight, (id(entry.origin or entry), node_id)
+        for entry in self.graph.adj.get(node_id, ()):
+            # Neorientovaná hrana vede i opačným směrem
+            if entry.direction == '-':
+                weight = arc_weight(entry.weight)
+                if weight is not None:
+                    yield entry.v.identifier, weight, (id(entry.origin or entry), node_id)
+
+    # ========== Údržba stromu ==========
+
+    def _set_parent(self, node_id, tail, key):
+        old = self.parent.get(node_id)
+        if old is not None:
+            self.children[old[0]].discard(node_id)
+        self.parent[node_id] = (tail, key)
+        self.children[tail].add(node_id)
+
+    def _dijkstra(self, heap):
+        """Dokončí Dijkstrův algoritmus z dané haldy; vrátí počet zpracovaných uzlů."""
+        dist = self.dist
+        settled = 0
+        while heap:
+            d, node_id = heapq.heappop(heap)
+            if d > dist.get(node_id, INF):
+                continue
+            settled += 1
+            for head, weight, key in self._out_arcs(node_id):
+                candidate = d + weight
+                if candidate < dist.get(head, INF):
+                    dist[head] = candidate
+                    self._set_parent(head, node_id, key)
+                    heapq.heappush(heap, (candidate, head))
+        return settled
+
+    def _recompute(self):
+        """Spočítá vzdálenosti od začátku."""
+        self.dist = {}
+        self.parent = {}
+        self.children = defaultdict(set)
+        if self.source not in self.graph.nodes:
+            self._touched(0)
+            return
+        self.dist[self.source] = 0
+        self._touched(self._dijkstra([(0, self.source)]))
+
+    def _touched(self, count):
+        self.last_touched = count
+        self.total_touched += count
+
+    def _improve(self, tail, head, weight, key):
+        """Zpracuje nový nebo zkrácený oblouk; vrátí počet přepočítaných uzlů."""
+        if weight is None or tail not in self.dist:
+            return 0
+        candidate = self.dist[tail] + weight
+        if candidate >= self.dist.get(head, INF):
+            return 0
+        self.dist[head] = candidate
+        self._set_parent(head, tail, key)
+        return self._dijkstra([(candidate, head)])
+
+    def _worsen(self, head, key):
+        """Zpracuje odebraný nebo prodloužený oblouk; vrátí počet přepočítaných uzlů."""
+        parent = self.parent.get(head)
+        if parent is None or parent[1] != key:
+            return 0
+
+        # Dotčené uzly = podstrom pod odebraným obloukem
+        affected = {head}
+        stack = [head]
+        while stack:
+            for child in self.children.get(stack.pop(), ()):
+                if child not in affected:
+                    affected.add(child)
+                    stack.append(child)
+
+        for node_id in affected:
+            del self.dist[node_id]
+            tail, _ = self.parent.pop(node_id)
+            if tail not in affected:
+                self.children[tail].discard(node_id)
+            self.children.pop(node_id, None)
+
+        heap = []
+        for node_id in affected:
+            best = None
+            for tail, weight, arc_key in self._in_arcs(node_id):
+                if tail in affected or tail not in self.dist:
+                    continue
+                candidate = self.dist[tail] + weight
+                if best is None or candidate < best[0]:
+                    best = (candidate, tail, arc_key)
+            if best is not None:
+                self.dist[node_id] = best[0]
+                self._set_parent(node_id, best[1], best[2])
+                heap.append((best[0], node_id))
+        heapq.heapify(heap)
+        self._dijkstra(heap)
+        return len(affected)
+
+    # ========== Notifikace z grafu ==========
+
+    def on_node_added(self, node):
+        if node.identifier == self.source:
+            self._recompute()
+
+    def on_node_removed(self, node):
+        # Incidentní hrany graf odebral dříve, uzel je už nedostupný
+        if node.identifier == self.source:
+            self._recompute()
+
+    def on_edge_added(self, edge):
+        weight = arc_weight(edge.weight)
+        touched = sum(self._improve(tail, head, weight, key) for tail, head, key in self._arcs(edge))
+        self.updates += 1
+        self._touched(touched)
+
+    def on_edge_removed(self, edge):
+        touched = sum(self._worsen(head, key) for _, head, key in self._arcs(edge))
+        self.updates += 1
+        self._touched(touched)
+
+    def on_edge_reweighted(self, edge, old_weight):
+        old = arc_weight(old_weight)
+        new = arc_weight(edge.weight)
+        touched = 0
+        for tail, head, key in self._arcs(edge):
+            if new is not None and (old is None or new < old):
+                touched += self._improve(tail, head, new, key)
+            elif old is not None and (new is None or new > old):
+                touched += self._worsen(head, key)
+        self.updates += 1
+        self._touched(touched)
+
+    # ========== Dotazy ==========
+
+    def get_distances(self):
+        """
+        Vrátí vzdálenosti ve stejném tvaru jako PathAnalyzer.get_shortest_distances.
+
+        Returns:
+            dict: {node_id: distance}; v ohodnoceném grafu včetně nedostupných uzlů (inf)
+        """
+        if self.source not in self.graph.nodes:
+            return {}
+        if self.graph.is_weighted:
+            return {node_id: self.dist.get(node_id, INF) for node_id in self.graph.nodes}
+        return dict(self.dist)
+
+    def get_path(self, target_id):
+        """
+        Vrátí nejkratší cestu ze zdroje podle stromu nejkratších cest.
+
+        Returns:
+            list: Seznam identifikátorů uzlů nebo None, pokud cíl není dostupný
+        """
+        if target_id not in self.dist:
+            return None
+        path = [target_id]
+        while path[-1] != self.source:
+            path.append(self.parent[path[-1]][0])
+        return path[::-1]
+
+    def stats(self):
+        """Vrátí počty zpracovaných změn a přepočítaných uzlů."""
+        return {
+            'updates': self.updates,
+            'last_touched': self.last_touched,
+            'total_touched': self.total_touched,
+            'reachable': len(self.dist),
+            'nodes': len(self.graph.nodes),
+        }
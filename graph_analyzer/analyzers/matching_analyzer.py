@@ -0,0 +1,518 @@
+"""
+Analyzátor maximálních párování (Hopcroft-Karp, Edmondsův algoritmus, přiřazení).
+"""
+
+import heapq
+import math
+
+from ..utils.indexed_graph import IndexedGraph
+from .graph_properties_analyzer import GraphPropertiesAnalyzer
+
+
+class MatchingAnalyzer:
+    """
+    Třída pro hledání maximálních párování.
+
+    Párování je množina hran bez společných uzlů. Počítá se na
+    neorientovaném grafu reálných uzlů (orientace se ignoruje, smyčky,
+    nečíselné váhy a placeholdery se vynechají). Bipartitní rozklad se
+    přebírá z GraphPropertiesAnalyzer.bipartition(); levá strana jsou uzly
+    s barvou 0.
+
+    Metody vrací slovník {
+        'size': počet hran párování, 'pairs': [(uzel, uzel)] spárované uzly
+        (u bipartitního grafu ve tvaru (levý, pravý)), 'algorithm': název,
+        'bipartite': bool, 'vertex_cover': minimální vrcholové pokrytí podle
+        Königovy věty (jen bipartitní graf, jinak None)
+    }; přiřazení navíc obsahuje 'weight'.
+    """
+
+    ALGORITHMS = ('auto', 'hopcroft-karp', 'blossom')
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+        self._prepared = None
+
+    def _prepare(self):
+        """Snímek grafu, seznamy sousedů bez duplicit a strany bipartitního rozkladu (None = není bipartitní)."""
+        if self._prepared is None:
+            indexed = IndexedGraph(self.graph, include=self.graph.is_real_node,
+                                   undirected=True, skip_loops=True)
+            adj = [list(dict.fromkeys(targets)) for targets in indexed.adjacency_lists()]
+            coloring = GraphPropertiesAnalyzer(self.graph).bipartition()
+            sides = None
+            if coloring is not None:
+                sides = [coloring[node_id] for node_id in indexed.ids]
+            self._prepared = indexed, adj, sides
+        return self._prepared
+
+    def is_bipartite(self):
+        """Zjistí, zda je graf bipartitní."""
+        return self._prepare()[2] is not None
+
+    def _result(self, mate, algorithm, sides):
+        indexed = self._prepare()[0]
+        ids = indexed.ids
+        pairs = []
+        for u, v in enumerate(mate):
+            if v < 0:
+                continue
+            # Každá dvojice jednou: levý uzel napřed, v obecném grafu menší index
+            if (sides[u] == 0) if sides is not None else u < v:
+                pairs.append((ids[u], ids[v]))
+        return {
+            'size': len(pairs),
+            'pairs': pairs,
+            'algorithm': algorithm,
+            'bipartite': sides is not None,
+            'vertex_cover': None,
+        }
+
+    @staticmethod
+    def _hopcroft_karp(adj, sides):
+        """
+        Hopcroftův-Karpův algoritmus v O(m * sqrt(n)).
+
+        Každá fáze spočítá BFS vrstvy od volných levých uzlů po střídavých
+        cestách a pak iterativním DFS najde maximální množinu disjunktních
+        nejkratších zlepšujících cest. Fází je nejvýš O(sqrt(n)).
+
+        Returns:
+            list: mate[u] - index spárovaného uzlu, nebo -1
+        """
+        n = len(adj)
+        left = [u for u in range(n) if sides[u] == 0]
+        mate = [-1] * n
+        # Hladové počáteční párování ušetří první fáze
+        for u in left:
+            for v in adj[u]:
+                if mate[v] < 0:
+                    mate[u] = v
+                    mate[v] = u
+                    break
+
+        while True:
+            dist = [-1] * n
+            queue = [u for u in left if mate[u] < 0]
+            for u in queue:
+                dist[u] = 0
+            # Délka nejkratší zlepšující cesty (ve vrstvách levých uzlů)
+            limit = -1
+            for u in queue:
+                if limit >= 0 and dist[u] >= limit:
+                    break
+                for v in adj[u]:
+                    w = mate[v]
+                    if w < 0:
+                        limit = dist[u] + 1
+                    elif dist[w] < 0:
+                        dist[w] = dist[u] + 1
+                        queue.append(w)
+            if limit < 0:
+                return mate
+
+            pointer = [0] * n
+            for root in left:
+                if mate[root] >= 0 or dist[root] != 0:
+                    continue
+                stack = [root]
+                via = []
+                while stack:
+                    u = stack[-1]
+                    targets = adj[u]
+                    i = pointer[u]
+                    step = None
+                    while i < len(targets):
+                        v = targets[i]
+                        i += 1
+                        w = mate[v]
+                        if w < 0:
+                            if dist[u] + 1 == limit:
+                                step = v
+                                break
+                        elif dist[w] == dist[u] + 1:
+                            step = v
+                            break
+                    pointer[u] = i
+                    if step is None:
+                        # Slepá ulička - uzel se z vrstev vyřadí
+                        dist[u] = -1
+                        stack.pop()
+                        if via:
+                            via.pop()
+                        continue
+                    w = mate[step]
+                    if w >= 0:
+                        stack.append(w)
+                        via.append(step)
+                        continue
+                    # Zlepšující cesta: stack[i] se spáruje s via[i], poslední uzel s step
+                    via.append(step)
+                    for u, v in zip(stack, via):
+                        mate[u] = v
+                        mate[v] = u
+                    for u in stack:
+                        dist[u] = -1
+                    break
+
+    @staticmethod
+    def _blossom(adj):
+        """
+        Edmondsův algoritmus (kontrakce květů) pro obecný graf.
+
+        Z každého volného uzlu se pustí BFS po střídavých cestách: sudé uzly
+        jsou ve frontě, liché mají předchůdce `parent`. Narazí-li hledání na
+        lichou kružnici (květ), báze jejích uzlů se sloučí v union-findu
+        a liché uzly květu se stanou sudými. Když se z kořene zlepšující
+        cesta nenajde, nenajde se už ani později a uzly jeho stromu se
+        z dalších hledání vyřadí, takže neúspěšná hledání stojí dohromady
+        O(m). Pole se po hledání nulují jen pro uzly stromu.
+
+        Returns:
+            list: mate[u] - index spárovaného uzlu, nebo -1
+        """
+        n = len(adj)
+        mate = [-1] * n
+        for u in range(n):
+            if mate[u] < 0:
+                for v in adj[u]:
+                    if mate[v] < 0:
+                        mate[u] = v
+                        mate[v] = u
+                        break
+
+        # Union-find bází květů: kořen množiny je báze
+        base = list(range(n))
+        parent = [-1] * n
+        even = [False] * n
+        dead = [False] * n
+        seen = [0] * n
+        stamp = 0
+
+        def find(x):
+            while base[x] != x:
+                base[x] = base[base[x]]
+                x = base[x]
+            return x
+
+        def lca(a, b):
+            nonlocal stamp
+            stamp += 1
+            while True:
+                a = find(a)
+                seen[a] = stamp
+                if mate[a] < 0:
+                    break
+                a = parent[mate[a]]
+            while True:
+                b = find(b)
+                if seen[b] == stamp:
+                    return b
+                b = parent[mate[b]]
+
+        def mark_path(v, b, child, queue):
+            while find(v) != b:
+                m = mate[v]
+                bv, bm = find(v), find(m)
+                base[bv] = b
+                base[bm] = b
+                parent[v] = child
+                if not even[m]:
+                    even[m] = True
+                    queue.append(m)
+                child = m
+                v = parent[m]
+
+        for root in range(n):
+            if mate[root] >= 0 or dead[root] or not adj[root]:
+                continue
+            even[root] = True
+            tree = [root]
+            queue = [root]
+            end = -1
+            for v in queue:
+                for to in adj[v]:
+                    if dead[to] or mate[v] == to or find(v) == find(to):
+                        continue
+                    if even[to]:
+                        b = lca(v, to)
+                        mark_path(v, b, to, queue)
+                        mark_path(to, b, v, queue)
+                    elif parent[to] < 0:
+                        parent[to] = v
+                        tree.append(to)
+                        if mate[to] < 0:
+                            end = to
+                            break
+                        w = mate[to]
+                        even[w] = True
+                        tree.append(w)
+                        queue.append(w)
+                if end >= 0:
+                    break
+
+            v = end
+            while v >= 0:
+                pv = parent[v]
+                next_v = mate[pv]
+                mate[v] = pv
+                mate[pv] = v
+                v = next_v
+            for i in tree:
+                base[i] = i
+                parent[i] = -1
+                even[i] = False
+                if end < 0:
+                    dead[i] = True
+        return mate
+
+    def _konig_cover(self, adj, sides, mate):
+        """
+        Minimální vrcholové pokrytí z maximálního párování (Königova věta).
+
+        Z volných levých uzlů se projdou střídavé cesty (levý -> pravý po
+        libovolné hraně, pravý -> levý po hraně párování). Pokrytí tvoří
+        nenavštívené levé a navštívené pravé uzly.
+        """
+        n = len(adj)
+        visited = [False] * n
+        queue = [u for u in range(n) if sides[u] == 0 and mate[u] < 0]
+        for u in queue:
+            visited[u] = True
+        for u in queue:
+            for v in adj[u]:
+                if not visited[v]:
+                    visited[v] = True
+                    w = mate[v]
+                    if w >= 0 and not visited[w]:
+                        visited[w] = True
+                        queue.append(w)
+        ids = self._prepare()[0].ids
+        return [ids[u] for u in range(n) if visited[u] == (sides[u] == 1) and adj[u]]
+
+    def maximum_matching(self, algorithm='auto'):
+        """
+        Najde maximální (nejpočetnější) párování.
+
+        Args:
+            algorithm (str): 'hopcroft-karp' (jen bipartitní graf), 'blossom'
+                nebo 'auto' - Hopcroft-Karp pro bipartitní graf, jinak blossom
+
+        Returns:
+            dict: Viz dokumentace třídy
+
+        Raises:
+            ValueError: Hopcroft-Karp na nebipartitním grafu nebo neznámý algoritmus
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"neznámý algoritmus párování: {algorithm}")
+        indexed, adj, sides = self._prepare()
+        if algorithm == 'auto':
+            algorithm = 'blossom' if sides is None else 'hopcroft-karp'
+        if algorithm == 'hopcroft-karp':
+            if sides is None:
+                raise ValueError("Hopcroftův-Karpův algoritmus vyžaduje bipartitní graf")
+            mate = self._hopcroft_karp(adj, sides)
+        else:
+            mate = self._blossom(adj)
+        result = self._result(mate, algorithm, sides)
+        if sides is not None:
+            result['vertex_cover'] = self._konig_cover(adj, sides, mate)
+        return result
+
+    @staticmethod
+    def _exact_costs(cost):
+        """
+        Převede ceny hran na celá čísla se stejným pořadím součtů.
+
+        Testy nulové redukované ceny v assignment() musí být přesné - s
+        desetinnými vahami by zaokrouhlovací chyby potenciálů způsobily, že
+        se zlepšující cesta nenajde. Desetinné číslo je zlomek se jmenovatelem
+        mocnina dvou, takže vynásobení největším jmenovatelem dá přesně celá
+        čísla (Python int nepřeteče).
+
+        Raises:
+            ValueError: Nekonečná nebo nedefinovaná váha
+        """
+        scale = 1
+        for row in cost:
+            for c in row.values():
+                if isinstance(c, float):
+                    if not math.isfinite(c):
+                        raise ValueError(f"přiřazení vyžaduje konečné váhy hran (nalezena {c})")
+                    scale = max(scale, c.as_integer_ratio()[1])
+        if scale == 1:
+            return [{v: int(c) for v, c in row.items()} for row in cost]
+        scaled = []
+        for row in cost:
+            exact = {}
+            for v, c in row.items():
+                if isinstance(c, float):
+                    numerator, denominator = c.as_integer_ratio()
+                    exact[v] = numerator * (scale // denominator)
+                else:
+                    exact[v] = c * scale
+            scaled.append(exact)
+        return scaled
+
+    def assignment(self, maximize=False):
+        """
+        Přiřazení s nejmenší (největší) celkovou vahou v bipartitním grafu.
+
+        Maďarská metoda v řídké podobě: párování se zvětšuje po nejkratších
+        zlepšujících cestách (Dijkstra z volných levých uzlů nad redukovanými
+        cenami s potenciály uzlů, v každém kroku podél všech disjunktních
+        nejkratších cest najednou), takže je párování vždy nejlevnější ze
+        všech párování své velikosti. Výsledkem je maximální
+        párování s nejmenší cenou. Z násobných hran se použije nejvýhodnější.
+
+        Args:
+            maximize (bool): Hledat největší celkovou váhu místo nejmenší
+
+        Returns:
+            dict: Viz dokumentace třídy a navíc 'weight' - součet vah hran párování
+
+        Raises:
+            ValueError: Graf není bipartitní nebo má nekonečnou váhu
+        """
+        indexed, adj, sides = self._prepare()
+        if sides is None:
+            raise ValueError("přiřazení vyžaduje bipartitní graf")
+        n = indexed.n
+        sign = -1 if maximize else 1
+        offsets, targets, weights = indexed.offsets, indexed.targets, indexed.weights
+        # Cena hrany levý -> pravý (nejvýhodnější z násobných hran)
+        cost = [{} for _ in range(n)]
+        for u in range(n):
+            if sides[u] != 0:
+                continue
+            row = cost[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                c = sign * weights[k]
+                v = targets[k]
+                if v not in row or c < row[v]:
+                    row[v] = c
+        scaled = self._exact_costs(cost)
+
+        # Volné pravé uzly vedou do společného stoku (index n) hranou s cenou 0.
+        # Počáteční potenciály: redukovaná cena c + p[u] - p[v] musí být nezáporná
+        sink = n
+        potential = [0] * (n + 1)
+        for u in range(n):
+            for v, c in scaled[u].items():
+                if c < potential[v]:
+                    potential[v] = c
+        potential[sink] = min(potential)
+        left = [u for u in range(n) if sides[u] == 0 and cost[u]]
+        mate = [-1] * n
+        infinity = float('inf')
+        dist = [infinity] * (n + 1)
+        arcs = [list(row.items()) for row in scaled]
+
+        while True:
+            # Dijkstra nad redukovanými cenami: vzdálenosti od volných levých uzlů
+            heap = []
+            for u in left:
+                if mate[u] < 0:
+                    dist[u] = 0
+                    heap.append((0, u))
+            reached = [u for _, u in heap]
+            heapq.heapify(heap)
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                if u == sink:
+                    break
+                if sides[u] == 1:
+                    w = mate[u]
+                    if w < 0:
+                        w = sink
+                        d += potential[u] - potential[sink]
+                    # Hrana párování má redukovanou cenu 0
+                    if d < dist[w]:
+                        if dist[w] == infinity:
+                            reached.append(w)
+                        dist[w] = d
+                        heapq.heappush(heap, (d, w))
+                    continue
+                pu = potential[u]
+                for v, c in arcs[u]:
+                    if v == mate[u]:
+                        continue
+                    nd = d + c + pu - potential[v]
+                    if nd < dist[v]:
+                        if dist[v] == infinity:
+                            reached.append(v)
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+            limit = dist[sink]
+            if limit == infinity:
+                break
+
+            # Posun potenciálů o min(dist, limit) zachová nezáporné redukované
+            # ceny; posun všech uzlů o stejnou hodnotu rozdíly nemění, takže
+            # stačí upravit jen uzly bližší než stok
+            for u in reached:
+                if dist[u] < limit:
+                    potential[u] += dist[u] - limit
+                dist[u] = infinity
+
+            # Všechny nejkratší zlepšující cesty mají teď nulovou redukovanou
+            # cenu. Do hloubky se najde maximální množina disjunktních z nich
+            # a párování se zlepší podél všech najednou (primárně-duální krok).
+            pointer = [0] * n
+            blocked = [False] * n
+            end_potential = potential[sink]
+            augmented = False
+            for root in left:
+                if mate[root] >= 0:
+                    continue
+                stack = [root]
+                via = []
+                while stack:
+                    u = stack[-1]
+                    row = arcs[u]
+                    pu = potential[u]
+                    i = pointer[u]
+                    step = -1
+                    while i < len(row):
+                        v, c = row[i]
+                        i += 1
+                        if not blocked[v] and v != mate[u] and c + pu - potential[v] == 0:
+                            blocked[v] = True
+                            step = v
+                            break
+                    pointer[u] = i
+                    if step < 0:
+                        stack.pop()
+                        if via:
+                            via.pop()
+                        continue
+                    w = mate[step]
+                    if w >= 0:
+                        stack.append(w)
+                        via.append(step)
+                        continue
+                    if potential[step] != end_potential:
+                        continue
+                    via.append(step)
+                    for u, v in zip(stack, via):
+                        mate[u] = v
+                        mate[v] = u
+                    augmented = True
+                    break
+            if not augmented:
+                # Při přesné aritmetice nenastane; pojistka proti nekonečné smyčce
+                break
+
+        result = self._result(mate, 'assignment', sides)
+        index = indexed.index
+        result['weight'] = sum(sign * cost[index[u]][index[v]] for u, v in result['pairs'])
+        return result
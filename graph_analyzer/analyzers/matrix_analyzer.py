@@ -177,9 +177,9 @@ class MatrixAnalyzer:
         return matrix, node_list
     
 
-    def print_adjacency_matrix(self):
-        """Vytiskne matici sousednosti ve čitelném formátu."""
-        matrix, nodes = self.get_adjacency_matrix()
+    def print_adjacency_matrix(self, precomputed=None):
+        """Vytiskne matici sousednosti ve čitelném formátu (volitelně z již spočítaného výsledku)."""
+        matrix, nodes = precomputed if precomputed is not None else self.get_adjacency_matrix()
         if not matrix:
             print("Prázdný graf - žádná matice sousednosti")
             return
@@ -187,9 +187,9 @@ class MatrixAnalyzer:
         print("\nMatice sousednosti:")
         self._print_matrix(matrix, nodes, col_labels=nodes)
     
-    def print_incidence_matrix(self):
-        """Vytiskne matici incidence ve čitelném formátu."""
-        matrix, nodes, edges = self.get_incidence_matrix()
+    def print_incidence_matrix(self, precomputed=None):
+        """Vytiskne matici incidence ve čitelném formátu (volitelně z již spočítaného výsledku)."""
+        matrix, nodes, edges = precomputed if precomputed is not None else self.get_incidence_matrix()
         if not matrix:
             print("Prázdný graf - žádná matice incidence")
             return
@@ -198,9 +198,9 @@ class MatrixAnalyzer:
         col_labels = [f"h{idx+1}" for idx in range(len(edges))]
         self._print_matrix(matrix, nodes, col_labels=col_labels)
     
-    def print_weight_matrix(self):
-        """Vytiskne matici vah ve čitelném formátu."""
-        matrix, nodes = self.get_weight_matrix()
+    def print_weight_matrix(self, precomputed=None):
+        """Vytiskne matici vah ve čitelném formátu (volitelně z již spočítaného výsledku)."""
+        matrix, nodes = precomputed if precomputed is not None else self.get_weight_matrix()
         if not matrix:
             print("Prázdný graf - žádná matice vah")
             return
@@ -6,6 +6,11 @@ import heapq
 from collections import deque
 from typing import Dict, List, Tuple, Optional, Mapping
 
+from .dag_analyzer import DagAnalyzer
+from .incremental_paths import IncrementalShortestPaths
+from ..utils.distance_profile import bfs_profile, dijkstra_profile
+from ..utils.indexed_graph import IndexedGraph
+
 class PathAnalyzer:
     """
     Třída pro analýzu cest a vzdáleností v grafu.
@@ -19,6 +24,37 @@ class PathAnalyzer:
             graph (Graph): Graf k analýze
         """
         self.graph = graph
+        self._profile = None
+        self._profile_version = None
+        self._use_dag = False
+        self._dag_version = None
+
+    def _dag_paths(self, start_id):
+        """
+        Nejkratší cesty relaxací v topologickém pořadí pro orientované grafy se zápornými vahami.
+
+        Dijkstra s opakovaným vkládáním do haldy je se zápornými vahami
+        správný, ale uzly může zpracovat mnohokrát; v acyklické části grafu
+        projde relaxace v topologickém pořadí každý oblouk jen dvakrát. Pro
+        nezáporné váhy je Dijkstra s haldou v CPythonu rychlejší, proto se
+        použije on.
+
+        Returns:
+            dict: Výsledek DagAnalyzer.shortest_paths(), nebo None (graf se
+                nehodí nebo je ze start_id dosažitelný cyklus - to se pamatuje
+                do další změny grafu)
+        """
+        if self._dag_version != self.graph.version:
+            self._dag_version = self.graph.version
+            self._use_dag = self.graph.is_directed and any(
+                isinstance(edge.weight, (int, float)) and edge.weight < 0 for edge in self.graph.edges)
+        if not self._use_dag:
+            return None
+        try:
+            return DagAnalyzer(self.graph).shortest_paths(start_id)
+        except ValueError:
+            self._use_dag = False
+            return None
     
     def find_shortest_path(self, start_id, end_id):
         """
@@ -36,8 +72,12 @@ class PathAnalyzer:
         
         if not self.graph.is_weighted:
             return self._bfs_shortest_path(start_id, end_id)
-        else:
-            return self._dijkstra_shortest_path(start_id, end_id)
+        dag = self._dag_paths(start_id)
+        if dag is not None:
+            if end_id != start_id and end_id not in dag['previous']:
+                return None
+            return DagAnalyzer.path_to(dag['previous'], end_id)
+        return self._dijkstra_shortest_path(start_id, end_id)
     
     def _bfs_shortest_path(self, start_id, end_id):
         """BFS pro neohodnocené grafy."""
@@ -146,9 +186,27 @@ class PathAnalyzer:
         
         if not self.graph.is_weighted:
             return self._bfs_distances(start_id)
-        else:
-            return self._dijkstra_distances(start_id)
+        dag = self._dag_paths(start_id)
+        if dag is not None:
+            reached = dag['distances']
+            return {node_id: reached.get(node_id, float('inf')) for node_id in self.graph.nodes}
+        return self._dijkstra_distances(start_id)
     
+    def track_shortest_distances(self, start_id):
+        """
+        Vrátí strukturu, která udržuje vzdálenosti od uzlu při změnách grafu.
+
+        Po přidání, odebrání nebo změně váhy hrany se přepočítá jen dotčená
+        část stromu nejkratších cest (viz IncrementalShortestPaths).
+
+        Args:
+            start_id (str): Identifikátor počátečního uzlu
+
+        Returns:
+            IncrementalShortestPaths: Sledované vzdálenosti (get_distances(), stats())
+        """
+        return IncrementalShortestPaths(self.graph, start_id)
+
     def _bfs_distances(self, start_id):
         """BFS pro výpočet vzdáleností v neohodnoceném grafu."""
         distances = {start_id: 0}
@@ -220,6 +278,80 @@ class PathAnalyzer:
 
         return max_distance
     
+    def get_distance_profile(self):
+        """
+        Spočítá statistiky vzdáleností ze všech uzlů najednou.
+
+        Neohodnocený graf používá bitově paralelní BFS (mnoho průchodů v jedné
+        celočíselné masce), ohodnocený Dijkstrův algoritmus z každého uzlu.
+        Výsledek se pamatuje do další změny grafu, takže průměr, poloměr
+        a centrum sdílí jeden výpočet.
+
+        Returns:
+            dict: 'ids' (uzly podle indexu) a seznamy 'reached', 'dist_sum',
+                'harmonic', 'eccentricity' a 'histogram' (viz utils.distance_profile)
+        """
+        if self._profile is not None and self._profile_version == self.graph.version:
+            return self._profile
+
+        indexed = IndexedGraph(self.graph)
+        if self.graph.is_weighted:
+            profile = dijkstra_profile(indexed.adjacency_lists(), indexed.weight_lists(), indexed.n)
+        else:
+            pred = indexed.reverse_lists()[0] if self.graph.is_directed else indexed.adjacency_lists()
+            profile = bfs_profile(pred, indexed.n)
+        profile['ids'] = indexed.ids
+        self._profile = profile
+        self._profile_version = self.graph.version
+        return profile
+
+    def get_eccentricities(self):
+        """
+        Vypočítá excentricity všech uzlů.
+
+        Returns:
+            dict: {node_id: excentricita}; float('inf') pro uzly, ze kterých
+                nejsou dostupné všechny ostatní uzly
+        """
+        profile = self.get_distance_profile()
+        others = len(profile['ids']) - 1
+        return {
+            node_id: float(ecc) if reached == others else float('inf')
+            for node_id, ecc, reached in zip(profile['ids'], profile['eccentricity'], profile['reached'])
+        }
+
+    def get_distance_statistics(self):
+        """
+        Vypočítá průměrnou délku nejkratší cesty a histogram vzdáleností.
+
+        Počítají se jen dvojice, mezi kterými cesta existuje. V neorientovaném
+        grafu se každá dvojice počítá jednou.
+
+        Returns:
+            dict: {
+                'average': průměrná délka (None, pokud žádná cesta neexistuje),
+                'pairs': počet dosažitelných dvojic,
+                'unreachable': počet nedosažitelných dvojic,
+                'histogram': {vzdálenost: počet dvojic}
+            }
+        """
+        profile = self.get_distance_profile()
+        n = len(profile['ids'])
+        pairs = sum(profile['reached'])
+        total = sum(profile['dist_sum'])
+        histogram = dict(sorted(profile['histogram'].items()))
+        unreachable = n * (n - 1) - pairs
+        if not self.graph.is_directed:
+            pairs //= 2
+            unreachable //= 2
+            histogram = {distance: count // 2 for distance, count in histogram.items()}
+        return {
+            'average': total / sum(profile['reached']) if pairs else None,
+            'pairs': pairs,
+            'unreachable': unreachable,
+            'histogram': histogram,
+        }
+
     def get_graph_diameter(self):
         """
         Vypočítá průměr grafu (maximální excentricita).
@@ -227,14 +359,7 @@ class PathAnalyzer:
         Returns:
             float: Průměr grafu
         """
-        max_eccentricity = 0.0
-        for node_id in self.graph.nodes:
-            eccentricity = self.get_node_eccentricity(node_id)
-            if eccentricity == float('inf'):
-                return float('inf')
-            max_eccentricity = max(max_eccentricity, eccentricity)
-        
-        return max_eccentricity
+        return max(self.get_eccentricities().values(), default=0.0)
     
     def get_graph_radius(self):
         """
@@ -243,14 +368,10 @@ class PathAnalyzer:
         Returns:
             float: Poloměr grafu
         """
-        min_eccentricity = float('inf')
-        for node_id in self.graph.nodes:
-            eccentricity = self.get_node_eccentricity(node_id)
-            if eccentricity == float('inf'):
-                return float('inf')
-            min_eccentricity = min(min_eccentricity, eccentricity)
-        
-        return min_eccentricity
+        eccentricities = self.get_eccentricities()
+        if float('inf') in eccentricities.values():
+            return float('inf')
+        return min(eccentricities.values(), default=float('inf'))
     
     def find_center_nodes(self):
         """
@@ -263,9 +384,4 @@ class PathAnalyzer:
         if radius == float('inf'):
             return []
         
-        center_nodes = []
-        for node_id in self.graph.nodes:
-            if self.get_node_eccentricity(node_id) == radius:
-                center_nodes.append(node_id)
-        
-        return center_nodes
+        return [node_id for node_id, eccentricity in self.get_eccentricities().items() if eccentricity == radius]
@@ -0,0 +1,236 @@
+"""
+Analyzátor spektrálních hodnocení uzlů (PageRank, Katz, vlastní vektor).
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # numpy je volitelné - bez něj se počítá v čistém Pythonu
+    np = None
+
+from ..utils.indexed_graph import IndexedGraph
+
+# Dolní mez jmenovatele relativního rezidua (nulový vektor)
+_TINY = 1e-300
+
+
+class _Operator:
+    """
+    Násobení vektoru transponovanou maticí sousednosti nad CSR polem oblouků.
+
+    `spread(x)` vrátí y, kde y[v] je součet x[u] * w(u, v) přes oblouky
+    u -> v. S numpy se počítá vektorově (np.bincount), jinak smyčkou
+    přes seznamy.
+    """
+
+    def __init__(self, indexed, use_numpy):
+        self.n = indexed.n
+        self.use_numpy = use_numpy
+        if use_numpy:
+            degrees = np.diff(np.asarray(indexed.offsets, dtype=np.int64))
+            self.sources = np.repeat(np.arange(indexed.n, dtype=np.int64), degrees)
+            self.targets = np.asarray(indexed.targets, dtype=np.int64)
+            self.weights = np.asarray(indexed.weights, dtype=np.float64)
+            self.out_weight = np.bincount(self.sources, weights=self.weights, minlength=self.n)
+        else:
+            self.sources = [i for i in range(indexed.n) for _ in range(indexed.degree(i))]
+            self.targets = indexed.targets
+            self.weights = [float(w) for w in indexed.weights]
+            self.out_weight = [0.0] * self.n
+            for u, w in zip(self.sources, self.weights):
+                self.out_weight[u] += w
+
+    def vector(self, values):
+        return np.asarray(values, dtype=np.float64) if self.use_numpy else [float(v) for v in values]
+
+    def spread(self, x):
+        if self.use_numpy:
+            return np.bincount(self.targets, weights=x[self.sources] * self.weights, minlength=self.n)
+        y = [0.0] * self.n
+        for u, v, w in zip(self.sources, self.targets, self.weights):
+            y[v] += x[u] * w
+        return y
+
+
+class RankAnalyzer:
+    """
+    Třída pro hodnocení uzlů mocninnou metodou.
+
+    Matice se sestaví z IndexedGraph (CSR), váhy hran se berou jako síla
+    vazby (neohodnocená hrana má váhu 1). Je-li k dispozici numpy, jedna
+    iterace je několik vektorových operací nad poli oblouků; jinak se
+    použije stejný výpočet v čistém Pythonu.
+
+    Každá metoda vrací slovník {
+        'values': {uzel: hodnota}, 'iterations': počet iterací,
+        'residual': L1 norma rozdílu posledních dvou iterací vůči L1 normě výsledku,
+        'converged': bool, 'backend': 'numpy' | 'python'
+    }.
+    """
+
+    def __init__(self, graph, use_numpy=None):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+            use_numpy (bool): Vynutit/zakázat numpy (None = použít, je-li nainstalované)
+        """
+        self.graph = graph
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+
+    def _prepare(self):
+        indexed = IndexedGraph(self.graph)
+        if any(w < 0 for w in indexed.weights):
+            raise ValueError("hodnocení uzlů vyžaduje nezáporné váhy hran")
+        return indexed, _Operator(indexed, self.use_numpy)
+
+    def _result(self, indexed, x, iterations, residual, tol):
+        values = x.tolist() if self.use_numpy else x
+        return {
+            'values': dict(zip(indexed.ids, values)),
+            'iterations': iterations,
+            'residual': residual,
+            'converged': residual < tol,
+            'backend': 'numpy' if self.use_numpy else 'python',
+        }
+
+    def _iterate(self, x, step, tol, max_iter):
+        """Opakuje x = step(x), dokud relativní L1 rozdíl neklesne pod tol; vrátí (x, iterace, reziduum)."""
+        residual = float('inf')
+        iterations = 0
+        while iterations < max_iter:
+            if self.use_numpy:
+                with np.errstate(over='ignore', invalid='ignore'):
+                    x_new = step(x)
+                    residual = float(np.abs(x_new - x).sum()) / max(float(np.abs(x_new).sum()), _TINY)
+            else:
+                x_new = step(x)
+                residual = sum(abs(a - b) for a, b in zip(x_new, x)) / max(sum(abs(a) for a in x_new), _TINY)
+            iterations += 1
+            x = x_new
+            # Divergence (např. Katz s příliš velkým alpha) - další iterace nepomohou
+            if residual < tol or not math.isfinite(residual):
+                break
+        return x, iterations, residual
+
+    def pagerank(self, damping=0.85, personalization=None, tol=1e-6, max_iter=100):
+        """
+        Spočítá PageRank uzlů.
+
+        Náhodný chodec s pravděpodobností `damping` přejde po hraně (úměrně
+        její váze), jinak skočí do uzlu podle personalizačního vektoru.
+        Z uzlů bez výstupních hran (dangling) skáče vždy podle
+        personalizačního vektoru.
+
+        Args:
+            damping (float): Pravděpodobnost pokračování po hraně
+            personalization (dict): {uzel: váha} pro skoky (None = rovnoměrně)
+            tol (float): Tolerance relativního rezidua (L1)
+            max_iter (int): Maximální počet iterací
+
+        Returns:
+            dict: Viz dokumentace třídy; hodnoty mají součet 1
+        """
+        indexed, op = self._prepare()
+        n = indexed.n
+        if n == 0:
+            return self._result(indexed, op.vector([]), 0, 0.0, tol)
+
+        if personalization is None:
+            jump = [1.0 / n] * n
+        else:
+            jump = [float(personalization.get(node_id, 0.0)) for node_id in indexed.ids]
+            total = sum(jump)
+            if total <= 0 or any(w < 0 for w in jump):
+                raise ValueError("personalizační vektor musí mít nezáporné váhy s kladným součtem")
+            jump = [w / total for w in jump]
+
+        if self.use_numpy:
+            jump = op.vector(jump)
+            dangling = op.out_weight == 0
+            inverse = np.divide(1.0, op.out_weight, out=np.zeros(n), where=~dangling)
+
+            def step(x):
+                y = damping * op.spread(x * inverse)
+                return y + (damping * x[dangling].sum() + (1.0 - damping)) * jump
+        else:
+            dangling = [i for i in range(n) if op.out_weight[i] == 0]
+            inverse = [1.0 / w if w else 0.0 for w in op.out_weight]
+
+            def step(x):
+                y = op.spread([a * b for a, b in zip(x, inverse)])
+                leak = damping * sum(x[i] for i in dangling) + (1.0 - damping)
+                return [damping * a + leak * j for a, j in zip(y, jump)]
+
+        x, iterations, residual = self._iterate(op.vector(jump), step, tol, max_iter)
+        return self._result(indexed, x, iterations, residual, tol)
+
+    def katz(self, alpha=0.1, beta=1.0, tol=1e-6, max_iter=1000, normalized=True):
+        """
+        Spočítá Katzovu centralitu x = alpha * A^T x + beta.
+
+        Řada konverguje jen pro alpha < 1 / (největší vlastní číslo A);
+        jinak výpočet skončí po max_iter iteracích s converged = False.
+
+        Args:
+            alpha (float): Útlum příspěvku delších cest
+            beta (float): Základní hodnota každého uzlu
+            tol (float): Tolerance relativního rezidua (L1)
+            max_iter (int): Maximální počet iterací
+            normalized (bool): Normalizovat výsledek na jednotkovou euklidovskou normu
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed, op = self._prepare()
+        n = indexed.n
+
+        if self.use_numpy:
+            def step(x):
+                return alpha * op.spread(x) + beta
+        else:
+            def step(x):
+                return [alpha * a + beta for a in op.spread(x)]
+
+        x, iterations, residual = self._iterate(op.vector([0.0] * n), step, tol, max_iter)
+        if normalized and math.isfinite(residual):
+            x = self._normalize(x)
+        return self._result(indexed, x, iterations, residual, tol)
+
+    def eigenvector(self, tol=1e-6, max_iter=100):
+        """
+        Spočítá centralitu podle vlastního vektoru matice A^T.
+
+        Iteruje se s maticí A^T + I, která má stejné vlastní vektory, ale
+        neosciluje na bipartitních grafech. Výsledek má jednotkovou
+        euklidovskou normu.
+
+        Args:
+            tol (float): Tolerance relativního rezidua (L1)
+            max_iter (int): Maximální počet iterací
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed, op = self._prepare()
+        n = indexed.n
+
+        if self.use_numpy:
+            def step(x):
+                return self._normalize(op.spread(x) + x)
+        else:
+            def step(x):
+                return self._normalize([a + b for a, b in zip(op.spread(x), x)])
+
+        start = self._normalize(op.vector([1.0] * n))
+        x, iterations, residual = self._iterate(start, step, tol, max_iter)
+        return self._result(indexed, x, iterations, residual, tol)
+
+    def _normalize(self, x):
+        if self.use_numpy:
+            norm = float(np.sqrt((x * x).sum()))
+            return x / norm if norm > 0 else x
+        norm = sum(a * a for a in x) ** 0.5
+        return [a / norm for a in x] if norm > 0 else x
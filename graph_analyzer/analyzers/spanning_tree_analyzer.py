@@ -0,0 +1,202 @@
+"""
+Analyzátor minimální kostry (lesa) ohodnoceného grafu.
+"""
+
+from ..utils.indexed_graph import IndexedGraph
+from ..utils.union_find import UnionFind
+
+
+class _IndexedHeap:
+    """
+    Binární min-halda nad uzly 0..n-1 s operací snížení klíče.
+
+    `pos[v]` je pozice uzlu v poli haldy (-1 = uzel v haldě není), takže
+    snížení klíče je jen probublání nahoru ze známé pozice.
+    """
+
+    def __init__(self, n):
+        self.heap = []
+        self.key = [0] * n
+        self.pos = [-1] * n
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def push_or_decrease(self, v, key):
+        """Vloží uzel, nebo mu sníží klíč; vrátí True, pokud se halda změnila."""
+        p = self.pos[v]
+        if p < 0:
+            p = len(self.heap)
+            self.heap.append(v)
+        elif key >= self.key[v]:
+            return False
+        self.key[v] = key
+        self._sift_up(p)
+        return True
+
+    def pop(self):
+        """Odebere a vrátí uzel s nejmenším klíčem."""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, p):
+        heap, key, pos = self.heap, self.key, self.pos
+        v = heap[p]
+        k = key[v]
+        while p > 0:
+            parent = (p - 1) >> 1
+            u = heap[parent]
+            if key[u] <= k:
+                break
+            heap[p] = u
+            pos[u] = p
+            p = parent
+        heap[p] = v
+        pos[v] = p
+
+    def _sift_down(self, p):
+        heap, key, pos = self.heap, self.key, self.pos
+        size = len(heap)
+        v = heap[p]
+        k = key[v]
+        while True:
+            child = 2 * p + 1
+            if child >= size:
+                break
+            if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            u = heap[child]
+            if key[u] >= k:
+                break
+            heap[p] = u
+            pos[u] = p
+            p = child
+        heap[p] = v
+        pos[v] = p
+
+
+class SpanningTreeAnalyzer:
+    """
+    Třída pro hledání minimální kostry, resp. minimálního lesa koster.
+
+    Počítá se na neorientovaném grafu reálných uzlů (orientace hran se
+    ignoruje, smyčky, nečíselné váhy a placeholdery se vynechají);
+    neohodnocená hrana má váhu 1. Nesouvislý graf dá les - jednu kostru
+    pro každou komponentu.
+
+    Metody vrací slovník {
+        'weight': součet vah hran lesa, 'edges': [Edge] hrany lesa,
+        'components': počet stromů lesa, 'algorithm': 'kruskal' | 'prim'
+    }.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicializace analyzátoru.
+
+        Args:
+            graph (Graph): Graf k analýze
+        """
+        self.graph = graph
+
+    def _indexed(self):
+        return IndexedGraph(self.graph, include=self.graph.is_real_node,
+                            undirected=True, skip_loops=True)
+
+    def _result(self, indexed, arcs, algorithm):
+        edges = self.graph.edges
+        return {
+            'weight': sum(indexed.weights[k] for k in arcs),
+            'edges': [edges[indexed.edge_pos[k]] for k in arcs],
+            'components': indexed.n - len(arcs),
+            'algorithm': algorithm,
+        }
+
+    def kruskal(self):
+        """
+        Minimální kostra Kruskalovým algoritmem.
+
+        Hrany se jednou seřadí podle váhy (při shodě podle pořadí v grafu)
+        a přidávají se, pokud spojují dvě různé množiny union-findu.
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed = self._indexed()
+        offsets, targets, weights, edge_pos = indexed.offsets, indexed.targets, indexed.weights, indexed.edge_pos
+        # Každá hrana má v neorientovaném snímku oblouk i -> j s i < j právě jednou
+        arcs = [(weights[k], edge_pos[k], i, targets[k], k)
+                for i in range(indexed.n) for k in range(offsets[i], offsets[i + 1]) if targets[k] > i]
+        arcs.sort()
+
+        union = UnionFind(range(indexed.n)).union
+        tree = []
+        limit = indexed.n - 1
+        for _, _, i, j, k in arcs:
+            if union(i, j):
+                tree.append(k)
+                if len(tree) == limit:
+                    break
+        return self._result(indexed, tree, 'kruskal')
+
+    def prim(self):
+        """
+        Minimální kostra Primovým algoritmem s indexovanou binární haldou.
+
+        Strom roste z libovolného uzlu, halda drží pro každý uzel mimo strom
+        nejlehčí hranu do stromu a klíč se při nalezení lehčí hrany sníží
+        na místě. Hodí se pro husté grafy. Po vyčerpání komponenty začne
+        nový strom v dalším nenavštíveném uzlu.
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        indexed = self._indexed()
+        n = indexed.n
+        offsets, targets, weights = indexed.offsets, indexed.targets, indexed.weights
+        heap = _IndexedHeap(n)
+        in_tree = [False] * n
+        best_arc = [-1] * n
+        tree = []
+
+        for root in range(n):
+            if in_tree[root]:
+                continue
+            heap.push_or_decrease(root, 0)
+            while heap:
+                u = heap.pop()
+                in_tree[u] = True
+                if best_arc[u] >= 0:
+                    tree.append(best_arc[u])
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if not in_tree[v] and heap.push_or_decrease(v, weights[k]):
+                        best_arc[v] = k
+        return self._result(indexed, tree, 'prim')
+
+    def minimum_spanning_forest(self, algorithm='auto'):
+        """
+        Minimální kostra (les) zvoleným algoritmem.
+
+        Args:
+            algorithm (str): 'kruskal', 'prim' nebo 'auto' (Prim pro husté
+                grafy, kde hran je alespoň čtvrtina všech dvojic uzlů)
+
+        Returns:
+            dict: Viz dokumentace třídy
+        """
+        if algorithm == 'auto':
+            n = len(self.graph.nodes)
+            algorithm = 'prim' if len(self.graph.edges) * 8 >= n * (n - 1) else 'kruskal'
+        if algorithm == 'prim':
+            return self.prim()
+        if algorithm == 'kruskal':
+            return self.kruskal()
+        raise ValueError(f"neznámý algoritmus kostry: {algorithm}")
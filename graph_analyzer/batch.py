@@ -0,0 +1,190 @@
+"""
+Dávkové zpracování celých adresářů grafů v poolu pracovních procesů.
+
+Každý soubor se načte a analyzuje v pracovním procesu jednou operací
+serveru (viz `server.ENDPOINTS`). Soubory se zadávají jako adresář nebo
+glob a plánují se od největšího, aby dlouhé úlohy nezačínaly až na konci
+a neprodlužovaly běh. Chyba jednoho souboru (i pád pracovního procesu)
+se zapíše do jeho řádku výsledků a ostatní soubory neovlivní.
+
+Řádek výsledku:
+    {'file': cesta, 'size': velikost v bajtech, 'ok': bool, 'error': text nebo None,
+     'nodes': počet uzlů, 'edges': počet hran, 'load_s': načtení [s],
+     'analysis_s': analýza [s], 'seconds': celkem [s], 'pid': pracovní proces,
+     'result': JSON-kompatibilní výsledek operace}
+"""
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import commands, server
+
+# Operace serveru, které nepotřebují parametry uzlů
+BATCH_OPS = ('info', 'properties', 'diameter', 'radius', 'center', 'fingerprint')
+
+SUMMARY_COLUMNS = ['file', 'size', 'ok', 'seconds', 'load_s', 'analysis_s', 'nodes', 'edges', 'pid', 'error']
+
+
+def collect_paths(pattern):
+    """
+    Cesty ke grafům podle adresáře nebo globu (seřazené, jen soubory).
+
+    Adresář se prochází bez podadresářů a skrytých souborů (viz
+    `commands.list_graph_files`); glob podporuje i `**`.
+    """
+    if os.path.isdir(pattern):
+        return commands.list_graph_files(pattern)
+    return sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+
+def _empty_row(path):
+    return {'file': path, 'size': None, 'ok': False, 'error': None, 'nodes': None, 'edges': None,
+            'load_s': None, 'analysis_s': None, 'seconds': None, 'pid': None, 'result': None}
+
+
+def analyze_file(path, op, request=None):
+    """
+    Načte a analyzuje jeden soubor; výjimky se vrátí v řádku výsledku.
+
+    Args:
+        path (str): Cesta k souboru s grafem
+        op (str): Název operace z BATCH_OPS
+        request (dict): Parametry operace
+
+    Returns:
+        dict: Řádek výsledku (viz dokumentace modulu)
+    """
+    row = _empty_row(path)
+    row['pid'] = os.getpid()
+    start = time.perf_counter()
+    try:
+        row['size'] = os.path.getsize(path)
+        graph = commands.load_graph(path)
+        loaded = time.perf_counter()
+        row['load_s'] = round(loaded - start, 6)
+        row['nodes'] = graph.get_node_count()
+        row['edges'] = graph.get_edge_count()
+        handler, _ = server.ENDPOINTS[op]
+        row['result'] = server._jsonable(handler(graph, request or {}))
+        row['analysis_s'] = round(time.perf_counter() - loaded, 6)
+        row['ok'] = True
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    row['seconds'] = round(time.perf_counter() - start, 6)
+    return row
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def run_batch(paths, op='properties', request=None, workers=None, progress=None):
+    """
+    Analyzuje soubory v poolu procesů, největší soubory první.
+
+    Pool má `workers` procesů (None = počet CPU, 0 = vše v hlavním procesu).
+    Úlohy se odesílají seřazené podle velikosti souboru sestupně a pool je
+    přiděluje volným procesům v tomto pořadí. Pokud pracovní proces spadne
+    (např. kvůli paměti), pool se rozpadne - dokončené výsledky zůstanou
+    a každý nedokončený soubor se zopakuje ve vlastním procesu; pokud spadne
+    i ten, soubor se označí jako chybný.
+
+    Args:
+        paths (list): Cesty k souborům
+        op (str): Název operace z BATCH_OPS
+        request (dict): Parametry operace
+        workers (int): Počet pracovních procesů
+        progress (callable): Volá se s každým hotovým řádkem
+
+    Returns:
+        list: Řádky výsledků ve stejném pořadí jako `paths`
+    """
+    if op not in BATCH_OPS:
+        raise ValueError(f"Neznámá dávková operace '{op}' (možnosti: {', '.join(BATCH_OPS)})")
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    order = sorted(paths, key=lambda path: (-_file_size(path), path))
+    rows = {}
+
+    def done(row):
+        rows[row['file']] = row
+        if progress is not None:
+            progress(row)
+
+    if workers <= 0 or len(order) <= 1:
+        for path in order:
+            done(analyze_file(path, op, request))
+    else:
+        crashed = _run_pool(order, op, request, workers, done)
+        # Po rozpadu poolu se nedokončené soubory zopakují každý ve vlastním procesu
+        for path in crashed:
+            _run_pool([path], op, request, 1, done, last_attempt=True)
+    return [rows[path] for path in paths]
+
+
+def _run_pool(paths, op, request, workers, done, last_attempt=False):
+    """Zpracuje soubory v jednom poolu; vrátí soubory, jejichž úloha skončila pádem procesu."""
+    crashed = []
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=server._fork_context())
+    try:
+        futures = {pool.submit(analyze_file, path, op, request): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                done(future.result())
+            except Exception as e:
+                if not last_attempt:
+                    crashed.append(path)
+                    continue
+                row = _empty_row(path)
+                row['size'] = _file_size(path)
+                row['error'] = f"{type(e).__name__}: {e}"
+                done(row)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return sorted(crashed, key=lambda path: (-_file_size(path), path))
+
+
+def summary_rows(rows):
+    """
+    Tabulka souhrnu: pevné sloupce a skalární hodnoty výsledků operace.
+
+    Returns:
+        tuple: (hlavička, řádky) pro `commands.write_csv`
+    """
+    keys = []
+    seen = set()
+    for row in rows:
+        if isinstance(row['result'], dict):
+            for key, value in row['result'].items():
+                if key not in seen and not isinstance(value, (dict, list)):
+                    seen.add(key)
+                    keys.append(key)
+    header = SUMMARY_COLUMNS + keys
+    table = []
+    for row in rows:
+        result = row['result'] if isinstance(row['result'], dict) else {}
+        values = [row[column] for column in SUMMARY_COLUMNS]
+        values += [result.get(key) for key in keys]
+        table.append(['' if value is None else value for value in values])
+    if rows and not keys:
+        # Výsledek operace není slovník (např. průměr) - samostatný sloupec
+        header = SUMMARY_COLUMNS + ['result']
+        for values, row in zip(table, rows):
+            values.append('' if row['result'] is None else json.dumps(row['result'], ensure_ascii=False))
+    return header, table
+
+
+def write_jsonl(path, rows):
+    """Zapíše řádky výsledků jako JSON Lines (jeden objekt na řádek)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
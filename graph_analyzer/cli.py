@@ -51,10 +51,11 @@ def create_parser():
             "  main.py graph.txt --properties\n"
             "  main.py graph.txt --info A\n"
             "  main.py graph.txt --matrices --export-csv out_dir\n"
+            "  main.py --serve --socket /tmp/graph.sock\n"
         ),
     )
 
-    parser.add_argument('input_file', help='Cesta k vstupnímu souboru s definicí grafu')
+    parser.add_argument('input_file', nargs='?', help='Cesta k vstupnímu souboru s definicí grafu')
     analysis_group = parser.add_argument_group('Typy analýz')
     analysis_group.add_argument('--properties', action='store_true', help='Zobrazí základní vlastnosti grafu')
     analysis_group.add_argument('--matrices', action='store_true', help='Zobrazí maticové reprezentace grafu')
@@ -63,6 +64,20 @@ def create_parser():
     analysis_group.add_argument('--weight', action='store_true', help='Zobrazí matici vah (pouze)')
     analysis_group.add_argument('--adj-power', type=int, metavar='K', help='Vypočte matici sousednosti na K-tou (A^K)')
     analysis_group.add_argument('--matrix-ops', action='store_true', help='Interaktivní operace s maticemi (sčítání řádků, sloupců, diagonál, atd.)')
+    analysis_group.add_argument('--clustering', action='store_true', help='Trojúhelníky, koeficienty shlukování a tranzitivita')
+    analysis_group.add_argument('--kcore', action='store_true', help='Jádrová čísla uzlů, degenerace a velikosti k-slupek')
+    analysis_group.add_argument('--kcore-export', nargs=2, metavar=('K', 'FILE'), help='Zapíše k-jádro grafu jako nový .tg soubor')
+    analysis_group.add_argument('--communities', nargs='?', const='louvain', choices=['louvain', 'lpa'], metavar='METHOD',
+                                help='Najde komunity: louvain (výchozí) nebo lpa - šíření značek')
+    analysis_group.add_argument('--resolution', type=float, default=1.0, metavar='G', help='Rozlišení modularity pro Louvain (výchozí: 1.0)')
+    analysis_group.add_argument('--mst', nargs='?', const='auto', choices=['auto', 'kruskal', 'prim'], metavar='ALG',
+                                help='Minimální kostra (les): kruskal, prim nebo auto (výchozí)')
+    analysis_group.add_argument('--mst-export', metavar='FILE', help='S --mst: zapíše kostru jako nový .tg soubor')
+    analysis_group.add_argument('--bridges', action='store_true', help='Mosty a artikulace (kritické hrany a uzly)')
+    analysis_group.add_argument('--biconnected', action='store_true', help='Dvojsouvislé komponenty (bloky) a strom bloků a artikulací')
+    analysis_group.add_argument('--coloring', nargs='?', const='dsatur', choices=['largest-first', 'smallest-last', 'dsatur', 'exact'],
+                                metavar='ALG', help='Obarví uzly: dsatur (výchozí), largest-first, smallest-last nebo exact')
+    analysis_group.add_argument('--exact-limit', type=int, default=64, metavar='N', help='S --coloring exact: největší komponenta pro přesné barvení (výchozí: 64)')
     analysis_group.add_argument('--full', action='store_true', help='Zobrazí kompletní analýzu grafu')
 
     node_group = parser.add_argument_group('Analýzy uzlů')
@@ -71,6 +86,13 @@ def create_parser():
     node_group.add_argument('--successors', metavar='NODE', help='Zobrazí následníky zadaného uzlu (orientované grafy)')
     node_group.add_argument('--predecessors', metavar='NODE', help='Zobrazí předchůdce zadaného uzlu (orientované grafy)')
     node_group.add_argument('--info', metavar='NODE', help='Zobrazí všechny vlastnosti zadaného uzlu')
+    node_group.add_argument('--ego', metavar='NODE', help='Omezí všechny analýzy na ego-síť uzlu (uzly do vzdálenosti --hops)')
+    node_group.add_argument('--hops', type=int, default=1, metavar='K', help='S --ego: největší počet hran od středu (výchozí: 1)')
+
+    edge_group = parser.add_argument_group('Dotazy na hrany')
+    edge_group.add_argument('--edges-where', metavar='COND',
+                            help='Vybere hrany podle váhy (např. "weight>50", "10<=weight<20") a omezí na ně analýzy')
+    edge_group.add_argument('--edge-label', metavar='LABEL', help='Vybere hrany s označením LABEL a omezí na ně analýzy')
 
     path_group = parser.add_argument_group('Analýzy cest')
     path_group.add_argument('--path', nargs=2, metavar=('START', 'END'), help='Najde nejkratší cestu mezi dvěma uzly')
@@ -79,9 +101,67 @@ def create_parser():
     path_group.add_argument('--diameter', action='store_true', help='Vypočítá průměr grafu')
     path_group.add_argument('--radius', action='store_true', help='Vypočítá poloměr grafu')
     path_group.add_argument('--center', action='store_true', help='Najde centrální uzly grafu')
+    path_group.add_argument('--approx', action='store_true', help='S --diameter: odhad HyperANF a meze průměru místo přesného výpočtu')
+    path_group.add_argument('--hll-precision', type=int, default=7, metavar='P', help='Počet bitů indexu registru HyperLogLogu, 2^P registrů na uzel (výchozí: 7)')
+    path_group.add_argument('--runs', type=int, default=3, metavar='K', help='Počet nezávislých běhů odhadu pro intervaly spolehlivosti (výchozí: 3)')
+    path_group.add_argument('--toposort', action='store_true', help='Topologické uspořádání (u grafu s cyklem vypíše cyklus)')
+    path_group.add_argument('--dag-paths', metavar='NODE', help='Nejkratší a nejdelší cesty z uzlu v acyklickém grafu')
+    path_group.add_argument('--critical-path', action='store_true', help='Kritická cesta acyklického grafu (váhy = doby trvání)')
+    path_group.add_argument('--euler', action='store_true', help='Eulerovský okruh nebo tah (každá hrana právě jednou)')
+    path_group.add_argument('--distance-stats', action='store_true', help='Průměrná délka nejkratší cesty a histogram vzdáleností')
+
+    centrality_group = parser.add_argument_group('Centralita')
+    centrality_group.add_argument('--betweenness', action='store_true', help='Vypočítá betweenness centralitu uzlů a hran (Brandes)')
+    centrality_group.add_argument('--closeness', action='store_true', help='Vypočítá closeness a harmonickou centralitu uzlů')
+    centrality_group.add_argument('--pagerank', action='store_true', help='Vypočítá PageRank uzlů')
+    centrality_group.add_argument('--katz', action='store_true', help='Vypočítá Katzovu centralitu uzlů')
+    centrality_group.add_argument('--eigenvector', action='store_true', help='Vypočítá centralitu podle vlastního vektoru')
+    centrality_group.add_argument('--damping', type=float, default=0.85, metavar='D', help='Tlumicí faktor PageRanku (výchozí: 0.85)')
+    centrality_group.add_argument('--personalize', action='append', metavar='NODE[=W]', help='Personalizace PageRanku - skoky jen do zadaných uzlů (lze opakovat)')
+    centrality_group.add_argument('--alpha', type=float, default=0.1, metavar='A', help='Útlum Katzovy centrality (výchozí: 0.1)')
+    centrality_group.add_argument('--tol', type=float, default=1e-6, metavar='EPS', help='Tolerance konvergence mocninné metody (výchozí: 1e-6)')
+    centrality_group.add_argument('--max-iter', type=int, metavar='N', help='Maximální počet iterací mocninné metody')
+    centrality_group.add_argument('--samples', type=int, metavar='K', help='Odhad z K náhodných zdrojů místo přesného výpočtu')
+    centrality_group.add_argument('--seed', type=int, metavar='N', help='Semínko náhodného generátoru (opakovatelné výsledky)')
+    centrality_group.add_argument('--top', type=int, default=10, metavar='N', help='Počet zobrazených nejlepších uzlů/hran (výchozí: 10)')
+
+    flow_group = parser.add_argument_group('Toky')
+    flow_group.add_argument('--maxflow', nargs=2, metavar=('S', 'T'), help='Maximální tok a minimální řez mezi uzly S a T (váhy = kapacity)')
+    flow_group.add_argument('--maxflow-pairs', metavar='FILE', help='Maximální toky pro dvojice uzlů ze souboru (řádek "S T") nad jednou sítí')
+    flow_group.add_argument('--flow-algorithm', choices=['dinic', 'push-relabel'], default='dinic', help='Algoritmus maximálního toku (výchozí: dinic)')
+
+    matching_group = parser.add_argument_group('Párování')
+    matching_group.add_argument('--matching', nargs='?', const='auto', choices=['auto', 'hopcroft-karp', 'blossom'], metavar='ALG',
+                                help='Maximální párování: auto (výchozí), hopcroft-karp (bipartitní graf) nebo blossom')
+    matching_group.add_argument('--assignment', nargs='?', const='min', choices=['min', 'max'],
+                                help='Přiřazení v bipartitním grafu s nejmenší (min) nebo největší (max) celkovou vahou')
+
+    fingerprint_group = parser.add_argument_group('Otisky grafů')
+    fingerprint_group.add_argument('--fingerprint', action='store_true', help='Otisk grafu (Weisfeiler-Lehman) nezávislý na pojmenování uzlů')
+    fingerprint_group.add_argument('--fingerprint-dir', metavar='DIR|GLOB', help='Otiskne všechny grafy z adresáře nebo globu a najde izomorfní (bez input_file)')
+    fingerprint_group.add_argument('--wl-iterations', type=int, default=3, metavar='N', help='Největší počet kol zjemňování barev (výchozí: 3)')
+    fingerprint_group.add_argument('--wl-node-values', action='store_true', help='Otisk rozlišuje ohodnocení uzlů')
+    fingerprint_group.add_argument('--wl-edge-labels', action='store_true', help='Otisk rozlišuje váhy a popisky hran')
+
+    batch_group = parser.add_argument_group('Dávkové zpracování')
+    batch_group.add_argument('--batch', metavar='DIR|GLOB', help='Analyzuje všechny grafy z adresáře nebo globu v poolu procesů (bez input_file)')
+    batch_group.add_argument('--batch-op', choices=['info', 'properties', 'diameter', 'radius', 'center', 'fingerprint'],
+                             default='properties', help='Analýza každého souboru dávky (výchozí: properties)')
+    batch_group.add_argument('--batch-output', metavar='FILE', help='Souhrnná tabulka dávky s časy souborů (.jsonl = JSON Lines, jinak CSV)')
+
+    server_group = parser.add_argument_group('Serverový režim')
+    server_group.add_argument('--serve', action='store_true', help='Spustí perzistentní JSON server (input_file se volitelně načte předem)')
+    server_group.add_argument('--socket', metavar='PATH', help='Naslouchá na Unix socketu PATH místo TCP')
+    server_group.add_argument('--port', type=int, default=8765, metavar='PORT', help='TCP port na localhostu (výchozí: 8765)')
+    server_group.add_argument('--cache-size', type=int, default=16, metavar='N', help='Počet grafů držených v paměti (výchozí: 16)')
 
+    parser.add_argument('--apply-delta', action='append', metavar='FILE', help='Před analýzou aplikuje soubor změn (+u/-u/+h/-h/~h); lze opakovat')
+    parser.add_argument('--workers', type=int, default=None, metavar='N', help='Počet pracovních procesů pro server a paralelní analýzy (výchozí: automaticky)')
     parser.add_argument('--quiet', '-q', action='store_true', help='Potlačí výstupní zprávy (pouze výsledky)')
     parser.add_argument('--export-csv', metavar='DIR', help='Exportovat vybrané matice jako CSV do adresáře DIR')
+    parser.add_argument('--no-cache', action='store_true', help='Nepoužije diskovou cache výsledků analýz')
+    parser.add_argument('--cache-dir', metavar='DIR', help='Adresář cache výsledků (výchozí: ~/.cache/graph_analyzer)')
+    parser.add_argument('--cache-limit', type=int, default=256, metavar='MB', help='Maximální velikost cache výsledků v MB (výchozí: 256)')
     parser.add_argument('--max-paths', type=int, default=10, metavar='N', help='Maximální počet zobrazených cest (výchozí: 10)')
 
     return parser
@@ -91,28 +171,95 @@ def run(argv=None):
     parser = create_parser()
     args = parser.parse_args(argv)
 
+    if args.serve:
+        from . import server
+        server.run_server(args)
+        return
+
+    if args.batch:
+        commands.analyze_batch(args, args.quiet)
+        return
+
+    if args.fingerprint_dir:
+        from .batch import collect_paths
+        commands.fingerprint_files(collect_paths(args.fingerprint_dir), args, args.quiet)
+        return
+
+    if args.input_file is None:
+        parser.error('chybí vstupní soubor (input_file)')
+
     # if not args.quiet:
     #     print_custom_header()
 
-    graph = commands.load_graph(args.input_file)
+    graph = commands.load_graph(args.input_file, hash_content=not args.no_cache)
+    tracker = None
+    edge_query = args.edges_where or args.edge_label is not None
+    if args.distances and args.apply_delta and not args.ego and not edge_query:
+        # Vzdálenosti se po změnách přepočítají jen v dotčené části grafu
+        tracker = commands.track_distances(graph, args.distances)
+    for delta_file in args.apply_delta or []:
+        commands.apply_delta(graph, delta_file, args.quiet)
+    commands.print_tracking_stats(tracker, args.quiet)
+    if args.ego:
+        graph = commands.scope_to_ego(graph, args.ego, args.hops, args.quiet)
+        if graph is None:
+            return
+    selected_edges = None
+    if edge_query:
+        scoped = commands.scope_to_edges(graph, args.edges_where, args.edge_label, args.quiet)
+        if scoped is None:
+            return
+        graph, selected_edges = scoped
+    cache = None
+    if not args.no_cache:
+        from .utils import ResultCache
+        cache = ResultCache(args.cache_dir, max_bytes=args.cache_limit * 1024 * 1024)
 
     has_specific_args = any([
-        args.properties, args.matrices, args.full,
+        args.properties, args.matrices, args.full, args.clustering, args.kcore, args.kcore_export,
+        args.communities, args.mst, args.bridges, args.biconnected, args.coloring,
         args.neighbors, args.degree, args.successors, args.predecessors, args.info,
         args.path, args.all_paths, args.distances, args.diameter, args.radius, args.center,
-        args.adjacency, args.incidence, args.weight, args.adj_power is not None, args.matrix_ops
+        args.distance_stats, args.toposort, args.dag_paths, args.critical_path, args.euler,
+        args.adjacency, args.incidence, args.weight, args.adj_power is not None, args.matrix_ops,
+        args.betweenness, args.closeness, args.pagerank, args.katz, args.eigenvector,
+        args.maxflow, args.maxflow_pairs, args.matching, args.assignment, args.fingerprint,
     ])
 
     if not has_specific_args:
+        if selected_edges is not None:
+            commands.print_selected_edges(selected_edges, args, args.quiet)
+            return
         commands.print_basic_info(graph, args.quiet)
-        commands.analyze_properties(graph, args.quiet)
+        commands.analyze_properties(graph, args.quiet, cache=cache)
         return
 
     if not args.quiet:
         commands.print_basic_info(graph, args.quiet)
 
+    if selected_edges is not None:
+        commands.print_selected_edges(selected_edges, args, args.quiet)
+
     if args.properties or args.full:
-        commands.analyze_properties(graph, args.quiet)
+        commands.analyze_properties(graph, args.quiet, cache=cache)
+
+    if args.clustering:
+        commands.analyze_clustering(graph, args, args.quiet, cache=cache)
+
+    if args.kcore or args.kcore_export:
+        commands.analyze_cores(graph, args, args.quiet)
+
+    if args.communities:
+        commands.analyze_communities(graph, args, args.quiet)
+
+    if args.mst:
+        commands.analyze_spanning_tree(graph, args, args.quiet)
+
+    if args.bridges or args.biconnected:
+        commands.analyze_biconnectivity(graph, args, args.quiet)
+
+    if args.coloring:
+        commands.analyze_coloring(graph, args, args.quiet)
 
     if args.neighbors:
         commands.analyze_node(graph, args.neighbors, 'neighbors', args.quiet)
@@ -129,9 +276,28 @@ def run(argv=None):
     if args.info:
         commands.analyze_node(graph, args.info, 'all', args.quiet)
 
-    if any([args.path, args.all_paths, args.distances, args.diameter, args.radius, args.center]):
-        commands.analyze_paths(graph, args, args.quiet)
+    if any([args.path, args.all_paths, args.distances, args.diameter, args.radius, args.center,
+            args.distance_stats]):
+        commands.analyze_paths(graph, args, args.quiet, cache=cache, tracker=tracker)
+
+    if args.toposort or args.dag_paths or args.critical_path:
+        commands.analyze_dag(graph, args, args.quiet)
+
+    if args.euler:
+        commands.analyze_euler(graph, args, args.quiet)
+
+    if any([args.betweenness, args.closeness, args.pagerank, args.katz, args.eigenvector]):
+        commands.analyze_centrality(graph, args, args.quiet)
+
+    if args.maxflow or args.maxflow_pairs:
+        commands.analyze_flow(graph, args, args.quiet)
+
+    if args.matching or args.assignment:
+        commands.analyze_matching(graph, args, args.quiet)
+
+    if args.fingerprint:
+        commands.analyze_fingerprint(graph, args, args.quiet)
 
     specific_matrix_flags = any([args.adjacency, args.incidence, args.weight, args.adj_power is not None])
     if args.matrices or args.full or specific_matrix_flags or args.matrix_ops:
-        commands.analyze_matrices(graph, args, args.quiet)
+        commands.analyze_matrices(graph, args, args.quiet, cache=cache)
@@ -1,17 +1,27 @@
+import csv
+import hashlib
 import os
+import re
 import sys
+import time
 
-from .models import Graph
-from .utils import GraphParser
-from .analyzers import GraphPropertiesAnalyzer, PathAnalyzer, MatrixAnalyzer
+from .models import Graph, GraphView
+from .utils import GraphParser, GraphWriter
+from .utils.result_cache import analysis_key, file_hash
 
 
-def load_graph(input_file):
-    """Načte graf ze souboru a vrátí objekt Graph."""
+def load_graph(input_file, hash_content=False):
+    """
+    Načte graf ze souboru a vrátí objekt Graph.
+
+    S hash_content=True spočítá i hash obsahu souboru (klíč cache výsledků).
+    """
     try:
         nodes_dict, edges_list = GraphParser.parse_file(input_file)
         graph = Graph()
         graph.load_from_data(nodes_dict, edges_list)
+        if hash_content:
+            graph.content_hash = file_hash(input_file)
         return graph
     except FileNotFoundError:
         raise
@@ -19,6 +29,144 @@ def load_graph(input_file):
         raise
 
 
+def apply_delta(graph, delta_file, quiet=False):
+    """Aplikuje soubor se změnami (+u/-u/+h/-h/~h) na načtený graf."""
+    base_hash = graph.content_hash
+    operations = GraphParser.parse_delta_file(delta_file)
+    applied = graph.apply_delta(operations)
+
+    # Klíč cache nového stavu = hash původního grafu + hash změn
+    if base_hash is not None:
+        graph.content_hash = hashlib.sha256(f"{base_hash}|{file_hash(delta_file)}".encode('utf-8')).hexdigest()
+
+    if not quiet:
+        summary = ', '.join(f"{kind}={count}" for kind, count in sorted(applied.items())) or 'žádné'
+        print(f"Aplikovány změny z '{delta_file}': {summary}")
+    return applied
+
+
+def scope_to_ego(graph, node_id, hops, quiet=False):
+    """Vrátí pohled na ego-síť uzlu (--ego), na který se omezí všechny další analýzy."""
+    try:
+        view = GraphView.ego(graph, node_id, hops)
+    except KeyError as e:
+        print(f"Chyba: {e.args[0]}", file=sys.stderr)
+        return None
+    if not quiet:
+        print(f"Ego-síť uzlu '{node_id}' (do {hops} hran): {len(view.nodes)} uzlů, {len(view.edges)} hran")
+    return view
+
+
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+_WEIGHT_BETWEEN = re.compile(rf'^({_NUMBER})(<=?)weight(<=?)({_NUMBER})$')
+_WEIGHT_COMPARE = re.compile(rf'^weight(<=|>=|==|=|<|>)({_NUMBER})$')
+
+
+def parse_weight_condition(text):
+    """
+    Převede podmínku --edges-where na interval pro WeightIndex.range().
+
+    Podporované tvary: 'weight>50', 'weight>=50', 'weight<5', 'weight<=5',
+    'weight=5' ('=='), '10<weight<=50' (mezery se ignorují).
+
+    Returns:
+        tuple: (dolní mez, horní mez, uzavřeno zdola, uzavřeno shora)
+
+    Raises:
+        ValueError: Neplatná podmínka
+    """
+    compact = text.replace(' ', '')
+    match = _WEIGHT_BETWEEN.match(compact)
+    if match:
+        low, low_op, high_op, high = match.groups()
+        return float(low), float(high), low_op == '<=', high_op == '<='
+    match = _WEIGHT_COMPARE.match(compact)
+    if not match:
+        raise ValueError(f"Neplatná podmínka '{text}' (očekáváno např. weight>50 nebo 10<=weight<20)")
+    op, value = match.group(1), float(match.group(2))
+    if op in ('=', '=='):
+        return value, value, True, True
+    if op in ('>', '>='):
+        return value, None, op == '>=', True
+    return None, value, True, op == '<='
+
+
+def scope_to_edges(graph, where=None, label=None, quiet=False):
+    """
+    Vybere hrany přes indexy vah a označení (--edges-where, --edge-label).
+
+    Returns:
+        tuple: (pohled se všemi uzly a vybranými hranami, vybrané hrany
+            seřazené podle váhy, resp. v pořadí vložení), nebo None při chybě
+    """
+    edges = None
+    parts = []
+    if where:
+        try:
+            low, high, include_low, include_high = parse_weight_condition(where)
+        except ValueError as e:
+            print(f"Chyba: {e}", file=sys.stderr)
+            return None
+        edges = graph.get_weight_index().range(low, high, include_low, include_high)
+        parts.append(where.replace(' ', ''))
+    if label is not None:
+        labelled = graph.get_label_index().get(label)
+        if edges is None:
+            edges = labelled
+        else:
+            keep = set(map(id, labelled))
+            edges = [edge for edge in edges if id(edge) in keep]
+        parts.append(f"label={label}")
+    description = ' '.join(parts)
+    view = GraphView.from_edges(graph, edges, description=f"edges:{description}")
+    if not quiet:
+        print(f"Hrany ({description}): {len(view.edges)} z {len(graph.edges)}, analýzy se omezí na ně")
+    return view, edges
+
+
+def print_selected_edges(edges, args, quiet=False):
+    """Vypíše hrany vybrané přes --edges-where / --edge-label (a exportuje je do edges.csv)."""
+    if not quiet:
+        print("\n" + "="*60)
+        print("VYBRANÉ HRANY")
+        print("="*60)
+    print(f"Počet hran:_________{len(edges)}")
+    shown = min(args.top, len(edges))
+    for edge in edges[:shown]:
+        print(f"  {format_edge(edge)}")
+    if len(edges) > shown:
+        print(f"  ... a dalších {len(edges) - shown}")
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'edges.csv'), ['source', 'direction', 'target', 'weight', 'label'],
+                  [[edge.u.identifier, edge.direction, edge.v.identifier, edge.weight, edge.label] for edge in edges])
+
+
+def track_distances(graph, node_id):
+    """Začne sledovat vzdálenosti od uzlu, aby je šlo po změnách přepočítat inkrementálně."""
+    from .analyzers import PathAnalyzer
+    if node_id not in graph.nodes:
+        return None
+    return PathAnalyzer(graph).track_shortest_distances(node_id)
+
+
+def print_tracking_stats(tracker, quiet=False):
+    """Vypíše, kolik uzlů se při inkrementálním přepočtu vzdáleností skutečně zpracovalo."""
+    if quiet or tracker is None:
+        return
+    stats = tracker.stats()
+    print(f"Inkrementální přepočet vzdáleností od '{tracker.source}': "
+          f"změn hran {stats['updates']}, přepočítáno uzlů {stats['total_touched']} "
+          f"(graf má {stats['nodes']} uzlů)")
+
+
+def _cached(cache, graph, analysis, compute, **params):
+    """Vrátí výsledek analýzy z cache výsledků, nebo ho spočítá a uloží."""
+    graph_hash = getattr(graph, 'content_hash', None)
+    if cache is None or graph_hash is None:
+        return compute()
+    return cache.get_or_compute(analysis_key(graph_hash, analysis, **params), compute)
+
+
 def print_basic_info(graph, quiet=False):
     """Vytiskne základní informace o grafu."""
     if not quiet:
@@ -30,10 +178,17 @@ def print_basic_info(graph, quiet=False):
     print(f"Počet hran:_________{graph.get_edge_count()}")
 
 
-def analyze_properties(graph, quiet=False):
+def analyze_properties(graph, quiet=False, cache=None):
     """Analyzuje vlastnosti grafu a vytiskne je."""
+    from .analyzers import GraphPropertiesAnalyzer
     analyzer = GraphPropertiesAnalyzer(graph)
-    properties = analyzer.get_basic_properties()
+
+    def compute():
+        result = analyzer.get_basic_properties()
+        result['is_planar'] = analyzer.is_planar_graph()
+        return result
+
+    properties = _cached(cache, graph, 'properties', compute)
 
     def _fmt_bool(val):
         """Vrací 'Ano'/'Ne' (či barevnou variantu) pro boolean hodnoty."""
@@ -62,10 +217,476 @@ def analyze_properties(graph, quiet=False):
     print(f"Les:________________{_fmt_bool(properties['is_forest'])}")
     print(f"Obsahuje smyčky:____{_fmt_bool(properties['has_loops'])}")
     print(f"Obsahuje cykly:_____{_fmt_bool(properties['has_cycles'])}")
-    print(f"Rovinný (heur.):____{_fmt_bool(analyzer.is_planar_graph())}")
+    print(f"Rovinný (heur.):____{_fmt_bool(properties['is_planar'])}")
     print(f"Počet komponent:____{properties['component_count']}")
 
 
+def analyze_clustering(graph, args, quiet=False, cache=None):
+    """Vypočítá a vypíše počty trojúhelníků a koeficienty shlukování."""
+    from .analyzers import GraphPropertiesAnalyzer
+    if not quiet:
+        print("\n" + "="*60)
+        print("TROJÚHELNÍKY A SHLUKOVÁNÍ")
+        print("="*60)
+
+    analyzer = GraphPropertiesAnalyzer(graph)
+    result = _cached(cache, graph, 'clustering', lambda: analyzer.clustering(workers=args.workers))
+    print(f"Trojúhelníky:_______{result['triangles']}")
+    print(f"Tranzitivita:_______{result['transitivity']:.4f}")
+    print(f"Prům. shlukování:___{result['average_clustering']:.4f}")
+
+    top = args.top
+    ranked = sorted(result['nodes'].items(), key=lambda item: (-item[1]['triangles'], item[0]))
+    if ranked:
+        print(f"Uzly s nejvíce trojúhelníky (top {min(top, len(ranked))}):")
+        for node_id, values in ranked[:top]:
+            print(f"  {node_id}: {values['triangles']} (koeficient {values['clustering']:.4f})")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'clustering.csv'), ['node', 'degree', 'triangles', 'clustering'],
+                  [[node_id, values['degree'], values['triangles'], values['clustering']] for node_id, values in ranked])
+
+
+def analyze_cores(graph, args, quiet=False):
+    """Vypočítá jádrová čísla; s --kcore-export zapíše k-jádro do .tg souboru."""
+    from .analyzers import CoreAnalyzer
+    analyzer = CoreAnalyzer(graph)
+    result = analyzer.core_numbers()
+
+    if args.kcore:
+        if not quiet:
+            print("\n" + "="*60)
+            print("K-JÁDRA")
+            print("="*60)
+        print(f"Degenerace:_________{result['degeneracy']}")
+        print("Velikosti k-slupek (jádrové číslo: počet uzlů):")
+        for k, size in result['shells'].items():
+            print(f"  {k}: {size}")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'core_numbers.csv'), ['node', 'core'],
+                      sorted(result['cores'].items(), key=lambda item: (-item[1], item[0])))
+
+    if args.kcore_export:
+        k_text, path = args.kcore_export
+        try:
+            k = int(k_text)
+        except ValueError:
+            k = -1
+        if k < 0:
+            print(f"Chyba: K musí být nezáporné celé číslo, ne '{k_text}'", file=sys.stderr)
+            return
+        members = analyzer.k_core(k, result['cores'])
+        node_count, edge_count = GraphWriter.write_file(graph, path, include=members.__contains__)
+        print(f"{k}-jádro ({node_count} uzlů, {edge_count} hran) zapsáno do {path}")
+
+
+def analyze_communities(graph, args, quiet=False):
+    """Najde komunity (Louvain nebo šíření značek) a vypíše jejich modularitu a velikosti."""
+    from .analyzers import CommunityAnalyzer
+    if not quiet:
+        print("\n" + "="*60)
+        print("KOMUNITY")
+        print("="*60)
+
+    analyzer = CommunityAnalyzer(graph)
+    try:
+        if args.communities == 'lpa':
+            result = analyzer.label_propagation(seed=args.seed, max_iter=args.max_iter or 100)
+        else:
+            result = analyzer.louvain(resolution=args.resolution, seed=args.seed)
+    except ValueError as e:
+        print(f"Chyba: {e}")
+        return
+
+    print(f"Metoda:_____________{'šíření značek' if args.communities == 'lpa' else 'Louvain'}")
+    print(f"Počet komunit:______{result['count']}")
+    print(f"Modularita:_________{result['modularity']:.4f}")
+    if 'levels' in result:
+        print(f"Úrovně:_____________{len(result['levels'])}")
+    else:
+        suffix = '' if result['converged'] else ' (nezkonvergovalo)'
+        print(f"Kola:_______________{result['iterations']}{suffix}")
+
+    members = {}
+    for node_id, community in result['communities'].items():
+        members.setdefault(community, []).append(node_id)
+    shown = min(args.top, result['count'])
+    if shown:
+        print(f"Největší komunity (top {shown}):")
+        for community in range(shown):
+            nodes = members[community]
+            preview = ', '.join(nodes[:5]) + (', ...' if len(nodes) > 5 else '')
+            print(f"  {community}: {len(nodes)} uzlů ({preview})")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'communities.csv'), ['node', 'community'],
+                  sorted(result['communities'].items(), key=lambda item: (item[1], item[0])))
+
+
+def analyze_spanning_tree(graph, args, quiet=False):
+    """Najde minimální kostru (les); s --mst-export ji zapíše do .tg souboru."""
+    from .analyzers import SpanningTreeAnalyzer
+    if not quiet:
+        print("\n" + "="*60)
+        print("MINIMÁLNÍ KOSTRA")
+        print("="*60)
+
+    result = SpanningTreeAnalyzer(graph).minimum_spanning_forest(args.mst)
+    edges = result['edges']
+    print(f"Algoritmus:_________{'Kruskal' if result['algorithm'] == 'kruskal' else 'Prim'}")
+    print(f"Celková váha:_______{result['weight']:g}")
+    print(f"Počet hran:_________{len(edges)}")
+    print(f"Počet stromů:_______{result['components']}")
+
+    shown = min(args.top, len(edges))
+    if shown:
+        print(f"Hrany kostry (prvních {shown}):")
+        for edge in edges[:shown]:
+            print(f"  {format_edge(edge)}")
+        if len(edges) > shown:
+            print(f"  ... a dalších {len(edges) - shown}")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'mst.csv'), ['source', 'target', 'weight'],
+                  [[edge.u.identifier, edge.v.identifier, 1 if edge.weight is None else edge.weight] for edge in edges])
+    if args.mst_export:
+        node_count, edge_count = GraphWriter.write_file(graph, args.mst_export, edges=edges,
+                                                        include=graph.is_real_node)
+        print(f"Kostra ({node_count} uzlů, {edge_count} hran) zapsána do {args.mst_export}")
+
+
+def analyze_biconnectivity(graph, args, quiet=False):
+    """Vypíše mosty a artikulace (--bridges) nebo bloky a strom bloků (--biconnected)."""
+    from .analyzers import BiconnectivityAnalyzer
+    result = BiconnectivityAnalyzer(graph).analyze()
+    bridges = result['bridges']
+    articulation = result['articulation_points']
+    blocks = result['blocks']
+
+    if args.bridges:
+        if not quiet:
+            print("\n" + "="*60)
+            print("MOSTY A ARTIKULACE")
+            print("="*60)
+        print(f"Počet mostů:________{len(bridges)}")
+        print(f"Počet artikulací:___{len(articulation)}")
+        shown = min(args.top, len(bridges))
+        if shown:
+            print(f"Mosty (prvních {shown}):")
+            for edge in bridges[:shown]:
+                print(f"  {format_edge(edge)}")
+            if len(bridges) > shown:
+                print(f"  ... a dalších {len(bridges) - shown}")
+        shown = min(args.top, len(articulation))
+        if shown:
+            preview = ', '.join(articulation[:shown]) + (', ...' if len(articulation) > shown else '')
+            print(f"Artikulace:_________{preview}")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'bridges.csv'), ['source', 'direction', 'target'],
+                      [[edge.u.identifier, edge.direction, edge.v.identifier] for edge in bridges])
+            write_csv(os.path.join(args.export_csv, 'articulation_points.csv'), ['node'],
+                      [[node_id] for node_id in articulation])
+
+    if args.biconnected:
+        if not quiet:
+            print("\n" + "="*60)
+            print("DVOJSOUVISLÉ KOMPONENTY")
+            print("="*60)
+        print(f"Počet bloků:________{len(blocks)}")
+        if blocks:
+            print(f"Největší blok:______{max(len(nodes) for nodes in blocks)} uzlů")
+        print(f"Hrany stromu bloků:_{len(result['block_cut_tree'])}")
+        ranked = sorted(range(len(blocks)), key=lambda b: (-len(blocks[b]), b))
+        shown = min(args.top, len(blocks))
+        if shown:
+            print(f"Největší bloky (top {shown}):")
+            for b in ranked[:shown]:
+                nodes = blocks[b]
+                preview = ', '.join(nodes[:5]) + (', ...' if len(nodes) > 5 else '')
+                print(f"  {b}: {len(nodes)} uzlů, {len(result['block_edges'][b])} hran ({preview})")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'biconnected.csv'), ['block', 'node'],
+                      [[b, node_id] for b, nodes in enumerate(blocks) for node_id in nodes])
+            write_csv(os.path.join(args.export_csv, 'block_cut_tree.csv'), ['block', 'articulation_point'],
+                      result['block_cut_tree'])
+
+
+def analyze_coloring(graph, args, quiet=False):
+    """Obarví uzly zvoleným algoritmem a vypíše počet barev a meze chromatického čísla."""
+    from .analyzers import ColoringAnalyzer
+    if not quiet:
+        print("\n" + "="*60)
+        print("BARVENÍ GRAFU")
+        print("="*60)
+
+    try:
+        result = ColoringAnalyzer(graph).color(args.coloring, max_nodes=args.exact_limit)
+    except ValueError as e:
+        print(f"Chyba: {e}")
+        return
+
+    print(f"Algoritmus:_________{result['algorithm']}")
+    print(f"Počet barev:________{result['count']}{' (optimální)' if result['optimal'] else ''}")
+    print(f"Dolní mez (klika):__{result['lower_bound']}")
+    print(f"Horní mez:__________{result['upper_bound']} (degenerace {result['degeneracy']} + 1)")
+    if result['clique']:
+        print(f"Klika:______________{', '.join(result['clique'])}")
+    sizes = {}
+    for color in result['colors'].values():
+        sizes[color] = sizes.get(color, 0) + 1
+    print("Velikosti barevných tříd (barva: počet uzlů):")
+    for color, size in sorted(sizes.items()):
+        print(f"  {color}: {size}")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'coloring.csv'), ['node', 'color'],
+                  sorted(result['colors'].items(), key=lambda item: (item[1], item[0])))
+
+
+def read_flow_pairs(path):
+    """Načte dvojice (zdroj, stok) ze souboru - jedna dvojice na řádek, '#' uvozuje komentář."""
+    pairs = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if len(parts) != 2:
+                raise ValueError(f"{path}:{line_no}: očekávána dvojice 'S T', nalezeno '{line}'")
+            pairs.append(tuple(parts))
+    return pairs
+
+
+def analyze_flow(graph, args, quiet=False):
+    """Vypočítá maximální tok a minimální řez (jedna dvojice nebo dávka ze souboru)."""
+    from .analyzers import FlowAnalyzer
+    if not quiet:
+        print("\n" + "="*60)
+        print("MAXIMÁLNÍ TOK")
+        print("="*60)
+
+    analyzer = FlowAnalyzer(graph)
+    try:
+        if args.maxflow:
+            source, sink = args.maxflow
+            result = analyzer.max_flow(source, sink, args.flow_algorithm)
+            print(f"Zdroj -> stok:______{source} -> {sink}")
+            print(f"Maximální tok:______{result['value']:g}")
+            print(f"Hrany minimálního řezu ({len(result['cut_edges'])}):")
+            for edge in result['cut_edges']:
+                print(f"  {format_edge(edge)}")
+            if args.export_csv:
+                write_csv(os.path.join(args.export_csv, 'min_cut.csv'), ['source', 'direction', 'target', 'capacity'],
+                          [[edge.u.identifier, edge.direction, edge.v.identifier, 1 if edge.weight is None else edge.weight]
+                           for edge in result['cut_edges']])
+
+        if args.maxflow_pairs:
+            pairs = read_flow_pairs(args.maxflow_pairs)
+            results = analyzer.max_flows(pairs, args.flow_algorithm)
+            print(f"Počet dotazů:_______{len(results)}")
+            for (source, sink), result in zip(pairs, results):
+                print(f"  {source} -> {sink}: {result['value']:g} (řez: {len(result['cut_edges'])} hran)")
+            if args.export_csv:
+                write_csv(os.path.join(args.export_csv, 'maxflow.csv'), ['source', 'target', 'value', 'cut_edges'],
+                          [[source, sink, result['value'], len(result['cut_edges'])]
+                           for (source, sink), result in zip(pairs, results)])
+    except (OSError, ValueError) as e:
+        print(f"Chyba: {e}")
+        return
+
+
+def analyze_matching(graph, args, quiet=False):
+    """Maximální párování (--matching) a přiřazení s optimální vahou (--assignment)."""
+    from .analyzers import MatchingAnalyzer
+    analyzer = MatchingAnalyzer(graph)
+    runs = []
+    if args.matching:
+        runs.append(('PÁROVÁNÍ', 'matching.csv', lambda: analyzer.maximum_matching(args.matching)))
+    if args.assignment:
+        runs.append(('PŘIŘAZENÍ', 'assignment.csv', lambda: analyzer.assignment(maximize=args.assignment == 'max')))
+
+    for title, filename, compute in runs:
+        if not quiet:
+            print("\n" + "="*60)
+            print(title)
+            print("="*60)
+        try:
+            result = compute()
+        except ValueError as e:
+            print(f"Chyba: {e}")
+            continue
+
+        pairs = result['pairs']
+        print(f"Algoritmus:_________{result['algorithm']}")
+        print(f"Bipartitní:_________{'ano' if result['bipartite'] else 'ne'}")
+        print(f"Velikost párování:__{result['size']}")
+        if 'weight' in result:
+            print(f"Celková váha:_______{result['weight']:g}")
+        shown = min(args.top, len(pairs))
+        if shown:
+            print(f"Dvojice (prvních {shown}):")
+            for u, v in pairs[:shown]:
+                print(f"  {u} - {v}")
+            if len(pairs) > shown:
+                print(f"  ... a dalších {len(pairs) - shown}")
+        cover = result['vertex_cover']
+        if cover is not None:
+            shown = min(args.top, len(cover))
+            print(f"Vrcholové pokrytí (König): {len(cover)} uzlů"
+                  + (f" ({', '.join(cover[:shown])}{', ...' if len(cover) > shown else ''})" if shown else ''))
+
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, filename), ['u', 'v'], pairs)
+            if cover is not None and filename == 'matching.csv':
+                write_csv(os.path.join(args.export_csv, 'vertex_cover.csv'), ['node'], [[node_id] for node_id in cover])
+
+
+def _fingerprint_analyzer(graph, args):
+    from .analyzers import FingerprintAnalyzer
+    return FingerprintAnalyzer(graph, iterations=args.wl_iterations,
+                               node_values=args.wl_node_values, edge_labels=args.wl_edge_labels)
+
+
+def _fingerprint_request(args):
+    return {'iterations': args.wl_iterations, 'node_values': args.wl_node_values, 'edge_labels': args.wl_edge_labels}
+
+
+def analyze_fingerprint(graph, args, quiet=False):
+    """Vypíše WL otisk grafu (--fingerprint)."""
+    if not quiet:
+        print("\n" + "="*60)
+        print("OTISK GRAFU")
+        print("="*60)
+
+    result = _fingerprint_analyzer(graph, args).fingerprint()
+    print(f"Otisk:______________{result['hash']}")
+    print(f"Uzly / hrany:_______{result['nodes']} / {result['edges']}")
+    print(f"Kola zjemňování:____{result['iterations']}")
+    print(f"Barevné třídy:______{result['classes']}")
+
+
+def list_graph_files(directory):
+    """Seřazené cesty k souborům v adresáři (bez skrytých souborů a podadresářů)."""
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if not name.startswith('.') and os.path.isfile(os.path.join(directory, name))]
+
+
+def fingerprint_files(paths, args, quiet=False):
+    """
+    Najde strukturně shodné grafy mezi soubory (--fingerprint-dir).
+
+    Soubory se otisknou dávkově v poolu procesů (viz `batch.run_batch`),
+    v paměti zůstanou jen otisky.
+    Izomorfismus se ověřuje jen uvnitř skupin se shodným otiskem - soubory
+    ze skupiny se načtou znovu a porovnají s představiteli už nalezených
+    tříd. Soubory, které nejdou načíst, se vypíšou a přeskočí.
+
+    Returns:
+        list: [[cesty]] třídy izomorfních grafů s více než jedním souborem
+    """
+    if not quiet:
+        print("\n" + "="*60)
+        print("OTISKY GRAFŮ")
+        print("="*60)
+
+    from . import batch
+    rows = batch.run_batch(paths, 'fingerprint', _fingerprint_request(args), workers=args.workers)
+    fingerprints = {row['file']: row['result'] for row in rows if row['ok']}
+    failed = [(row['file'], row['error']) for row in rows if not row['ok']]
+
+    by_hash = {}
+    for path, result in fingerprints.items():
+        by_hash.setdefault(result['hash'], []).append(path)
+
+    group = {}
+    classes = []
+    for members in by_hash.values():
+        if len(members) == 1:
+            group[members[0]] = len(classes)
+            classes.append(members)
+            continue
+        # Shodný otisk - přesné ověření proti představitelům tříd této skupiny
+        representatives = []
+        for path in members:
+            analyzer = _fingerprint_analyzer(load_graph(path), args)
+            for number, representative in representatives:
+                if representative.is_isomorphic(analyzer):
+                    group[path] = number
+                    classes[number].append(path)
+                    break
+            else:
+                group[path] = len(classes)
+                representatives.append((len(classes), analyzer))
+                classes.append([path])
+
+    duplicates = [members for members in classes if len(members) > 1]
+    print(f"Souborů:____________{len(fingerprints)}")
+    print(f"Různých otisků:_____{len(by_hash)}")
+    print(f"Tříd izomorfismu:___{len(classes)}")
+    if duplicates:
+        print("Izomorfní grafy:")
+        for members in duplicates:
+            print(f"  {fingerprints[members[0]]['hash'][:16]}: {', '.join(members)}")
+    for path, error in failed:
+        print(f"Chyba: {path}: {error}")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'fingerprints.csv'), ['file', 'hash', 'nodes', 'edges', 'group'],
+                  [[path, result['hash'], result['nodes'], result['edges'], group[path]]
+                   for path, result in fingerprints.items()])
+    return duplicates
+
+
+def analyze_batch(args, quiet=False):
+    """
+    Analyzuje všechny grafy z adresáře nebo globu (--batch) v poolu procesů.
+
+    Vypíše souhrn (počty, celkový čas, nejpomalejší soubory a chyby)
+    a tabulku výsledků zapíše do --batch-output (.jsonl = JSON Lines,
+    jinak CSV), resp. do batch.csv v adresáři --export-csv.
+    """
+    from . import batch
+    if not quiet:
+        print("\n" + "="*60)
+        print("DÁVKOVÁ ANALÝZA")
+        print("="*60)
+
+    paths = batch.collect_paths(args.batch)
+    if not paths:
+        print(f"Chyba: žádné soubory neodpovídají '{args.batch}'")
+        return []
+    request = _fingerprint_request(args) if args.batch_op == 'fingerprint' else {}
+    started = time.perf_counter()
+    rows = batch.run_batch(paths, args.batch_op, request, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    failed = [row for row in rows if not row['ok']]
+    print(f"Operace:____________{args.batch_op}")
+    print(f"Souborů:____________{len(rows)}")
+    print(f"Úspěšně:____________{len(rows) - len(failed)}")
+    print(f"Chyby:______________{len(failed)}")
+    print(f"Součet časů:________{sum(row['seconds'] or 0 for row in rows):.3f} s")
+    print(f"Doba běhu:__________{elapsed:.3f} s")
+    slowest = sorted(rows, key=lambda row: -(row['seconds'] or 0))[:args.top]
+    if slowest:
+        print(f"Nejpomalejší soubory (top {len(slowest)}):")
+        for row in slowest:
+            print(f"  {row['seconds'] or 0:.3f} s  {row['file']}")
+    for row in failed:
+        print(f"Chyba: {row['file']}: {row['error']}")
+
+    header, table = batch.summary_rows(rows)
+    if args.batch_output:
+        if args.batch_output.endswith('.jsonl'):
+            batch.write_jsonl(args.batch_output, rows)
+        else:
+            write_csv(args.batch_output, header, table)
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'batch.csv'), header, table)
+    return rows
+
+
 def analyze_node(graph, node_id, analysis_type, quiet=False):
     """Analyzuje konkrétní uzel."""
     if not graph.has_node(node_id):
@@ -129,8 +750,9 @@ def analyze_node(graph, node_id, analysis_type, quiet=False):
         print(f"Předchůdci uzlu '{node_id}': {predecessors}")
 
 
-def analyze_paths(graph, args, quiet=False):
-    """Analyzuje cesty v grafu."""
+def analyze_paths(graph, args, quiet=False, cache=None, tracker=None):
+    """Analyzuje cesty v grafu (tracker = inkrementálně udržované vzdálenosti pro --distances)."""
+    from .analyzers import PathAnalyzer
     path_analyzer = PathAnalyzer(graph)
 
     if args.path:
@@ -140,7 +762,8 @@ def analyze_paths(graph, args, quiet=False):
             print(f"NEJKRATŠÍ CESTA: {start} → {end}")
             print("="*60)
 
-        path = path_analyzer.find_shortest_path(start, end)
+        path = _cached(cache, graph, 'path', lambda: path_analyzer.find_shortest_path(start, end),
+                       start=start, end=end)
         if path:
             print(f"Nejkratší cesta: {' → '.join(path)}")
             if graph.is_weighted:
@@ -163,7 +786,8 @@ def analyze_paths(graph, args, quiet=False):
             print(f"VŠECHNY CESTY: {start} → {end}")
             print("="*60)
 
-        paths = path_analyzer.find_all_paths(start, end, max_length=10)
+        paths = _cached(cache, graph, 'all_paths', lambda: path_analyzer.find_all_paths(start, end, max_length=10),
+                        start=start, end=end, max_length=10)
         if paths:
             print(f"Nalezeno {len(paths)} cest:")
             for i, path in enumerate(paths[:args.max_paths], 1):
@@ -189,7 +813,11 @@ def analyze_paths(graph, args, quiet=False):
             print(f"VZDÁLENOSTI OD UZLU '{node_id}'")
             print("="*60)
 
-        distances = path_analyzer.get_shortest_distances(node_id)
+        if tracker is not None and tracker.source == node_id:
+            distances = tracker.get_distances()
+        else:
+            distances = _cached(cache, graph, 'distances', lambda: path_analyzer.get_shortest_distances(node_id),
+                                node=node_id)
         for target_id, distance in sorted(distances.items()):
             if target_id != node_id:
                 if distance == float('inf'):
@@ -197,13 +825,15 @@ def analyze_paths(graph, args, quiet=False):
                 else:
                     print(f"  {node_id} → {target_id}: {distance}")
 
-    if args.diameter:
+    if args.diameter and args.approx:
+        analyze_approx_diameter(graph, args, quiet)
+    elif args.diameter:
         if not quiet:
             print(f"\n{'='*60}")
             print("PRŮMĚR GRAFU")
             print("="*60)
 
-        diameter = path_analyzer.get_graph_diameter()
+        diameter = _cached(cache, graph, 'diameter', path_analyzer.get_graph_diameter)
         if diameter == float('inf'):
             print("Průměr: nekonečno (graf není souvislý)")
         else:
@@ -215,7 +845,7 @@ def analyze_paths(graph, args, quiet=False):
             print("POLOMĚR GRAFU")
             print("="*60)
 
-        radius = path_analyzer.get_graph_radius()
+        radius = _cached(cache, graph, 'radius', path_analyzer.get_graph_radius)
         if radius == float('inf'):
             print("Poloměr: nekonečno (graf není souvislý)")
         else:
@@ -227,17 +857,180 @@ def analyze_paths(graph, args, quiet=False):
             print("CENTRÁLNÍ UZLY")
             print("="*60)
 
-        center_nodes = path_analyzer.find_center_nodes()
+        center_nodes = _cached(cache, graph, 'center', path_analyzer.find_center_nodes)
         if center_nodes:
             print(f"Centrální uzly: {center_nodes}")
         else:
             print("Žádné centrální uzly (graf není souvislý)")
 
+    if args.distance_stats:
+        if not quiet:
+            print(f"\n{'='*60}")
+            print("STATISTIKY VZDÁLENOSTÍ")
+            print("="*60)
+
+        stats = path_analyzer.get_distance_statistics()
+        if stats['average'] is None:
+            print("Průměrná délka nejkratší cesty: žádné cesty")
+        else:
+            print(f"Průměrná délka nejkratší cesty: {stats['average']:.4f}")
+        print(f"Dosažitelné dvojice: {stats['pairs']}, nedosažitelné: {stats['unreachable']}")
+        print("Histogram vzdáleností:")
+        for distance, count in stats['histogram'].items():
+            print(f"  {distance:g}: {count}")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'distance_histogram.csv'), ['distance', 'pairs'],
+                      list(stats['histogram'].items()))
+
+
+def analyze_dag(graph, args, quiet=False):
+    """Topologické uspořádání, cesty z uzlu a kritická cesta acyklického grafu."""
+    from .analyzers import DagAnalyzer
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("ACYKLICKÝ GRAF (DAG)")
+        print("="*60)
+
+    analyzer = DagAnalyzer(graph, include=graph.is_real_node)
+    result = analyzer.topological_sort()
+    if not result['is_dag']:
+        print(f"Graf obsahuje cyklus: {' → '.join(result['cycle'])}")
+        return
+
+    if args.toposort:
+        order = result['order']
+        print(f"Topologické pořadí: {', '.join(order)}")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'topological_order.csv'), ['position', 'node'],
+                      list(enumerate(order)))
+
+    if args.dag_paths:
+        source = args.dag_paths
+        if not graph.has_node(source):
+            print(f"Chyba: Uzel '{source}' neexistuje v grafu.", file=sys.stderr)
+        else:
+            shortest = analyzer.shortest_paths(source)['distances']
+            longest = analyzer.longest_paths(source)['distances']
+            print(f"Cesty z uzlu {source} (nejkratší / nejdelší):")
+            for node_id in result['order']:
+                if node_id in shortest:
+                    print(f"  {node_id}: {shortest[node_id]:g} / {longest[node_id]:g}")
+            if args.export_csv:
+                write_csv(os.path.join(args.export_csv, 'dag_paths.csv'), ['node', 'shortest', 'longest'],
+                          [[node_id, shortest[node_id], longest[node_id]] for node_id in result['order'] if node_id in shortest])
+
+    if args.critical_path:
+        critical = analyzer.critical_path()
+        print(f"Délka kritické cesty: {critical['length']:g}")
+        print(f"Kritická cesta: {' → '.join(critical['path'])}")
+        if args.export_csv:
+            write_csv(os.path.join(args.export_csv, 'critical_path.csv'), ['node', 'earliest', 'latest', 'slack'],
+                      [[node_id, critical['earliest'][node_id], critical['latest'][node_id], critical['slack'][node_id]]
+                       for node_id in result['order']])
+
+
+# Počet uzlů eulerovského průchodu vypsaných na obrazovku (celý je v CSV)
+_EULER_PREVIEW = 100
+
+
+def analyze_euler(graph, args, quiet=False):
+    """Zjistí, zda má graf eulerovský okruh nebo tah, a vypíše ho."""
+    from .analyzers import EulerAnalyzer
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("EULEROVSKÝ TAH")
+        print("="*60)
+
+    try:
+        result = EulerAnalyzer(graph).analyze()
+    except ValueError as e:
+        print(f"Chyba: {e}")
+        return
+
+    if result['type'] is None:
+        print(f"Graf není eulerovský: {result['reason']}")
+        odd = result['odd_nodes']
+        if odd:
+            title = "Uzly lichého stupně"
+            if result['directed']:
+                title = "Nevyrovnané uzly"
+                odd = [f"{node_id} ({balance:+d})" for node_id, balance in odd]
+            shown = min(args.top, len(odd))
+            print(f"{title}: {', '.join(odd[:shown])}{', ...' if len(odd) > shown else ''}")
+        return
+
+    nodes = result['nodes']
+    print(f"Typ:________________{'eulerovský okruh' if result['type'] == 'circuit' else 'eulerovský tah'}")
+    print(f"Počet hran:_________{len(result['edges'])}")
+    if nodes:
+        preview = nodes[:_EULER_PREVIEW]
+        print(f"Průchod: {' → '.join(preview)}{' → ...' if len(nodes) > len(preview) else ''}")
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'euler.csv'), ['step', 'source', 'target', 'label'],
+                  [[step, nodes[step], nodes[step + 1], edge.label or '']
+                   for step, edge in enumerate(result['edges'])])
+
+def _fmt_estimate(value, ci, digits=4):
+    return f"{value:.{digits}f}" if ci is None else f"{value:.{digits}f} ± {ci:.{digits}f}"
+
 
-def analyze_matrices(graph, args, quiet=False):
+def analyze_approx_diameter(graph, args, quiet=False):
+    """Vypíše odhad průměru a rozdělení vzdáleností (HyperANF) a meze průměru ze sweepů."""
+    from .analyzers import ApproxDistanceAnalyzer
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("PRŮMĚR GRAFU (ODHAD)")
+        print("="*60)
+
+    analyzer = ApproxDistanceAnalyzer(graph)
+    try:
+        result = analyzer.neighbourhood_function(precision=args.hll_precision, runs=args.runs, seed=args.seed)
+    except ValueError as e:
+        print(f"Chyba: {e}")
+        return
+    bounds = analyzer.diameter_bounds()
+
+    if not quiet:
+        print(f"HyperANF: počet běhů {result['runs']}, registrů na uzel {1 << result['precision']} "
+              f"(výpočet: {result['backend']}), ± = 95% interval spolehlivosti")
+        if graph.is_weighted:
+            print("Vzdálenosti se měří v počtu hran, váhy se ignorují")
+    print(f"Efektivní průměr (90 % dvojic): {_fmt_estimate(*result['effective_diameter'], digits=2)}")
+    print(f"Průměrná vzdálenost: {_fmt_estimate(*result['average_distance'], digits=2)}")
+    print(f"Dosažitelné uspořádané dvojice: {_fmt_estimate(*result['reachable_pairs'], digits=0)}")
+    print(f"Iterací do ustálení: {result['iterations']}")
+    print("Rozdělení vzdáleností (podíl dvojic):")
+    for t, (share, ci) in enumerate(zip(result['distribution'], result['distribution_ci']), 1):
+        print(f"  {t}: {_fmt_estimate(share, ci)}")
+
+    upper = bounds['upper'] if bounds['upper'] is not None else '-'
+    print(f"Meze průměru ({bounds['sweeps']} průchody BFS): dolní {bounds['lower']}, horní {upper}")
+    if bounds['infinite']:
+        print("Průměr: nekonečno (graf není souvislý)")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'distance_distribution.csv'), ['distance', 'share', 'ci95'],
+                  [[t, share, ci] for t, (share, ci) in enumerate(zip(result['distribution'], result['distribution_ci']), 1)])
+
+
+def analyze_matrices(graph, args, quiet=False, cache=None):
     """Analyzuje maticové reprezentace grafu."""
+    from .analyzers import MatrixAnalyzer
     matrix_analyzer = MatrixAnalyzer(graph)
 
+    def adjacency():
+        return _cached(cache, graph, 'adjacency', matrix_analyzer.get_adjacency_matrix)
+
+    def incidence():
+        def compute():
+            # Hrany jako slovníky, aby šel výsledek uložit do JSON cache
+            matrix, nodes, edges = matrix_analyzer.get_incidence_matrix()
+            return matrix, nodes, [edge.to_dict() for edge in edges]
+        return _cached(cache, graph, 'incidence', compute)
+
+    def weight():
+        return _cached(cache, graph, 'weight', matrix_analyzer.get_weight_matrix)
+
     if not quiet:
         print(f"\n{'='*60}")
         print("MATICOVÉ REPREZENTACE")
@@ -297,46 +1090,191 @@ def analyze_matrices(graph, args, quiet=False):
         return
 
     if not show_any_specific:
-        matrix_analyzer.print_adjacency_matrix()
-        matrix_analyzer.print_incidence_matrix()
+        matrix_analyzer.print_adjacency_matrix(adjacency())
+        matrix_analyzer.print_incidence_matrix(incidence())
         if graph.is_weighted:
-            matrix_analyzer.print_weight_matrix()
+            matrix_analyzer.print_weight_matrix(weight())
         if export_dir:
-            A, nodes = matrix_analyzer.get_adjacency_matrix()
+            A, nodes = adjacency()
             path = os.path.join(export_dir, 'adjacency.csv')
             matrix_analyzer.save_matrix_csv(A, nodes, col_labels=nodes, path=path)
-            I, nodes, edges = matrix_analyzer.get_incidence_matrix()
+            I, nodes, edges = incidence()
             path = os.path.join(export_dir, 'incidence.csv')
             matrix_analyzer.save_matrix_csv(I, nodes, col_labels=[f'e{i+1}' for i in range(len(edges))], path=path)
             if graph.is_weighted:
-                W, nodes = matrix_analyzer.get_weight_matrix()
+                W, nodes = weight()
                 path = os.path.join(export_dir, 'weight.csv')
                 matrix_analyzer.save_matrix_csv(W, nodes, col_labels=nodes, path=path)
         return
 
     if '--adjacency' in sys.argv:
-        matrix_analyzer.print_adjacency_matrix()
+        matrix_analyzer.print_adjacency_matrix(adjacency())
         if export_dir:
-            A, nodes = matrix_analyzer.get_adjacency_matrix()
+            A, nodes = adjacency()
             matrix_analyzer.save_matrix_csv(A, nodes, col_labels=nodes, path=os.path.join(export_dir, 'adjacency.csv'))
     if '--incidence' in sys.argv:
-        matrix_analyzer.print_incidence_matrix()
+        matrix_analyzer.print_incidence_matrix(incidence())
         if export_dir:
-            I, nodes, edges = matrix_analyzer.get_incidence_matrix()
+            I, nodes, edges = incidence()
             matrix_analyzer.save_matrix_csv(I, nodes, col_labels=[f'e{i+1}' for i in range(len(edges))], path=os.path.join(export_dir, 'incidence.csv'))
     if '--weight' in sys.argv and graph.is_weighted:
-        matrix_analyzer.print_weight_matrix()
+        matrix_analyzer.print_weight_matrix(weight())
         if export_dir:
-            W, nodes = matrix_analyzer.get_weight_matrix()
+            W, nodes = weight()
             matrix_analyzer.save_matrix_csv(W, nodes, col_labels=nodes, path=os.path.join(export_dir, 'weight.csv'))
     if '--adj-power' in sys.argv:
         try:
             k_idx = sys.argv.index('--adj-power') + 1
             k = int(sys.argv[k_idx])
-            A_k, nodes = matrix_analyzer.get_adjacency_power(k)
+            A_k, nodes = _cached(cache, graph, 'adj_power', lambda: matrix_analyzer.get_adjacency_power(k), k=k)
             print(f"\nMatice sousednosti ^{k}:")
             matrix_analyzer._print_matrix(A_k, nodes, col_labels=nodes)
             if export_dir:
                 matrix_analyzer.save_matrix_csv(A_k, nodes, col_labels=nodes, path=os.path.join(export_dir, f'adjacency_power_{k}.csv'))
         except Exception as e:
             print(f"Chyba při výpočtu A^k: {e}")
+
+
+def write_csv(path, header, rows):
+    """Zapíše tabulku do CSV souboru (adresář se vytvoří, pokud neexistuje)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def format_edge(edge):
+    """Vrátí textový zápis hrany ve tvaru z .tg souboru (bez středníku)."""
+    return GraphWriter.format_edge(edge)
+
+
+def analyze_centrality(graph, args, quiet=False):
+    """Vypočítá a vypíše vybrané centrality (betweenness, closeness, PageRank, Katz, ...)."""
+    if args.betweenness:
+        _analyze_betweenness(graph, args, quiet)
+    if args.closeness:
+        _analyze_closeness(graph, args, quiet)
+    for method, title in (('pagerank', 'PAGERANK'), ('katz', 'KATZOVA CENTRALITA'),
+                          ('eigenvector', 'CENTRALITA PODLE VLASTNÍHO VEKTORU')):
+        if getattr(args, method):
+            _analyze_rank(graph, args, method, title, quiet)
+
+
+def _analyze_betweenness(graph, args, quiet=False):
+    from .analyzers import CentralityAnalyzer
+    from .analyzers.centrality_analyzer import Z_95
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("BETWEENNESS CENTRALITA")
+        print("="*60)
+
+    try:
+        result = CentralityAnalyzer(graph).betweenness(samples=args.samples, seed=args.seed, workers=args.workers)
+    except ValueError as e:
+        print(f"Chyba: {e}", file=sys.stderr)
+        return
+    stderr = result['stderr']
+    if not quiet:
+        if result['exact']:
+            print(f"Metoda: přesný Brandesův algoritmus ({result['method']}, zdrojů: {result['sources']})")
+        else:
+            print(f"Metoda: odhad z {result['sources']} náhodných zdrojů ({result['method']}), "
+                  f"± = 95% interval spolehlivosti")
+
+    top = args.top
+    ranked = sorted(result['nodes'].items(), key=lambda item: (-item[1], item[0]))
+    print(f"Uzly s nejvyšší betweenness (top {min(top, len(ranked))}):")
+    for node_id, value in ranked[:top]:
+        if stderr is None:
+            print(f"  {node_id}: {value:.4f}")
+        else:
+            print(f"  {node_id}: {value:.4f} ± {Z_95 * stderr[node_id]:.4f}")
+
+    edges = sorted(enumerate(result['edges']), key=lambda item: -item[1])
+    print(f"Hrany s nejvyšší betweenness (top {min(top, len(edges))}):")
+    for pos, value in edges[:top]:
+        print(f"  {format_edge(graph.edges[pos])}: {value:.4f}")
+
+    if args.export_csv:
+        node_rows = []
+        for node_id, value in ranked:
+            row = [node_id, value]
+            if stderr is not None:
+                row.append(stderr[node_id])
+            node_rows.append(row)
+        header = ['node', 'betweenness'] + (['stderr'] if stderr is not None else [])
+        write_csv(os.path.join(args.export_csv, 'betweenness_nodes.csv'), header, node_rows)
+        write_csv(os.path.join(args.export_csv, 'betweenness_edges.csv'), ['edge', 'betweenness'],
+                  [[format_edge(graph.edges[pos]), value] for pos, value in edges])
+
+
+def _analyze_closeness(graph, args, quiet=False):
+    from .analyzers import CentralityAnalyzer
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("CLOSENESS A HARMONICKÁ CENTRALITA")
+        print("="*60)
+
+    result = CentralityAnalyzer(graph).closeness()
+    top = args.top
+    for key, title in (('closeness', 'closeness'), ('harmonic', 'harmonickou centralitou')):
+        ranked = sorted(result[key].items(), key=lambda item: (-item[1], item[0]))
+        print(f"Uzly s nejvyšší {title} (top {min(top, len(ranked))}):")
+        for node_id, value in ranked[:top]:
+            print(f"  {node_id}: {value:.4f}")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, 'closeness.csv'), ['node', 'closeness', 'harmonic'],
+                  [[node_id, value, result['harmonic'][node_id]] for node_id, value in result['closeness'].items()])
+
+
+def parse_personalization(items):
+    """Převede položky NODE nebo NODE=W z příkazové řádky na slovník vah (None bez položek)."""
+    if not items:
+        return None
+    weights = {}
+    for item in items:
+        node_id, _, weight = item.partition('=')
+        weights[node_id] = float(weight) if weight else 1.0
+    return weights
+
+
+def _analyze_rank(graph, args, method, title, quiet=False):
+    from .analyzers import RankAnalyzer
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(title)
+        print("="*60)
+
+    analyzer = RankAnalyzer(graph)
+    options = {'tol': args.tol}
+    if args.max_iter is not None:
+        options['max_iter'] = args.max_iter
+    try:
+        if method == 'pagerank':
+            result = analyzer.pagerank(damping=args.damping, personalization=parse_personalization(args.personalize),
+                                       **options)
+        elif method == 'katz':
+            result = analyzer.katz(alpha=args.alpha, **options)
+        else:
+            result = analyzer.eigenvector(**options)
+    except ValueError as e:
+        print(f"Chyba: {e}")
+        return
+
+    if not quiet:
+        state = "Konvergovalo" if result['converged'] else "NEKONVERGOVALO"
+        print(f"{state} po {result['iterations']} iteracích, reziduum {result['residual']:.3g} "
+              f"(výpočet: {result['backend']})")
+    elif not result['converged']:
+        print(f"Varování: nekonvergovalo po {result['iterations']} iteracích (reziduum {result['residual']:.3g})")
+
+    top = args.top
+    ranked = sorted(result['values'].items(), key=lambda item: (-item[1], item[0]))
+    print(f"Uzly s nejvyšším hodnocením (top {min(top, len(ranked))}):")
+    for node_id, value in ranked[:top]:
+        print(f"  {node_id}: {value:.6f}")
+
+    if args.export_csv:
+        write_csv(os.path.join(args.export_csv, f'{method}.csv'), ['node', method], ranked)
@@ -2,8 +2,9 @@
 Modely pro reprezentaci grafových struktur.
 """
 
-from .node import Node
+from .node import Node, is_placeholder_id
 from .edge import Edge
 from .graph import Graph
+from .graph_view import GraphView
 
-__all__ = ['Node', 'Edge', 'Graph']
+__all__ = ['Node', 'Edge', 'Graph', 'GraphView', 'is_placeholder_id']
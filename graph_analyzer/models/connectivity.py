@@ -0,0 +1,214 @@
+"""
+Dynamická souvislost grafu udržovaná při změnách hran.
+"""
+
+import itertools
+
+from ..utils.union_find import UnionFind
+
+
+class DynamicConnectivity:
+    """
+    Udržuje komponenty (slabé) souvislosti grafu při jeho změnách.
+
+    Každý uzel nese číslo své komponenty a každá komponenta množinu členů,
+    takže dotazy na souvislost a počet komponent stojí O(1). Počáteční
+    komponenty se spočítají pomocí union-find. Hrany, které při vkládání
+    spojily dvě komponenty, tvoří kostru (les) udržovanou jako seznamy
+    sousednosti.
+
+    - Přidání hrany mezi dvě komponenty přečísluje menší z nich (každý uzel
+      se tak přečísluje nejvýše O(log n)krát).
+    - Odebrání hrany mimo kostru souvislost nemění a stojí O(1).
+    - Odebrání hrany kostry rozdělí strom na dvě části. Střídavý průchod
+      z obou koncových uzlů najde menší část a mezi hranami jejích uzlů se
+      hledá náhradní hrana do druhé části. Pokud žádná není, menší část
+      dostane nové číslo komponenty. Cena je úměrná velikosti menší části,
+      nikoli celé komponenty.
+    """
+
+    def __init__(self, graph, include=None):
+        """
+        Inicializace a výpočet počátečních komponent.
+
+        Args:
+            graph (Graph): Sledovaný graf (struktura se zaregistruje jako posluchač)
+            include (callable): Predikát nad identifikátorem uzlu - uzly, pro
+                které vrátí False (např. placeholdery), se ignorují
+        """
+        self.graph = graph
+        self.include = include or (lambda node_id: True)
+        self.splits = 0
+        self.replacements = 0
+        self._labels = itertools.count()
+        self._label = {}      # uzel -> číslo komponenty
+        self._members = {}    # číslo komponenty -> množina uzlů
+        self._tree = {}       # uzel -> {id(hrana kostry): soused}
+        self._tree_edges = {} # id(hrana kostry) -> (u, v)
+        self._build()
+        graph.add_listener(self)
+
+    def _build(self):
+        uf = UnionFind(node_id for node_id in self.graph.nodes if self.include(node_id))
+        for node_id in uf.parent:
+            self._tree[node_id] = {}
+        for edge in self.graph.edges:
+            endpoints = self._endpoints(edge)
+            if endpoints is not None and uf.union(*endpoints):
+                self._link(edge, *endpoints)
+
+        by_root = {}
+        for node_id in uf.parent:
+            by_root.setdefault(uf.find(node_id), set()).add(node_id)
+        for members in by_root.values():
+            self._new_component(members)
+
+    def _endpoints(self, edge):
+        """Vrátí koncové uzly hrany, pokud se hrana pro souvislost počítá."""
+        u_id = edge.u.identifier
+        v_id = edge.v.identifier
+        if u_id == v_id or u_id not in self._tree or v_id not in self._tree:
+            return None
+        return u_id, v_id
+
+    def _new_component(self, members):
+        label = next(self._labels)
+        self._members[label] = members
+        for node_id in members:
+            self._label[node_id] = label
+        return label
+
+    def _link(self, edge, u_id, v_id):
+        """Zařadí hranu do kostry."""
+        key = id(edge)
+        self._tree_edges[key] = (u_id, v_id)
+        self._tree[u_id][key] = v_id
+        self._tree[v_id][key] = u_id
+
+    # ========== Notifikace z grafu ==========
+
+    def on_node_added(self, node):
+        node_id = node.identifier
+        if node_id not in self._tree and self.include(node_id):
+            self._tree[node_id] = {}
+            self._new_component({node_id})
+
+    def on_node_removed(self, node):
+        # Incidentní hrany graf odebral dříve, uzel je tedy samostatná komponenta
+        node_id = node.identifier
+        if node_id in self._tree:
+            del self._tree[node_id]
+            del self._members[self._label.pop(node_id)]
+
+    def on_edge_added(self, edge):
+        endpoints = self._endpoints(edge)
+        if endpoints is None:
+            return
+        u_id, v_id = endpoints
+        label_u = self._label[u_id]
+        label_v = self._label[v_id]
+        if label_u == label_v:
+            return
+        self._link(edge, u_id, v_id)
+        # Menší komponenta se přečísluje na větší
+        if len(self._members[label_u]) < len(self._members[label_v]):
+            label_u, label_v = label_v, label_u
+        moved = self._members.pop(label_v)
+        for node_id in moved:
+            self._label[node_id] = label_u
+        self._members[label_u] |= moved
+
+    def on_edge_removed(self, edge):
+        endpoints = self._tree_edges.pop(id(edge), None)
+        if endpoints is None:
+            return
+        u_id, v_id = endpoints
+        del self._tree[u_id][id(edge)]
+        del self._tree[v_id][id(edge)]
+
+        side = self._smaller_side(u_id, v_id)
+        replacement = self._find_replacement(side)
+        if replacement is not None:
+            self.replacements += 1
+            self._link(*replacement)
+            return
+
+        # Náhradní hrana neexistuje - menší část tvoří novou komponentu
+        self.splits += 1
+        self._members[self._label[u_id]] -= side
+        self._new_component(side)
+
+    # ========== Pomocné průchody ==========
+
+    def _smaller_side(self, u_id, v_id):
+        """
+        Vrátí uzly menší ze dvou částí stromu kostry po odebrání hrany u-v.
+
+        Průchody z obou konců běží střídavě a skončí, jakmile jeden z nich
+        projde celou svou část, takže cena je úměrná menší části.
+        """
+        tree = self._tree
+        seen = ({u_id}, {v_id})
+        stacks = ([u_id], [v_id])
+        while True:
+            for side in (0, 1):
+                stack = stacks[side]
+                if not stack:
+                    return seen[side]
+                visited = seen[side]
+                for neighbor_id in tree[stack.pop()].values():
+                    if neighbor_id not in visited:
+                        visited.add(neighbor_id)
+                        stack.append(neighbor_id)
+
+    def _find_replacement(self, side):
+        """
+        Najde hranu grafu spojující uzly množiny side se zbytkem komponenty.
+
+        Returns:
+            tuple: (hrana, uzel v side, uzel mimo side) nebo None
+        """
+        adj = self.graph.adj
+        rev_adj = self.graph.rev_adj
+        tree = self._tree
+        for node_id in side:
+            for entry in adj.get(node_id, ()):
+                other = entry.v.identifier
+                if other not in side and other in tree:
+                    return entry.origin or entry, node_id, other
+            for entry in rev_adj.get(node_id, ()):
+                other = entry.u.identifier
+                if other not in side and other in tree:
+                    return entry.origin or entry, node_id, other
+        return None
+
+    # ========== Dotazy ==========
+
+    def component_count(self):
+        """Vrátí počet komponent souvislosti."""
+        return len(self._members)
+
+    def is_connected(self):
+        """Zjistí, zda je graf souvislý (prázdný graf je souvislý)."""
+        return len(self._members) <= 1
+
+    def connected(self, u_id, v_id):
+        """
+        Zjistí, zda jsou dva uzly ve stejné komponentě.
+
+        Returns:
+            bool: True pokud existuje (neorientovaná) cesta mezi uzly
+        """
+        label = self._label.get(u_id)
+        return label is not None and label == self._label.get(v_id)
+
+    def component_of(self, node_id):
+        """Vrátí seznam uzlů komponenty obsahující uzel (nebo None)."""
+        label = self._label.get(node_id)
+        if label is None:
+            return None
+        return list(self._members[label])
+
+    def component_sizes(self):
+        """Vrátí velikosti všech komponent (sestupně)."""
+        return sorted((len(members) for members in self._members.values()), reverse=True)
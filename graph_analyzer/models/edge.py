@@ -10,6 +10,8 @@ class Edge:
         direction (str): Směr hrany ('<', '-', '>')
         weight: Volitelné ohodnocení hrany
         label (str): Volitelné označení hrany
+        origin (Edge): Původní hrana grafu, ze které byl záznam v seznamu
+            sousednosti odvozen (None pro hrany zadané přímo)
     """
     
     def __init__(self, u, v, direction, weight=None, label=None):
@@ -28,6 +30,7 @@ class Edge:
         self.direction = direction
         self.weight = weight
         self.label = label
+        self.origin = None
 
     def __repr__(self):
         """Řetězcová reprezentace hrany pro debugging."""
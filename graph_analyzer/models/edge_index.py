@@ -0,0 +1,162 @@
+"""
+Sekundární indexy hran podle váhy a označení udržované při změnách grafu.
+"""
+
+import bisect
+
+
+def _numeric_weight(weight):
+    """Vrátí číselnou váhu hrany, nebo None (neohodnocená hrana, textová váha)."""
+    if isinstance(weight, (int, float)) and not isinstance(weight, bool):
+        return weight
+    return None
+
+
+class WeightIndex:
+    """
+    Hrany s číselnou vahou seřazené podle váhy.
+
+    Váhy a hrany jsou ve dvou souběžných seznamech; rozsahové dotazy
+    najdou hranice bisekcí v O(log m) a vrátí souvislý úsek, k nejlehčích
+    či nejtěžších hran je začátek či konec seznamu. Vložení a odebrání
+    hrany stojí O(m) kvůli posunu seznamu, ale bez přeřazování. Hrany
+    se stejnou vahou jsou v pořadí vložení. Neohodnocené hrany a hrany
+    s textovou vahou se neindexují.
+    """
+
+    def __init__(self, graph):
+        """
+        Vytvoří index ze všech hran grafu.
+
+        Args:
+            graph (Graph): Indexovaný graf (index se zaregistruje jako posluchač)
+        """
+        self.graph = graph
+        edges = [edge for edge in graph.edges if _numeric_weight(edge.weight) is not None]
+        weights = [edge.weight for edge in edges]
+        # Stabilní řazení zachová pořadí hran se stejnou vahou
+        order = sorted(range(len(edges)), key=weights.__getitem__)
+        self._weights = [weights[i] for i in order]
+        self._edges = [edges[i] for i in order]
+        graph.add_listener(self)
+
+    def __len__(self):
+        return len(self._edges)
+
+    def _insert(self, edge, weight):
+        pos = bisect.bisect_right(self._weights, weight)
+        self._weights.insert(pos, weight)
+        self._edges.insert(pos, edge)
+
+    def _remove(self, edge, weight):
+        pos = bisect.bisect_left(self._weights, weight)
+        end = bisect.bisect_right(self._weights, weight, pos)
+        for i in range(pos, end):
+            if self._edges[i] is edge:
+                del self._weights[i]
+                del self._edges[i]
+                return
+
+    def range(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Vrátí hrany s vahou v intervalu.
+
+        Args:
+            low: Dolní mez (None = bez omezení)
+            high: Horní mez (None = bez omezení)
+            include_low (bool): Uzavřený interval zdola
+            include_high (bool): Uzavřený interval shora
+
+        Returns:
+            list: Hrany seřazené vzestupně podle váhy
+        """
+        weights = self._weights
+        start = 0
+        if low is not None:
+            start = (bisect.bisect_left if include_low else bisect.bisect_right)(weights, low)
+        end = len(weights)
+        if high is not None:
+            end = (bisect.bisect_right if include_high else bisect.bisect_left)(weights, high)
+        return self._edges[start:end] if start < end else []
+
+    def top(self, k, largest=True):
+        """
+        Vrátí k nejtěžších (nebo nejlehčích) hran.
+
+        Returns:
+            list: Hrany seřazené od nejtěžší (u largest=False od nejlehčí)
+        """
+        if k <= 0:
+            return []
+        if largest:
+            return self._edges[:-k - 1:-1]
+        return self._edges[:k]
+
+    # ========== Notifikace z grafu ==========
+
+    def on_edge_added(self, edge):
+        weight = _numeric_weight(edge.weight)
+        if weight is not None:
+            self._insert(edge, weight)
+
+    def on_edge_removed(self, edge):
+        weight = _numeric_weight(edge.weight)
+        if weight is not None:
+            self._remove(edge, weight)
+
+    def on_edge_reweighted(self, edge, old_weight):
+        old_weight = _numeric_weight(old_weight)
+        if old_weight is not None:
+            self._remove(edge, old_weight)
+        self.on_edge_added(edge)
+
+
+class LabelIndex:
+    """
+    Hašovací index z označení hrany (`:label`) na hrany.
+
+    Hrany jednoho označení jsou ve slovníku id(hrana) -> hrana, takže
+    dotaz, vložení i odebrání stojí O(1) a výsledek je v pořadí vložení.
+    """
+
+    def __init__(self, graph):
+        """
+        Vytvoří index ze všech hran grafu.
+
+        Args:
+            graph (Graph): Indexovaný graf (index se zaregistruje jako posluchač)
+        """
+        self.graph = graph
+        self._by_label = {}
+        for edge in graph.edges:
+            self.on_edge_added(edge)
+        graph.add_listener(self)
+
+    def __len__(self):
+        return len(self._by_label)
+
+    def labels(self):
+        """Vrátí seznam všech použitých označení hran."""
+        return list(self._by_label)
+
+    def get(self, label):
+        """
+        Vrátí hrany s daným označením.
+
+        Returns:
+            list: Hrany v pořadí vložení (prázdný seznam, pokud žádná není)
+        """
+        return list(self._by_label.get(label, {}).values())
+
+    # ========== Notifikace z grafu ==========
+
+    def on_edge_added(self, edge):
+        if edge.label is not None:
+            self._by_label.setdefault(edge.label, {})[id(edge)] = edge
+
+    def on_edge_removed(self, edge):
+        edges = self._by_label.get(edge.label)
+        if edges is not None:
+            edges.pop(id(edge), None)
+            if not edges:
+                del self._by_label[edge.label]
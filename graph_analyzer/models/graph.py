@@ -17,6 +17,205 @@ class Graph:
         self.is_weighted = False
         self.has_loops = False
         self.has_multiple_edges = False
+        self.content_hash = None  # SHA-256 zdrojového souboru (klíč pro cache výsledků)
+        self.version = 0  # Zvyšuje se při každé změně struktury grafu
+
+        # Čítače, ze kterých se příznaky grafu udržují inkrementálně
+        self._directed_edge_count = 0
+        self._weighted_edge_count = 0
+        self._loop_count = 0
+        self._pair_counts = collections.Counter()
+        self._multi_pair_count = 0
+        # Maska placeholder uzlů a stupně/počet hran jen mezi reálnými uzly
+        self._real_nodes = set()
+        self._real_in = collections.Counter()  # uzel -> záznamy rev_adj z reálného uzlu
+        self._real_out = collections.Counter()  # uzel -> záznamy adj do reálného uzlu
+        self._real_edge_count = 0
+        self._edge_pos = None  # id(hrana) -> index v self.edges, vytváří se až při prvním odebrání
+        self._listeners = []
+        self._connectivity = None
+        self._weight_index = None
+        self._label_index = None
+
+    # ========== Notifikace o změnách ==========
+
+    def add_listener(self, listener):
+        """
+        Zaregistruje posluchače změn grafu.
+
+        Posluchač může implementovat libovolnou podmnožinu metod
+        on_node_added(node), on_node_removed(node), on_node_updated(node, old_value),
+        on_edge_added(edge), on_edge_removed(edge) a on_edge_reweighted(edge, old_weight).
+
+        Args:
+            listener: Objekt s notifikačními metodami
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Odregistruje posluchače změn grafu."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _changed(self, event, *payload):
+        """Zaznamená změnu grafu a upozorní posluchače."""
+        self.version += 1
+        self.content_hash = None
+        for listener in list(self._listeners):
+            handler = getattr(listener, event, None)
+            if handler is not None:
+                handler(*payload)
+
+    def get_connectivity(self):
+        """
+        Vrátí strukturu dynamické souvislosti svázanou s grafem.
+
+        Struktura se vytvoří při prvním volání a dále se udržuje při každé
+        změně grafu; placeholder uzly binárních stromů ('*_N') se ignorují.
+
+        Returns:
+            DynamicConnectivity: Komponenty (slabé) souvislosti grafu
+        """
+        if self._connectivity is None:
+            from .connectivity import DynamicConnectivity
+            self._connectivity = DynamicConnectivity(self, include=self.is_real_node)
+        return self._connectivity
+
+    def get_weight_index(self):
+        """
+        Vrátí index hran seřazených podle číselné váhy (rozsahové a top-k dotazy).
+
+        Index se vytvoří při prvním volání a dále se udržuje při každé
+        změně grafu.
+
+        Returns:
+            WeightIndex: Index vah hran
+        """
+        if self._weight_index is None:
+            from .edge_index import WeightIndex
+            self._weight_index = WeightIndex(self)
+        return self._weight_index
+
+    def get_label_index(self):
+        """
+        Vrátí index hran podle označení (`:label`).
+
+        Index se vytvoří při prvním volání a dále se udržuje při každé
+        změně grafu.
+
+        Returns:
+            LabelIndex: Index označení hran
+        """
+        if self._label_index is None:
+            from .edge_index import LabelIndex
+            self._label_index = LabelIndex(self)
+        return self._label_index
+
+    # ========== Udržování příznaků ==========
+
+    @staticmethod
+    def _pair_key(edge):
+        """
+        Vrátí kanonický klíč dvojice uzlů pro detekci násobných hran.
+
+        Klíč nezávisí na zápisu směru: `A > B` a `B < A` popisují stejnou
+        orientovanou hranu, a proto se dohromady počítají jako násobná hrana
+        (původní kontrola v add_edge je porovnávala jen podle zápisu a
+        výsledek závisel na pořadí hran). Neorientované hrany mají klíč se
+        seřazenou dvojicí, orientovaná a neorientovaná hrana se nesčítají.
+        """
+        u_id = edge.u.identifier
+        v_id = edge.v.identifier
+        if edge.direction == '>':
+            return (u_id, v_id, '>')
+        if edge.direction == '<':
+            return (v_id, u_id, '>')
+        return (u_id, v_id, '-') if u_id <= v_id else (v_id, u_id, '-')
+
+    def _count_edge(self, edge, delta):
+        """Aktualizuje čítače a příznaky grafu po přidání (+1) nebo odebrání (-1) hrany."""
+        if edge.direction != '-':
+            self._directed_edge_count += delta
+        if edge.weight is not None:
+            self._weighted_edge_count += delta
+        if edge.u == edge.v:
+            self._loop_count += delta
+
+        key = self._pair_key(edge)
+        before = self._pair_counts[key]
+        after = before + delta
+        if after > 0:
+            self._pair_counts[key] = after
+        else:
+            del self._pair_counts[key]
+        if before < 2 <= after:
+            self._multi_pair_count += 1
+        elif after < 2 <= before:
+            self._multi_pair_count -= 1
+
+        self.is_directed = self._directed_edge_count > 0
+        self.is_weighted = self._weighted_edge_count > 0
+        self.has_loops = self._loop_count > 0
+        self.has_multiple_edges = self._multi_pair_count > 0
+        self._count_real_edge(edge, delta)
+
+    def _count_real_edge(self, edge, delta):
+        """
+        Aktualizuje stupně a počet hran mezi reálnými uzly.
+
+        Stupně odpovídají záznamům v adj / rev_adj: neorientovaná hrana
+        zvyšuje výstupní stupeň obou konců (smyčka dvakrát), hrana '<' se
+        počítá jako opačně zapsaná '>'.
+        """
+        if edge.u.is_placeholder or edge.v.is_placeholder:
+            return
+        self._real_edge_count += delta
+        u_id = edge.u.identifier
+        v_id = edge.v.identifier
+        if edge.direction == '-':
+            changes = ((self._real_out, u_id), (self._real_out, v_id))
+        elif edge.direction == '>':
+            changes = ((self._real_out, u_id), (self._real_in, v_id))
+        else:
+            changes = ((self._real_out, v_id), (self._real_in, u_id))
+        for counter, node_id in changes:
+            count = counter[node_id] + delta
+            if count:
+                counter[node_id] = count
+            else:
+                del counter[node_id]
+
+    # ========== Reálné uzly (bez placeholderů) ==========
+
+    def is_real_node(self, node_id):
+        """Zjistí, zda je uzel v grafu a není placeholder (lze předat jako predikát `include`)."""
+        return node_id in self._real_nodes
+
+    def real_node_ids(self):
+        """
+        Vrátí množinu identifikátorů reálných uzlů (bez placeholderů '*_N').
+
+        Množina se udržuje při změnách grafu - nesmí se měnit.
+        """
+        return self._real_nodes
+
+    def real_degrees(self):
+        """
+        Vrátí stupně reálných uzlů počítané jen přes hrany mezi reálnými uzly.
+
+        Returns:
+            tuple: (vstupní, výstupní) - Countery uzel -> počet záznamů v
+                rev_adj / adj, jejichž druhý konec je reálný (chybějící uzel
+                má stupeň 0); udržují se při změnách grafu a nesmí se měnit
+        """
+        return self._real_in, self._real_out
+
+    def real_edge_count(self):
+        """Vrátí počet hran, jejichž oba konce jsou reálné uzly."""
+        return self._real_edge_count
+
+    # ========== Mutace ==========
 
     def add_node(self, node):
         """
@@ -27,6 +226,9 @@ class Graph:
         """
         if node.identifier not in self.nodes:
             self.nodes[node.identifier] = node
+            if not node.is_placeholder:
+                self._real_nodes.add(node.identifier)
+            self._changed('on_node_added', node)
 
     def add_edge(self, edge):
         """
@@ -42,24 +244,10 @@ class Graph:
             self.add_node(edge.v)
 
         # Update graph properties
-        if edge.direction != '-':
-            self.is_directed = True
-        if edge.weight is not None:
-            self.is_weighted = True
-        if edge.u == edge.v:
-            self.has_loops = True
-
-        # Check for multiple edges
-        for existing_edge in self.adj[edge.u.identifier]:
-            if existing_edge.v == edge.v and existing_edge.direction == edge.direction:
-                self.has_multiple_edges = True
-                break
-        if not self.is_directed:
-            for existing_edge in self.adj[edge.v.identifier]:
-                if existing_edge.v == edge.u and existing_edge.direction == edge.direction:
-                    self.has_multiple_edges = True
-                    break
+        self._count_edge(edge, +1)
 
+        if self._edge_pos is not None:
+            self._edge_pos[id(edge)] = len(self.edges)
         self.edges.append(edge)
         
         # Handle adjacency lists based on edge direction
@@ -70,14 +258,223 @@ class Graph:
         elif edge.direction == '<':
             # u <- v: v has outgoing edge to u, u has incoming edge from v
             actual_edge = Edge(edge.v, edge.u, '>', edge.weight, edge.label)
+            actual_edge.origin = edge
             self.adj[edge.v.identifier].append(actual_edge)
             self.rev_adj[edge.u.identifier].append(actual_edge)
         else:  # '-' undirected
             # For undirected, both nodes can reach each other
             self.adj[edge.u.identifier].append(edge)
             reverse_edge = Edge(edge.v, edge.u, '-', edge.weight, edge.label)
+            reverse_edge.origin = edge
             self.adj[edge.v.identifier].append(reverse_edge)
 
+        self._changed('on_edge_added', edge)
+
+    def _adjacency_entries(self, edge):
+        """
+        Vrátí záznamy hrany v seznamech sousednosti.
+
+        Returns:
+            list: Dvojice (seznam, záznam) pro všechny výskyty hrany v adj/rev_adj
+        """
+        u_id = edge.u.identifier
+        v_id = edge.v.identifier
+        if edge.direction == '>':
+            return [(self.adj[u_id], edge), (self.rev_adj[v_id], edge)]
+        if edge.direction == '<':
+            for entry in self.adj[v_id]:
+                if entry.origin is edge:
+                    return [(self.adj[v_id], entry), (self.rev_adj[u_id], entry)]
+            return []
+        entries = [(self.adj[u_id], edge)]
+        for entry in self.adj[v_id]:
+            if entry.origin is edge:
+                entries.append((self.adj[v_id], entry))
+                break
+        return entries
+
+    def find_edge(self, u_id, direction, v_id, weight=None, label=None):
+        """
+        Najde hranu grafu podle koncových uzlů a směru.
+
+        Args:
+            u_id (str): Identifikátor prvního uzlu
+            direction (str): Směr hrany ('<', '-', '>')
+            v_id (str): Identifikátor druhého uzlu
+            weight: Pokud není None, musí se shodovat i váha
+            label (str): Pokud není None, musí se shodovat i označení
+
+        Returns:
+            Edge: Původní hrana (prvek self.edges) nebo None
+        """
+        if direction == '<':
+            u_id, v_id, direction = v_id, u_id, '>'
+        for entry in self.adj.get(u_id, []):
+            if entry.v.identifier != v_id or (entry.direction == '-') != (direction == '-'):
+                continue
+            if weight is not None and entry.weight != weight:
+                continue
+            if label is not None and entry.label != label:
+                continue
+            return entry.origin or entry
+        return None
+
+    def edge_positions(self):
+        """
+        Vrátí slovník id(hrana) -> index hrany v self.edges.
+
+        Slovník se vytvoří při prvním volání a dále se udržuje při přidávání
+        i odebírání hran.
+        """
+        if self._edge_pos is None:
+            self._edge_pos = {id(e): i for i, e in enumerate(self.edges)}
+        return self._edge_pos
+
+    def remove_edge(self, edge):
+        """
+        Odebere hranu z grafu.
+
+        Args:
+            edge (Edge): Hrana grafu (prvek self.edges nebo záznam z adj/rev_adj)
+
+        Raises:
+            ValueError: Pokud hrana v grafu není
+        """
+        edge = edge.origin or edge
+        pos = self.edge_positions().pop(id(edge), None)
+        if pos is None or self.edges[pos] is not edge:
+            raise ValueError(f"Hrana {edge!r} není součástí grafu.")
+
+        # Odebrání ze seznamu hran v O(1) - na uvolněné místo se přesune poslední hrana
+        last = self.edges.pop()
+        if last is not edge:
+            self.edges[pos] = last
+            self._edge_pos[id(last)] = pos
+
+        for lst, entry in self._adjacency_entries(edge):
+            for i, candidate in enumerate(lst):
+                if candidate is entry:
+                    del lst[i]
+                    break
+
+        self._count_edge(edge, -1)
+        self._changed('on_edge_removed', edge)
+
+    def remove_node(self, node_id):
+        """
+        Odebere uzel včetně všech incidentních hran.
+
+        Args:
+            node_id (str): Identifikátor uzlu
+
+        Raises:
+            KeyError: Pokud uzel v grafu není
+        """
+        if node_id not in self.nodes:
+            raise KeyError(f"Uzel '{node_id}' neexistuje v grafu.")
+
+        incident = {}
+        for entry in list(self.adj.get(node_id, [])) + list(self.rev_adj.get(node_id, [])):
+            original = entry.origin or entry
+            incident[id(original)] = original
+        for edge in incident.values():
+            self.remove_edge(edge)
+
+        self.adj.pop(node_id, None)
+        self.rev_adj.pop(node_id, None)
+        node = self.nodes.pop(node_id)
+        self._real_nodes.discard(node_id)
+        self._changed('on_node_removed', node)
+
+    def set_node_value(self, node_id, value):
+        """
+        Změní ohodnocení uzlu.
+
+        Args:
+            node_id (str): Identifikátor uzlu
+            value: Nové ohodnocení
+
+        Raises:
+            KeyError: Pokud uzel v grafu není
+        """
+        if node_id not in self.nodes:
+            raise KeyError(f"Uzel '{node_id}' neexistuje v grafu.")
+        node = self.nodes[node_id]
+        old_value = node.value
+        node.value = value
+        self._changed('on_node_updated', node, old_value)
+
+    def reweight_edge(self, edge, weight):
+        """
+        Změní váhu hrany (včetně jejích záznamů v seznamech sousednosti).
+
+        Args:
+            edge (Edge): Hrana grafu
+            weight: Nová váha (None = neohodnocená hrana)
+        """
+        edge = edge.origin or edge
+        old_weight = edge.weight
+        if old_weight is not None:
+            self._weighted_edge_count -= 1
+        if weight is not None:
+            self._weighted_edge_count += 1
+        self.is_weighted = self._weighted_edge_count > 0
+
+        for _, entry in self._adjacency_entries(edge):
+            entry.weight = weight
+        edge.weight = weight
+        self._changed('on_edge_reweighted', edge, old_weight)
+
+    def apply_delta(self, operations):
+        """
+        Aplikuje seznam změn (výstup GraphParser.parse_delta_lines) na graf.
+
+        Neplatné operace (neexistující uzel nebo hrana) se přeskočí s varováním,
+        stejně jako neplatné řádky při parsování grafu.
+
+        Args:
+            operations (list): Seznam operací ve tvaru (operace, argumenty...)
+
+        Returns:
+            dict: Počty provedených operací podle typu (a 'skipped')
+        """
+        applied = collections.Counter()
+        for op in operations:
+            kind = op[0]
+            try:
+                if kind == 'add_node':
+                    _, identifier, value = op
+                    if identifier in self.nodes:
+                        self.set_node_value(identifier, value)
+                    else:
+                        self.add_node(Node(identifier, value))
+                elif kind == 'remove_node':
+                    self.remove_node(op[1])
+                elif kind == 'add_edge':
+                    _, u_id, direction, v_id, weight, label = op
+                    u_node = self.nodes.get(u_id)
+                    v_node = self.nodes.get(v_id)
+                    if u_node is None or v_node is None:
+                        raise KeyError(f"Uzel(y) pro hranu {u_id} {direction} {v_id} nebyly nalezeny.")
+                    self.add_edge(Edge(u_node, v_node, direction, weight, label))
+                elif kind in ('remove_edge', 'reweight_edge'):
+                    _, u_id, direction, v_id, weight, label = op
+                    match_weight = weight if kind == 'remove_edge' else None
+                    edge = self.find_edge(u_id, direction, v_id, match_weight, label)
+                    if edge is None:
+                        raise KeyError(f"Hrana {u_id} {direction} {v_id} nebyla nalezena.")
+                    if kind == 'remove_edge':
+                        self.remove_edge(edge)
+                    else:
+                        self.reweight_edge(edge, weight)
+                else:
+                    raise ValueError(f"Neznámá operace '{kind}'")
+                applied[kind] += 1
+            except (KeyError, ValueError) as e:
+                print(f"Varování: Změnu nelze aplikovat: {e.args[0] if e.args else e}")
+                applied['skipped'] += 1
+        return dict(applied)
+
     def load_from_data(self, nodes_dict, edges_list):
         """
         Načte graf z parsovaných dat.
@@ -0,0 +1,249 @@
+"""
+Pohledy na podgrafy bez kopírování uzlů a hran.
+"""
+
+import collections
+import hashlib
+from array import array
+from collections.abc import Mapping, Sequence
+
+from .graph import Graph
+
+
+class _EdgeSequence(Sequence):
+    """Hrany rodičovského grafu vybrané polem jejich pozic (indexová maska)."""
+
+    __slots__ = ('_edges', '_positions')
+
+    def __init__(self, edges, positions):
+        self._edges = edges
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._edges[pos] for pos in self._positions[i]]
+        return self._edges[self._positions[i]]
+
+    def __iter__(self):
+        return map(self._edges.__getitem__, self._positions)
+
+
+class _AdjacencyView(Mapping):
+    """
+    Seznamy sousednosti rodiče zúžené na vybrané hrany.
+
+    Seznam uzlu se vyfiltruje až při prvním přístupu a uloží; záznamy
+    jsou objekty z rodičovského `adj` / `rev_adj`. Jako defaultdict
+    rodiče vrací pro uzel bez hran prázdný seznam.
+    """
+
+    def __init__(self, parent_adj, nodes, selected):
+        self._parent = parent_adj
+        self._nodes = nodes
+        self._selected = selected
+        self._cache = {}
+
+    def __getitem__(self, node_id):
+        entries = self._cache.get(node_id)
+        if entries is None:
+            selected = self._selected
+            if node_id in self._nodes:
+                entries = [entry for entry in self._parent.get(node_id, ()) if id(entry.origin or entry) in selected]
+            else:
+                entries = []
+            self._cache[node_id] = entries
+        return entries
+
+    def get(self, node_id, default=None):
+        return self[node_id] if node_id in self._nodes else default
+
+    def __contains__(self, node_id):
+        return node_id in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class GraphView(Graph):
+    """
+    Podgraf sdílející uzly a hrany rodičovského grafu.
+
+    Pohled nic nekopíruje: `nodes` odkazuje na objekty Node rodiče, `edges`
+    je sekvence nad polem pozic vybraných hran v `parent.edges`
+    (`edge_index`) a `adj` /
+    `rev_adj` filtrují seznamy rodiče líně po uzlech. Pohled má stejné
+    rozhraní jako Graph, takže ho přijme každý analyzátor; pohledy lze
+    i vnořovat (pohled na pohled).
+
+    Pohled je jen pro čtení a odpovídá stavu rodiče v okamžiku vytvoření -
+    po změně rodiče je potřeba vytvořit nový. Příznaky (orientovaný,
+    ohodnocený, smyčky, násobné hrany) se počítají jen z vybraných hran.
+    Pokud má rodič `content_hash`, odvodí se z něj a z popisu pohledu
+    klíč cache výsledků.
+
+    Pohledy se vytvářejí metodami induced(), edge_filtered(), from_edges() a ego().
+    """
+
+    def __init__(self, parent, node_ids, positions, description):
+        """
+        Inicializace pohledu (viz tovární metody).
+
+        Args:
+            parent (Graph): Rodičovský graf (nebo jiný pohled)
+            node_ids (iterable): Identifikátory uzlů pohledu (v pořadí rodiče)
+            positions (iterable): Vzestupné pozice vybraných hran v `parent.edges`;
+                oba konce každé hrany musí patřit do pohledu
+            description (str): Popis pohledu (např. 'ego:A:2')
+        """
+        parent_nodes = parent.nodes
+        self.parent = parent
+        self.description = description
+        self.nodes = {node_id: parent_nodes[node_id] for node_id in node_ids}
+        self.edge_index = array('q', positions)
+        self.edges = _EdgeSequence(parent.edges, self.edge_index)
+        selected = set(map(id, self.edges))
+        self.adj = _AdjacencyView(parent.adj, self.nodes, selected)
+        self.rev_adj = _AdjacencyView(parent.rev_adj, self.nodes, selected)
+        self.version = parent.version
+        self.content_hash = None
+        if parent.content_hash is not None:
+            self.content_hash = hashlib.sha256(f"{parent.content_hash}|{description}".encode('utf-8')).hexdigest()
+
+        pairs = collections.Counter(map(Graph._pair_key, self.edges))
+        self.is_directed = any(edge.direction != '-' for edge in self.edges)
+        self.is_weighted = any(edge.weight is not None for edge in self.edges)
+        self.has_loops = any(edge.u.identifier == edge.v.identifier for edge in self.edges)
+        self.has_multiple_edges = any(count > 1 for count in pairs.values())
+        self._real_nodes = {node_id for node_id, node in self.nodes.items() if not node.is_placeholder}
+        self._real_in = collections.Counter()
+        self._real_out = collections.Counter()
+        self._real_edge_count = 0
+        for edge in self.edges:
+            self._count_real_edge(edge, +1)
+        self._listeners = []
+        self._connectivity = None
+        self._weight_index = None
+        self._label_index = None
+        self._edge_pos = None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Pohled na graf je jen pro čtení - změny se provádějí v původním grafu.")
+
+    add_node = add_edge = remove_edge = remove_node = reweight_edge = set_node_value = apply_delta = load_from_data = \
+        _read_only
+
+    def __repr__(self):
+        return f"GraphView('{self.description}', nodes={len(self.nodes)}, edges={len(self.edges)})"
+
+    @classmethod
+    def induced(cls, graph, node_ids, description=None):
+        """
+        Podgraf indukovaný množinou uzlů (všechny hrany mezi nimi).
+
+        Hrany se najdou průchodem seznamů sousednosti vybraných uzlů, cena
+        tedy nezávisí na velikosti zbytku grafu.
+
+        Args:
+            graph (Graph): Rodičovský graf
+            node_ids (iterable): Identifikátory uzlů; neexistující se ignorují
+            description (str): Popis pohledu (výchozí 'induced:N')
+
+        Returns:
+            GraphView: Pohled na podgraf
+        """
+        members = set(node_ids)
+        ordered = [node_id for node_id in graph.nodes if node_id in members]
+        members = set(ordered)
+        # Každá hrana je v adj svého počátku (neorientovaná u obou konců), stačí tedy projít adj členů
+        edge_pos = graph.edge_positions()
+        positions = set()
+        adj = graph.adj
+        for node_id in ordered:
+            for entry in adj.get(node_id, ()):
+                if entry.v.identifier in members:
+                    positions.add(edge_pos[id(entry.origin or entry)])
+        positions = sorted(positions)
+        return cls(graph, ordered, positions, description or f"induced:{len(ordered)}")
+
+    @classmethod
+    def edge_filtered(cls, graph, predicate, description='edges'):
+        """
+        Podgraf se všemi uzly a jen hranami splňujícími predikát.
+
+        Args:
+            graph (Graph): Rodičovský graf
+            predicate (callable): Funkce Edge -> bool
+            description (str): Popis pohledu (součást klíče cache)
+
+        Returns:
+            GraphView: Pohled na podgraf
+        """
+        positions = [pos for pos, edge in enumerate(graph.edges) if predicate(edge)]
+        return cls(graph, graph.nodes, positions, description)
+
+    @classmethod
+    def from_edges(cls, graph, edges, description='edges'):
+        """
+        Podgraf se všemi uzly a jen zadanými hranami (např. výsledkem dotazu na index).
+
+        Pozice hran se najdou přes Graph.edge_positions(), takže hrany
+        mimo výběr se neprocházejí. Pohled ale kopíruje všechny uzly
+        a jejich masku reálných uzlů, což stojí O(n); první volání
+        edge_positions() po změně grafu navíc staví mapu v O(m), další
+        dotazy ji už jen použijí.
+
+        Args:
+            graph (Graph): Rodičovský graf
+            edges (iterable): Hrany grafu (prvky graph.edges)
+            description (str): Popis pohledu (součást klíče cache)
+
+        Returns:
+            GraphView: Pohled na podgraf
+        """
+        edge_pos = graph.edge_positions()
+        positions = sorted({edge_pos[id(edge)] for edge in edges})
+        return cls(graph, graph.nodes, positions, description)
+
+    @classmethod
+    def ego(cls, graph, node_id, hops=1):
+        """
+        Ego-síť: podgraf indukovaný uzly do vzdálenosti `hops` od uzlu.
+
+        Vzdálenost se měří počtem hran bez ohledu na jejich orientaci
+        (do šířky po `adj` i `rev_adj`).
+
+        Args:
+            graph (Graph): Rodičovský graf
+            node_id (str): Střed ego-sítě
+            hops (int): Největší počet hran od středu
+
+        Returns:
+            GraphView: Pohled na ego-síť
+
+        Raises:
+            KeyError: Uzel v grafu není
+        """
+        if node_id not in graph.nodes:
+            raise KeyError(f"Uzel '{node_id}' neexistuje v grafu.")
+        adj, rev_adj = graph.adj, graph.rev_adj
+        reached = {node_id}
+        frontier = [node_id]
+        for _ in range(hops):
+            next_frontier = []
+            for u in frontier:
+                for entries in (adj.get(u, ()), rev_adj.get(u, ())):
+                    for entry in entries:
+                        for w in (entry.u.identifier, entry.v.identifier):
+                            if w not in reached:
+                                reached.add(w)
+                                next_frontier.append(w)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return cls.induced(graph, reached, description=f"ego:{node_id}:{hops}")
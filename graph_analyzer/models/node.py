@@ -1,3 +1,12 @@
+def is_placeholder_id(node_id):
+    """
+    Zjistí, zda identifikátor patří placeholder uzlu ('*' v zápisu binárního stromu).
+
+    Parser takové uzly pojmenovává '*_N'; do vlastností grafu se nezapočítávají.
+    """
+    return isinstance(node_id, str) and node_id.startswith('*')
+
+
 class Node:
     """
     Třída reprezentující uzel v grafu.
@@ -5,18 +14,21 @@ class Node:
     Attributes:
         identifier (str): Unikátní identifikátor uzlu
         value: Volitelné ohodnocení uzlu (může být číslo nebo řetězec)
+        is_placeholder (bool): Placeholder uzel binárního stromu (určí se jednou při vytvoření)
     """
     
-    def __init__(self, identifier, value=None):
+    def __init__(self, identifier, value=None, placeholder=None):
         """
         Inicializace uzlu.
         
         Args:
             identifier (str): Unikátní identifikátor uzlu
             value: Volitelné ohodnocení uzlu
+            placeholder (bool): Zda jde o placeholder uzel (None = podle identifikátoru)
         """
         self.identifier = identifier
         self.value = value
+        self.is_placeholder = is_placeholder_id(identifier) if placeholder is None else placeholder
 
     def __repr__(self):
         """Řetězcová reprezentace uzlu pro debugging."""
@@ -0,0 +1,660 @@
+"""
+Perzistentní dotazovací server nad asyncio.
+
+Server načte každý graf jen jednou, drží ho v LRU cache (klíč = cesta + mtime)
+a odpovídá na JSON dotazy oddělené novým řádkem. Výpočetně náročné dotazy se
+posílají do poolu pracovních procesů, aby neblokovaly rychlé dotazy.
+
+Formát dotazu (jeden JSON objekt na řádek):
+    {"id": 1, "op": "distances", "graph": "graphs/01.tg", "node": "A"}
+
+Formát odpovědi:
+    {"id": 1, "ok": true, "result": {...}}
+    {"id": 1, "ok": false, "error": "..."}
+"""
+
+import asyncio
+import bisect
+import collections
+import json
+import multiprocessing
+import os
+import signal
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import commands
+from .analyzers import GraphPropertiesAnalyzer, PathAnalyzer, MatrixAnalyzer, FingerprintAnalyzer
+
+
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 16
+
+# Horní meze košů histogramu latencí v milisekundách (poslední koš je +inf)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class GraphCache:
+    """
+    LRU cache načtených grafů.
+
+    Klíčem je absolutní cesta k souboru a jeho mtime, takže změněný soubor
+    se při dalším dotazu automaticky načte znovu.
+    """
+
+    def __init__(self, capacity=DEFAULT_CACHE_SIZE):
+        """
+        Inicializace cache.
+
+        Args:
+            capacity (int): Maximální počet grafů držených v paměti
+        """
+        self.capacity = max(1, capacity)
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path):
+        """
+        Vyhledá graf v cache bez načítání ze souboru.
+
+        Args:
+            path (str): Cesta k souboru s grafem
+
+        Returns:
+            tuple: (klíč, graf nebo None při chybějícím záznamu)
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje
+        """
+        abs_path = os.path.abspath(path)
+        try:
+            mtime = os.stat(abs_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Soubor '{path}' nebyl nalezen.")
+
+        key = (abs_path, mtime)
+        graph = self._entries.get(key)
+        if graph is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return key, graph
+
+    def insert(self, key, graph):
+        """
+        Vloží načtený graf do cache a odstraní nejdéle nepoužité záznamy.
+
+        Args:
+            key (tuple): Klíč vrácený metodou lookup()
+            graph (Graph): Načtený graf
+        """
+        # Starší verze téhož souboru už nebude nikdy potřeba
+        for old_key in [k for k in self._entries if k[0] == key[0] and k != key]:
+            del self._entries[old_key]
+        self._entries[key] = graph
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def get(self, path):
+        """
+        Vrátí graf pro danou cestu, v případě potřeby ho načte ze souboru.
+
+        Args:
+            path (str): Cesta k souboru s grafem
+
+        Returns:
+            Graph: Načtený graf
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje
+        """
+        key, graph = self.lookup(path)
+        if graph is None:
+            graph = commands.load_graph(key[0])
+            self.insert(key, graph)
+        return graph
+
+    def stats(self):
+        """Vrátí statistiky cache jako slovník."""
+        return {
+            'size': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'graphs': [path for path, _ in self._entries],
+        }
+
+
+class LatencyHistogram:
+    """Histogram latencí jednoho endpointu s pevnými koši v milisekundách."""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def record(self, elapsed_ms, ok=True):
+        """Zaznamená jedno měření (v milisekundách)."""
+        self.counts[bisect.bisect_left(self.bounds, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not ok:
+            self.errors += 1
+
+    def to_dict(self):
+        """Převede histogram na slovník pro serializaci."""
+        labels = [f"<={b}ms" for b in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return {
+            'count': self.total,
+            'errors': self.errors,
+            'mean_ms': round(self.sum_ms / self.total, 3) if self.total else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+def _jsonable(value):
+    """Převede výsledek analýzy na hodnotu serializovatelnou do JSON (inf -> None)."""
+    if isinstance(value, float) and value in (float('inf'), float('-inf')):
+        return None
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def _require(request, *names):
+    """Vrátí hodnoty povinných parametrů dotazu nebo vyhodí ValueError."""
+    missing = [name for name in names if request.get(name) is None]
+    if missing:
+        raise ValueError(f"Chybí parametr(y): {', '.join(missing)}")
+    return [request[name] for name in names]
+
+
+def _require_node(graph, node_id):
+    if not graph.has_node(node_id):
+        raise ValueError(f"Uzel '{node_id}' neexistuje v grafu.")
+
+
+# ========== Endpointy ==========
+
+def _op_info(graph, request):
+    return {
+        'node_count': graph.get_node_count(),
+        'edge_count': graph.get_edge_count(),
+    }
+
+
+def _op_neighbors(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    return graph.get_neighbors(node_id)
+
+
+def _op_successors(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    return graph.get_successors(node_id)
+
+
+def _op_predecessors(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    return graph.get_predecessors(node_id)
+
+
+def _op_degree(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    result = dict(graph.get_node_degree(node_id))
+    result['is_isolated'] = graph.is_isolated_node(node_id)
+    return result
+
+
+def _op_node(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    analyzer = GraphPropertiesAnalyzer(graph)
+    node = graph.get_node(node_id)
+    return {
+        'identifier': node.identifier,
+        'value': node.value,
+        'neighbors': graph.get_neighbors(node_id),
+        'successors': analyzer.get_successors(node_id),
+        'predecessors': analyzer.get_predecessors(node_id),
+        'in_degree': analyzer.in_degree(node_id),
+        'out_degree': analyzer.out_degree(node_id),
+        'degree': analyzer.degree(node_id),
+        'incident_edges': [edge.to_dict() for edge in analyzer.incident_edges(node_id)],
+        'is_isolated': graph.is_isolated_node(node_id),
+    }
+
+
+def _op_path(graph, request):
+    start, end = _require(request, 'start', 'end')
+    path = PathAnalyzer(graph).find_shortest_path(start, end)
+    return {'path': path}
+
+
+def _op_all_paths(graph, request):
+    start, end = _require(request, 'start', 'end')
+    max_length = request.get('max_length', 10)
+    max_paths = request.get('max_paths')
+    paths = PathAnalyzer(graph).find_all_paths(start, end, max_length=max_length)
+    total = len(paths)
+    if max_paths is not None:
+        paths = paths[:max_paths]
+    return {'count': total, 'paths': paths}
+
+
+def _op_distances(graph, request):
+    node_id, = _require(request, 'node')
+    _require_node(graph, node_id)
+    return PathAnalyzer(graph).get_shortest_distances(node_id)
+
+
+def _op_diameter(graph, request):
+    return PathAnalyzer(graph).get_graph_diameter()
+
+
+def _op_radius(graph, request):
+    return PathAnalyzer(graph).get_graph_radius()
+
+
+def _op_center(graph, request):
+    return PathAnalyzer(graph).find_center_nodes()
+
+
+def _op_properties(graph, request):
+    analyzer = GraphPropertiesAnalyzer(graph)
+    properties = analyzer.get_basic_properties()
+    properties['is_planar'] = analyzer.is_planar_graph()
+    return properties
+
+
+def _op_fingerprint(graph, request):
+    analyzer = FingerprintAnalyzer(graph, iterations=int(request.get('iterations', 3)),
+                                   node_values=bool(request.get('node_values')),
+                                   edge_labels=bool(request.get('edge_labels')))
+    return analyzer.fingerprint()
+
+
+def _op_matrices(graph, request):
+    analyzer = MatrixAnalyzer(graph)
+    kinds = request.get('kinds') or ['adjacency', 'incidence', 'weight']
+    result = {}
+    if 'adjacency' in kinds:
+        matrix, nodes = analyzer.get_adjacency_matrix()
+        result['adjacency'] = {'nodes': nodes, 'matrix': matrix}
+    if 'incidence' in kinds:
+        matrix, nodes, edges = analyzer.get_incidence_matrix()
+        result['incidence'] = {
+            'nodes': nodes,
+            'edges': [edge.to_dict() for edge in edges],
+            'matrix': matrix,
+        }
+    if 'weight' in kinds and graph.is_weighted:
+        matrix, nodes = analyzer.get_weight_matrix()
+        result['weight'] = {'nodes': nodes, 'matrix': matrix}
+    if request.get('adj_power') is not None:
+        k = int(request['adj_power'])
+        matrix, nodes = analyzer.get_adjacency_power(k)
+        result['adj_power'] = {'k': k, 'nodes': nodes, 'matrix': matrix}
+    return result
+
+
+# Název endpointu -> (handler, běží v pracovním procesu)
+ENDPOINTS = {
+    'info': (_op_info, False),
+    'neighbors': (_op_neighbors, False),
+    'successors': (_op_successors, False),
+    'predecessors': (_op_predecessors, False),
+    'degree': (_op_degree, False),
+    'node': (_op_node, False),
+    'path': (_op_path, True),
+    'all_paths': (_op_all_paths, True),
+    'distances': (_op_distances, True),
+    'diameter': (_op_diameter, True),
+    'radius': (_op_radius, True),
+    'center': (_op_center, True),
+    'properties': (_op_properties, True),
+    'matrices': (_op_matrices, True),
+    'fingerprint': (_op_fingerprint, True),
+}
+
+
+# ========== Pracovní procesy ==========
+
+_worker_cache = None
+
+# Cache rodičovského procesu zděděná pracovními procesy při startu přes fork
+_inherited_cache = None
+
+
+def _fork_context():
+    """Vrátí multiprocessing kontext 'fork', pokud ho platforma podporuje."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def _init_worker(cache_size):
+    """
+    Inicializace pracovního procesu.
+
+    Při startu přes fork převezme kopii cache rodiče (grafy se znovu neparsují),
+    jinak si vytvoří vlastní prázdnou cache. Přerušení (Ctrl+C) řeší hlavní
+    proces, pracovní procesy ho ignorují.
+    """
+    global _worker_cache
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if _inherited_cache is not None:
+        _worker_cache = _inherited_cache
+        # Statistiky počítáme zvlášť pro každý proces
+        _worker_cache.hits = _worker_cache.misses = 0
+    else:
+        _worker_cache = GraphCache(cache_size)
+
+
+def _run_in_worker(op, request):
+    """Spustí endpoint v pracovním procesu a vrátí JSON-kompatibilní výsledek."""
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = GraphCache()
+    handler, _ = ENDPOINTS[op]
+    graph = _worker_cache.get(request['graph'])
+    return _jsonable(handler(graph, request))
+
+
+def _worker_stats():
+    """Vrátí statistiky cache pracovního procesu."""
+    stats = _worker_cache.stats() if _worker_cache is not None else {}
+    stats['pid'] = os.getpid()
+    return stats
+
+
+def _remove_stale_socket(path):
+    """
+    Odstraní soubor Unix socketu po předchozím běhu serveru.
+
+    Raises:
+        FileExistsError: Pokud cesta existuje a není socket
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"Cesta '{path}' existuje a není socket.")
+    os.unlink(path)
+
+
+class QueryServer:
+    """
+    Asynchronní server odpovídající na JSON dotazy nad grafy.
+
+    Rychlé dotazy (sousedé, stupně) se vyřizují přímo ve smyčce událostí nad
+    sdílenou cache, náročné dotazy běží v `ProcessPoolExecutor`. Pool vzniká
+    jednou při startu, po načtení grafů z `preload`; pracovní procesy se
+    forkují hned, dokud hlavní proces nemá další vlákna, a tyto grafy zdědí.
+    Grafy požadované později si každý pracovní proces načte a drží ve vlastní
+    cache, pool se tedy nikdy nevytváří znovu.
+    """
+
+    def __init__(self, workers=None, cache_size=DEFAULT_CACHE_SIZE, preload=None):
+        """
+        Inicializace serveru.
+
+        Args:
+            workers (int): Počet pracovních procesů (None = počet CPU, 0 = vše ve smyčce událostí)
+            cache_size (int): Kapacita LRU cache grafů (v každém procesu)
+            preload (list): Cesty ke grafům, které se načtou hned při startu
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.cache_size = cache_size
+        self.cache = GraphCache(cache_size)
+        self.histograms = collections.defaultdict(LatencyHistogram)
+        self.preload = list(preload or [])
+        self._pool = None
+        self._fork = _fork_context()
+        self._loading = {}
+        self._connections = set()
+        self.started_at = time.time()
+
+    # ---------- Pool pracovních procesů ----------
+
+    def _start_pool(self):
+        """
+        Vytvoří pool pracovních procesů na celou dobu běhu serveru.
+
+        Musí se volat dřív, než hlavní proces spustí další vlákna (načítání
+        grafů přes run_in_executor) - fork vícevláknového procesu může
+        v potomkovi zanechat zamčené zámky. S kontextem 'fork' spustí
+        ProcessPoolExecutor všechny procesy při prvním odeslání úlohy, proto
+        se hned odešle zahřívací úloha.
+        """
+        global _inherited_cache
+        if self.workers <= 0:
+            return
+        if self._fork is not None:
+            # Pracovní procesy zdědí grafy načtené při startu (preload)
+            _inherited_cache = self.cache
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._fork,
+            initializer=_init_worker,
+            initargs=(self.cache_size,),
+        )
+        self._pool.submit(_worker_stats).result()
+
+    def _preload(self):
+        """Načte grafy z `preload` přímo v hlavním vlákně (před startem poolu i naslouchání)."""
+        for path in self.preload:
+            key, graph = self.cache.lookup(path)
+            if graph is None:
+                self.cache.insert(key, commands.load_graph(key[0]))
+
+    async def _load(self, key):
+        """Načte graf v pomocném vlákně a vloží ho do cache."""
+        try:
+            loop = asyncio.get_running_loop()
+            graph = await loop.run_in_executor(None, commands.load_graph, key[0])
+            self.cache.insert(key, graph)
+            return graph
+        finally:
+            del self._loading[key]
+
+    async def get_graph(self, path):
+        """
+        Vrátí graf z cache; při chybějícím záznamu ho načte bez blokování smyčky.
+
+        Souběžné dotazy na tentýž soubor sdílejí jedno načítání.
+
+        Args:
+            path (str): Cesta k souboru s grafem
+
+        Returns:
+            Graph: Načtený graf
+        """
+        key, graph = self.cache.lookup(path)
+        if graph is not None:
+            return graph
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key))
+            self._loading[key] = task
+        return await asyncio.shield(task)
+
+    async def _stats(self):
+        stats = {
+            'uptime_s': round(time.time() - self.started_at, 3),
+            'workers': self.workers,
+            'cache': self.cache.stats(),
+            'latency': {op: hist.to_dict() for op, hist in sorted(self.histograms.items())},
+        }
+        if self._pool is not None:
+            loop = asyncio.get_running_loop()
+            replies = await asyncio.gather(
+                *(loop.run_in_executor(self._pool, _worker_stats) for _ in range(self.workers)),
+                return_exceptions=True,
+            )
+            by_pid = {r['pid']: r for r in replies if isinstance(r, dict)}
+            stats['pool'] = {
+                'shared_cache': self._fork is not None,
+                'worker_caches': [by_pid[pid] for pid in sorted(by_pid)],
+            }
+        return stats
+
+    async def handle_request(self, request):
+        """
+        Zpracuje jeden dotaz a vrátí slovník s odpovědí.
+
+        Args:
+            request (dict): Dekódovaný JSON dotaz
+
+        Returns:
+            dict: Odpověď připravená k serializaci
+        """
+        op = request.get('op')
+        response = {'id': request.get('id')}
+        started = time.perf_counter()
+        ok = True
+        try:
+            if op == 'ping':
+                result = 'pong'
+            elif op == 'stats':
+                result = await self._stats()
+            elif op not in ENDPOINTS:
+                raise ValueError(f"Neznámá operace '{op}'. Dostupné: {', '.join(sorted(ENDPOINTS))}")
+            else:
+                _require(request, 'graph')
+                handler, heavy = ENDPOINTS[op]
+                if heavy and self._pool is not None:
+                    # Pracovní proces použije zděděný graf, nebo si ho načte do své cache
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(self._pool, _run_in_worker, op, request)
+                else:
+                    graph = await self.get_graph(request['graph'])
+                    result = _jsonable(handler(graph, request))
+            response.update(ok=True, result=result)
+        except Exception as e:
+            ok = False
+            response.update(ok=False, error=f"{type(e).__name__}: {e}")
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        known = op in ENDPOINTS or op in ('ping', 'stats')
+        self.histograms[op if known else 'unknown'].record(elapsed_ms, ok)
+        return response
+
+    async def _handle_connection(self, reader, writer):
+        """Obslouží jedno spojení; každý řádek je samostatný dotaz zpracovaný souběžně."""
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line):
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('Dotaz musí být JSON objekt')
+            except ValueError as e:
+                response = {'id': None, 'ok': False, 'error': f"Neplatný JSON: {e}"}
+            else:
+                response = await self.handle_request(request)
+            data = (json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8')
+            async with write_lock:
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Ukončení serveru - rozpracované dotazy zrušíme a spojení zavřeme
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    async def _close_connections(self):
+        """Zruší obsluhu všech otevřených spojení a počká na jejich ukončení."""
+        connections = list(self._connections)
+        for connection in connections:
+            connection.cancel()
+        await asyncio.gather(*connections, return_exceptions=True)
+
+    async def serve(self, socket_path=None, host='127.0.0.1', port=DEFAULT_PORT, ready=None):
+        """
+        Spustí server a obsluhuje spojení až do zrušení.
+
+        Args:
+            socket_path (str): Cesta k Unix socketu (má přednost před TCP)
+            host (str): Adresa pro TCP (výchozí pouze localhost)
+            port (int): TCP port
+            ready (callable): Volitelný callback zavolaný po startu s popisem adresy
+        """
+        self._preload()
+        self._start_pool()
+
+        server = None
+        try:
+            if socket_path:
+                _remove_stale_socket(socket_path)
+                server = await asyncio.start_unix_server(self._handle_connection, path=socket_path)
+                address = f"unix:{socket_path}"
+            else:
+                server = await asyncio.start_server(self._handle_connection, host=host, port=port)
+                address = f"tcp:{host}:{port}"
+
+            if ready is not None:
+                ready(address)
+            await server.serve_forever()
+        finally:
+            if server is not None:
+                server.close()
+                await self._close_connections()
+                await server.wait_closed()
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+            if socket_path and server is not None:
+                _remove_stale_socket(socket_path)
+
+
+def run_server(args):
+    """Spustí server podle argumentů z CLI (blokující volání)."""
+    preload = [args.input_file] if args.input_file else []
+    server = QueryServer(workers=args.workers, cache_size=args.cache_size, preload=preload)
+
+    def ready(address):
+        if not args.quiet:
+            print(f"Server naslouchá na {address} (pracovní procesy: {server.workers})", file=sys.stderr)
+
+    try:
+        asyncio.run(server.serve(socket_path=args.socket, port=args.port, ready=ready))
+    except KeyboardInterrupt:
+        if not args.quiet:
+            print("\nServer ukončen", file=sys.stderr)
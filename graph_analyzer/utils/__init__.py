@@ -3,5 +3,7 @@ Utility moduly pro parsování a pomocné funkce.
 """
 
 from .graph_parser import GraphParser
+from .graph_writer import GraphWriter
+from .result_cache import ResultCache
 
-__all__ = ['GraphParser']
+__all__ = ['GraphParser', 'GraphWriter', 'ResultCache']
@@ -0,0 +1,142 @@
+"""
+Souhrnné statistiky vzdáleností ze všech uzlů grafu.
+
+Pro každý uzel x se počítají součty přes vzdálenosti d(x, y) do ostatních
+uzlů: počet dosažitelných uzlů, součet vzdáleností, součet převrácených
+vzdáleností a excentricita. K tomu histogram vzdáleností přes všechny
+dvojice. Z těchto hodnot se odvozuje closeness a harmonická centralita,
+průměrná délka nejkratší cesty, průměr, poloměr i centrum grafu.
+"""
+
+import heapq
+import math
+
+# Paměť pro masky navštívených cílů jedné dávky (v bitech, tj. 64 MB);
+# větší dávka znamená méně průchodů přes oblouky
+BATCH_MEMORY_BITS = 1 << 29
+
+
+def bfs_profile(pred, n, batch_size=None):
+    """
+    Bitově paralelní průchod do šířky z mnoha uzlů najednou.
+
+    Uzly se zpracují po dávkách; každý uzel dávky má v celočíselné masce
+    jeden bit. Maska uzlu x na úrovni d obsahuje cíle y s d(x, y) = d, takže
+    jeden průchod přes oblouky posune všechny průchody dávky o úroveň naráz.
+    Bity se šíří proti směru oblouků (z cíle k předchůdcům), aby se součty
+    sbíraly u počátečního uzlu cesty. Počet nových cílů na úrovni je
+    `int.bit_count()` masky.
+
+    Args:
+        pred (list): Předchůdci každého uzlu (obrácené oblouky; u neorientovaného
+            grafu stačí sousedé)
+        n (int): Počet uzlů
+        batch_size (int): Počet průchodů v jedné dávce (None = podle BATCH_MEMORY_BITS)
+
+    Returns:
+        dict: {'reached', 'dist_sum', 'harmonic', 'eccentricity'} - seznamy
+            indexované uzlem (vlastní uzel se nepočítá) a 'histogram' -
+            {vzdálenost: počet uspořádaných dvojic}
+    """
+    if batch_size is None:
+        batch_size = max(64, BATCH_MEMORY_BITS // max(n, 1))
+    reached = [0] * n
+    dist_sum = [0] * n
+    harmonic = [0.0] * n
+    eccentricity = [0] * n
+    histogram = {}
+
+    for start in range(0, n, batch_size):
+        stop = min(start + batch_size, n)
+        visited = [0] * n
+        frontier = {}
+        for y in range(start, stop):
+            bit = 1 << (y - start)
+            visited[y] = bit
+            frontier[y] = bit
+
+        level = 0
+        while frontier:
+            level += 1
+            incoming = {}
+            for u, mask in frontier.items():
+                for x in pred[u]:
+                    incoming[x] = incoming.get(x, 0) | mask
+
+            frontier = {}
+            pairs = 0
+            for x, mask in incoming.items():
+                new = mask & ~visited[x]
+                if new:
+                    visited[x] |= new
+                    frontier[x] = new
+                    count = new.bit_count()
+                    reached[x] += count
+                    dist_sum[x] += count * level
+                    harmonic[x] += count / level
+                    if level > eccentricity[x]:
+                        eccentricity[x] = level
+                    pairs += count
+            if pairs:
+                histogram[level] = histogram.get(level, 0) + pairs
+
+    return {
+        'reached': reached,
+        'dist_sum': dist_sum,
+        'harmonic': harmonic,
+        'eccentricity': eccentricity,
+        'histogram': histogram,
+    }
+
+
+def dijkstra_profile(adj, weights, n):
+    """
+    Stejné statistiky jako bfs_profile pro ohodnocený graf (Dijkstra z každého uzlu).
+
+    Args:
+        adj (list): Následníci každého uzlu
+        weights (list): Délky oblouků ve stejném pořadí jako adj
+        n (int): Počet uzlů
+
+    Returns:
+        dict: Viz bfs_profile
+    """
+    reached = [0] * n
+    dist_sum = [0] * n
+    harmonic = [0.0] * n
+    eccentricity = [0] * n
+    histogram = {}
+
+    for s in range(n):
+        dist = [math.inf] * n
+        dist[s] = 0
+        heap = [(0, s)]
+        while heap:
+            d, v = heapq.heappop(heap)
+            if d > dist[v]:
+                continue
+            for w, weight in zip(adj[v], weights[v]):
+                candidate = d + weight
+                if candidate < dist[w]:
+                    dist[w] = candidate
+                    heapq.heappush(heap, (candidate, w))
+
+        # Součty až po doběhnutí - záporná hrana může vzdálenost uzlu ještě zlepšit
+        for v, d in enumerate(dist):
+            if v == s or d == math.inf:
+                continue
+            reached[s] += 1
+            dist_sum[s] += d
+            if d > 0:
+                harmonic[s] += 1.0 / d
+            if d > eccentricity[s]:
+                eccentricity[s] = d
+            histogram[d] = histogram.get(d, 0) + 1
+
+    return {
+        'reached': reached,
+        'dist_sum': dist_sum,
+        'harmonic': harmonic,
+        'eccentricity': eccentricity,
+        'histogram': histogram,
+    }
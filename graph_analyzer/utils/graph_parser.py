@@ -2,7 +2,7 @@
 Parser pro načítání grafů z textových souborů.
 """
 
-from ..models import Node, Edge
+from ..models import Node, Edge, is_placeholder_id
 
 class GraphParser:
     """
@@ -101,8 +101,8 @@ class GraphParser:
                 # Levé dítě
                 if left_child_idx < len(node_sequence):
                     child_id = node_sequence[left_child_idx] 
-                    if (not parent_id.startswith('*_') and 
-                        not child_id.startswith('*_')):
+                    if (not is_placeholder_id(parent_id) and
+                        not is_placeholder_id(child_id)):
                         from ..models import Edge
                         parent_node = nodes_dict[parent_id]
                         child_node = nodes_dict[child_id]
@@ -112,8 +112,8 @@ class GraphParser:
                 # Pravé dítě  
                 if right_child_idx < len(node_sequence):
                     child_id = node_sequence[right_child_idx]
-                    if (not parent_id.startswith('*_') and 
-                        not child_id.startswith('*_')):
+                    if (not is_placeholder_id(parent_id) and
+                        not is_placeholder_id(child_id)):
                         from ..models import Edge  
                         parent_node = nodes_dict[parent_id]
                         child_node = nodes_dict[child_id]
@@ -171,7 +171,7 @@ class GraphParser:
         if node_spec == '*':
             # Vytvoří unikátní identifikátor pro placeholder uzel
             identifier = f"*_{position}"
-            return Node(identifier, None)
+            return Node(identifier, None, placeholder=True)
         else:
             # Standardní zpracování skutečných uzlů
             return GraphParser._parse_node(command)
@@ -189,8 +189,31 @@ class GraphParser:
         Returns:
             Edge: Objekt hrany nebo None při chybě
         """
-        edge_spec = command[2:].strip()
-        
+        spec = GraphParser._parse_edge_spec(command[2:].strip())
+        if spec is None:
+            return None
+        u_id, direction, v_id, weight, label = spec
+
+        u_node = nodes_dict.get(u_id)
+        v_node = nodes_dict.get(v_id)
+
+        if not u_node or not v_node:
+            print(f"Varování: Uzel(y) pro hranu {u_id} {direction} {v_id} nebyly nalezeny. Přeskakuji hranu.")
+            return None
+
+        return Edge(u_node, v_node, direction, weight, label)
+
+    @staticmethod
+    def _parse_edge_spec(edge_spec):
+        """
+        Rozloží specifikaci hrany 'u (<|-|>) v [weight] [:label]' na části.
+
+        Args:
+            edge_spec (str): Text hrany bez úvodního 'h '
+
+        Returns:
+            tuple: (u_id, direction, v_id, weight, label) nebo None při chybě
+        """
         # Split by spaces, but be careful with weight and label
         parts = edge_spec.split()
         if len(parts) < 3:
@@ -201,13 +224,6 @@ class GraphParser:
         direction_symbol = parts[1].strip()
         v_id = parts[2].strip()
 
-        u_node = nodes_dict.get(u_id)
-        v_node = nodes_dict.get(v_id)
-
-        if not u_node or not v_node:
-            print(f"Varování: Uzel(y) pro hranu {u_id} {direction_symbol} {v_id} nebyly nalezeny. Přeskakuji hranu.")
-            return None
-
         weight = None
         label = None
 
@@ -242,4 +258,81 @@ class GraphParser:
         else:  # '-'
             direction = '-'
 
-        return Edge(u_node, v_node, direction, weight, label)
+        return u_id, direction, v_id, weight, label
+
+    # ========== Soubory změn (delta) ==========
+
+    @staticmethod
+    def parse_delta_file(file_path):
+        """
+        Načte soubor se změnami grafu.
+
+        Args:
+            file_path (str): Cesta k souboru
+
+        Returns:
+            list: Seznam operací pro Graph.apply_delta()
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Soubor '{file_path}' nebyl nalezen.")
+
+        return GraphParser.parse_delta_lines(lines)
+
+    @staticmethod
+    def parse_delta_lines(lines):
+        """
+        Parsuje řádky souboru se změnami grafu.
+
+        Formát (jedna změna na řádek, zbytek syntaxe shodný s .tg):
+            +u X [value];        přidání uzlu (u existujícího uzlu změna hodnoty)
+            -u X;                odebrání uzlu včetně incidentních hran
+            +h A > B [w] [:l];   přidání hrany
+            -h A > B [w] [:l];   odebrání jedné odpovídající hrany (váha/označení volitelně)
+            ~h A > B w [:l];     změna váhy hrany
+
+        Args:
+            lines (list): Seznam řádků
+
+        Returns:
+            list: Seznam operací ve tvaru (operace, argumenty...)
+        """
+        operations = []
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            try:
+                command = line.split(';', 1)[0].strip()
+                prefix, body = command[:2], command[2:].strip()
+
+                if prefix in ('+u', '-u'):
+                    node = GraphParser._parse_node('u ' + body)
+                    if prefix == '+u':
+                        operations.append(('add_node', node.identifier, node.value))
+                    else:
+                        operations.append(('remove_node', node.identifier))
+
+                elif prefix in ('+h', '-h', '~h'):
+                    spec = GraphParser._parse_edge_spec(body)
+                    if spec is None:
+                        continue
+                    if prefix == '~h' and spec[3] is None:
+                        raise ValueError("změna váhy (~h) vyžaduje novou váhu")
+                    kind = {'+h': 'add_edge', '-h': 'remove_edge', '~h': 'reweight_edge'}[prefix]
+                    operations.append((kind,) + spec)
+
+                else:
+                    print(f"Varování: Neznámý typ změny na řádku {line_num}: {line}")
+
+            except Exception as e:
+                print(f"Varování: Chyba na řádku {line_num}: {e}")
+                continue
+
+        return operations
@@ -0,0 +1,65 @@
+"""
+Zápis grafů do textového formátu .tg.
+"""
+
+import os
+
+
+class GraphWriter:
+    """
+    Třída pro zápis grafů ve formátu, který čte GraphParser.
+    """
+
+    @staticmethod
+    def format_value(value):
+        """Vrátí textový zápis váhy nebo hodnoty (celá čísla bez desetinné části)."""
+        if isinstance(value, float):
+            return f"{value:g}"
+        return str(value)
+
+    @staticmethod
+    def format_node(node):
+        """Vrátí zápis uzlu 'u X [hodnota]' (bez středníku)."""
+        if node.value is None:
+            return f"u {node.identifier}"
+        return f"u {node.identifier} [{GraphWriter.format_value(node.value)}]"
+
+    @staticmethod
+    def format_edge(edge):
+        """Vrátí textový zápis hrany ve tvaru z .tg souboru (bez 'h' a středníku)."""
+        text = f"{edge.u.identifier} {edge.direction} {edge.v.identifier}"
+        if edge.weight is not None:
+            text += f" {GraphWriter.format_value(edge.weight)}"
+        if edge.label is not None:
+            text += f" :{edge.label}"
+        return text
+
+    @staticmethod
+    def write_file(graph, file_path, include=None, edges=None):
+        """
+        Zapíše graf (nebo jeho podgraf) do souboru .tg.
+
+        Args:
+            graph (Graph): Graf k zápisu
+            file_path (str): Cílový soubor (adresář se vytvoří, pokud neexistuje)
+            include (callable): Predikát nad identifikátorem uzlu; zapíšou se jen
+                vybrané uzly a hrany mezi nimi
+            edges (iterable): Hrany k zápisu místo všech hran grafu (např. kostra)
+
+        Returns:
+            tuple: (počet zapsaných uzlů, počet zapsaných hran)
+        """
+        keep = include or (lambda node_id: True)
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        node_count = 0
+        edge_count = 0
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for node_id, node in graph.nodes.items():
+                if keep(node_id):
+                    f.write(GraphWriter.format_node(node) + ";\n")
+                    node_count += 1
+            for edge in graph.edges if edges is None else edges:
+                if keep(edge.u.identifier) and keep(edge.v.identifier):
+                    f.write("h " + GraphWriter.format_edge(edge) + ";\n")
+                    edge_count += 1
+        return node_count, edge_count
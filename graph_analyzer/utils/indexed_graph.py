@@ -0,0 +1,133 @@
+"""
+Kompaktní reprezentace grafu nad celočíselnými indexy (CSR).
+"""
+
+
+def arc_weight(weight):
+    """Vrátí délku oblouku; neohodnocená hrana má délku 1, nečíselná váha vrátí None."""
+    if weight is None:
+        return 1
+    if isinstance(weight, (int, float)):
+        return weight
+    return None
+
+
+class IndexedGraph:
+    """
+    Snímek grafu v podobě polí indexovaných čísly uzlů 0..n-1.
+
+    Sousedé uzlu i jsou `targets[offsets[i]:offsets[i + 1]]` (formát CSR),
+    k nim délky oblouků `weights` a pozice původní hrany v `graph.edges`
+    (`edge_pos`). Oblouky odpovídají `graph.adj` - orientovaná hrana má
+    jeden oblouk, neorientovaná dva. Výpočetně náročné analyzátory pracují
+    nad těmito poli místo slovníků a objektů Edge.
+
+    Snímek se po změně grafu neaktualizuje, je potřeba vytvořit nový.
+
+    Attributes:
+        ids (list): Identifikátory uzlů podle indexu
+        index (dict): Identifikátor uzlu -> index
+        n (int): Počet uzlů
+        m (int): Počet oblouků
+    """
+
+    def __init__(self, graph, include=None, undirected=False, skip_loops=False):
+        """
+        Vytvoří snímek grafu.
+
+        Args:
+            graph (Graph): Zdrojový graf
+            include (callable): Predikát nad identifikátorem uzlu; uzly, pro
+                které vrátí False, se vynechají i s hranami
+            undirected (bool): Ignorovat orientaci - orientovaná hrana dostane
+                i opačný oblouk
+            skip_loops (bool): Vynechat smyčky
+        """
+        self.graph = graph
+        self.ids = [node_id for node_id in graph.nodes if include is None or include(node_id)]
+        self.index = {node_id: i for i, node_id in enumerate(self.ids)}
+        self.n = len(self.ids)
+        self.undirected = undirected
+
+        edge_pos = {id(edge): k for k, edge in enumerate(graph.edges)}
+        index = self.index
+        offsets = [0]
+        targets = []
+        weights = []
+        positions = []
+        add_target = targets.append
+        add_weight = weights.append
+        add_position = positions.append
+        adj = graph.adj
+        rev_adj = graph.rev_adj
+        # Bez orientovaných hran obsahuje graph.adj už oba směry
+        add_reverse = undirected and graph.is_directed
+        for node_id in self.ids:
+            entries = adj.get(node_id, ())
+            if add_reverse:
+                entries = list(entries) + [entry for entry in rev_adj.get(node_id, ()) if entry.direction != '-']
+            for entry in entries:
+                other = entry.v.identifier
+                if other == node_id:
+                    other = entry.u.identifier
+                j = index.get(other)
+                if j is None or (skip_loops and other == node_id):
+                    continue
+                weight = entry.weight
+                if weight is None:
+                    weight = 1
+                elif not isinstance(weight, (int, float)):
+                    continue
+                add_target(j)
+                add_weight(weight)
+                add_position(edge_pos[id(entry.origin or entry)])
+            offsets.append(len(targets))
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.edge_pos = positions
+        self.m = len(targets)
+
+    def neighbors(self, i):
+        """Vrátí indexy sousedů (cílů oblouků) uzlu i."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i):
+        """Vrátí počet oblouků vycházejících z uzlu i."""
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def _split(self, values):
+        offsets = self.offsets
+        return [values[offsets[i]:offsets[i + 1]] for i in range(self.n)]
+
+    def adjacency_lists(self):
+        """Vrátí seznam sousedů pro každý uzel (rychlejší pro průchody v Pythonu)."""
+        return self._split(self.targets)
+
+    def weight_lists(self):
+        """Vrátí délky oblouků pro každý uzel (ve stejném pořadí jako adjacency_lists)."""
+        return self._split(self.weights)
+
+    def edge_lists(self):
+        """Vrátí pozice původních hran pro každý uzel (ve stejném pořadí jako adjacency_lists)."""
+        return self._split(self.edge_pos)
+
+    def reverse_lists(self):
+        """
+        Vrátí obrácené oblouky pro každý uzel.
+
+        Returns:
+            tuple: (předchůdci, délky, pozice hran) - seznamy indexované cílovým uzlem
+        """
+        sources = [[] for _ in range(self.n)]
+        weights = [[] for _ in range(self.n)]
+        positions = [[] for _ in range(self.n)]
+        offsets = self.offsets
+        for i in range(self.n):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = self.targets[k]
+                sources[j].append(i)
+                weights[j].append(self.weights[k])
+                positions[j].append(self.edge_pos[k])
+        return sources, weights, positions
@@ -0,0 +1,311 @@
+"""
+Obsahově adresovaná cache výsledků analýz na disku.
+"""
+
+import hashlib
+import json
+import os
+
+from .. import __version__
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Verze formátu a algoritmů - zvýšit při každé změně, která mění výsledky analýz
+CACHE_VERSION = 3
+
+# Po tolika zápisech se index velikosti přepočítá skutečným průchodem adresáře
+RESCAN_EVERY = 64
+
+_SUFFIX = '.json'
+_INDEX_NAME = 'size_index.json'
+
+
+def default_cache_dir():
+    """
+    Vrátí výchozí adresář cache.
+
+    Pořadí: proměnná GRAPH_ANALYZER_CACHE_DIR, $XDG_CACHE_HOME/graph_analyzer,
+    ~/.cache/graph_analyzer.
+    """
+    explicit = os.environ.get('GRAPH_ANALYZER_CACHE_DIR')
+    if explicit:
+        return explicit
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'graph_analyzer')
+
+
+def file_hash(file_path, chunk_size=1 << 20):
+    """
+    Vrátí SHA-256 hash obsahu souboru s grafem.
+
+    Args:
+        file_path (str): Cesta k souboru
+        chunk_size (int): Velikost čteného bloku v bajtech
+
+    Returns:
+        str: Hexadecimální hash
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def analysis_key(graph_hash, analysis, **params):
+    """
+    Sestaví textový klíč analýzy, např. 'adj_power:k=5'.
+
+    Args:
+        graph_hash (str): Hash obsahu grafu
+        analysis (str): Název analýzy
+        **params: Parametry analýzy (řadí se podle jména)
+
+    Returns:
+        str: Klíč ve tvaru '<hash>/<analýza>:<parametry>'
+    """
+    param_str = ','.join(f"{name}={params[name]!r}" for name in sorted(params))
+    return f"{graph_hash}/{analysis}:{param_str}"
+
+
+class ResultCache:
+    """
+    Cache výsledků analýz ve formátu JSON ve sdíleném adresáři.
+
+    Každý výsledek je jeden soubor pojmenovaný hashem klíče. Zápis probíhá
+    přes dočasný soubor a atomické `os.replace`, takže několik procesů může
+    sdílet jeden adresář bez zámků - čtenář vždy vidí buď celý starý, nebo
+    celý nový soubor. Adresář se vytváří s právy 0700 a záznamy jiného
+    vlastníka se nečtou.
+
+    Hodnoty se ukládají jako JSON (n-tice se vrací jako seznamy, nekonečno
+    jako float('inf')); hodnoty, které do JSON převést nelze, se neukládají.
+    Celková velikost se sleduje v malém indexu; teprve po překročení limitu
+    (nebo jednou za RESCAN_EVERY zápisů) se projde celý adresář a smažou se
+    nejdéle nepoužité záznamy (mtime se při každém zásahu aktualizuje).
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializace cache.
+
+        Args:
+            cache_dir (str): Adresář cache (None = default_cache_dir())
+            max_bytes (int): Maximální celková velikost záznamů v bajtech
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path_for(self, key):
+        digest = hashlib.sha256(f"{CACHE_VERSION}|{__version__}|{key}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest + _SUFFIX)
+
+    @staticmethod
+    def _owned(st):
+        """Ověří, že soubor patří aktuálnímu uživateli (na platformách bez UID vždy True)."""
+        return not hasattr(os, 'getuid') or st.st_uid == os.getuid()
+
+    def _read_own(self, path):
+        """
+        Přečte soubor, pokud patří aktuálnímu uživateli a není to symbolický odkaz.
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje
+            PermissionError: Pokud soubor patří jinému uživateli
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+        with os.fdopen(fd, 'rb') as f:
+            if not self._owned(os.fstat(f.fileno())):
+                raise PermissionError(f"Záznam cache '{path}' patří jinému uživateli.")
+            return f.read()
+
+    def _ensure_dir(self, directory):
+        """Vytvoří adresář s právy 0700 a ověří, že patří aktuálnímu uživateli."""
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not self._owned(os.stat(directory)):
+            raise PermissionError(f"Adresář cache '{directory}' patří jinému uživateli.")
+
+    def get(self, key):
+        """
+        Načte výsledek z cache.
+
+        Args:
+            key (str): Klíč z analysis_key()
+
+        Returns:
+            tuple: (nalezeno, hodnota)
+        """
+        path = self._path_for(key)
+        try:
+            value = json.loads(self._read_own(path).decode('utf-8'))
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except PermissionError:
+            # Cizí záznam nečteme ani nemažeme
+            self.misses += 1
+            return False, None
+        except (OSError, ValueError):
+            # Poškozený záznam (neplatné JSON/UTF-8) - zahodíme ho
+            self._remove(path)
+            self.misses += 1
+            return False, None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return True, value
+
+    def put(self, key, value):
+        """
+        Uloží výsledek do cache (chyby zápisu a neserializovatelné hodnoty se ignorují).
+
+        Args:
+            key (str): Klíč z analysis_key()
+            value: Hodnota převoditelná do JSON
+        """
+        try:
+            data = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+        path = self._path_for(key)
+        directory = os.path.dirname(path)
+        try:
+            self._ensure_dir(self.cache_dir)
+            self._ensure_dir(directory)
+            # tempfile se načítá až při zápisu - start CLI bez zápisu do cache ho nepotřebuje
+            import tempfile
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError:
+            return
+        self._account(len(data))
+
+    def get_or_compute(self, key, compute):
+        """
+        Vrátí výsledek z cache, nebo ho spočítá funkcí compute a uloží.
+
+        Args:
+            key (str): Klíč z analysis_key()
+            compute (callable): Funkce bez argumentů počítající výsledek
+
+        Returns:
+            Výsledek analýzy
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        """Smaže všechny záznamy v cache."""
+        for path, _, _ in self._entries():
+            self._remove(path)
+        self._remove(os.path.join(self.cache_dir, _INDEX_NAME))
+
+    # ---------- Sledování velikosti ----------
+
+    def _read_index(self):
+        """Vrátí (celková velikost, počet zápisů od přepočtu), nebo None."""
+        try:
+            index = json.loads(self._read_own(os.path.join(self.cache_dir, _INDEX_NAME)))
+            return int(index['total_bytes']), int(index['puts'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_index(self, total, puts):
+        """Atomicky zapíše index velikosti (chyby se ignorují)."""
+        import tempfile
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'total_bytes': total, 'puts': puts}, f)
+                os.replace(tmp_path, os.path.join(self.cache_dir, _INDEX_NAME))
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def _account(self, added):
+        """
+        Započítá nový záznam do indexu velikosti a při překročení limitu uvolní místo.
+
+        Index je jen odhad (souběžné procesy si mohou přepsat zápisy nebo
+        přepisovaný záznam započítat dvakrát), proto se pravidelně přepočítává.
+        """
+        index = self._read_index()
+        if index is None or index[1] + 1 >= RESCAN_EVERY:
+            total, puts = sum(size for _, size, _ in self._entries()), 0
+        else:
+            total, puts = index[0] + added, index[1] + 1
+        if total > self.max_bytes:
+            total, puts = self._evict(), 0
+        self._write_index(total, puts)
+
+    def _entries(self):
+        """Vrátí seznam (cesta, velikost, mtime) všech záznamů."""
+        entries = []
+        try:
+            subdirs = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for sub in subdirs:
+            sub_path = os.path.join(self.cache_dir, sub)
+            if not os.path.isdir(sub_path):
+                continue
+            try:
+                names = os.listdir(sub_path)
+            except OSError:
+                continue
+            for name in names:
+                if not name.endswith(_SUFFIX):
+                    continue
+                path = os.path.join(sub_path, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    # Soubor mezitím smazal jiný proces
+                    continue
+                entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self):
+        """
+        Odstraní nejdéle nepoužité záznamy, dokud celková velikost nepřesahuje limit.
+
+        Returns:
+            int: Celková velikost záznamů po úklidu
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+        entries.sort(key=lambda entry: entry[2])
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+        return total
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,76 @@
+"""
+Disjunktní množiny (union-find) s kompresí cest a spojováním podle velikosti.
+"""
+
+
+class UnionFind:
+    """
+    Struktura disjunktních množin nad libovolnými hashovatelnými prvky.
+
+    Attributes:
+        count (int): Aktuální počet množin
+    """
+
+    def __init__(self, elements=()):
+        """
+        Inicializace struktury.
+
+        Args:
+            elements (iterable): Prvky, které tvoří počáteční jednoprvkové množiny
+        """
+        self.parent = {}
+        self.size = {}
+        self.count = 0
+        for element in elements:
+            self.add(element)
+
+    def __contains__(self, element):
+        return element in self.parent
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self, element):
+        """Přidá prvek jako jednoprvkovou množinu (existující prvek se ignoruje)."""
+        if element not in self.parent:
+            self.parent[element] = element
+            self.size[element] = 1
+            self.count += 1
+
+    def find(self, element):
+        """
+        Vrátí reprezentanta množiny obsahující prvek.
+
+        Iterativní varianta s půlením cest, takže funguje i pro dlouhé řetězce.
+        """
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a, b):
+        """
+        Sjednotí množiny obsahující prvky a, b.
+
+        Returns:
+            bool: True pokud byly prvky v různých množinách
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        """Zjistí, zda jsou prvky ve stejné množině."""
+        return self.find(a) == self.find(b)
+
+    def set_size(self, element):
+        """Vrátí velikost množiny obsahující prvek."""
+        return self.size[self.find(element)]
@@ -0,0 +1,36 @@
+"""Společné pomocné funkce testů."""
+
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def random_graph(rng, n, m, directions='<>-', weights=None, loops=True, bipartite=False, labels=None,
+                 values=False):
+    """
+    Náhodný graf s uzly N0..N{n-1} a m hranami.
+
+    Args:
+        rng (random.Random): Generátor náhodných čísel
+        n (int): Počet uzlů
+        m (int): Počet hran
+        directions (str): Směry, ze kterých se losuje ('<', '>', '-')
+        weights (tuple): Váhy, ze kterých se losuje (None = neohodnocené hrany)
+        loops (bool): Povolit smyčky
+        bipartite (bool): Hrany jen mezi sudými a lichými uzly
+        labels (tuple): Označení, ze kterých se losuje (None = bez označení)
+        values (bool): Ohodnotit uzly hodnotami i % 3
+    """
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}', i % 3 if values else None))
+    for _ in range(m):
+        if bipartite:
+            u, v = rng.randrange(0, n, 2), rng.randrange(1, n, 2)
+        elif loops:
+            u, v = rng.randrange(n), rng.randrange(n)
+        else:
+            u, v = rng.sample(range(n), 2)
+        direction = rng.choice(directions)
+        weight = None if weights is None else rng.choice(weights)
+        label = None if labels is None else rng.choice(labels)
+        graph.add_edge(Edge(graph.nodes[f'N{u}'], graph.nodes[f'N{v}'], direction, weight, label))
+    return graph
@@ -0,0 +1,86 @@
+"""Testy přibližných statistik vzdáleností (HyperANF) a mezí průměru."""
+
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import ApproxDistanceAnalyzer, PathAnalyzer
+from graph_analyzer.analyzers import approx_distance_analyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def build_graph(n, pairs, direction='-'):
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for u, v in pairs:
+        graph.add_edge(Edge(graph.nodes[f'N{u}'], graph.nodes[f'N{v}'], direction, None))
+    return graph
+
+
+def random_connected_graph(rng, n, extra):
+    pairs = [(i, rng.randrange(i)) for i in range(1, n)]
+    pairs += [tuple(rng.sample(range(n), 2)) for _ in range(extra)]
+    return build_graph(n, pairs)
+
+
+def test_path_graph_estimates_are_close():
+    graph = build_graph(30, [(i, i + 1) for i in range(29)])
+    result = ApproxDistanceAnalyzer(graph).neighbourhood_function(precision=10, runs=3, seed=1)
+    exact = PathAnalyzer(graph).get_distance_statistics()
+    assert result['iterations'] == 29
+    assert result['average_distance'][0] == pytest.approx(exact['average'], rel=0.1)
+    assert result['reachable_pairs'][0] == pytest.approx(2 * exact['pairs'], rel=0.1)
+    assert sum(result['distribution']) == pytest.approx(1.0)
+    assert len(result['distribution']) == len(result['distribution_ci']) == 29
+
+
+@pytest.mark.skipif(approx_distance_analyzer.np is None, reason="numpy není nainstalované")
+def test_numpy_and_python_backends_agree():
+    graph = random_connected_graph(random.Random(2), 60, 40)
+    numpy_result = ApproxDistanceAnalyzer(graph, use_numpy=True).neighbourhood_function(runs=2, seed=3)
+    python_result = ApproxDistanceAnalyzer(graph, use_numpy=False).neighbourhood_function(runs=2, seed=3)
+    assert numpy_result['backend'] == 'numpy' and python_result['backend'] == 'python'
+    assert numpy_result['iterations'] == python_result['iterations']
+    assert numpy_result['neighbourhood'] == pytest.approx(python_result['neighbourhood'])
+
+
+def test_single_run_has_counter_bound_only():
+    graph = build_graph(5, [(0, 1), (1, 2)])
+    result = ApproxDistanceAnalyzer(graph).neighbourhood_function(runs=1)
+    assert result['average_distance'][1] is None
+    assert all(ci is not None for ci in result['neighbourhood_ci'])
+
+
+def test_invalid_parameters():
+    analyzer = ApproxDistanceAnalyzer(build_graph(2, [(0, 1)]))
+    with pytest.raises(ValueError):
+        analyzer.neighbourhood_function(precision=3)
+    with pytest.raises(ValueError):
+        analyzer.neighbourhood_function(runs=0)
+
+
+def test_bounds_contain_exact_diameter():
+    rng = random.Random(34)
+    for _ in range(20):
+        graph = random_connected_graph(rng, rng.randint(2, 40), rng.randint(0, 20))
+        bounds = ApproxDistanceAnalyzer(graph).diameter_bounds()
+        diameter = PathAnalyzer(graph).get_graph_diameter()
+        assert not bounds['infinite']
+        assert bounds['lower'] <= diameter <= bounds['upper']
+
+
+def test_four_sweep_is_exact_on_trees():
+    rng = random.Random(5)
+    for _ in range(10):
+        graph = random_connected_graph(rng, 50, 0)
+        assert ApproxDistanceAnalyzer(graph).diameter_bounds()['lower'] == PathAnalyzer(graph).get_graph_diameter()
+
+
+def test_directed_bounds():
+    cycle = build_graph(6, [(i, (i + 1) % 6) for i in range(6)], '>')
+    bounds = ApproxDistanceAnalyzer(cycle).diameter_bounds()
+    assert bounds == {'lower': 5, 'upper': None, 'infinite': False, 'sweeps': 4}
+
+    chain = build_graph(4, [(0, 1), (1, 2), (2, 3)], '>')
+    assert ApproxDistanceAnalyzer(chain).diameter_bounds()['infinite']
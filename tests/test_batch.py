@@ -0,0 +1,75 @@
+"""Testy dávkového zpracování adresářů grafů."""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from graph_analyzer import batch
+
+
+def write_graphs(directory, count):
+    directory.mkdir()
+    for i in range(count):
+        nodes = [f'N{j}' for j in range(i + 2)]
+        lines = [f'u {node};' for node in nodes]
+        lines += [f'h {a} - {b};' for a, b in zip(nodes, nodes[1:])]
+        (directory / f'g{i}.tg').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return sorted(str(path) for path in directory.iterdir())
+
+
+_analyze_file = batch.analyze_file
+
+
+def crash_on_g1(path, op, request=None):
+    """Pracovní proces na souboru g1.tg okamžitě skončí."""
+    if path.endswith('g1.tg'):
+        os._exit(1)
+    return _analyze_file(path, op, request)
+
+
+def test_largest_files_first_and_results_in_input_order(tmp_path):
+    paths = write_graphs(tmp_path / 'graphs', 5)
+    finished = []
+    rows = batch.run_batch(paths, 'info', workers=0, progress=lambda row: finished.append(row['file']))
+    assert [row['file'] for row in rows] == paths
+    assert finished == sorted(paths, key=lambda path: -os.path.getsize(path))
+    assert all(row['ok'] and row['seconds'] is not None for row in rows)
+    assert [row['result']['node_count'] for row in rows] == [2, 3, 4, 5, 6]
+
+
+def test_failures_are_isolated(tmp_path):
+    paths = write_graphs(tmp_path / 'graphs', 3)
+    missing = str(tmp_path / 'missing.tg')
+    rows = batch.run_batch(paths + [missing], 'properties', workers=2)
+    assert [row['ok'] for row in rows] == [True, True, True, False]
+    assert rows[-1]['error'].startswith('FileNotFoundError')
+    with pytest.raises(ValueError):
+        batch.run_batch(paths, 'path')
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='vyžaduje fork')
+def test_crashed_worker_marks_only_its_file(tmp_path, monkeypatch):
+    paths = write_graphs(tmp_path / 'graphs', 4)
+    monkeypatch.setattr(batch, 'analyze_file', crash_on_g1)
+    rows = batch.run_batch(paths, 'info', workers=2)
+    assert [row['ok'] for row in rows] == [True, False, True, True]
+    assert 'BrokenProcessPool' in rows[1]['error']
+
+
+def test_cli_batch_summary(tmp_path, capsys):
+    from graph_analyzer import cli
+    write_graphs(tmp_path / 'graphs', 3)
+    out = tmp_path / 'summary.csv'
+    cli.run(['--batch', str(tmp_path / 'graphs' / '*.tg'), '--batch-output', str(out), '--workers', '2', '-q'])
+    assert 'Souborů:____________3' in capsys.readouterr().out
+    lines = out.read_text(encoding='utf-8').splitlines()
+    header = lines[0].split(',')
+    assert header[:3] == ['file', 'size', 'ok'] and 'is_tree' in header
+    assert all(line.split(',')[header.index('is_tree')] == 'True' for line in lines[1:])
+
+    out = tmp_path / 'summary.jsonl'
+    cli.run(['--batch', str(tmp_path / 'graphs'), '--batch-op', 'diameter', '--batch-output', str(out), '-q'])
+    rows = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+    assert [row['result'] for row in rows] == [1.0, 2.0, 3.0]
@@ -0,0 +1,107 @@
+"""Testy mostů, artikulací a bloků (dvojsouvislých komponent)."""
+
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import BiconnectivityAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+from graph_analyzer.utils.union_find import UnionFind
+
+from helpers import random_graph
+
+
+def components(nodes, edges, skip_node=None, skip_edge=None):
+    sets = UnionFind(node_id for node_id in nodes if node_id != skip_node)
+    for edge in edges:
+        u, v = edge.u.identifier, edge.v.identifier
+        if edge is not skip_edge and skip_node not in (u, v):
+            sets.union(u, v)
+    return sets.count
+
+
+@pytest.mark.parametrize('size', [(6, 6), (10, 14), (15, 18)])
+def test_matches_brute_force(size):
+    rng = random.Random(41)
+    for _ in range(25):
+        graph = random_graph(rng, *size)
+        result = BiconnectivityAnalyzer(graph).analyze()
+        nodes, edges = list(graph.nodes), graph.edges
+        base = components(nodes, edges)
+
+        bridges = [e for e in edges if e.u is not e.v and components(nodes, edges, skip_edge=e) > base]
+        assert result['bridges'] == bridges
+        articulation = [x for x in nodes if components(nodes, edges, skip_node=x) > base]
+        assert result['articulation_points'] == articulation
+
+        # Každá hrana (kromě smyček) leží právě v jednom bloku
+        owner = {}
+        for number, block_edges in enumerate(result['block_edges']):
+            for edge in block_edges:
+                assert id(edge) not in owner
+                owner[id(edge)] = number
+        assert set(owner) == {id(e) for e in edges if e.u is not e.v}
+
+        for block, block_edges in zip(result['blocks'], result['block_edges']):
+            # Blok je dvojsouvislý: souvislý i po odebrání libovolného uzlu
+            if len(block) > 2:
+                for x in block:
+                    assert components(block, block_edges, skip_node=x) == 1
+            assert components(block, block_edges) == 1
+
+        # Strom bloků a artikulací je les a spojuje bloky jen přes artikulace
+        tree = UnionFind()
+        for number, node_id in result['block_cut_tree']:
+            assert node_id in articulation
+            tree.add(('B', number))
+            tree.add(node_id)
+            assert tree.union(('B', number), node_id)
+
+
+def test_two_triangles_sharing_node():
+    graph = Graph()
+    for node_id in 'ABCDEF':
+        graph.add_node(Node(node_id))
+    for u, v in ('AB', 'BC', 'CA', 'CD', 'DE', 'EC', 'EF'):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    result = BiconnectivityAnalyzer(graph).analyze()
+    assert [(e.u.identifier, e.v.identifier) for e in result['bridges']] == [('E', 'F')]
+    assert result['articulation_points'] == ['C', 'E']
+    assert sorted(result['blocks']) == [['A', 'B', 'C'], ['C', 'D', 'E'], ['E', 'F']]
+    assert len(result['block_cut_tree']) == 4
+
+
+def test_parallel_edge_is_not_bridge():
+    graph = Graph()
+    for node_id in 'AB':
+        graph.add_node(Node(node_id))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['B'], '-', None))
+    graph.add_edge(Edge(graph.nodes['B'], graph.nodes['A'], '>', None))
+    result = BiconnectivityAnalyzer(graph).analyze()
+    assert result['bridges'] == [] and result['articulation_points'] == []
+    assert result['blocks'] == [['A', 'B']]
+
+
+def test_long_chain_without_recursion():
+    n = 100_000
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for i in range(n - 1):
+        graph.add_edge(Edge(graph.nodes[f'N{i}'], graph.nodes[f'N{i + 1}'], '-', None))
+    result = BiconnectivityAnalyzer(graph).analyze()
+    assert len(result['bridges']) == n - 1
+    assert len(result['articulation_points']) == n - 2
+    assert len(result['blocks']) == n - 1
+
+
+def test_cli_exports_csv(tmp_path):
+    from graph_analyzer import cli
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nu C;\nu D;\nh A - B;\nh B - C;\nh C - A;\nh C - D;\n', encoding='utf-8')
+    out = tmp_path / 'csv'
+    cli.run([str(path), '--bridges', '--biconnected', '--export-csv', str(out), '--no-cache', '-q'])
+    assert (out / 'bridges.csv').read_text(encoding='utf-8').splitlines() == ['source,direction,target', 'C,-,D']
+    assert (out / 'articulation_points.csv').read_text(encoding='utf-8').splitlines() == ['node', 'C']
+    tree = (out / 'block_cut_tree.csv').read_text(encoding='utf-8').splitlines()
+    assert sorted(tree[1:]) == ['0,C', '1,C']
@@ -0,0 +1,117 @@
+"""Testy betweenness centrality."""
+
+import functools
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import CentralityAnalyzer, PathAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, directions='-', weights=(None,), loops=False)
+
+
+def count_paths(graph, distances, source):
+    """Počet nejkratších cest ze zdroje do každého uzlu (podle známých vzdáleností)."""
+    sigma = {source: 1}
+    for node_id in sorted(distances, key=distances.get):
+        if node_id == source or distances[node_id] == float('inf'):
+            continue
+        total = 0
+        for edge in graph.rev_adj.get(node_id, []) + [e for e in graph.adj.get(node_id, []) if e.direction == '-']:
+            pred = edge.u.identifier if edge.direction != '-' else edge.v.identifier
+            weight = edge.weight if edge.weight is not None else 1
+            if pred in sigma and distances.get(pred, float('inf')) + weight == distances[node_id]:
+                total += sigma[pred]
+        sigma[node_id] = total
+    return sigma
+
+
+def brute_betweenness(graph):
+    analyzer = PathAnalyzer(graph)
+    dist = {s: analyzer.get_shortest_distances(s) for s in graph.nodes}
+    sigma = {s: count_paths(graph, dist[s], s) for s in graph.nodes}
+    result = {v: 0.0 for v in graph.nodes}
+    for s, t in itertools.permutations(graph.nodes, 2):
+        d_st = dist[s].get(t, float('inf'))
+        if d_st == float('inf'):
+            continue
+        for v in graph.nodes:
+            if v in (s, t):
+                continue
+            if dist[s].get(v, float('inf')) + dist[v].get(t, float('inf')) == d_st:
+                result[v] += sigma[s][v] * sigma[v][t] / sigma[s][t]
+    if not graph.is_directed:
+        result = {v: value / 2 for v, value in result.items()}
+    return result
+
+
+@pytest.mark.parametrize('directions,weights', [('-', (None,)), ('>', (None,)), ('<->', (1.0, 2.0, 3.0))])
+def test_exact_matches_brute_force(directions, weights):
+    rng = random.Random(31)
+    for _ in range(20):
+        graph = random_graph(rng, 8, 14, directions=directions, weights=weights)
+        result = CentralityAnalyzer(graph).betweenness()
+        expected = brute_betweenness(graph)
+        assert result['exact'] and result['stderr'] is None
+        for node_id, value in expected.items():
+            assert result['nodes'][node_id] == pytest.approx(value)
+
+
+def test_path_graph_values():
+    graph = Graph()
+    for node_id in 'ABCD':
+        graph.add_node(Node(node_id))
+    for u, v in ('AB', 'BC', 'CD'):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-'))
+    result = CentralityAnalyzer(graph).betweenness()
+    assert result['nodes'] == {'A': 0, 'B': 2, 'C': 2, 'D': 0}
+    # Hrana B-C leží na cestách A-C, A-D, B-C, B-D
+    assert result['edges'] == [3, 4, 3]
+
+
+def test_parallel_matches_serial():
+    graph = random_graph(random.Random(1), 60, 150)
+    serial = CentralityAnalyzer(graph).betweenness(workers=1)
+    parallel = CentralityAnalyzer(graph).betweenness(workers=2)
+    assert parallel['nodes'] == pytest.approx(serial['nodes'])
+    assert parallel['edges'] == pytest.approx(serial['edges'])
+
+
+def test_sampling_is_seeded_and_bounded():
+    graph = random_graph(random.Random(2), 200, 600)
+    exact = CentralityAnalyzer(graph).betweenness()
+    first = CentralityAnalyzer(graph).betweenness(samples=100, seed=7)
+    second = CentralityAnalyzer(graph).betweenness(samples=100, seed=7)
+    assert first['nodes'] == second['nodes']
+    assert not first['exact'] and first['sources'] == 100
+
+    # Většina skutečných hodnot leží v 95% intervalu odhadu
+    inside = sum(
+        abs(first['nodes'][v] - exact['nodes'][v]) <= 1.96 * first['stderr'][v] + 1e-9
+        for v in graph.nodes
+    )
+    assert inside >= 0.85 * len(graph.nodes)
+
+    full_sample = CentralityAnalyzer(graph).betweenness(samples=500)
+    assert full_sample['exact']
+
+
+def test_rejects_negative_weights_and_invalid_samples():
+    graph = Graph()
+    for node_id in 'ABCD':
+        graph.add_node(Node(node_id))
+    for u, v, w in (('A', 'B', 1), ('A', 'C', 3), ('C', 'B', -5), ('B', 'D', 1)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '>', w))
+    analyzer = CentralityAnalyzer(graph)
+    with pytest.raises(ValueError):
+        analyzer.betweenness()
+    graph.reweight_edge(graph.find_edge('C', '>', 'B'), 5)
+    for samples in (0, -3):
+        with pytest.raises(ValueError):
+            analyzer.betweenness(samples=samples)
+    assert analyzer.betweenness(samples=1, seed=1)['sources'] == 1
@@ -0,0 +1,79 @@
+"""Testy počítání trojúhelníků a koeficientů shlukování."""
+
+import functools
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import GraphPropertiesAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, directions='-', loops=False)
+
+
+def brute_clustering(graph, include=lambda node_id: True):
+    neighbors = {node_id: set() for node_id in graph.nodes if include(node_id)}
+    for edge in graph.edges:
+        u, v = edge.u.identifier, edge.v.identifier
+        if u != v and u in neighbors and v in neighbors:
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+    triangles = {node_id: 0 for node_id in neighbors}
+    for a, b, c in itertools.combinations(neighbors, 3):
+        if b in neighbors[a] and c in neighbors[a] and c in neighbors[b]:
+            for node_id in (a, b, c):
+                triangles[node_id] += 1
+    return neighbors, triangles
+
+
+@pytest.mark.parametrize('directions,loops', [('-', False), ('<>-', True)])
+def test_matches_brute_force(directions, loops):
+    rng = random.Random(35)
+    for _ in range(20):
+        graph = random_graph(rng, rng.randint(2, 14), rng.randint(0, 45), directions=directions, loops=loops)
+        result = GraphPropertiesAnalyzer(graph).clustering()
+        neighbors, triangles = brute_clustering(graph)
+        assert result['triangles'] == sum(triangles.values()) // 3
+        for node_id, values in result['nodes'].items():
+            degree = len(neighbors[node_id])
+            assert values['degree'] == degree
+            assert values['triangles'] == triangles[node_id]
+            expected = 2 * triangles[node_id] / (degree * (degree - 1)) if degree > 1 else 0.0
+            assert values['clustering'] == pytest.approx(expected)
+        triples = sum(len(adjacent) * (len(adjacent) - 1) // 2 for adjacent in neighbors.values())
+        assert result['transitivity'] == pytest.approx(sum(triangles.values()) / triples if triples else 0.0)
+
+
+def test_complete_graph():
+    graph = Graph()
+    for i in range(5):
+        graph.add_node(Node(str(i)))
+    for u, v in itertools.combinations('01234', 2):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    result = GraphPropertiesAnalyzer(graph).clustering()
+    assert result['triangles'] == 10
+    assert result['transitivity'] == 1.0
+    assert result['average_clustering'] == 1.0
+    assert all(values['triangles'] == 6 for values in result['nodes'].values())
+
+
+def test_placeholders_are_ignored():
+    graph = Graph()
+    for node_id in ('A', 'B', 'C', '*1'):
+        graph.add_node(Node(node_id))
+    for u, v in (('A', 'B'), ('A', '*1'), ('B', '*1'), ('B', 'C')):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    result = GraphPropertiesAnalyzer(graph).clustering()
+    assert result['triangles'] == 0
+    assert set(result['nodes']) == {'A', 'B', 'C'}
+    assert result['nodes']['B']['degree'] == 2
+
+
+def test_parallel_matches_serial():
+    graph = random_graph(random.Random(3), 60, 400)
+    analyzer = GraphPropertiesAnalyzer(graph)
+    assert analyzer.clustering(workers=2) == analyzer.clustering(workers=1)
@@ -0,0 +1,90 @@
+"""Testy barvení grafu (hladové barvení, DSatur, přesné barvení)."""
+
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import ColoringAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+from helpers import random_graph
+
+
+def chromatic_number(graph):
+    ids = list(graph.nodes)
+    pairs = [(e.u.identifier, e.v.identifier) for e in graph.edges if e.u != e.v]
+    for k in range(1, len(ids) + 1):
+        for assignment in itertools.product(range(k), repeat=len(ids)):
+            colors = dict(zip(ids, assignment))
+            if all(colors[a] != colors[b] for a, b in pairs):
+                return k
+    return 0
+
+
+def assert_proper(graph, result):
+    colors = result['colors']
+    assert set(colors) == set(graph.nodes)
+    assert all(colors[e.u.identifier] != colors[e.v.identifier] for e in graph.edges if e.u != e.v)
+    assert result['count'] == len(set(colors.values()))
+    assert result['lower_bound'] <= result['count']
+
+
+def test_exact_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(30):
+        graph = random_graph(rng, 7, rng.randrange(25))
+        analyzer = ColoringAnalyzer(graph)
+        result = analyzer.exact()
+        assert_proper(graph, result)
+        assert result['optimal']
+        assert result['count'] == chromatic_number(graph)
+
+
+@pytest.mark.parametrize('algorithm', ColoringAnalyzer.ALGORITHMS)
+def test_colorings_are_proper(algorithm):
+    rng = random.Random(11)
+    for _ in range(10):
+        graph = random_graph(rng, 30, rng.randrange(120))
+        result = ColoringAnalyzer(graph).color(algorithm)
+        assert_proper(graph, result)
+        assert result['algorithm'] == algorithm
+
+
+def test_bounds_and_clique():
+    graph = Graph()
+    for node_id in 'ABCDEF':
+        graph.add_node(Node(node_id))
+    # K4 na A-D a k ní přivěšená cesta D-E-F
+    for u, v in ('AB', 'AC', 'AD', 'BC', 'BD', 'CD', 'DE', 'EF'):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    result = ColoringAnalyzer(graph).dsatur()
+    assert result['count'] == 4 and result['optimal']
+    assert sorted(result['clique']) == ['A', 'B', 'C', 'D']
+    assert result['degeneracy'] == 3 and result['upper_bound'] == 4
+
+
+def test_smallest_last_respects_degeneracy():
+    rng = random.Random(5)
+    graph = random_graph(rng, 300, 900)
+    result = ColoringAnalyzer(graph).greedy('smallest-last')
+    assert_proper(graph, result)
+    assert result['count'] <= result['upper_bound']
+
+
+def test_odd_cycle_needs_three_colors():
+    graph = Graph()
+    for i in range(9):
+        graph.add_node(Node(f'N{i}'))
+    for i in range(9):
+        graph.add_edge(Edge(graph.nodes[f'N{i}'], graph.nodes[f'N{(i + 1) % 9}'], '-', None))
+    analyzer = ColoringAnalyzer(graph)
+    assert analyzer.exact()['count'] == 3
+    # Klika je jen hrana, optimum dokazuje až přesné barvení
+    assert analyzer.dsatur()['lower_bound'] == 2
+
+
+def test_exact_limit():
+    graph = random_graph(random.Random(1), 20, 60)
+    with pytest.raises(ValueError):
+        ColoringAnalyzer(graph).exact(max_nodes=5)
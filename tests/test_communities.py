@@ -0,0 +1,108 @@
+"""Testy hledání komunit (Louvain, šíření značek) a modularity."""
+
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import CommunityAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def build(edges, nodes=()):
+    graph = Graph()
+    for node_id in nodes:
+        graph.add_node(Node(node_id))
+    for u, v, *weight in edges:
+        for node_id in (u, v):
+            if node_id not in graph.nodes:
+                graph.add_node(Node(node_id))
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', weight[0] if weight else None))
+    return graph
+
+
+def planted(rng, groups, size, degree, inside=0.9):
+    edges = []
+    n = groups * size
+    for u in range(n):
+        for _ in range(degree):
+            v = (u // size) * size + rng.randrange(size) if rng.random() < inside else rng.randrange(n)
+            if u != v:
+                edges.append((f'N{u}', f'N{v}'))
+    return build(edges)
+
+
+def brute_modularity(graph, communities):
+    """Modularita přímo z definice: Q = 1/2m * sum (A_ij - k_i k_j / 2m) [c_i = c_j]."""
+    weight = {}
+    for edge in graph.edges:
+        u, v = edge.u.identifier, edge.v.identifier
+        w = 1 if edge.weight is None else edge.weight
+        weight[u, v] = weight.get((u, v), 0) + w
+        weight[v, u] = weight.get((v, u), 0) + w
+    degree = {node_id: 0 for node_id in graph.nodes}
+    for (u, _), w in weight.items():
+        degree[u] += w
+    m2 = sum(degree.values())
+    return sum(weight.get((u, v), 0) - degree[u] * degree[v] / m2
+               for u in graph.nodes for v in graph.nodes if communities[u] == communities[v]) / m2
+
+
+def two_triangles():
+    return build([('A', 'B'), ('B', 'C'), ('A', 'C'), ('D', 'E'), ('E', 'F'), ('D', 'F'), ('C', 'D')])
+
+
+def test_modularity_of_two_triangles():
+    graph = two_triangles()
+    communities = {'A': 0, 'B': 0, 'C': 0, 'D': 1, 'E': 1, 'F': 1}
+    assert CommunityAnalyzer(graph).modularity(communities) == pytest.approx(5 / 14)
+    assert CommunityAnalyzer(graph).modularity(communities) == pytest.approx(brute_modularity(graph, communities))
+
+
+@pytest.mark.parametrize('method', ['louvain', 'label_propagation'])
+def test_finds_two_triangles(method):
+    result = getattr(CommunityAnalyzer(two_triangles()), method)(seed=1)
+    communities = result['communities']
+    assert result['count'] == 2
+    assert result['sizes'] == [3, 3]
+    assert communities['A'] == communities['B'] == communities['C'] != communities['D']
+    assert communities['D'] == communities['E'] == communities['F']
+    assert result['modularity'] == pytest.approx(5 / 14)
+
+
+@pytest.mark.parametrize('method', ['louvain', 'label_propagation'])
+def test_planted_partition(method):
+    graph = planted(random.Random(37), groups=8, size=30, degree=6)
+    result = getattr(CommunityAnalyzer(graph), method)(seed=3)
+    assert result['modularity'] == pytest.approx(brute_modularity(graph, result['communities']))
+    assert result['modularity'] > 0.7
+    assert result == getattr(CommunityAnalyzer(graph), method)(seed=3)
+
+
+def test_louvain_levels_do_not_decrease():
+    graph = planted(random.Random(5), groups=20, size=15, degree=3, inside=0.8)
+    result = CommunityAnalyzer(graph).louvain(seed=0)
+    assert result['levels'] == sorted(result['levels'])
+    assert result['levels'][-1] == pytest.approx(result['modularity'])
+
+
+def test_weights_decide_communities():
+    # Čtverec, ve kterém silné hrany tvoří dvě dvojice
+    graph = build([('A', 'B', 10), ('C', 'D', 10), ('A', 'C', 1), ('B', 'D', 1)])
+    result = CommunityAnalyzer(graph).louvain(seed=0)
+    communities = result['communities']
+    assert communities['A'] == communities['B'] != communities['C'] == communities['D']
+
+
+def test_isolated_nodes_and_placeholders():
+    graph = build([('A', 'B'), ('A', '*_1')], nodes=['X'])
+    result = CommunityAnalyzer(graph).louvain()
+    assert set(result['communities']) == {'A', 'B', 'X'}
+    assert result['count'] == 2
+
+    empty = CommunityAnalyzer(build([], nodes=['X', 'Y'])).label_propagation()
+    assert empty['count'] == 2 and empty['modularity'] == 0.0 and empty['converged']
+
+
+def test_negative_weights_rejected():
+    with pytest.raises(ValueError):
+        CommunityAnalyzer(build([('A', 'B', -1)])).louvain()
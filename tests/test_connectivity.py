@@ -0,0 +1,130 @@
+"""Testy dynamické souvislosti grafu."""
+
+import contextlib
+import io
+import random
+
+from graph_analyzer.analyzers import GraphPropertiesAnalyzer
+from graph_analyzer.models import Edge, Graph, Node, is_placeholder_id
+from graph_analyzer.utils import GraphParser
+from graph_analyzer.utils.union_find import UnionFind
+
+
+def build(lines):
+    graph = Graph()
+    graph.load_from_data(*GraphParser.parse_lines(lines))
+    return graph
+
+
+def apply(graph, lines):
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph.apply_delta(GraphParser.parse_delta_lines(lines))
+
+
+def bfs_components(graph):
+    """Komponenty slabé souvislosti počítané od nuly (referenční výsledek)."""
+    real = [node_id for node_id in graph.nodes if not is_placeholder_id(node_id)]
+    seen = set()
+    components = []
+    for start in real:
+        if start in seen:
+            continue
+        seen.add(start)
+        stack = [start]
+        component = {start}
+        while stack:
+            current = stack.pop()
+            for edge in graph.adj.get(current, []) + graph.rev_adj.get(current, []):
+                for neighbor in (edge.u.identifier, edge.v.identifier):
+                    if neighbor not in seen and not is_placeholder_id(neighbor):
+                        seen.add(neighbor)
+                        component.add(neighbor)
+                        stack.append(neighbor)
+        components.append(component)
+    return components
+
+
+def test_union_find():
+    uf = UnionFind('abcd')
+    assert uf.union('a', 'b') and uf.union('c', 'd')
+    assert not uf.union('b', 'a')
+    assert uf.count == 2 and uf.connected('a', 'b') and not uf.connected('a', 'c')
+    uf.union('a', 'd')
+    assert uf.set_size('c') == 4 and len(uf) == 4 and 'e' not in uf
+
+
+def test_node_removed_and_readded():
+    graph = build(['u X;', 'u Y;', 'u Z;', 'h X - Y;', 'h Y - Z;'])
+    connectivity = graph.get_connectivity()
+    assert connectivity.component_count() == 1
+
+    apply(graph, ['-u X;', '+u X;'])
+    assert connectivity.component_count() == 2
+    assert connectivity.connected('Y', 'Z') and not connectivity.connected('X', 'Y')
+
+    apply(graph, ['-h Y - Z;'])
+    assert connectivity.component_count() == 3
+    assert connectivity.component_sizes() == [1, 1, 1]
+
+
+def test_tree_edge_replaced_by_non_tree_edge():
+    graph = build(['u A;', 'u B;', 'u C;', 'h A - B;', 'h B - C;', 'h C > A;'])
+    connectivity = graph.get_connectivity()
+    graph.remove_edge(graph.find_edge('A', '-', 'B'))
+    assert connectivity.is_connected()
+    assert connectivity.replacements == 1
+    graph.remove_edge(graph.find_edge('B', '-', 'C'))
+    assert connectivity.component_count() == 2
+    graph.remove_edge(graph.edges[0])
+    assert connectivity.component_count() == 3
+
+
+def placeholder_graph(direction):
+    graph = Graph()
+    for node_id in ('A', '*_1', 'B'):
+        graph.add_node(Node(node_id))
+    graph.add_edge(Edge(graph.nodes['*_1'], graph.nodes['A'], direction))
+    graph.add_edge(Edge(graph.nodes['B'], graph.nodes['*_1'], direction))
+    return graph
+
+
+def test_placeholders_are_ignored():
+    graph = placeholder_graph('-')
+    connectivity = graph.get_connectivity()
+    assert connectivity.component_count() == 2
+    assert connectivity.component_of('*_1') is None
+    assert is_placeholder_id('*_1') and not is_placeholder_id('A')
+
+
+def test_directed_components_ignore_placeholders():
+    analyzer = GraphPropertiesAnalyzer(placeholder_graph('>'))
+    assert analyzer.count_components() == 2
+    assert not analyzer.is_connected_graph()
+
+
+def test_random_deltas_match_bfs():
+    rng = random.Random(29)
+    for _ in range(200):
+        n = 8
+        graph = build([f'u N{i};' for i in range(n)])
+        connectivity = graph.get_connectivity()
+        for _ in range(40):
+            a, b = f'N{rng.randrange(n)}', f'N{rng.randrange(n)}'
+            direction = rng.choice('<->')
+            r = rng.random()
+            if r < 0.5:
+                line = f'+h {a} {direction} {b};'
+            elif r < 0.8:
+                line = f'-h {a} {direction} {b};'
+            elif r < 0.9:
+                line = f'-u {a};'
+            else:
+                line = f'+u {a};'
+            apply(graph, [line])
+
+            expected = bfs_components(graph)
+            assert connectivity.component_count() == len(expected), line
+            assert connectivity.component_sizes() == sorted(map(len, expected), reverse=True), line
+            for component in expected:
+                first = next(iter(component))
+                assert set(connectivity.component_of(first)) == component
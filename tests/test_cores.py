@@ -0,0 +1,99 @@
+"""Testy k-jader a zápisu grafu do .tg."""
+
+import functools
+import random
+
+from graph_analyzer.analyzers import CoreAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+from graph_analyzer.utils import GraphParser, GraphWriter
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, directions='-')
+
+
+def brute_cores(graph):
+    """Jádrová čísla opakovaným odebíráním uzlů se stupněm menším než k."""
+    neighbors = {node_id: set() for node_id in graph.nodes}
+    for edge in graph.edges:
+        u, v = edge.u.identifier, edge.v.identifier
+        if u != v:
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+    cores = {}
+    k = 0
+    alive = set(neighbors)
+    while alive:
+        removed = True
+        while removed:
+            removed = False
+            for node_id in list(alive):
+                if len(neighbors[node_id] & alive) < k:
+                    alive.discard(node_id)
+                    removed = True
+        for node_id in alive:
+            cores[node_id] = k
+        k += 1
+    return cores
+
+
+def test_core_numbers_match_peeling():
+    rng = random.Random(36)
+    for _ in range(30):
+        graph = random_graph(rng, rng.randint(1, 25), rng.randint(0, 80), directions='<>-')
+        result = CoreAnalyzer(graph).core_numbers()
+        expected = brute_cores(graph)
+        assert result['cores'] == expected
+        assert result['degeneracy'] == max(expected.values())
+        assert sum(result['shells'].values()) == len(graph.nodes)
+
+
+def test_clique_with_tail():
+    graph = Graph()
+    for node_id in 'ABCDEF':
+        graph.add_node(Node(node_id))
+    for u, v in ('AB', 'AC', 'AD', 'BC', 'BD', 'CD', 'DE', 'EF'):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    analyzer = CoreAnalyzer(graph)
+    result = analyzer.core_numbers()
+    assert result['cores'] == {'A': 3, 'B': 3, 'C': 3, 'D': 3, 'E': 1, 'F': 1}
+    assert result['shells'] == {1: 2, 3: 4}
+    assert analyzer.k_core(2) == set('ABCD')
+
+
+def test_placeholders_are_ignored():
+    graph = Graph()
+    for node_id in ('A', 'B', '*_1'):
+        graph.add_node(Node(node_id))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['*_1'], '>', None))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['B'], '>', None))
+    assert CoreAnalyzer(graph).core_numbers()['cores'] == {'A': 1, 'B': 1}
+
+
+def test_written_subgraph_parses_back(tmp_path):
+    graph = Graph()
+    graph.add_node(Node('A', 1.5))
+    graph.add_node(Node('B', 'text'))
+    graph.add_node(Node('C'))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['B'], '<', 2.0, 'x'))
+    graph.add_edge(Edge(graph.nodes['B'], graph.nodes['C'], '-', None))
+    path = tmp_path / 'sub.tg'
+    assert GraphWriter.write_file(graph, str(path), include={'A', 'B'}.__contains__) == (2, 1)
+
+    nodes, edges = GraphParser.parse_file(str(path))
+    assert {node_id: node.value for node_id, node in nodes.items()} == {'A': 1.5, 'B': 'text'}
+    [edge] = edges
+    assert (edge.u.identifier, edge.direction, edge.v.identifier, edge.weight, edge.label) == ('A', '<', 'B', 2.0, 'x')
+
+
+def test_cli_rejects_invalid_kcore_export(tmp_path, capsys):
+    from graph_analyzer import cli
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nh A - B;\n', encoding='utf-8')
+    for k in ('-1', 'x'):
+        out = tmp_path / f'core{k}.tg'
+        cli.run([str(path), '--kcore-export', k, str(out), '--no-cache', '-q'])
+        captured = capsys.readouterr()
+        assert 'nezáporné celé číslo' in captured.err and 'Chyba' not in captured.out
+        assert not out.exists()
@@ -0,0 +1,131 @@
+"""Testy topologického uspořádání a cest v acyklických grafech."""
+
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import DagAnalyzer, GraphPropertiesAnalyzer, PathAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def random_dag(rng, n, m, weights=(None, 1, 2, 5, -3)):
+    """Náhodný DAG - hrany vedou jen z uzlu s menším číslem do většího (v náhodné orientaci zápisu)."""
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for _ in range(m):
+        u, v = sorted(rng.sample(range(n), 2))
+        weight = rng.choice(weights)
+        if rng.random() < 0.5:
+            graph.add_edge(Edge(graph.nodes[f'N{u}'], graph.nodes[f'N{v}'], '>', weight))
+        else:
+            graph.add_edge(Edge(graph.nodes[f'N{v}'], graph.nodes[f'N{u}'], '<', weight))
+    return graph
+
+
+def arcs(graph):
+    return [(e.u.identifier, e.v.identifier, 1 if e.weight is None else e.weight) if e.direction == '>'
+            else (e.v.identifier, e.u.identifier, 1 if e.weight is None else e.weight) for e in graph.edges]
+
+
+def brute_paths(graph, source):
+    """Nejkratší a nejdelší délky všech cest ze source (výčet cest - jen pro malé DAG)."""
+    out = {}
+    for u, v, w in arcs(graph):
+        out.setdefault(u, []).append((v, w))
+    shortest, longest = {}, {}
+    stack = [(source, 0)]
+    while stack:
+        u, d = stack.pop()
+        shortest[u] = min(shortest.get(u, d), d)
+        longest[u] = max(longest.get(u, d), d)
+        stack.extend((v, d + w) for v, w in out.get(u, ()))
+    return shortest, longest
+
+
+def test_order_respects_all_arcs():
+    rng = random.Random(40)
+    for _ in range(20):
+        graph = random_dag(rng, rng.randint(2, 30), rng.randint(0, 60))
+        result = DagAnalyzer(graph).topological_sort()
+        assert result['is_dag'] and result['cycle'] is None
+        position = {node_id: i for i, node_id in enumerate(result['order'])}
+        assert len(position) == len(graph.nodes)
+        assert all(position[u] < position[v] for u, v, _ in arcs(graph))
+
+
+def test_paths_match_enumeration():
+    rng = random.Random(41)
+    for _ in range(30):
+        graph = random_dag(rng, rng.randint(2, 9), rng.randint(0, 14))
+        analyzer = DagAnalyzer(graph)
+        source = rng.choice(sorted(graph.nodes))
+        shortest, longest = brute_paths(graph, source)
+        result = analyzer.shortest_paths(source)
+        assert result['distances'] == shortest
+        assert analyzer.longest_paths(source)['distances'] == longest
+        lightest = {}
+        for u, v, w in arcs(graph):
+            lightest[u, v] = min(lightest.get((u, v), w), w)
+        for target, distance in shortest.items():
+            path = DagAnalyzer.path_to(result['previous'], target)
+            assert path[0] == source and path[-1] == target
+            assert sum(lightest[step] for step in zip(path, path[1:])) == distance
+        # Neohodnocené hrany jsou délky 1 i pro cesty přes PathAnalyzer (DAG větev)
+        distances = PathAnalyzer(graph).get_shortest_distances(source)
+        assert {k: v for k, v in distances.items() if v != float('inf')} == shortest
+
+
+def test_cycle_witness():
+    rng = random.Random(42)
+    for _ in range(30):
+        graph = random_dag(rng, rng.randint(3, 15), rng.randint(2, 30))
+        u, v = rng.sample(sorted(graph.nodes), 2)
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '>', None))
+        graph.add_edge(Edge(graph.nodes[v], graph.nodes[u], '>', None))
+        result = DagAnalyzer(graph).topological_sort()
+        assert not result['is_dag']
+        cycle = result['cycle']
+        assert cycle[0] == cycle[-1] and len(cycle) >= 2
+        present = {(a, b) for a, b, _ in arcs(graph)}
+        assert all(step in present for step in zip(cycle, cycle[1:]))
+        with pytest.raises(ValueError):
+            DagAnalyzer(graph).shortest_paths(u)
+
+
+def test_undirected_edge_and_loop_are_cycles():
+    graph = Graph()
+    for node_id in 'AB':
+        graph.add_node(Node(node_id))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['B'], '-', None))
+    assert DagAnalyzer(graph).topological_sort()['cycle'] in (['A', 'B', 'A'], ['B', 'A', 'B'])
+
+    graph = Graph()
+    graph.add_node(Node('A'))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['A'], '>', None))
+    assert DagAnalyzer(graph).topological_sort()['cycle'] == ['A', 'A']
+
+
+def test_critical_path():
+    graph = Graph()
+    for node_id in 'SABCT':
+        graph.add_node(Node(node_id))
+    for u, v, w in (('S', 'A', 3), ('S', 'B', 2), ('A', 'C', 4), ('B', 'C', 1), ('C', 'T', 2), ('B', 'T', 1)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '>', w))
+    result = DagAnalyzer(graph).critical_path()
+    assert result['length'] == 9
+    assert result['path'] == ['S', 'A', 'C', 'T']
+    assert result['earliest'] == {'S': 0, 'A': 3, 'B': 2, 'C': 7, 'T': 9}
+    assert result['slack'] == {'S': 0, 'A': 0, 'B': 4, 'C': 0, 'T': 0}
+
+
+def test_long_chain_without_recursion():
+    graph = Graph()
+    n = 50_000
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for i in range(n - 1):
+        graph.add_edge(Edge(graph.nodes[f'N{i}'], graph.nodes[f'N{i + 1}'], '>', 2))
+    assert not GraphPropertiesAnalyzer(graph).has_cycles()
+    assert DagAnalyzer(graph).critical_path()['length'] == 2 * (n - 1)
+    assert PathAnalyzer(graph).get_shortest_distances('N0')[f'N{n - 1}'] == 2 * (n - 1)
@@ -0,0 +1,90 @@
+"""Testy statistik vzdáleností ze všech uzlů (bitově paralelní BFS)."""
+
+import functools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import CentralityAnalyzer, PathAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+from graph_analyzer.utils.distance_profile import bfs_profile
+from graph_analyzer.utils.indexed_graph import IndexedGraph
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, directions='-', weights=(None,), loops=False)
+
+
+def path_graph(n):
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for i in range(n - 1):
+        graph.add_edge(Edge(graph.nodes[f'N{i}'], graph.nodes[f'N{i + 1}'], '-', None))
+    return graph
+
+
+def brute_distances(graph):
+    analyzer = PathAnalyzer(graph)
+    return {s: {t: d for t, d in analyzer.get_shortest_distances(s).items() if t != s and d != float('inf')}
+            for s in graph.nodes}
+
+
+@pytest.mark.parametrize('directions,weights', [('-', (None,)), ('>', (None,)), ('<->', (None,)), ('->', (1, 2.5))])
+def test_profile_matches_single_source_searches(directions, weights):
+    rng = random.Random(32)
+    for _ in range(15):
+        graph = random_graph(rng, rng.randint(2, 12), rng.randint(0, 20), directions=directions, weights=weights)
+        expected = brute_distances(graph)
+        profile = PathAnalyzer(graph).get_distance_profile()
+        for i, node_id in enumerate(profile['ids']):
+            distances = expected[node_id]
+            assert profile['reached'][i] == len(distances)
+            assert profile['dist_sum'][i] == pytest.approx(sum(distances.values()))
+            assert profile['harmonic'][i] == pytest.approx(sum(1 / d for d in distances.values()))
+            assert profile['eccentricity'][i] == max(distances.values(), default=0)
+
+
+def test_small_batches_give_same_result():
+    graph = random_graph(random.Random(7), 150, 300, directions='->')
+    indexed = IndexedGraph(graph)
+    pred = indexed.reverse_lists()[0]
+    small = bfs_profile(pred, indexed.n, batch_size=64)
+    whole = bfs_profile(pred, indexed.n)
+    for key in ('reached', 'dist_sum', 'eccentricity', 'histogram'):
+        assert small[key] == whole[key]
+    assert small['harmonic'] == pytest.approx(whole['harmonic'])
+
+
+def test_eccentricity_based_measures():
+    graph = path_graph(5)
+    analyzer = PathAnalyzer(graph)
+    assert analyzer.get_eccentricities() == {'N0': 4.0, 'N1': 3.0, 'N2': 2.0, 'N3': 3.0, 'N4': 4.0}
+    assert analyzer.get_graph_diameter() == 4.0
+    assert analyzer.get_graph_radius() == 2.0
+    assert analyzer.find_center_nodes() == ['N2']
+
+    graph.add_node(Node('X'))
+    assert analyzer.get_graph_diameter() == float('inf')
+    assert analyzer.find_center_nodes() == []
+
+
+def test_distance_statistics_of_path():
+    stats = PathAnalyzer(path_graph(4)).get_distance_statistics()
+    assert stats['histogram'] == {1: 3, 2: 2, 3: 1}
+    assert stats['pairs'] == 6
+    assert stats['unreachable'] == 0
+    assert stats['average'] == pytest.approx(10 / 6)
+
+
+def test_closeness_and_harmonic():
+    graph = path_graph(3)
+    graph.add_node(Node('X'))
+    result = CentralityAnalyzer(graph).closeness()
+    # N1: dva dostupné uzly ve vzdálenosti 1 ze tří ostatních
+    assert result['closeness']['N1'] == pytest.approx((2 / 2) * (2 / 3))
+    assert result['closeness']['N0'] == pytest.approx((2 / 3) * (2 / 3))
+    assert result['closeness']['X'] == 0.0
+    assert result['harmonic']['N0'] == pytest.approx(1.5)
+    assert result['harmonic']['N1'] == pytest.approx(2.0)
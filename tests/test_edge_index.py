@@ -0,0 +1,102 @@
+"""Testy indexů hran podle váhy a označení (--edges-where, --edge-label)."""
+
+import random
+
+import pytest
+
+from graph_analyzer.commands import parse_weight_condition
+from graph_analyzer.models import Edge, Graph, GraphView, Node
+
+
+def matching(graph, low, high, include_low=True, include_high=True):
+    """Hrany s číselnou vahou v intervalu nalezené průchodem všech hran."""
+    result = []
+    for edge in graph.edges:
+        weight = edge.weight
+        if not isinstance(weight, (int, float)):
+            continue
+        if low is not None and (weight < low or (weight == low and not include_low)):
+            continue
+        if high is not None and (weight > high or (weight == high and not include_high)):
+            continue
+        result.append(edge)
+    return result
+
+
+def ids(edges):
+    return sorted(map(id, edges))
+
+
+def test_indexes_follow_mutations():
+    rng = random.Random(5)
+    graph = Graph()
+    for i in range(10):
+        graph.add_node(Node(f'N{i}'))
+    weight_index = graph.get_weight_index()
+    label_index = graph.get_label_index()
+    for step in range(500):
+        action = rng.random()
+        if action < 0.5:
+            u, v = rng.sample(list(graph.nodes), 2)
+            graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], rng.choice('<>-'),
+                                rng.choice((None, 'x', 1, 2.5, 7, 7, 10)), rng.choice((None, 'a', 'b'))))
+        elif action < 0.75 and graph.edges:
+            graph.remove_edge(rng.choice(graph.edges))
+        elif action < 0.9 and graph.edges:
+            graph.reweight_edge(rng.choice(graph.edges), rng.choice((None, 3, 7, 'y')))
+        elif len(graph.nodes) > 2:
+            graph.remove_node(rng.choice(list(graph.nodes)))
+            graph.add_node(Node(f'M{step}'))
+
+        weights = [edge.weight for edge in weight_index.range()]
+        assert weights == sorted(weights)
+        assert ids(weight_index.range()) == ids(matching(graph, None, None))
+        for bounds in ((7, 7), (2, 8, False, True), (None, 7, True, False), (3, None)):
+            assert ids(weight_index.range(*bounds)) == ids(matching(graph, *bounds))
+        for label in ('a', 'b'):
+            assert ids(label_index.get(label)) == ids(e for e in graph.edges if e.label == label)
+        assert sorted(label_index.labels()) == sorted({e.label for e in graph.edges if e.label is not None})
+
+
+def test_top_k_and_edge_order():
+    graph = Graph()
+    for node_id in 'ABCD':
+        graph.add_node(Node(node_id))
+    for u, v, w in (('A', 'B', 5), ('B', 'C', 1), ('C', 'D', 9), ('D', 'A', 5)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', w))
+    index = graph.get_weight_index()
+    assert [e.weight for e in index.top(2)] == [9, 5]
+    assert [e.weight for e in index.top(3, largest=False)] == [1, 5, 5]
+    assert index.top(0) == [] and len(index.top(10)) == 4
+    # Hrany se stejnou vahou zůstávají v pořadí vložení
+    assert [e.u.identifier for e in index.range(5, 5)] == ['A', 'D']
+    view = GraphView.from_edges(graph, index.range(5, None))
+    assert [e.weight for e in view.edges] == [5, 9, 5] and len(view.nodes) == 4
+
+
+def test_parse_weight_condition():
+    assert parse_weight_condition('weight>50') == (50, None, False, True)
+    assert parse_weight_condition('weight >= 2.5') == (2.5, None, True, True)
+    assert parse_weight_condition('weight<-1') == (None, -1, True, False)
+    assert parse_weight_condition('weight==3') == (3, 3, True, True)
+    assert parse_weight_condition('10<=weight<20') == (10, 20, True, False)
+    for text in ('weight', 'w>5', 'weight>x', '5>weight'):
+        with pytest.raises(ValueError):
+            parse_weight_condition(text)
+
+
+def test_cli_edge_queries_scope_analysis(tmp_path, capsys):
+    from graph_analyzer import cli
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nu C;\nu D;\nh A - B 10 :e1;\nh B - C 60 :e42;\nh C - D 75 :e42;\nh D - A 50;\n',
+                    encoding='utf-8')
+    cli.run([str(path), '--edges-where', 'weight>50', '--no-cache', '-q'])
+    out = capsys.readouterr().out
+    assert 'Počet hran:_________2' in out and 'B - C 60 :e42' in out and 'A - B' not in out
+
+    cli.run([str(path), '--edge-label', 'e42', '--edges-where', 'weight<=60', '--properties', '--no-cache'])
+    out = capsys.readouterr().out
+    assert 'Počet hran:_________1' in out and 'Počet komponent:____3' in out
+
+    cli.run([str(path), '--edges-where', 'weight>>1', '--no-cache'])
+    assert 'Neplatná podmínka' in capsys.readouterr().err
@@ -0,0 +1,104 @@
+"""Testy eulerovských okruhů a tahů (Hierholzer)."""
+
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import EulerAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def make_graph(edges, direction='-'):
+    graph = Graph()
+    for u, v in edges:
+        for node_id in (u, v):
+            if node_id not in graph.nodes:
+                graph.add_node(Node(node_id))
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], direction, None))
+    return graph
+
+
+def assert_valid_walk(graph, result):
+    """Každá hrana právě jednou a sousední kroky na sebe navazují."""
+    assert len(result['edges']) == len(graph.edges)
+    assert len({id(edge) for edge in result['edges']}) == len(graph.edges)
+    nodes = result['nodes']
+    for step, edge in enumerate(result['edges']):
+        u, v = nodes[step], nodes[step + 1]
+        ends = (edge.u.identifier, edge.v.identifier)
+        if edge.direction == '>':
+            assert ends == (u, v)
+        elif edge.direction == '<':
+            assert ends == (v, u)
+        else:
+            assert ends in ((u, v), (v, u))
+
+
+def test_undirected_circuit_with_loop_and_multi_edges():
+    graph = make_graph([('A', 'B'), ('B', 'A'), ('A', 'A'), ('B', 'C'), ('C', 'B')])
+    result = EulerAnalyzer(graph).analyze()
+    assert result['type'] == 'circuit'
+    assert result['nodes'][0] == result['nodes'][-1]
+    assert_valid_walk(graph, result)
+
+
+def test_undirected_trail_starts_at_odd_node():
+    graph = make_graph([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+    result = EulerAnalyzer(graph).analyze()
+    assert result['type'] == 'trail'
+    assert sorted(result['odd_nodes']) == ['C', 'D']
+    assert {result['nodes'][0], result['nodes'][-1]} == {'C', 'D'}
+    assert_valid_walk(graph, result)
+
+
+def test_not_eulerian():
+    star = EulerAnalyzer(make_graph([('A', 'B'), ('A', 'C'), ('A', 'D')])).analyze()
+    assert star['type'] is None and sorted(star['odd_nodes']) == ['A', 'B', 'C', 'D']
+    # Dvě oddělené kružnice - stupně sedí, ale hrany nejsou souvislé
+    split = EulerAnalyzer(make_graph([('A', 'B'), ('B', 'C'), ('C', 'A'),
+                                      ('D', 'E'), ('E', 'F'), ('F', 'D')])).analyze()
+    assert split['type'] is None and split['nodes'] == []
+
+
+def test_directed_trail_and_balance():
+    graph = make_graph([('A', 'B'), ('B', 'C'), ('C', 'A'), ('A', 'D')], '>')
+    result = EulerAnalyzer(graph).analyze()
+    assert result['directed'] and result['type'] == 'trail'
+    assert result['nodes'][0] == 'A' and result['nodes'][-1] == 'D'
+    assert_valid_walk(graph, result)
+
+    reverse = make_graph([('B', 'A'), ('C', 'B'), ('A', 'C')], '<')
+    result = EulerAnalyzer(reverse).analyze()
+    assert result['type'] == 'circuit'
+    assert_valid_walk(reverse, result)
+
+    unbalanced = EulerAnalyzer(make_graph([('A', 'B'), ('A', 'C')], '>')).analyze()
+    assert unbalanced['type'] is None
+    assert sorted(unbalanced['odd_nodes']) == [('A', 2), ('B', -1), ('C', -1)]
+
+
+def test_mixed_graph_is_rejected():
+    graph = make_graph([('A', 'B')])
+    graph.add_edge(Edge(graph.nodes['B'], graph.nodes['A'], '>', None))
+    with pytest.raises(ValueError):
+        EulerAnalyzer(graph).analyze()
+
+
+@pytest.mark.parametrize('direction', ['-', '>'])
+def test_random_eulerian_graphs(direction):
+    # Uzavřená náhodná procházka dá vždy eulerovský (multi)graf
+    rng = random.Random(7)
+    for _ in range(20):
+        walk = [rng.randrange(8) for _ in range(rng.randrange(1, 40))]
+        walk.append(walk[0])
+        graph = make_graph([(f'N{u}', f'N{v}') for u, v in zip(walk, walk[1:])], direction)
+        result = EulerAnalyzer(graph).analyze()
+        assert result['type'] == 'circuit'
+        assert_valid_walk(graph, result)
+
+
+def test_long_cycle_without_recursion():
+    n = 100_000
+    graph = make_graph([(f'N{i}', f'N{(i + 1) % n}') for i in range(n)], '>')
+    result = EulerAnalyzer(graph).analyze()
+    assert result['type'] == 'circuit' and len(result['nodes']) == n + 1
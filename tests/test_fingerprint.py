@@ -0,0 +1,101 @@
+"""Testy otisků grafů (Weisfeiler-Lehman) a ověření izomorfismu."""
+
+import random
+
+from graph_analyzer.analyzers import FingerprintAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+
+def build(edges, values=None, prefix='N'):
+    graph = Graph()
+    nodes = sorted({x for u, v, *_ in edges for x in (u, v)} | set(values or ()))
+    for x in nodes:
+        graph.add_node(Node(f'{prefix}{x}', (values or {}).get(x)))
+    for u, v, direction, *rest in edges:
+        graph.add_edge(Edge(graph.nodes[f'{prefix}{u}'], graph.nodes[f'{prefix}{v}'], direction, *rest))
+    return graph
+
+
+def random_edges(rng, n, m):
+    return [(rng.randrange(n), rng.randrange(n), rng.choice('<>-'), rng.choice((None, 1, 2))) for _ in range(m)]
+
+
+def relabel(edges, n, rng):
+    """Stejný graf s náhodně přečíslovanými uzly a přeházenými hranami (i zápisem '<' / '>')."""
+    perm = list(range(n))
+    rng.shuffle(perm)
+    result = []
+    for u, v, direction, weight in edges:
+        u, v = perm[u], perm[v]
+        if direction != '-' and rng.random() < 0.5:
+            u, v, direction = v, u, '<' if direction == '>' else '>'
+        result.append((u, v, direction, weight))
+    rng.shuffle(result)
+    return result
+
+
+def test_relabelled_graphs_share_fingerprint_and_are_isomorphic():
+    rng = random.Random(3)
+    for _ in range(40):
+        n = rng.randint(1, 25)
+        edges = random_edges(rng, n, rng.randint(0, 50))
+        a = FingerprintAnalyzer(build(edges), edge_labels=True)
+        b = FingerprintAnalyzer(build(relabel(edges, n, rng), prefix='M'), edge_labels=True)
+        assert a.fingerprint()['hash'] == b.fingerprint()['hash']
+        assert a.is_isomorphic(b)
+
+
+def test_changed_edge_breaks_isomorphism():
+    rng = random.Random(5)
+    for _ in range(40):
+        n = rng.randint(3, 15)
+        edges = random_edges(rng, n, rng.randint(1, 30))
+        changed = list(edges)
+        u, v, direction, weight = changed[0]
+        changed[0] = (u, v, {'-': '>', '>': '-', '<': '-'}[direction], weight)
+        assert not FingerprintAnalyzer(build(edges)).is_isomorphic(build(changed))
+
+
+def test_collision_resolved_by_exact_check():
+    # Šestiúhelník a dva trojúhelníky: 2-regulární grafy, WL je nerozliší
+    hexagon = build([(i, (i + 1) % 6, '-') for i in range(6)])
+    triangles = build([(0, 1, '-'), (1, 2, '-'), (2, 0, '-'), (3, 4, '-'), (4, 5, '-'), (5, 3, '-')])
+    a, b = FingerprintAnalyzer(hexagon), FingerprintAnalyzer(triangles)
+    assert a.fingerprint()['hash'] == b.fingerprint()['hash']
+    assert not a.is_isomorphic(b)
+    assert a.is_isomorphic(build([(0, 2, '-'), (2, 4, '-'), (4, 1, '-'), (1, 3, '-'), (3, 5, '-'), (5, 0, '-')]))
+
+
+def test_orientation_values_and_labels():
+    path = FingerprintAnalyzer(build([(0, 1, '>'), (1, 2, '>')])).fingerprint()['hash']
+    assert path != FingerprintAnalyzer(build([(0, 1, '>'), (2, 1, '>')])).fingerprint()['hash']
+    assert path != FingerprintAnalyzer(build([(0, 1, '-'), (1, 2, '-')])).fingerprint()['hash']
+
+    one = build([(0, 1, '-', 1, 'a')], values={0: 1, 1: 2})
+    other = build([(0, 1, '-', 5, 'b')], values={0: 1, 1: 3})
+    assert FingerprintAnalyzer(one).is_isomorphic(other)
+    assert not FingerprintAnalyzer(one, node_values=True).is_isomorphic(other)
+    assert not FingerprintAnalyzer(one, edge_labels=True).is_isomorphic(other)
+
+
+def test_empty_graph_and_early_stop():
+    empty = FingerprintAnalyzer(Graph())
+    assert empty.fingerprint()['nodes'] == 0
+    assert empty.is_isomorphic(Graph())
+    result = FingerprintAnalyzer(build([(0, 1, '-')]), iterations=10).fingerprint()
+    assert result['iterations'] < 10 and result['classes'] == 1
+
+
+def test_cli_fingerprint_dir(tmp_path, capsys):
+    from graph_analyzer import cli
+    graphs = tmp_path / 'graphs'
+    graphs.mkdir()
+    (graphs / 'a.tg').write_text('u A;\nu B;\nu C;\nh A > B;\nh B - C;\n', encoding='utf-8')
+    (graphs / 'b.tg').write_text('u X;\nu Y;\nu Z;\nh Z - Y;\nh Y < X;\n', encoding='utf-8')
+    (graphs / 'c.tg').write_text('u A;\nu B;\nu C;\nh A > B;\nh C - A;\n', encoding='utf-8')
+    out = tmp_path / 'csv'
+    cli.run(['--fingerprint-dir', str(graphs), '--export-csv', str(out), '-q'])
+    assert 'Tříd izomorfismu:___2' in capsys.readouterr().out
+    rows = [line.split(',') for line in (out / 'fingerprints.csv').read_text(encoding='utf-8').splitlines()[1:]]
+    groups = {row[0].rsplit('/', 1)[-1]: row[4] for row in rows}
+    assert groups['a.tg'] == groups['b.tg'] != groups['c.tg']
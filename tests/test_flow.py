@@ -0,0 +1,103 @@
+"""Testy maximálního toku a minimálního řezu (Dinic, push-relabel)."""
+
+import functools
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import FlowAnalyzer
+from graph_analyzer.commands import read_flow_pairs
+from graph_analyzer.models import Edge, Graph, Node
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, weights=(None, 1, 2, 3, 5))
+
+
+def arcs(graph):
+    """Oblouky (u, v, kapacita) podle orientace hran."""
+    result = []
+    for edge in graph.edges:
+        u, v = edge.u.identifier, edge.v.identifier
+        capacity = 1 if edge.weight is None else edge.weight
+        if u == v:
+            continue
+        if edge.direction in '>-':
+            result.append((u, v, capacity))
+        if edge.direction in '<-':
+            result.append((v, u, capacity))
+    return result
+
+
+def cut_capacity(graph, side):
+    return sum(c for u, v, c in arcs(graph) if u in side and v not in side)
+
+
+def brute_min_cut(graph, source, sink):
+    others = [node_id for node_id in graph.nodes if node_id not in (source, sink)]
+    return min(cut_capacity(graph, {source, *chosen})
+               for size in range(len(others) + 1) for chosen in itertools.combinations(others, size))
+
+
+@pytest.mark.parametrize('algorithm', FlowAnalyzer.ALGORITHMS)
+def test_matches_brute_force_min_cut(algorithm):
+    rng = random.Random(39)
+    for _ in range(60):
+        graph = random_graph(rng, rng.randint(2, 7), rng.randint(0, 16))
+        source, sink = rng.sample(sorted(graph.nodes), 2)
+        result = FlowAnalyzer(graph).max_flow(source, sink, algorithm)
+        assert result['value'] == brute_min_cut(graph, source, sink)
+        side = set(result['source_side'])
+        assert source in side and sink not in side
+        assert cut_capacity(graph, side) == result['value']
+        crossing = [e for e in result['cut_edges']]
+        assert sum(1 if e.weight is None else e.weight for e in crossing) == result['value']
+
+
+def test_algorithms_agree_and_network_is_reused():
+    graph = random_graph(random.Random(3), 200, 1200, weights=(1, 2.5, 4, 10))
+    analyzer = FlowAnalyzer(graph)
+    pairs = [(f'N{i}', f'N{199 - i}') for i in range(20)]
+    dinic = analyzer.max_flows(pairs)
+    network = analyzer._network
+    push_relabel = analyzer.max_flows(pairs, 'push-relabel')
+    assert analyzer._network is network
+    for a, b in zip(dinic, push_relabel):
+        assert a['value'] == pytest.approx(b['value'])
+        assert sum(e.weight for e in a['cut_edges']) == pytest.approx(a['value'])
+
+
+def test_directed_chain_and_unreachable_sink():
+    graph = Graph()
+    for node_id in 'ABCD':
+        graph.add_node(Node(node_id))
+    for u, d, v, w in (('A', '>', 'B', 3), ('B', '>', 'C', 2), ('C', '<', 'D', 7)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], d, w))
+    analyzer = FlowAnalyzer(graph)
+    result = analyzer.max_flow('A', 'C')
+    assert result['value'] == 2
+    assert [(e.u.identifier, e.v.identifier) for e in result['cut_edges']] == [('B', 'C')]
+    assert analyzer.max_flow('C', 'A')['value'] == 0
+    assert analyzer.max_flow('D', 'C', 'push-relabel')['value'] == 7
+
+
+def test_invalid_queries():
+    graph = random_graph(random.Random(1), 3, 3)
+    analyzer = FlowAnalyzer(graph)
+    with pytest.raises(ValueError):
+        analyzer.max_flow('N0', 'X')
+    with pytest.raises(ValueError):
+        analyzer.max_flow('N0', 'N0')
+    with pytest.raises(ValueError):
+        analyzer.max_flow('N0', 'N1', 'simplex')
+
+
+def test_read_flow_pairs(tmp_path):
+    path = tmp_path / 'pairs.txt'
+    path.write_text('A B\n# komentář\n\nC D  # poznámka\n', encoding='utf-8')
+    assert read_flow_pairs(str(path)) == [('A', 'B'), ('C', 'D')]
+    path.write_text('A B C\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        read_flow_pairs(str(path))
@@ -0,0 +1,186 @@
+"""Testy inkrementálních změn grafu (odebírání, změna váhy, soubory změn)."""
+
+import contextlib
+import io
+import random
+
+import pytest
+
+from graph_analyzer.models import Edge, Graph
+from graph_analyzer.utils import GraphParser
+
+
+def build(lines):
+    graph = Graph()
+    graph.load_from_data(*GraphParser.parse_lines(lines))
+    return graph
+
+
+def apply(graph, lines):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return graph.apply_delta(GraphParser.parse_delta_lines(lines))
+
+
+def flags(graph):
+    return (graph.is_directed, graph.is_weighted, graph.has_loops, graph.has_multiple_edges)
+
+
+def adjacency(graph):
+    out = sorted((k, e.v.identifier, e.direction, repr(e.weight)) for k, lst in graph.adj.items() for e in lst)
+    inc = sorted((k, e.u.identifier, e.direction, repr(e.weight)) for k, lst in graph.rev_adj.items() for e in lst)
+    return out, inc
+
+
+def rebuilt(graph):
+    fresh = Graph()
+    fresh.load_from_data(dict(graph.nodes), [Edge(e.u, e.v, e.direction, e.weight, e.label) for e in graph.edges])
+    return fresh
+
+
+def test_remove_edge_updates_adjacency_and_flags():
+    graph = build(['u A;', 'u B;', 'h A > B 2;', 'h A > B 2;'])
+    assert graph.has_multiple_edges
+    graph.remove_edge(graph.find_edge('A', '>', 'B'))
+    assert graph.get_edge_count() == 1
+    assert not graph.has_multiple_edges
+    assert graph.get_successors('A') == ['B']
+    graph.remove_edge(graph.edges[0])
+    assert graph.get_successors('A') == [] and graph.get_predecessors('B') == []
+    assert not graph.is_directed and not graph.is_weighted
+
+
+def test_remove_unknown_edge_raises():
+    graph = build(['u A;', 'u B;', 'h A - B;'])
+    stray = Edge(graph.nodes['A'], graph.nodes['B'], '-')
+    with pytest.raises(ValueError):
+        graph.remove_edge(stray)
+
+
+def test_remove_node_drops_incident_edges():
+    graph = build(['u A;', 'u B;', 'u C;', 'h A > B;', 'h B - C;', 'h C > C;'])
+    graph.remove_node('C')
+    assert 'C' not in graph.nodes
+    assert graph.get_edge_count() == 1
+    assert not graph.has_loops
+    assert graph.get_predecessors('B') == ['A']
+    with pytest.raises(KeyError):
+        graph.remove_node('C')
+
+
+def test_reweight_edge_updates_both_adjacency_copies():
+    graph = build(['u A;', 'u B;', 'h A - B;'])
+    edge = graph.edges[0]
+    graph.reweight_edge(edge, 4)
+    assert graph.is_weighted
+    assert [e.weight for lst in graph.adj.values() for e in lst] == [4, 4]
+    graph.reweight_edge(edge, None)
+    assert not graph.is_weighted
+
+
+def test_pair_key_counts_both_notations_of_one_direction():
+    assert build(['u A;', 'u B;', 'h A > B;', 'h B < A;']).has_multiple_edges
+    assert not build(['u A;', 'u B;', 'h A > B;', 'h B > A;']).has_multiple_edges
+    assert not build(['u A;', 'u B;', 'h A > B;', 'h A - B;']).has_multiple_edges
+    assert build(['u A;', 'u B;', 'h A - B;', 'h B - A;']).has_multiple_edges
+
+
+def test_listeners_and_version():
+    graph = build(['u A;', 'u B;'])
+    graph.content_hash = 'abc'
+    events = []
+
+    class Listener:
+        def on_edge_added(self, edge):
+            events.append(('added', edge.u.identifier, edge.v.identifier))
+
+        def on_node_removed(self, node):
+            events.append(('removed', node.identifier))
+
+    graph.add_listener(Listener())
+    version = graph.version
+    apply(graph, ['+h A > B;', '-u A;'])
+    assert events[0] == ('added', 'A', 'B')
+    assert events[-1] == ('removed', 'A')
+    assert graph.version > version
+    assert graph.content_hash is None
+
+
+def test_node_value_update_is_a_change():
+    graph = build(['u A 1;', 'u B;'])
+    graph.content_hash = 'abc'
+    events = []
+
+    class Listener:
+        def on_node_updated(self, node, old_value):
+            events.append((node.identifier, old_value, node.value))
+
+    graph.add_listener(Listener())
+    version = graph.version
+    apply(graph, ['+u A 7;'])
+    assert events == [('A', 1.0, 7.0)]
+    assert graph.version == version + 1 and graph.content_hash is None
+    with pytest.raises(KeyError):
+        graph.set_node_value('Z', 1)
+
+
+def test_apply_delta_counts_and_skips():
+    graph = build(['u A;', 'u B;', 'h A > B 1;'])
+    applied = apply(graph, [
+        '+u C 5;',
+        '+h B > C 2 :x;',
+        '~h A > B 9;',
+        '-h A > B 3;',      # špatná váha -> přeskočeno
+        '-h B > C;',
+        '-u Z;',            # neexistující uzel -> přeskočeno
+        '+u A 7;',          # existující uzel -> změna hodnoty
+    ])
+    assert applied == {'add_node': 2, 'add_edge': 1, 'reweight_edge': 1, 'remove_edge': 1, 'skipped': 2}
+    assert graph.find_edge('A', '>', 'B').weight == 9
+    assert graph.nodes['A'].value == 7
+    assert graph.get_edge_count() == 1
+
+
+def test_parse_delta_lines():
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        ops = GraphParser.parse_delta_lines([
+            '# komentář', '+u X 3;', '-u Y;', '+h X > Y 2 :e1;', '-h X - Y;', '~h X > Y 5;',
+            '~h X > Y;', '?u Q;',
+        ])
+    assert ops == [
+        ('add_node', 'X', 3),
+        ('remove_node', 'Y'),
+        ('add_edge', 'X', '>', 'Y', 2, 'e1'),
+        ('remove_edge', 'X', '-', 'Y', None, None),
+        ('reweight_edge', 'X', '>', 'Y', 5, None),
+    ]
+    warnings = out.getvalue()
+    assert 'řádku 7' in warnings and '~h' in warnings
+    assert 'řádku 8' in warnings
+
+
+def test_random_deltas_match_full_rebuild():
+    rng = random.Random(28)
+    for _ in range(100):
+        n = 5
+        graph = build([f'u N{i};' for i in range(n)])
+        for _ in range(30):
+            a, b = f'N{rng.randrange(n)}', f'N{rng.randrange(n)}'
+            direction = rng.choice('<->')
+            weight = rng.choice(['', ' 3', ' 5'])
+            r = rng.random()
+            if r < 0.5:
+                line = f'+h {a} {direction} {b}{weight};'
+            elif r < 0.75:
+                line = f'-h {a} {direction} {b};'
+            elif r < 0.85:
+                line = f'~h {a} {direction} {b} 7;'
+            elif r < 0.93:
+                line = f'-u {a};'
+            else:
+                line = f'+u {a};'
+            apply(graph, [line])
+
+            fresh = rebuilt(graph)
+            assert flags(graph) == flags(fresh), line
+            assert adjacency(graph) == adjacency(fresh), line
+            assert graph.get_edge_count() == fresh.get_edge_count()
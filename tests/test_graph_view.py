@@ -0,0 +1,107 @@
+"""Testy pohledů na podgrafy (indukovaný podgraf, filtr hran, ego-síť)."""
+
+import functools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import (BiconnectivityAnalyzer, ColoringAnalyzer, CoreAnalyzer, FingerprintAnalyzer,
+                                      GraphPropertiesAnalyzer, MatrixAnalyzer, PathAnalyzer)
+from graph_analyzer.models import Edge, Graph, GraphView, Node
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, weights=(None, 1, 2, 3), labels=(None, 'x'), values=True)
+
+
+def copy_of(view):
+    """Samostatný graf se stejnými uzly a hranami jako pohled."""
+    graph = Graph()
+    for node in view.nodes.values():
+        graph.add_node(Node(node.identifier, node.value))
+    for edge in view.edges:
+        graph.add_edge(Edge(graph.nodes[edge.u.identifier], graph.nodes[edge.v.identifier],
+                            edge.direction, edge.weight, edge.label))
+    return graph
+
+
+def analyses(graph):
+    first = next(iter(graph.nodes), None)
+    return {
+        'properties': GraphPropertiesAnalyzer(graph).get_basic_properties(),
+        'distances': PathAnalyzer(graph).get_shortest_distances(first) if first else None,
+        'cores': CoreAnalyzer(graph).core_numbers(),
+        'bridges': [(e.u.identifier, e.v.identifier) for e in BiconnectivityAnalyzer(graph).analyze()['bridges']],
+        'colors': ColoringAnalyzer(graph).dsatur()['colors'],
+        'adjacency': MatrixAnalyzer(graph).get_adjacency_matrix(),
+        'neighbors': {node_id: sorted(graph.get_neighbors(node_id)) for node_id in graph.nodes},
+        'degrees': {node_id: graph.get_node_degree(node_id) for node_id in graph.nodes},
+    }
+
+
+def views(graph, rng):
+    nodes = list(graph.nodes)
+    yield GraphView.induced(graph, rng.sample(nodes, len(nodes) // 2))
+    yield GraphView.edge_filtered(graph, lambda edge: edge.weight is not None and edge.weight >= 2)
+    yield GraphView.edge_filtered(graph, lambda edge: edge.label == 'x')
+    yield GraphView.ego(graph, rng.choice(nodes), hops=2)
+
+
+def test_analyzers_on_views_match_copies():
+    rng = random.Random(7)
+    for _ in range(15):
+        graph = random_graph(rng, rng.randint(2, 20), rng.randint(0, 40))
+        for view in views(graph, rng):
+            copy = copy_of(view)
+            for flag in ('is_directed', 'is_weighted', 'has_loops', 'has_multiple_edges'):
+                assert getattr(view, flag) == getattr(copy, flag)
+            assert analyses(view) == analyses(copy)
+            assert FingerprintAnalyzer(view).fingerprint() == FingerprintAnalyzer(copy).fingerprint()
+
+
+def test_views_share_parent_objects_and_nest():
+    rng = random.Random(1)
+    graph = random_graph(rng, 30, 60)
+    view = GraphView.ego(graph, 'N0', hops=2)
+    assert all(view.nodes[node_id] is graph.nodes[node_id] for node_id in view.nodes)
+    assert all(graph.edges[pos] is edge for pos, edge in zip(view.edge_index, view.edges))
+    inner = GraphView.ego(view, 'N0', hops=1)
+    assert inner.nodes.keys() == GraphView.ego(graph, 'N0', hops=1).nodes.keys()
+    assert inner.edges[:] == GraphView.ego(graph, 'N0', hops=1).edges[:]
+
+
+def test_ego_follows_edges_in_both_directions():
+    graph = Graph()
+    for node_id in 'ABCDE':
+        graph.add_node(Node(node_id))
+    for u, direction, v in [('A', '>', 'B'), ('C', '>', 'A'), ('B', '<', 'D'), ('D', '-', 'E')]:
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], direction))
+    assert set(GraphView.ego(graph, 'A', 0).nodes) == {'A'}
+    assert set(GraphView.ego(graph, 'A', 1).nodes) == {'A', 'B', 'C'}
+    assert set(GraphView.ego(graph, 'A', 2).nodes) == {'A', 'B', 'C', 'D'}
+    with pytest.raises(KeyError):
+        GraphView.ego(graph, 'Z')
+
+
+def test_view_is_read_only_and_keyed_for_cache():
+    graph = random_graph(random.Random(2), 5, 5)
+    graph.content_hash = 'abc'
+    view = GraphView.ego(graph, 'N0', 1)
+    with pytest.raises(TypeError):
+        view.add_node(Node('X'))
+    with pytest.raises(TypeError):
+        view.remove_node('N0')
+    assert view.content_hash not in (None, graph.content_hash)
+    assert view.content_hash == GraphView.ego(graph, 'N0', 1).content_hash != GraphView.ego(graph, 'N0', 2).content_hash
+
+
+def test_cli_ego_scopes_analysis(tmp_path, capsys):
+    from graph_analyzer import cli
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nu C;\nu D;\nh A - B;\nh B - C;\nh C - D;\n', encoding='utf-8')
+    cli.run([str(path), '--ego', 'B', '--hops', '1', '--properties', '--no-cache'])
+    out = capsys.readouterr().out
+    assert 'Počet uzlů:_________3' in out and 'Počet hran:_________2' in out
+    cli.run([str(path), '--ego', 'Z', '--no-cache', '-q'])
+    assert 'neexistuje' in capsys.readouterr().err
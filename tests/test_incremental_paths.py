@@ -0,0 +1,87 @@
+"""Testy inkrementálních nejkratších cest."""
+
+import contextlib
+import io
+import random
+
+from graph_analyzer.analyzers import PathAnalyzer
+from graph_analyzer.models import Graph
+from graph_analyzer.utils import GraphParser
+
+
+def build(lines):
+    graph = Graph()
+    graph.load_from_data(*GraphParser.parse_lines(lines))
+    return graph
+
+
+def apply(graph, lines):
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph.apply_delta(GraphParser.parse_delta_lines(lines))
+
+
+def test_chain_update_touches_only_suffix():
+    n = 50
+    lines = [f'u N{i};' for i in range(n)] + [f'h N{i} > N{i + 1} 1;' for i in range(n - 1)]
+    graph = build(lines)
+    tracker = PathAnalyzer(graph).track_shortest_distances('N0')
+    assert tracker.last_touched == n
+
+    apply(graph, ['~h N45 > N46 3;'])
+    assert tracker.last_touched == 4
+    assert tracker.get_distances()['N49'] == 51
+
+    apply(graph, ['+h N0 > N48 1;'])
+    assert tracker.last_touched == 2
+    assert tracker.get_path('N49') == ['N0', 'N48', 'N49']
+
+    apply(graph, ['-h N10 > N11;'])
+    distances = tracker.get_distances()
+    assert distances['N20'] == float('inf') and distances['N48'] == 1
+    assert tracker.stats()['updates'] == 3
+
+
+def test_unweighted_format_matches_bfs():
+    graph = build(['u A;', 'u B;', 'u C;', 'u D;', 'h A - B;', 'h B - C;'])
+    tracker = PathAnalyzer(graph).track_shortest_distances('A')
+    apply(graph, ['+h C - D;', '-h A - B;', '+h A > C;'])
+    assert tracker.get_distances() == PathAnalyzer(graph).get_shortest_distances('A')
+    assert tracker.get_distances() == {'A': 0, 'C': 1, 'B': 2, 'D': 2}
+
+
+def test_source_removed_and_readded():
+    graph = build(['u A;', 'u B;', 'h A > B 2;'])
+    tracker = PathAnalyzer(graph).track_shortest_distances('A')
+    apply(graph, ['-u A;'])
+    assert tracker.get_distances() == {}
+    apply(graph, ['+u A;', '+h A > B 5;'])
+    assert tracker.get_distances() == {'A': 0, 'B': 5}
+    tracker.close()
+    apply(graph, ['~h A > B 1;'])
+    assert tracker.get_distances()['B'] == 5
+
+
+def test_random_changes_match_full_recompute():
+    rng = random.Random(30)
+    for weighted in (False, True):
+        for _ in range(60):
+            n = 8
+            graph = build([f'u N{i};' for i in range(n)] + ['h N0 > N1 1;' if weighted else 'h N0 > N1;'])
+            tracker = PathAnalyzer(graph).track_shortest_distances('N0')
+            for _ in range(40):
+                a, b = f'N{rng.randrange(n)}', f'N{rng.randrange(n)}'
+                direction = rng.choice('<->')
+                weight = f' {rng.randint(0, 6)}' if weighted else ''
+                r = rng.random()
+                if r < 0.45:
+                    line = f'+h {a} {direction} {b}{weight};'
+                elif r < 0.75:
+                    line = f'-h {a} {direction} {b};'
+                elif r < 0.9 and weighted:
+                    line = f'~h {a} {direction} {b}{weight};'
+                elif r < 0.95:
+                    line = f'-u {a};'
+                else:
+                    line = f'+u {a};'
+                apply(graph, [line])
+                assert tracker.get_distances() == PathAnalyzer(graph).get_shortest_distances('N0'), line
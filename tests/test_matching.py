@@ -0,0 +1,112 @@
+"""Testy maximálních párování (Hopcroft-Karp, Edmonds, přiřazení)."""
+
+import functools
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import MatchingAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, weights=(None,))
+
+
+def brute_force(graph, maximize=False):
+    """(velikost, nejlepší váha) maximálního párování zkoušením všech podmnožin hran."""
+    edges = [(e.u.identifier, e.v.identifier, 1 if e.weight is None else e.weight)
+             for e in graph.edges if e.u != e.v]
+    for size in range(len(edges), 0, -1):
+        weights = [sum(w for _, _, w in chosen) for chosen in itertools.combinations(edges, size)
+                   if len({x for u, v, _ in chosen for x in (u, v)}) == 2 * size]
+        if weights:
+            return size, max(weights) if maximize else min(weights)
+    return 0, 0
+
+
+def assert_matching(graph, result):
+    nodes = [x for pair in result['pairs'] for x in pair]
+    assert len(nodes) == len(set(nodes))
+    edges = {frozenset((e.u.identifier, e.v.identifier)) for e in graph.edges}
+    assert all(frozenset(pair) in edges for pair in result['pairs'])
+    assert result['size'] == len(result['pairs'])
+
+
+def test_general_graphs_match_brute_force():
+    rng = random.Random(2)
+    for _ in range(40):
+        graph = random_graph(rng, 8, rng.randrange(16))
+        result = MatchingAnalyzer(graph).maximum_matching('blossom')
+        assert_matching(graph, result)
+        assert result['size'] == brute_force(graph)[0]
+
+
+def test_bipartite_hopcroft_karp_and_konig_cover():
+    rng = random.Random(4)
+    for _ in range(40):
+        graph = random_graph(rng, 10, rng.randrange(16), bipartite=True)
+        analyzer = MatchingAnalyzer(graph)
+        result = analyzer.maximum_matching()
+        assert result['algorithm'] == 'hopcroft-karp' and result['bipartite']
+        assert_matching(graph, result)
+        assert result['size'] == brute_force(graph)[0]
+        assert analyzer.maximum_matching('blossom')['size'] == result['size']
+        cover = set(result['vertex_cover'])
+        assert len(cover) == result['size']
+        assert all(e.u.identifier in cover or e.v.identifier in cover for e in graph.edges)
+
+
+@pytest.mark.parametrize('maximize', [False, True])
+def test_assignment_matches_brute_force(maximize):
+    rng = random.Random(6)
+    for weights in ((None, -3, 0, 2, 5, 9), (None, 0.0, 0.1, 0.3, 0.7, -2.5), (0.123456, 0.654321, 1e-6, 2.000001)):
+        for _ in range(40):
+            graph = random_graph(rng, 8, rng.randrange(14), bipartite=True, weights=weights)
+            result = MatchingAnalyzer(graph).assignment(maximize=maximize)
+            assert_matching(graph, result)
+            size, weight = brute_force(graph, maximize)
+            assert result['size'] == size and result['weight'] == pytest.approx(weight)
+
+
+def test_assignment_with_decimal_weights_terminates():
+    # Dříve se kvůli zaokrouhlení potenciálů nenašla zlepšující cesta a výpočet se zacyklil
+    graph = Graph()
+    for node_id in ('L0', 'L1', 'L2', 'L3', 'R0', 'R1', 'R2'):
+        graph.add_node(Node(node_id))
+    for u, v, w in (('L0', 'R0', 0.2), ('L0', 'R2', 0.1), ('L1', 'R0', 0.8), ('L1', 'R2', 0.7),
+                    ('L2', 'R0', 0.6), ('L2', 'R1', 0.0), ('L2', 'R2', 0.4), ('L3', 'R2', 0.3)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', w))
+    result = MatchingAnalyzer(graph).assignment()
+    assert result['size'] == 3 and result['weight'] == pytest.approx(0.5)
+    assert brute_force(graph) == (3, pytest.approx(0.5))
+
+
+def test_odd_cycle_needs_blossom():
+    graph = Graph()
+    for node_id in 'ABCDEF':
+        graph.add_node(Node(node_id))
+    # Trojúhelník A-B-C s přivěšenou cestou C-D-E-F: perfektní párování existuje
+    for u, v in ('AB', 'BC', 'CA', 'CD', 'DE', 'EF'):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', None))
+    analyzer = MatchingAnalyzer(graph)
+    assert not analyzer.is_bipartite()
+    assert analyzer.maximum_matching()['size'] == 3
+    with pytest.raises(ValueError):
+        analyzer.maximum_matching('hopcroft-karp')
+    with pytest.raises(ValueError):
+        analyzer.assignment()
+
+
+def test_long_path():
+    n = 50_000
+    graph = Graph()
+    for i in range(n):
+        graph.add_node(Node(f'N{i}'))
+    for i in range(n - 1):
+        graph.add_edge(Edge(graph.nodes[f'N{i}'], graph.nodes[f'N{i + 1}'], '-', None))
+    analyzer = MatchingAnalyzer(graph)
+    assert analyzer.maximum_matching()['size'] == n // 2
+    assert analyzer.maximum_matching('blossom')['size'] == n // 2
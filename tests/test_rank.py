@@ -0,0 +1,107 @@
+"""Testy PageRanku, Katzovy centrality a centrality podle vlastního vektoru."""
+
+import functools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import RankAnalyzer
+from graph_analyzer.models import Edge, Graph, Node
+
+import helpers
+
+# Referenční hodnoty se počítají hustými maticemi
+np = pytest.importorskip('numpy')
+
+
+random_graph = functools.partial(helpers.random_graph, directions='-', weights=(None,), loops=False)
+
+
+def dense_matrix(graph):
+    ids = list(graph.nodes)
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    matrix = np.zeros((len(ids), len(ids)))
+    for node_id in ids:
+        for entry in graph.adj[node_id]:
+            matrix[index[node_id], index[entry.v.identifier]] += entry.weight if entry.weight is not None else 1
+    return ids, matrix
+
+
+def reference_pagerank(graph, damping=0.85, personalization=None):
+    ids, matrix = dense_matrix(graph)
+    n = len(ids)
+    jump = np.full(n, 1.0 / n) if personalization is None else np.array([personalization.get(i, 0.0) for i in ids])
+    jump = jump / jump.sum()
+    out = matrix.sum(axis=1)
+    transition = np.where(out[:, None] > 0, matrix / np.where(out > 0, out, 1)[:, None], jump[None, :])
+    # x = d * P^T x + (1 - d) * p  =>  (I - d * P^T) x = (1 - d) * p
+    x = np.linalg.solve(np.eye(n) - damping * transition.T, (1 - damping) * jump)
+    return dict(zip(ids, x))
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+@pytest.mark.parametrize('directions,weights', [('>', (None,)), ('-', (None,)), ('<->', (1, 2.5, 4))])
+def test_pagerank_matches_linear_solve(use_numpy, directions, weights):
+    rng = random.Random(33)
+    for _ in range(10):
+        graph = random_graph(rng, rng.randint(2, 15), rng.randint(0, 30), directions=directions, weights=weights)
+        result = RankAnalyzer(graph, use_numpy=use_numpy).pagerank(tol=1e-12, max_iter=1000)
+        assert result['converged']
+        assert result['backend'] == ('numpy' if use_numpy else 'python')
+        assert sum(result['values'].values()) == pytest.approx(1.0)
+        expected = reference_pagerank(graph)
+        for node_id, value in result['values'].items():
+            assert value == pytest.approx(expected[node_id], abs=1e-9)
+
+
+def test_personalized_pagerank():
+    graph = random_graph(random.Random(1), 10, 25, directions='>')
+    personalization = {'N0': 1.0, 'N3': 3.0}
+    result = RankAnalyzer(graph).pagerank(personalization=personalization, tol=1e-12, max_iter=1000)
+    expected = reference_pagerank(graph, personalization=personalization)
+    for node_id, value in result['values'].items():
+        assert value == pytest.approx(expected[node_id], abs=1e-9)
+
+    with pytest.raises(ValueError):
+        RankAnalyzer(graph).pagerank(personalization={'missing': 1.0})
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_katz_matches_linear_solve(use_numpy):
+    graph = random_graph(random.Random(5), 12, 30, directions='>')
+    ids, matrix = dense_matrix(graph)
+    alpha = 0.9 / max(abs(np.linalg.eigvals(matrix)).max(), 1.0)
+    result = RankAnalyzer(graph, use_numpy=use_numpy).katz(alpha=alpha, tol=1e-12, max_iter=10000)
+    assert result['converged']
+    expected = np.linalg.solve(np.eye(len(ids)) - alpha * matrix.T, np.ones(len(ids)))
+    expected /= np.linalg.norm(expected)
+    for node_id, value in zip(ids, expected):
+        assert result['values'][node_id] == pytest.approx(value, abs=1e-8)
+
+
+def test_katz_divergence_is_reported():
+    graph = random_graph(random.Random(5), 12, 40, directions='-')
+    result = RankAnalyzer(graph).katz(alpha=5.0)
+    assert not result['converged']
+    assert result['iterations'] < 1000
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_eigenvector_matches_dense_solver(use_numpy):
+    graph = random_graph(random.Random(9), 15, 40, directions='-')
+    ids, matrix = dense_matrix(graph)
+    values, vectors = np.linalg.eigh(matrix)
+    expected = np.abs(vectors[:, np.argmax(values)])
+    result = RankAnalyzer(graph, use_numpy=use_numpy).eigenvector(tol=1e-13, max_iter=10000)
+    assert result['converged']
+    for node_id, value in zip(ids, expected):
+        assert result['values'][node_id] == pytest.approx(value, abs=1e-6)
+
+
+def test_negative_weights_are_rejected():
+    graph = Graph()
+    graph.add_node(Node('A'))
+    graph.add_node(Node('B'))
+    graph.add_edge(Edge(graph.nodes['A'], graph.nodes['B'], '>', -1))
+    with pytest.raises(ValueError):
+        RankAnalyzer(graph).pagerank()
@@ -0,0 +1,73 @@
+"""Testy masky placeholder uzlů a stupňů přes reálné uzly udržovaných grafem."""
+
+import collections
+import random
+
+from graph_analyzer.analyzers import GraphPropertiesAnalyzer
+from graph_analyzer.models import Edge, Graph, GraphView, Node, is_placeholder_id
+from graph_analyzer.utils.graph_parser import GraphParser
+
+
+def recomputed(graph):
+    """Stupně a počet hran mezi reálnými uzly spočítané znovu ze seznamů sousednosti."""
+    real = {node_id for node_id in graph.nodes if not is_placeholder_id(node_id)}
+    in_degrees = collections.Counter()
+    out_degrees = collections.Counter()
+    for node_id in real:
+        in_degrees[node_id] = len([e for e in graph.rev_adj.get(node_id, []) if e.u.identifier in real])
+        out_degrees[node_id] = len([e for e in graph.adj.get(node_id, []) if e.v.identifier in real])
+    edges = len([e for e in graph.edges if e.u.identifier in real and e.v.identifier in real])
+    return real, +in_degrees, +out_degrees, edges
+
+
+def maintained(graph):
+    in_degrees, out_degrees = graph.real_degrees()
+    return set(graph.real_node_ids()), +in_degrees, +out_degrees, graph.real_edge_count()
+
+
+def test_counters_follow_mutations():
+    rng = random.Random(3)
+    graph = Graph()
+    ids = [f'N{i}' for i in range(8)] + [f'*_{i}' for i in range(3)]
+    for _ in range(400):
+        action = rng.random()
+        if action < 0.2:
+            node_id = rng.choice(ids)
+            graph.add_node(Node(node_id))
+        elif action < 0.6 and len(graph.nodes) >= 1:
+            u, v = rng.choice(list(graph.nodes)), rng.choice(list(graph.nodes))
+            graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], rng.choice('<>-')))
+        elif action < 0.85 and graph.edges:
+            graph.remove_edge(rng.choice(graph.edges))
+        elif graph.nodes:
+            graph.remove_node(rng.choice(list(graph.nodes)))
+        assert maintained(graph) == recomputed(graph)
+        view = GraphView.ego(graph, next(iter(graph.nodes)), hops=1) if graph.nodes else None
+        if view is not None:
+            assert maintained(view) == recomputed(view)
+
+
+def test_parser_marks_placeholders_once(tmp_path):
+    path = tmp_path / 'tree.tg'
+    path.write_text('u A;\nu *;\nu B;\nu *;\nu *;\nu C;\n', encoding='utf-8')
+    nodes, edges = GraphParser.parse_file(str(path))
+    assert [node_id for node_id, node in nodes.items() if node.is_placeholder] == ['*_1', '*_3', '*_4']
+    graph = Graph()
+    graph.load_from_data(nodes, edges)
+    assert graph.real_node_ids() == {'A', 'B', 'C'} and graph.real_edge_count() == 2
+    analyzer = GraphPropertiesAnalyzer(graph)
+    assert analyzer.is_tree() and analyzer.is_forest() and not analyzer.is_regular_graph()
+    assert Node('X', placeholder=True).is_placeholder and not Node('*_9', placeholder=False).is_placeholder
+
+
+def test_regular_and_complete_ignore_placeholders():
+    graph = Graph()
+    for node_id in ('A', 'B', 'C', '*_1'):
+        graph.add_node(Node(node_id))
+    for u, v in (('A', 'B'), ('B', 'C'), ('C', 'A'), ('A', '*_1')):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-'))
+    analyzer = GraphPropertiesAnalyzer(graph)
+    assert analyzer.is_complete_graph() and analyzer.is_regular_graph()
+    graph.remove_edge(graph.find_edge('B', '-', 'C'))
+    assert not analyzer.is_complete_graph() and not analyzer.is_regular_graph()
+    assert analyzer.is_tree() and analyzer.is_forest()
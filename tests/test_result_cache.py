@@ -0,0 +1,160 @@
+"""Testy diskové cache výsledků analýz."""
+
+import json
+import os
+
+import pytest
+
+from graph_analyzer.utils import result_cache
+from graph_analyzer.utils.result_cache import ResultCache, analysis_key, file_hash
+
+
+def entry_files(cache_dir):
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(cache_dir)
+        for name in names
+        if name.endswith('.json') and name != 'size_index.json'
+    )
+
+
+def test_analysis_key_is_stable():
+    assert analysis_key('abc', 'adj_power', k=5) == 'abc/adj_power:k=5'
+    # Pořadí parametrů nehraje roli
+    assert analysis_key('h', 'path', start='A', end='B') == analysis_key('h', 'path', end='B', start='A')
+    assert analysis_key('h', 'path', start='A', end='B') != analysis_key('h', 'path', start='B', end='A')
+
+
+def test_path_depends_on_cache_version(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    before = cache._path_for('h/diameter:')
+    assert before == ResultCache(str(tmp_path))._path_for('h/diameter:')
+    monkeypatch.setattr(result_cache, 'CACHE_VERSION', result_cache.CACHE_VERSION + 1)
+    assert cache._path_for('h/diameter:') != before
+
+
+def test_file_hash_follows_content(tmp_path):
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\n')
+    first = file_hash(str(path))
+    assert first == file_hash(str(path), chunk_size=1)
+    path.write_text('u B;\n')
+    assert file_hash(str(path)) != first
+
+
+def test_roundtrip_uses_json_types(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    value = ([[0, 1], [1, 0]], ['A', 'B'])
+    assert cache.get_or_compute('k', lambda: value) == value
+    found, cached = cache.get('k')
+    assert found and cached == [[[0, 1], [1, 0]], ['A', 'B']]
+    cache.put('dist', {'A': 0, 'B': float('inf')})
+    assert cache.get('dist') == (True, {'A': 0, 'B': float('inf')})
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_unserializable_value_is_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put('k', object())
+    assert cache.get('k') == (False, None)
+    assert entry_files(tmp_path) == []
+
+
+def test_directory_is_private(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    ResultCache(str(cache_dir)).put('k', 1)
+    assert (os.stat(cache_dir).st_mode & 0o777) == 0o700
+
+
+def test_atomic_put_keeps_old_entry_on_failure(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cache.put('k', 'old')
+
+    def failing_replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(result_cache.os, 'replace', failing_replace)
+    cache.put('k', 'new')
+    monkeypatch.undo()
+
+    assert cache.get('k') == (True, 'old')
+    leftovers = [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith('.tmp')]
+    assert leftovers == []
+
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put('k', [1, 2, 3])
+    path = cache._path_for('k')
+    with open(path, 'wb') as f:
+        f.write(b'{"truncated": ')
+
+    assert cache.get('k') == (False, None)
+    assert not os.path.exists(path)
+    cache.put('k', [1, 2, 3])
+    assert cache.get('k') == (True, [1, 2, 3])
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='platforma nezná vlastníky souborů')
+def test_foreign_entry_is_ignored(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cache.put('k', 'value')
+    monkeypatch.setattr(result_cache.os, 'getuid', lambda: os.stat(tmp_path).st_uid + 1)
+
+    assert cache.get('k') == (False, None)
+    assert os.path.exists(cache._path_for('k'))
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    payload = 'x' * 1000
+    cache = ResultCache(str(tmp_path), max_bytes=3500)
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, payload)
+        os.utime(cache._path_for(key), (1000 + i, 1000 + i))
+    # Zásah obnoví mtime - 'a' je teď nejnovější
+    assert cache.get('a')[0]
+
+    cache.put('d', payload)
+
+    assert not os.path.exists(cache._path_for('b'))
+    for key in ('a', 'c', 'd'):
+        assert cache.get(key) == (True, payload)
+
+
+def test_size_index_tracks_puts_without_rescanning(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cache.put('a', 'x' * 100)
+    scans = []
+    original = ResultCache._entries
+
+    def counting_entries(self):
+        scans.append(1)
+        return original(self)
+
+    monkeypatch.setattr(ResultCache, '_entries', counting_entries)
+    for i in range(5):
+        cache.put(f'k{i}', 'x' * 100)
+    assert scans == []
+
+    with open(tmp_path / 'size_index.json', encoding='utf-8') as f:
+        index = json.load(f)
+    assert index['total_bytes'] == sum(os.path.getsize(p) for p in entry_files(tmp_path))
+    assert index['puts'] == 5
+
+
+def test_clear(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.clear()
+    assert entry_files(tmp_path) == []
+    assert cache.get('a') == (False, None)
+
+
+def test_load_graph_hashes_only_on_request(tmp_path):
+    from graph_analyzer import commands
+
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nh A - B;\n')
+    assert commands.load_graph(str(path)).content_hash is None
+    assert commands.load_graph(str(path), hash_content=True).content_hash == file_hash(str(path))
@@ -0,0 +1,191 @@
+"""Testy dotazovacího serveru a jeho cache grafů."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from graph_analyzer import server
+from graph_analyzer.server import GraphCache, LatencyHistogram, QueryServer
+
+
+GRAPH = """u A;
+u B;
+u C;
+h A > B 2;
+h B > C 3;
+h A > C 10;
+"""
+
+
+def write_graph(path, text=GRAPH):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def query(srv, **request):
+    return asyncio.run(srv.handle_request(request))
+
+
+def test_dispatch_light_and_heavy_ops(tmp_path):
+    path = write_graph(tmp_path / 'g.tg')
+    srv = QueryServer(workers=0)
+
+    assert query(srv, id=1, op='ping') == {'id': 1, 'ok': True, 'result': 'pong'}
+    assert query(srv, op='successors', graph=path, node='A')['result'] == ['B', 'C']
+    assert query(srv, op='degree', graph=path, node='B')['result']['total_degree'] == 2
+    assert query(srv, op='distances', graph=path, node='A')['result'] == {'A': 0, 'B': 2.0, 'C': 5.0}
+    assert query(srv, op='path', graph=path, start='A', end='C')['result']['path'] == ['A', 'B', 'C']
+    assert srv.cache.stats()['misses'] == 1
+
+
+def test_error_responses(tmp_path):
+    path = write_graph(tmp_path / 'g.tg')
+    srv = QueryServer(workers=0)
+
+    unknown = query(srv, id=7, op='nope', graph=path)
+    assert unknown['id'] == 7 and not unknown['ok']
+    assert "Neznámá operace 'nope'" in unknown['error']
+
+    assert 'graph' in query(srv, op='neighbors')['error']
+    assert 'neexistuje' in query(srv, op='degree', graph=path, node='ZZ')['error']
+    assert query(srv, op='info', graph=str(tmp_path / 'missing.tg'))['error'].startswith('FileNotFoundError')
+
+    latency = asyncio.run(srv.handle_request({'op': 'stats'}))['result']['latency']
+    assert latency['unknown']['errors'] == 1
+    assert latency['degree']['errors'] == 1
+
+
+def test_graph_cache_lru_eviction(tmp_path):
+    paths = [write_graph(tmp_path / f'{name}.tg') for name in 'abc']
+    cache = GraphCache(capacity=2)
+
+    first = cache.get(paths[0])
+    cache.get(paths[1])
+    assert cache.get(paths[0]) is first          # a je nejnověji použitý
+    cache.get(paths[2])                          # vytlačí b
+
+    assert cache.stats()['graphs'] == [os.path.abspath(paths[0]), os.path.abspath(paths[2])]
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_graph_cache_mtime_invalidation(tmp_path):
+    path = write_graph(tmp_path / 'g.tg')
+    cache = GraphCache()
+    old = cache.get(path)
+
+    write_graph(tmp_path / 'g.tg', GRAPH + 'u D;\n')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    new = cache.get(path)
+    assert new is not old
+    assert 'D' in new.nodes
+    assert cache.stats()['size'] == 1
+
+
+def test_concurrent_misses_share_one_load(tmp_path, monkeypatch):
+    path = write_graph(tmp_path / 'g.tg')
+    loads = []
+    original = server.commands.load_graph
+
+    def counting_load(file_path):
+        loads.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(server.commands, 'load_graph', counting_load)
+    srv = QueryServer(workers=0)
+
+    async def burst():
+        return await asyncio.gather(*(srv.get_graph(path) for _ in range(5)))
+
+    graphs = asyncio.run(burst())
+    assert len(loads) == 1
+    assert all(graph is graphs[0] for graph in graphs)
+
+
+def test_latency_histogram_buckets():
+    hist = LatencyHistogram(bounds=(1, 10))
+    for elapsed in (0.5, 1, 5, 50):
+        hist.record(elapsed)
+    hist.record(2, ok=False)
+    data = hist.to_dict()
+    assert data['count'] == 5 and data['errors'] == 1
+    assert list(data['buckets'].values()) == [2, 2, 1]
+
+
+def test_remove_stale_socket_refuses_regular_file(tmp_path):
+    path = tmp_path / 'not-a-socket'
+    path.write_text('data')
+    with pytest.raises(FileExistsError):
+        server._remove_stale_socket(str(path))
+    assert path.exists()
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'start_unix_server'), reason='Unix sockety nejsou k dispozici')
+def test_unix_socket_roundtrip_with_workers(tmp_path):
+    path = write_graph(tmp_path / 'g.tg')
+    socket_path = str(tmp_path / 's.sock')
+    srv = QueryServer(workers=1, preload=[path])
+
+    async def scenario():
+        ready = asyncio.Event()
+        serve_task = asyncio.create_task(srv.serve(socket_path=socket_path, ready=lambda _: ready.set()))
+        await asyncio.wait_for(ready.wait(), 10)
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        requests = [
+            {'id': 1, 'op': 'distances', 'graph': path, 'node': 'A'},
+            {'id': 2, 'op': 'neighbors', 'graph': path, 'node': 'B'},
+            {'id': 3, 'op': 'stats'},
+        ]
+        for request in requests:
+            writer.write((json.dumps(request) + '\n').encode('utf-8'))
+        writer.write(b'not json\n')
+        await writer.drain()
+        responses = [json.loads(await asyncio.wait_for(reader.readline(), 30)) for _ in range(4)]
+        # Otevřené spojení nesmí bránit ukončení serveru
+        serve_task.cancel()
+        await asyncio.gather(serve_task, return_exceptions=True)
+        writer.close()
+        return {response['id']: response for response in responses}
+
+    responses = asyncio.run(scenario())
+    assert responses[1]['result'] == {'A': 0, 'B': 2.0, 'C': 5.0}
+    assert sorted(responses[2]['result']) == ['A', 'C']
+    assert responses[None]['error'].startswith('Neplatný JSON')
+    pool = responses[3]['result']['pool']
+    if pool['shared_cache']:
+        # Pracovní proces zdědil graf načtený hlavním procesem
+        assert all(worker['misses'] == 0 for worker in pool['worker_caches'])
+    assert srv.cache.misses == 1
+    assert not os.path.exists(socket_path)
+
+
+def test_pool_is_created_once_and_workers_load_new_graphs(tmp_path):
+    first = write_graph(tmp_path / 'g1.tg')
+    second = write_graph(tmp_path / 'g2.tg', GRAPH.replace('10', '1'))
+    srv = QueryServer(workers=1, preload=[first])
+    srv._preload()
+    srv._start_pool()
+    pool = srv._pool
+    try:
+        async def scenario():
+            before = await srv.handle_request({'op': 'stats'})
+            answers = [await srv.handle_request({'op': 'distances', 'graph': path, 'node': 'A'})
+                       for path in (first, second, first, second)]
+            after = await srv.handle_request({'op': 'stats'})
+            return before, answers, after
+
+        before, answers, after = asyncio.run(scenario())
+        assert [answer['result']['C'] for answer in answers] == [5.0, 1.0, 5.0, 1.0]
+        assert srv._pool is pool
+        workers_before = before['result']['pool']['worker_caches']
+        workers_after = after['result']['pool']['worker_caches']
+        assert [w['pid'] for w in workers_before] == [w['pid'] for w in workers_after]
+        # Druhý graf si pracovní proces načetl sám, a to jen jednou (první zdědil, pokud je k dispozici fork)
+        loaded = 1 if before['result']['pool']['shared_cache'] else 2
+        assert workers_after[0]['misses'] - workers_before[0]['misses'] == loaded
+        assert srv.cache.misses == 1
+    finally:
+        pool.shutdown()
@@ -0,0 +1,84 @@
+"""Testy minimální kostry (Kruskal, Prim) a jejího zápisu do .tg."""
+
+import functools
+import itertools
+import random
+
+import pytest
+
+from graph_analyzer.analyzers import SpanningTreeAnalyzer
+from graph_analyzer.commands import load_graph
+from graph_analyzer.models import Edge, Graph, Node
+from graph_analyzer.utils import GraphWriter
+from graph_analyzer.utils.union_find import UnionFind
+
+import helpers
+
+
+random_graph = functools.partial(helpers.random_graph, weights=(None, 1, 2, 3.5, -1, 7))
+
+
+def weight_of(edge):
+    return 1 if edge.weight is None else edge.weight
+
+
+def brute_forest_weight(graph):
+    """Nejmenší váha ze všech podmnožin hran, které tvoří kostru každé komponenty."""
+    edges = [edge for edge in graph.edges if edge.u is not edge.v]
+    components = UnionFind(graph.nodes)
+    for edge in edges:
+        components.union(edge.u.identifier, edge.v.identifier)
+    size = len(graph.nodes) - components.count
+    best = None
+    for subset in itertools.combinations(edges, size):
+        sets = UnionFind(graph.nodes)
+        if all(sets.union(edge.u.identifier, edge.v.identifier) for edge in subset):
+            total = sum(weight_of(edge) for edge in subset)
+            best = total if best is None else min(best, total)
+    return best, components.count
+
+
+@pytest.mark.parametrize('algorithm', ['kruskal', 'prim'])
+def test_matches_brute_force(algorithm):
+    rng = random.Random(38)
+    for _ in range(40):
+        graph = random_graph(rng, rng.randint(1, 6), rng.randint(0, 9))
+        result = SpanningTreeAnalyzer(graph).minimum_spanning_forest(algorithm)
+        weight, components = brute_forest_weight(graph)
+        assert result['weight'] == pytest.approx(weight)
+        assert result['components'] == components
+        assert sum(weight_of(edge) for edge in result['edges']) == pytest.approx(weight)
+
+
+def test_algorithms_agree_on_larger_graph():
+    graph = random_graph(random.Random(1), 300, 1500)
+    analyzer = SpanningTreeAnalyzer(graph)
+    kruskal = analyzer.kruskal()
+    prim = analyzer.prim()
+    assert kruskal['weight'] == pytest.approx(prim['weight'])
+    assert len(kruskal['edges']) == len(prim['edges']) == 300 - kruskal['components']
+
+
+def test_forest_of_disconnected_graph():
+    graph = Graph()
+    for node_id in 'ABCDE':
+        graph.add_node(Node(node_id))
+    for u, v, w in (('A', 'B', 3), ('B', 'C', 1), ('A', 'C', 2), ('D', 'E', 5)):
+        graph.add_edge(Edge(graph.nodes[u], graph.nodes[v], '-', w))
+    result = SpanningTreeAnalyzer(graph).minimum_spanning_forest()
+    assert result['weight'] == 8
+    assert result['components'] == 2
+    assert sorted((edge.u.identifier, edge.v.identifier) for edge in result['edges']) == [('A', 'C'), ('B', 'C'), ('D', 'E')]
+
+
+def test_tree_export_round_trip(tmp_path):
+    graph = random_graph(random.Random(2), 30, 80)
+    result = SpanningTreeAnalyzer(graph).kruskal()
+    path = str(tmp_path / 'mst.tg')
+    GraphWriter.write_file(graph, path, edges=result['edges'])
+    tree = load_graph(path)
+    assert set(tree.nodes) == set(graph.nodes)
+    assert len(tree.edges) == len(result['edges'])
+    again = SpanningTreeAnalyzer(tree).kruskal()
+    assert again['weight'] == pytest.approx(result['weight'])
+    assert again['components'] == result['components']
@@ -0,0 +1,65 @@
+"""Testy rychlého startu CLI (líné načítání analyzátorů)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Rozpočet kumulativní doby importu graph_analyzer.cli (nejlepší ze tří běhů);
+# bez líného načítání analyzátorů a numpy trval import přes 100 ms
+IMPORT_BUDGET_US = 60_000
+
+# Moduly, které se při startu načíst nesmí
+HEAVY_MODULES = ('numpy', 'multiprocessing', 'concurrent.futures', 'asyncio', 'tempfile',
+                 'graph_analyzer.server', 'graph_analyzer.batch')
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def import_times():
+    """{modul: kumulativní doba importu v µs} z výstupu -X importtime."""
+    times = {}
+    for line in run_python('-X', 'importtime', '-c', 'import graph_analyzer.cli').stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_is_lazy_and_within_budget():
+    runs = [import_times() for _ in range(3)]
+    modules = runs[0]
+    assert not [name for name in modules if name.startswith('graph_analyzer.analyzers.')]
+    assert not [name for name in modules if any(name == heavy or name.startswith(heavy + '.') for heavy in HEAVY_MODULES)]
+    best = min(times['graph_analyzer.cli'] for times in runs)
+    assert best <= IMPORT_BUDGET_US, f"import graph_analyzer.cli trval {best / 1000:.1f} ms"
+
+
+def loaded_analyzers(*cli_args):
+    code = ("import sys\nfrom graph_analyzer import cli\n"
+            f"cli.run({list(cli_args)!r})\n"
+            "print(sorted(m for m in sys.modules if m.startswith('graph_analyzer.analyzers.')))")
+    return eval(run_python('-c', code).stdout.splitlines()[-1])
+
+
+def test_only_used_analyzers_are_loaded(tmp_path):
+    path = tmp_path / 'g.tg'
+    path.write_text('u A;\nu B;\nu C;\nh A - B;\nh B > C;\n', encoding='utf-8')
+    assert loaded_analyzers(str(path), '--degree', 'A', '--no-cache', '-q') == []
+    assert loaded_analyzers(str(path), '--euler', '--no-cache', '-q') == ['graph_analyzer.analyzers.euler_analyzer']
+
+
+def test_lazy_package_attributes():
+    import graph_analyzer.analyzers as analyzers
+    from graph_analyzer.analyzers.path_analyzer import PathAnalyzer
+    assert analyzers.PathAnalyzer is PathAnalyzer
+    assert set(analyzers.__all__) <= set(dir(analyzers))
+    with pytest.raises(AttributeError):
+        analyzers.MissingAnalyzer